@@ -11,14 +11,26 @@ import sys
 sys.path.insert(
     0, os.path.abspath("../..")
 )  # Adds the parent directory to the system path
-import tempfile
-from typing import Optional
+import asyncio
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Dict, List, Optional
 
 from litellm._logging import verbose_proxy_logger
 from litellm.caching.caching import DualCache
+from litellm.caching.in_memory_cache import InMemoryCache
+from litellm.constants import (
+    SECRET_DETECTION_CACHE_SIZE,
+    SECRET_DETECTION_CACHE_TTL,
+    SECRET_DETECTION_MAX_WORKERS,
+    SECRET_DETECTION_OFFLOAD_MIN_CHARS,
+)
 from litellm.integrations.custom_guardrail import CustomGuardrail
 from litellm.proxy._types import UserAPIKeyAuth
 
+if TYPE_CHECKING:
+    from .secret_scanner import SecretScanner
+
 GUARDRAIL_NAME = "hide_secrets"
 
 _custom_plugins_path = "file://" + os.path.join(
@@ -420,38 +432,109 @@ _default_detect_secrets_config = {
 }
 
 
+# worker threads for scanning large texts, shared by all secret detection guardrails
+_scan_executor: Optional[ThreadPoolExecutor] = None
+
+
+def _get_scan_executor() -> ThreadPoolExecutor:
+    global _scan_executor
+    if _scan_executor is None:
+        _scan_executor = ThreadPoolExecutor(
+            max_workers=SECRET_DETECTION_MAX_WORKERS,
+            thread_name_prefix="secret_detection",
+        )
+    return _scan_executor
+
+
 class _ENTERPRISE_SecretDetection(CustomGuardrail):
     def __init__(self, detect_secrets_config: Optional[dict] = None, **kwargs):
         self.user_defined_detect_secrets_config = detect_secrets_config
+        self._secret_scanner: Optional["SecretScanner"] = None
+        # (type, start, end) of the detected secrets by sha256 of the scanned text -
+        # secret values are not kept in memory, they're sliced from the text on a hit
+        self.scan_cache = InMemoryCache(
+            max_size_in_memory=SECRET_DETECTION_CACHE_SIZE,
+            default_ttl=SECRET_DETECTION_CACHE_TTL,
+        )
         super().__init__(**kwargs)
 
-    def scan_message_for_secrets(self, message_content: str):
-        from detect_secrets import SecretsCollection
-        from detect_secrets.settings import transient_settings
+    @property
+    def secret_scanner(self) -> "SecretScanner":
+        """The plugins / filters of the detect_secrets config, loaded on first use."""
+        if self._secret_scanner is None:
+            from .secret_scanner import SecretScanner
 
-        temp_file = tempfile.NamedTemporaryFile(delete=False)
-        temp_file.write(message_content.encode("utf-8"))
-        temp_file.close()
+            self._secret_scanner = SecretScanner(
+                self.user_defined_detect_secrets_config
+                or _default_detect_secrets_config
+            )
+        return self._secret_scanner
 
-        secrets = SecretsCollection()
+    @staticmethod
+    def _get_scan_cache_key(message_content: str) -> str:
+        return hashlib.sha256(
+            message_content.encode("utf-8", errors="surrogatepass")
+        ).hexdigest()
 
-        detect_secrets_config = (
-            self.user_defined_detect_secrets_config or _default_detect_secrets_config
-        )
-        with transient_settings(detect_secrets_config):
-            secrets.scan_file(temp_file.name)
+    def _get_cached_secrets(
+        self, cache_key: str, message_content: str
+    ) -> Optional[List[Dict[str, str]]]:
+        cached_secrets = self.scan_cache.get_cache(cache_key)
+        if cached_secrets is None:
+            return None
+        return [
+            {"type": secret_type, "value": message_content[start:end]}
+            for secret_type, start, end in cached_secrets
+        ]
 
-        os.remove(temp_file.name)
+    def _set_cached_secrets(
+        self,
+        cache_key: str,
+        message_content: str,
+        detected_secrets: List[Dict[str, str]],
+    ) -> None:
+        cached_secrets = []
+        for secret in detected_secrets:
+            start = message_content.find(secret["value"])
+            if start == -1:
+                # value was transformed (e.g. unquoted from a config file), can't
+                # be sliced from the text - don't cache
+                return
+            cached_secrets.append((secret["type"], start, start + len(secret["value"])))
+        self.scan_cache.set_cache(cache_key, cached_secrets)
 
-        detected_secrets = []
-        for file in secrets.files:
-            for found_secret in secrets[file]:
-                if found_secret.secret_value is None:
-                    continue
-                detected_secrets.append(
-                    {"type": found_secret.type, "value": found_secret.secret_value}
-                )
+    def scan_message_for_secrets(self, message_content: str) -> List[Dict[str, str]]:
+        cache_key = self._get_scan_cache_key(message_content)
+        detected_secrets = self._get_cached_secrets(cache_key, message_content)
+        if detected_secrets is not None:
+            return detected_secrets
 
+        detected_secrets = self.secret_scanner.scan(message_content)
+        self._set_cached_secrets(cache_key, message_content, detected_secrets)
+        return detected_secrets
+
+    async def async_scan_message_for_secrets(
+        self, message_content: str
+    ) -> List[Dict[str, str]]:
+        """
+        Same as `scan_message_for_secrets`. Texts of at least
+        SECRET_DETECTION_OFFLOAD_MIN_CHARS are scanned in a worker thread, so a
+        large prompt doesn't block the event loop.
+        """
+        if len(message_content) < SECRET_DETECTION_OFFLOAD_MIN_CHARS:
+            return self.scan_message_for_secrets(message_content)
+
+        cache_key = self._get_scan_cache_key(message_content)
+        detected_secrets = self._get_cached_secrets(cache_key, message_content)
+        if detected_secrets is not None:
+            return detected_secrets
+
+        # load the scanner here, not in the worker threads
+        secret_scanner = self.secret_scanner
+        detected_secrets = await asyncio.get_running_loop().run_in_executor(
+            _get_scan_executor(), secret_scanner.scan, message_content
+        )
+        self._set_cached_secrets(cache_key, message_content, detected_secrets)
         return detected_secrets
 
     async def should_run_check(self, user_api_key_dict: UserAPIKeyAuth) -> bool:
@@ -476,7 +559,9 @@ class _ENTERPRISE_SecretDetection(CustomGuardrail):
         if "messages" in data and isinstance(data["messages"], list):
             for message in data["messages"]:
                 if "content" in message and isinstance(message["content"], str):
-                    detected_secrets = self.scan_message_for_secrets(message["content"])
+                    detected_secrets = await self.async_scan_message_for_secrets(
+                        message["content"]
+                    )
 
                     for secret in detected_secrets:
                         message["content"] = message["content"].replace(
@@ -493,7 +578,9 @@ class _ENTERPRISE_SecretDetection(CustomGuardrail):
 
         if "prompt" in data:
             if isinstance(data["prompt"], str):
-                detected_secrets = self.scan_message_for_secrets(data["prompt"])
+                detected_secrets = await self.async_scan_message_for_secrets(
+                    data["prompt"]
+                )
                 for secret in detected_secrets:
                     data["prompt"] = data["prompt"].replace(
                         secret["value"], "[REDACTED]"
@@ -506,7 +593,9 @@ class _ENTERPRISE_SecretDetection(CustomGuardrail):
             elif isinstance(data["prompt"], list):
                 for item in data["prompt"]:
                     if isinstance(item, str):
-                        detected_secrets = self.scan_message_for_secrets(item)
+                        detected_secrets = await self.async_scan_message_for_secrets(
+                            item
+                        )
                         for secret in detected_secrets:
                             item = item.replace(secret["value"], "[REDACTED]")
                         if len(detected_secrets) > 0:
@@ -519,7 +608,9 @@ class _ENTERPRISE_SecretDetection(CustomGuardrail):
 
         if "input" in data:
             if isinstance(data["input"], str):
-                detected_secrets = self.scan_message_for_secrets(data["input"])
+                detected_secrets = await self.async_scan_message_for_secrets(
+                    data["input"]
+                )
                 for secret in detected_secrets:
                     data["input"] = data["input"].replace(secret["value"], "[REDACTED]")
                 if len(detected_secrets) > 0:
@@ -531,7 +622,9 @@ class _ENTERPRISE_SecretDetection(CustomGuardrail):
                 _input_in_request = data["input"]
                 for idx, item in enumerate(_input_in_request):
                     if isinstance(item, str):
-                        detected_secrets = self.scan_message_for_secrets(item)
+                        detected_secrets = await self.async_scan_message_for_secrets(
+                            item
+                        )
                         for secret in detected_secrets:
                             _input_in_request[idx] = item.replace(
                                 secret["value"], "[REDACTED]"
@@ -0,0 +1,234 @@
+"""
+In-memory secret scanner used by `_ENTERPRISE_SecretDetection`.
+
+Runs the detect-secrets plugins / filters / transformers of a detect_secrets config
+the same way `detect_secrets.core.scan.scan_file` does, without writing the text to
+a temp file:
+    - plugins and filters are loaded once, not on every scan
+    - the plugin regexes (denylists of the regex based plugins, quoted-string regexes
+      of the high entropy plugins) are combined into one prefilter regex, and the
+      plugins / filters only run on the lines it matches - entropy is only computed
+      for the quoted strings on those lines
+    - plugins that are not regex based run on every line, as before
+"""
+
+import io
+import re
+import threading
+from typing import Any, Dict, List, Optional, Pattern
+
+from litellm._logging import verbose_proxy_logger
+
+# detect-secrets scans files, the scanned text is reported under this filename
+SCAN_FILENAME = "message"
+
+_LEADING_GLOBAL_FLAGS = re.compile(r"^\(\?[aiLmsux]+\)")
+_NAMED_GROUP = re.compile(r"\(\?P<[A-Za-z_][A-Za-z0-9_]*>")
+_BACKREFERENCE = re.compile(r"\\[1-9]|\(\?P=")
+_SCOPED_FLAGS = (
+    (re.IGNORECASE, "i"),
+    (re.MULTILINE, "m"),
+    (re.DOTALL, "s"),
+    (re.VERBOSE, "x"),
+)
+
+# `transient_settings` changes detect-secrets' global settings
+_detect_secrets_settings_lock = threading.Lock()
+
+
+class _NamedStringIO(io.StringIO):
+    """The text as the file object detect-secrets' transformers expect."""
+
+    name = SCAN_FILENAME
+
+    def __init__(self, text: str):
+        # newline=None: read back with universal newlines, like the temp file was
+        super().__init__(text, newline=None)
+
+
+def _prefilter_alternative(regex: Pattern) -> Optional[str]:
+    """
+    `regex` as an alternative of the combined prefilter regex: global inline flags
+    become scoped flags and named groups become non-capturing. None if the pattern
+    can't be combined (e.g. backreferences).
+    """
+    pattern = regex.pattern
+    if not isinstance(pattern, str):
+        return None
+    if _BACKREFERENCE.search(pattern):
+        return None
+    while _LEADING_GLOBAL_FLAGS.match(pattern):
+        pattern = _LEADING_GLOBAL_FLAGS.sub("", pattern, count=1)
+    pattern = _NAMED_GROUP.sub("(?:", pattern)
+    flags = "".join(letter for flag, letter in _SCOPED_FLAGS if regex.flags & flag)
+    if regex.flags & re.VERBOSE:
+        pattern += "\n"  # a trailing comment must not swallow the closing paren
+    alternative = f"(?{flags}:{pattern})" if flags else f"(?:{pattern})"
+    try:
+        re.compile(alternative)
+    except re.error:
+        return None
+    return alternative
+
+
+class SecretScanner:
+    """Scans text with the plugins and filters of a detect_secrets config."""
+
+    def __init__(self, detect_secrets_config: Dict[str, Any]):
+        from detect_secrets.core.scan import get_filters_with_parameter
+        from detect_secrets.plugins.base import RegexBasedDetector
+        from detect_secrets.plugins.high_entropy_strings import (
+            HighEntropyStringsPlugin,
+        )
+        from detect_secrets.settings import get_plugins, transient_settings
+
+        self.detect_secrets_config = detect_secrets_config
+        # filters configured via `filters_used` (e.g. regex exclusions) read the
+        # global detect-secrets settings when called, so scans have to run inside
+        # `transient_settings`
+        self.requires_transient_settings = bool(
+            detect_secrets_config.get("filters_used")
+        )
+
+        with transient_settings(detect_secrets_config):
+            self.plugins = list(get_plugins())
+            self.line_filters = get_filters_with_parameter("line")
+            self.secret_filters = get_filters_with_parameter("secret")
+            self.context_filters = get_filters_with_parameter("context")
+
+        alternatives: List[str] = []
+        self.unfused_regexes: List[Pattern] = []
+        self.line_plugins: List[Any] = []
+        for plugin in self.plugins:
+            if isinstance(plugin, RegexBasedDetector):
+                regexes = list(plugin.denylist)
+            elif isinstance(plugin, HighEntropyStringsPlugin):
+                # superset of plugin.regex, which needs a backreference to the quote
+                charset = re.escape(plugin.charset)
+                regexes = [re.compile(rf"['\"][{charset}]+['\"]")]
+            else:
+                self.line_plugins.append(plugin)
+                continue
+            for regex in regexes:
+                alternative = _prefilter_alternative(regex)
+                if alternative is None:
+                    self.unfused_regexes.append(regex)
+                else:
+                    alternatives.append(alternative)
+
+        self.prefilter: Optional[Pattern] = (
+            re.compile("|".join(alternatives)) if alternatives else None
+        )
+        verbose_proxy_logger.debug(
+            "SecretScanner: %s plugins, %s regexes combined, %s not combined, "
+            "%s plugins run on every line",
+            len(self.plugins),
+            len(alternatives),
+            len(self.unfused_regexes),
+            len(self.line_plugins),
+        )
+
+    def _is_candidate_line(self, line: str) -> bool:
+        if self.prefilter is not None and self.prefilter.search(line):
+            return True
+        return any(regex.search(line) for regex in self.unfused_regexes)
+
+    @staticmethod
+    def _is_filtered_out(filters: List[Any], **kwargs: Any) -> bool:
+        from detect_secrets.util.inject import call_function_with_arguments
+
+        for filter_fn in filters:
+            try:
+                if call_function_with_arguments(filter_fn, **kwargs):
+                    return True
+            except TypeError:
+                # same as detect-secrets: skip filters needing other parameters
+                pass
+        return False
+
+    def scan(self, text: str) -> List[Dict[str, str]]:
+        """
+        Return the secrets in `text` as [{"type": ..., "value": ...}], each
+        (type, value) once.
+        """
+        if self.requires_transient_settings:
+            from detect_secrets.settings import transient_settings
+
+            with _detect_secrets_settings_lock, transient_settings(
+                self.detect_secrets_config
+            ):
+                return self._scan(text)
+        return self._scan(text)
+
+    def _scan(self, text: str) -> List[Dict[str, str]]:
+        from detect_secrets.transformers import get_transformed_file
+
+        # same steps as scan_file: the lines, transformed if the text parses as a
+        # config file; then, if nothing was found, the eager transformers' lines
+        file = _NamedStringIO(text)
+        lines = get_transformed_file(file) or file.readlines()
+        detected_secrets = self._scan_lines(lines)
+        if detected_secrets:
+            return detected_secrets
+
+        file.seek(0)
+        lines = get_transformed_file(file, use_eager_transformers=True)
+        if not lines:
+            return []
+        return self._scan_lines(lines)
+
+    def _scan_lines(self, lines: List[str]) -> List[Dict[str, str]]:
+        from detect_secrets.util.code_snippet import get_code_snippet
+        from detect_secrets.util.inject import call_function_with_arguments
+
+        detected_secrets: Dict[tuple, Dict[str, str]] = {}
+        for line_number, raw_line in enumerate(lines, start=1):
+            line = raw_line.rstrip()
+            if self._is_candidate_line(line):
+                plugins = self.plugins
+            elif self.line_plugins:
+                plugins = self.line_plugins
+            else:
+                continue
+
+            context = get_code_snippet(lines=lines, line_number=line_number)
+            if self._is_filtered_out(
+                self.line_filters,
+                filename=SCAN_FILENAME,
+                line=line,
+                context=context,
+            ):
+                continue
+
+            for plugin in plugins:
+                secrets = call_function_with_arguments(
+                    plugin.analyze_line,
+                    filename=SCAN_FILENAME,
+                    line=line,
+                    line_number=line_number,
+                    context=context,
+                )
+                for secret in secrets or ():
+                    value = secret.secret_value
+                    if value is None or (secret.type, value) in detected_secrets:
+                        continue
+                    if self._is_filtered_out(
+                        self.secret_filters,
+                        filename=SCAN_FILENAME,
+                        secret=value,
+                        plugin=plugin,
+                        line=line,
+                    ) or self._is_filtered_out(
+                        self.context_filters,
+                        filename=SCAN_FILENAME,
+                        secret=value,
+                        plugin=plugin,
+                        line=line,
+                        context=context,
+                    ):
+                        continue
+                    detected_secrets[(secret.type, value)] = {
+                        "type": secret.type,
+                        "value": value,
+                    }
+        return list(detected_secrets.values())
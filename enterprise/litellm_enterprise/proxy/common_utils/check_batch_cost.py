@@ -39,11 +39,9 @@ class CheckBatchCost:
             _PROXY_LiteLLMManagedFiles,
         )
 
-        from litellm.batches.batch_utils import (
-            _get_file_content_as_dictionary,
-            calculate_batch_cost_and_usage,
-        )
+        from litellm.batches.batch_utils import calculate_batch_cost_and_usage
         from litellm.litellm_core_utils.get_llm_provider_logic import get_llm_provider
+        from litellm.litellm_core_utils.jsonl_utils import iter_jsonl
         from litellm.litellm_core_utils.litellm_logging import Logging as LiteLLMLogging
         from litellm.proxy.openai_files_endpoints.common_utils import (
             _is_base64_encoded_unified_file_id,
@@ -125,9 +123,8 @@ class CheckBatchCost:
                     model_file_id_mapping=model_file_id_mapping,
                 )
 
-                file_content_as_dict = _get_file_content_as_dictionary(
-                    _file_content.content
-                )
+                # decoded lazily, one output line at a time
+                file_content_as_dict = iter_jsonl(_file_content.content)
 
                 deployment_info = self.llm_router.get_deployment(model_id=model_id)
                 if deployment_info is None:
@@ -38,6 +38,7 @@ from litellm._logging import (
 import re
 from litellm.constants import (
     DEFAULT_BATCH_SIZE,
+    MODEL_COST_MAP_BACKGROUND_REFRESH,
     DEFAULT_FLUSH_INTERVAL_SECONDS,
     ROUTER_MAX_FALLBACKS,
     DEFAULT_MAX_RETRIES,
@@ -308,6 +309,8 @@ cache: Optional["Cache"] = (
 default_in_memory_ttl: Optional[float] = None
 default_redis_ttl: Optional[float] = None
 default_redis_batch_cache_expiry: Optional[float] = None
+default_negative_cache_ttl: Optional[float] = None  # seconds DualCache remembers redis misses
+dual_cache_invalidation_channel: Optional[str] = None  # redis pub/sub channel keeping DualCache L1 coherent across instances
 model_alias_map: Dict[str, str] = {}
 model_group_settings: Optional["ModelGroupSettings"] = None
 max_budget: float = 0.0  # set the max budget across all providers
@@ -391,6 +394,9 @@ disable_aiohttp_trust_env: bool = (
 force_ipv4: bool = (
     False  # when True, litellm will force ipv4 for all LLM requests. Some users have seen httpx ConnectionError when using ipv6.
 )
+http_client_pool_settings: Optional[Dict[str, Dict[str, Any]]] = (
+    None  # per-provider connection limits / keep-alive / http2 for shared httpx clients, "default" applies to all providers. See HTTPClientPoolSettings
+)
 
 #### RETRIES ####
 num_retries: Optional[int] = None  # per model endpoint
@@ -417,9 +423,19 @@ _key_management_system: Optional["KeyManagementSystem"] = None
 #### PII MASKING ####
 output_parse_pii: bool = False
 #############################################
-from litellm.litellm_core_utils.get_model_cost_map import get_model_cost_map
-
-model_cost = get_model_cost_map(url=model_cost_map_url)
+from litellm.litellm_core_utils.get_model_cost_map import (
+    get_model_cost_map,
+    start_model_cost_map_refresh,
+    use_local_model_cost_map,
+)
+from litellm.litellm_core_utils.model_cost_index import load_model_cost_index
+
+_model_cost_provider_models: Optional[Dict[str, List[str]]] = None
+if MODEL_COST_MAP_BACKGROUND_REFRESH or use_local_model_cost_map():
+    # no network on import - the hosted map is fetched in the background below
+    model_cost, _model_cost_provider_models = load_model_cost_index()
+else:
+    model_cost = get_model_cost_map(url=model_cost_map_url)
 cost_discount_config: Dict[str, float] = (
     {}
 )  # Provider-specific cost discounts {"vertex_ai": 0.05} = 5% discount
@@ -596,233 +612,175 @@ def is_openai_finetune_model(key: str) -> bool:
     return key.startswith("ft:") and not key.count(":") > 1
 
 
-def add_known_models():
-    for key, value in model_cost.items():
-        if value.get("litellm_provider") == "openai" and not is_openai_finetune_model(
+# litellm_provider in model_cost -> set its models are added to
+_model_cost_provider_sets: Dict[str, Set] = {
+    "openai": open_ai_chat_completion_models,
+    "text-completion-openai": open_ai_text_completion_models,
+    "azure_text": azure_text_models,
+    "cohere": cohere_models,
+    "cohere_chat": cohere_chat_models,
+    "mistral": mistral_chat_models,
+    "anthropic": anthropic_models,
+    "empower": empower_models,
+    "openrouter": openrouter_models,
+    "vercel_ai_gateway": vercel_ai_gateway_models,
+    "datarobot": datarobot_models,
+    "vertex_ai-text-models": vertex_text_models,
+    "vertex_ai-code-text-models": vertex_code_text_models,
+    "vertex_ai-language-models": vertex_language_models,
+    "vertex_ai-vision-models": vertex_vision_models,
+    "vertex_ai-chat-models": vertex_chat_models,
+    "vertex_ai-code-chat-models": vertex_code_chat_models,
+    "vertex_ai-embedding-models": vertex_embedding_models,
+    "vertex_ai-anthropic_models": vertex_anthropic_models,
+    "vertex_ai-llama_models": vertex_llama3_models,
+    "vertex_ai-deepseek_models": vertex_deepseek_models,
+    "vertex_ai-mistral_models": vertex_mistral_models,
+    "vertex_ai-ai21_models": vertex_ai_ai21_models,
+    "vertex_ai-image-models": vertex_ai_image_models,
+    "vertex_ai-video-models": vertex_ai_video_models,
+    "vertex_ai-openai_models": vertex_openai_models,
+    "vertex_ai-minimax_models": vertex_minimax_models,
+    "vertex_ai-moonshot_models": vertex_moonshot_models,
+    "vertex_ai-zai_models": vertex_zai_models,
+    "nlp_cloud": nlp_cloud_models,
+    "aleph_alpha": aleph_alpha_models,
+    "bedrock": bedrock_models,
+    "bedrock_converse": bedrock_converse_models,
+    "deepinfra": deepinfra_models,
+    "perplexity": perplexity_models,
+    "watsonx": watsonx_models,
+    "gemini": gemini_models,
+    "fireworks_ai": fireworks_ai_models,
+    "fireworks_ai-embedding-models": fireworks_ai_embedding_models,
+    "text-completion-codestral": text_completion_codestral_models,
+    "xai": xai_models,
+    "zai": zai_models,
+    "fal_ai": fal_ai_models,
+    "deepseek": deepseek_models,
+    "runwayml": runwayml_models,
+    "meta_llama": llama_models,
+    "nscale": nscale_models,
+    "azure_ai": azure_ai_models,
+    "voyage": voyage_models,
+    "infinity": infinity_models,
+    "databricks": databricks_models,
+    "cloudflare": cloudflare_models,
+    "codestral": codestral_models,
+    "friendliai": friendliai_models,
+    "palm": palm_models,
+    "groq": groq_models,
+    "azure": azure_models,
+    "azure_anthropic": azure_anthropic_models,
+    "anyscale": anyscale_models,
+    "cerebras": cerebras_models,
+    "galadriel": galadriel_models,
+    "nvidia_nim": nvidia_nim_models,
+    "sambanova": sambanova_models,
+    "sambanova-embedding-models": sambanova_embedding_models,
+    "novita": novita_models,
+    "nebius-chat-models": nebius_models,
+    "nebius-embedding-models": nebius_embedding_models,
+    "aiml": aiml_models,
+    "assemblyai": assemblyai_models,
+    "jina_ai": jina_ai_models,
+    "snowflake": snowflake_models,
+    "gradient_ai": gradient_ai_models,
+    "featherless_ai": featherless_ai_models,
+    "deepgram": deepgram_models,
+    "elevenlabs": elevenlabs_models,
+    "heroku": heroku_models,
+    "dashscope": dashscope_models,
+    "moonshot": moonshot_models,
+    "publicai": publicai_models,
+    "v0": v0_models,
+    "morph": morph_models,
+    "lambda_ai": lambda_ai_models,
+    "hyperbolic": hyperbolic_models,
+    "recraft": recraft_models,
+    "cometapi": cometapi_models,
+    "oci": oci_models,
+    "volcengine": volcengine_models,
+    "wandb": wandb_models,
+    "ovhcloud": ovhcloud_models,
+    "ovhcloud-embedding-models": ovhcloud_embedding_models,
+    "lemonade": lemonade_models,
+    "docker_model_runner": docker_model_runner_models,
+    "amazon_nova": amazon_nova_models,
+    "stability": stability_models,
+    "github_copilot": github_copilot_models,
+    "minimax": minimax_models,
+    "aws_polly": aws_polly_models,
+    "gigachat": gigachat_models,
+    "llamagate": llamagate_models,
+}
+# vertex partner models are added without their "vertex_ai/" prefix
+_vertex_ai_prefixed_model_providers = {
+    "vertex_ai-anthropic_models",
+    "vertex_ai-llama_models",
+    "vertex_ai-deepseek_models",
+    "vertex_ai-mistral_models",
+    "vertex_ai-ai21_models",
+    "vertex_ai-image-models",
+    "vertex_ai-video-models",
+    "vertex_ai-openai_models",
+    "vertex_ai-minimax_models",
+    "vertex_ai-moonshot_models",
+    "vertex_ai-zai_models",
+}
+
+
+def _filter_known_models(provider: str, keys: List[str]) -> List[str]:
+    if provider == "openai":
+        return [key for key in keys if not is_openai_finetune_model(key)]
+    if provider == "bedrock":
+        return [key for key in keys if not is_bedrock_pricing_only_model(key)]
+    if provider in ("fireworks_ai", "fireworks_ai-embedding-models"):
+        # ignore the 'up-to', '-to-' model names -> not real models. just for cost tracking based on model params.
+        return [
             key
-        ):
-            open_ai_chat_completion_models.add(key)
-        elif value.get("litellm_provider") == "text-completion-openai":
-            open_ai_text_completion_models.add(key)
-        elif value.get("litellm_provider") == "azure_text":
-            azure_text_models.add(key)
-        elif value.get("litellm_provider") == "cohere":
-            cohere_models.add(key)
-        elif value.get("litellm_provider") == "cohere_chat":
-            cohere_chat_models.add(key)
-        elif value.get("litellm_provider") == "mistral":
-            mistral_chat_models.add(key)
-        elif value.get("litellm_provider") == "anthropic":
-            anthropic_models.add(key)
-        elif value.get("litellm_provider") == "empower":
-            empower_models.add(key)
-        elif value.get("litellm_provider") == "openrouter":
-            openrouter_models.add(key)
-        elif value.get("litellm_provider") == "vercel_ai_gateway":
-            vercel_ai_gateway_models.add(key)
-        elif value.get("litellm_provider") == "datarobot":
-            datarobot_models.add(key)
-        elif value.get("litellm_provider") == "vertex_ai-text-models":
-            vertex_text_models.add(key)
-        elif value.get("litellm_provider") == "vertex_ai-code-text-models":
-            vertex_code_text_models.add(key)
-        elif value.get("litellm_provider") == "vertex_ai-language-models":
-            vertex_language_models.add(key)
-        elif value.get("litellm_provider") == "vertex_ai-vision-models":
-            vertex_vision_models.add(key)
-        elif value.get("litellm_provider") == "vertex_ai-chat-models":
-            vertex_chat_models.add(key)
-        elif value.get("litellm_provider") == "vertex_ai-code-chat-models":
-            vertex_code_chat_models.add(key)
-        elif value.get("litellm_provider") == "vertex_ai-embedding-models":
-            vertex_embedding_models.add(key)
-        elif value.get("litellm_provider") == "vertex_ai-anthropic_models":
-            key = key.replace("vertex_ai/", "")
-            vertex_anthropic_models.add(key)
-        elif value.get("litellm_provider") == "vertex_ai-llama_models":
-            key = key.replace("vertex_ai/", "")
-            vertex_llama3_models.add(key)
-        elif value.get("litellm_provider") == "vertex_ai-deepseek_models":
-            key = key.replace("vertex_ai/", "")
-            vertex_deepseek_models.add(key)
-        elif value.get("litellm_provider") == "vertex_ai-mistral_models":
-            key = key.replace("vertex_ai/", "")
-            vertex_mistral_models.add(key)
-        elif value.get("litellm_provider") == "vertex_ai-ai21_models":
-            key = key.replace("vertex_ai/", "")
-            vertex_ai_ai21_models.add(key)
-        elif value.get("litellm_provider") == "vertex_ai-image-models":
-            key = key.replace("vertex_ai/", "")
-            vertex_ai_image_models.add(key)
-        elif value.get("litellm_provider") == "vertex_ai-video-models":
-            key = key.replace("vertex_ai/", "")
-            vertex_ai_video_models.add(key)
-        elif value.get("litellm_provider") == "vertex_ai-openai_models":
-            key = key.replace("vertex_ai/", "")
-            vertex_openai_models.add(key)
-        elif value.get("litellm_provider") == "vertex_ai-minimax_models":
-            key = key.replace("vertex_ai/", "")
-            vertex_minimax_models.add(key)
-        elif value.get("litellm_provider") == "vertex_ai-moonshot_models":
-            key = key.replace("vertex_ai/", "")
-            vertex_moonshot_models.add(key)
-        elif value.get("litellm_provider") == "vertex_ai-zai_models":
-            key = key.replace("vertex_ai/", "")
-            vertex_zai_models.add(key)
-        elif value.get("litellm_provider") == "ai21":
-            if value.get("mode") == "chat":
-                ai21_chat_models.add(key)
-            else:
-                ai21_models.add(key)
-        elif value.get("litellm_provider") == "nlp_cloud":
-            nlp_cloud_models.add(key)
-        elif value.get("litellm_provider") == "aleph_alpha":
-            aleph_alpha_models.add(key)
-        elif value.get(
-            "litellm_provider"
-        ) == "bedrock" and not is_bedrock_pricing_only_model(key):
-            bedrock_models.add(key)
-        elif value.get("litellm_provider") == "bedrock_converse":
-            bedrock_converse_models.add(key)
-        elif value.get("litellm_provider") == "deepinfra":
-            deepinfra_models.add(key)
-        elif value.get("litellm_provider") == "perplexity":
-            perplexity_models.add(key)
-        elif value.get("litellm_provider") == "watsonx":
-            watsonx_models.add(key)
-        elif value.get("litellm_provider") == "gemini":
-            gemini_models.add(key)
-        elif value.get("litellm_provider") == "fireworks_ai":
-            # ignore the 'up-to', '-to-' model names -> not real models. just for cost tracking based on model params.
-            if "-to-" not in key and "fireworks-ai-default" not in key:
-                fireworks_ai_models.add(key)
-        elif value.get("litellm_provider") == "fireworks_ai-embedding-models":
-            # ignore the 'up-to', '-to-' model names -> not real models. just for cost tracking based on model params.
-            if "-to-" not in key:
-                fireworks_ai_embedding_models.add(key)
-        elif value.get("litellm_provider") == "text-completion-codestral":
-            text_completion_codestral_models.add(key)
-        elif value.get("litellm_provider") == "xai":
-            xai_models.add(key)
-        elif value.get("litellm_provider") == "zai":
-            zai_models.add(key)
-        elif value.get("litellm_provider") == "fal_ai":
-            fal_ai_models.add(key)
-        elif value.get("litellm_provider") == "deepseek":
-            deepseek_models.add(key)
-        elif value.get("litellm_provider") == "runwayml":
-            runwayml_models.add(key)
-        elif value.get("litellm_provider") == "meta_llama":
-            llama_models.add(key)
-        elif value.get("litellm_provider") == "nscale":
-            nscale_models.add(key)
-        elif value.get("litellm_provider") == "azure_ai":
-            azure_ai_models.add(key)
-        elif value.get("litellm_provider") == "voyage":
-            voyage_models.add(key)
-        elif value.get("litellm_provider") == "infinity":
-            infinity_models.add(key)
-        elif value.get("litellm_provider") == "databricks":
-            databricks_models.add(key)
-        elif value.get("litellm_provider") == "cloudflare":
-            cloudflare_models.add(key)
-        elif value.get("litellm_provider") == "codestral":
-            codestral_models.add(key)
-        elif value.get("litellm_provider") == "friendliai":
-            friendliai_models.add(key)
-        elif value.get("litellm_provider") == "palm":
-            palm_models.add(key)
-        elif value.get("litellm_provider") == "groq":
-            groq_models.add(key)
-        elif value.get("litellm_provider") == "azure":
-            azure_models.add(key)
-        elif value.get("litellm_provider") == "azure_anthropic":
-            azure_anthropic_models.add(key)
-        elif value.get("litellm_provider") == "anyscale":
-            anyscale_models.add(key)
-        elif value.get("litellm_provider") == "cerebras":
-            cerebras_models.add(key)
-        elif value.get("litellm_provider") == "galadriel":
-            galadriel_models.add(key)
-        elif value.get("litellm_provider") == "nvidia_nim":
-            nvidia_nim_models.add(key)
-        elif value.get("litellm_provider") == "sambanova":
-            sambanova_models.add(key)
-        elif value.get("litellm_provider") == "sambanova-embedding-models":
-            sambanova_embedding_models.add(key)
-        elif value.get("litellm_provider") == "novita":
-            novita_models.add(key)
-        elif value.get("litellm_provider") == "nebius-chat-models":
-            nebius_models.add(key)
-        elif value.get("litellm_provider") == "nebius-embedding-models":
-            nebius_embedding_models.add(key)
-        elif value.get("litellm_provider") == "aiml":
-            aiml_models.add(key)
-        elif value.get("litellm_provider") == "assemblyai":
-            assemblyai_models.add(key)
-        elif value.get("litellm_provider") == "jina_ai":
-            jina_ai_models.add(key)
-        elif value.get("litellm_provider") == "snowflake":
-            snowflake_models.add(key)
-        elif value.get("litellm_provider") == "gradient_ai":
-            gradient_ai_models.add(key)
-        elif value.get("litellm_provider") == "featherless_ai":
-            featherless_ai_models.add(key)
-        elif value.get("litellm_provider") == "deepgram":
-            deepgram_models.add(key)
-        elif value.get("litellm_provider") == "elevenlabs":
-            elevenlabs_models.add(key)
-        elif value.get("litellm_provider") == "heroku":
-            heroku_models.add(key)
-        elif value.get("litellm_provider") == "dashscope":
-            dashscope_models.add(key)
-        elif value.get("litellm_provider") == "moonshot":
-            moonshot_models.add(key)
-        elif value.get("litellm_provider") == "publicai":
-            publicai_models.add(key)
-        elif value.get("litellm_provider") == "v0":
-            v0_models.add(key)
-        elif value.get("litellm_provider") == "morph":
-            morph_models.add(key)
-        elif value.get("litellm_provider") == "lambda_ai":
-            lambda_ai_models.add(key)
-        elif value.get("litellm_provider") == "hyperbolic":
-            hyperbolic_models.add(key)
-        elif value.get("litellm_provider") == "recraft":
-            recraft_models.add(key)
-        elif value.get("litellm_provider") == "cometapi":
-            cometapi_models.add(key)
-        elif value.get("litellm_provider") == "oci":
-            oci_models.add(key)
-        elif value.get("litellm_provider") == "volcengine":
-            volcengine_models.add(key)
-        elif value.get("litellm_provider") == "wandb":
-            wandb_models.add(key)
-        elif value.get("litellm_provider") == "ovhcloud":
-            ovhcloud_models.add(key)
-        elif value.get("litellm_provider") == "ovhcloud-embedding-models":
-            ovhcloud_embedding_models.add(key)
-        elif value.get("litellm_provider") == "lemonade":
-            lemonade_models.add(key)
-        elif value.get("litellm_provider") == "docker_model_runner":
-            docker_model_runner_models.add(key)
-        elif value.get("litellm_provider") == "amazon_nova":
-            amazon_nova_models.add(key)
-        elif value.get("litellm_provider") == "stability":
-            stability_models.add(key)
-        elif value.get("litellm_provider") == "github_copilot":
-            github_copilot_models.add(key)
-        elif value.get("litellm_provider") == "minimax":
-            minimax_models.add(key)
-        elif value.get("litellm_provider") == "aws_polly":
-            aws_polly_models.add(key)
-        elif value.get("litellm_provider") == "gigachat":
-            gigachat_models.add(key)
-        elif value.get("litellm_provider") == "llamagate":
-            llamagate_models.add(key)
-
-
-add_known_models()
+            for key in keys
+            if "-to-" not in key
+            and (provider != "fireworks_ai" or "fireworks-ai-default" not in key)
+        ]
+    if provider in _vertex_ai_prefixed_model_providers:
+        return [key.replace("vertex_ai/", "") for key in keys]
+    return keys
+
+
+def add_known_models(
+    model_cost_map: Optional[dict] = None,
+    provider_models: Optional[Dict[str, List[str]]] = None,
+):
+    """
+    Add the models in `model_cost_map` (default: `litellm.model_cost`) to the
+    provider model sets (`litellm.anthropic_models`, ...).
+
+    `provider_models` is the map's keys grouped by `litellm_provider` (prebuilt in
+    the model cost index), computed from `model_cost_map` when not passed.
+    """
+    from litellm.litellm_core_utils.model_cost_index import group_models_by_provider
+
+    if model_cost_map is None:
+        model_cost_map = model_cost
+    if provider_models is None:
+        provider_models = group_models_by_provider(model_cost_map)
+    for provider, keys in provider_models.items():
+        if provider == "ai21":
+            for key in keys:
+                if model_cost_map[key].get("mode") == "chat":
+                    ai21_chat_models.add(key)
+                else:
+                    ai21_models.add(key)
+            continue
+        provider_model_set = _model_cost_provider_sets.get(provider)
+        if provider_model_set is not None:
+            provider_model_set.update(_filter_known_models(provider, keys))
+
+
+add_known_models(provider_models=_model_cost_provider_models)
+if MODEL_COST_MAP_BACKGROUND_REFRESH:
+    start_model_cost_map_refresh(url=model_cost_map_url, loaded_model_cost=model_cost)
 # known openai compatible endpoints - we'll eventually move this list to the model_prices_and_context_window.json dictionary
 
 # this is maintained for Exception Mapping
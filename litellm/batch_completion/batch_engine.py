@@ -0,0 +1,385 @@
+"""
+Async engine behind `litellm.abatch_completion` / `Router.abatch_completion_iter`.
+
+- Each deployment gets a `BatchDeploymentLimiter`: bounded concurrency that is
+  halved on a 429 and grows back by ~1 per round of successes (AIMD), and
+  request starts paced by the deployment's rpm / tpm.
+- Rate limited requests are re-queued instead of failing the batch.
+- Results are yielded as they complete and appended to an optional JSONL
+  checkpoint, so an interrupted job skips finished requests when re-run.
+"""
+
+import asyncio
+import json
+import os
+import time
+from collections import deque
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+
+import litellm
+from litellm._logging import verbose_logger
+from litellm.constants import (
+    DEFAULT_BATCH_COMPLETION_MAX_CONCURRENCY,
+    DEFAULT_BATCH_COMPLETION_RATE_LIMIT_RETRIES,
+)
+from litellm.litellm_core_utils.exception_mapping_utils import _get_response_headers
+
+if TYPE_CHECKING:
+    from litellm.router import Router
+
+BatchCompletionResult = Tuple[Any, int]  # (response or exception, request index)
+
+
+class BatchDeploymentLimiter:
+    """
+    Concurrency and request-rate limits for one deployment during a batch job.
+    """
+
+    def __init__(
+        self,
+        deployment: str,
+        max_concurrency: int = DEFAULT_BATCH_COMPLETION_MAX_CONCURRENCY,
+        rpm: Optional[int] = None,
+        tpm: Optional[int] = None,
+    ):
+        self.deployment = deployment
+        self.max_concurrency = max(1, max_concurrency)
+        self.rpm = rpm
+        self.tpm = tpm
+        self.concurrency_limit: float = float(self.max_concurrency)
+        self.in_flight = 0
+        self.paused_until = 0.0
+        self.next_start = 0.0
+        self.avg_tokens_per_request: Optional[float] = None
+
+    def free_slots(self) -> int:
+        return int(self.concurrency_limit) - self.in_flight
+
+    def start_delay(self, now: float) -> float:
+        """Seconds until the next request may start, ignoring concurrency."""
+        return max(self.paused_until, self.next_start) - now
+
+    def on_start(self, now: float) -> None:
+        self.in_flight += 1
+        self.next_start = max(now, self.next_start) + self._min_start_interval()
+
+    def on_success(self, total_tokens: Optional[int] = None) -> None:
+        self.in_flight -= 1
+        self.concurrency_limit = min(
+            float(self.max_concurrency),
+            self.concurrency_limit + 1 / self.concurrency_limit,
+        )
+        if total_tokens:
+            if self.avg_tokens_per_request is None:
+                self.avg_tokens_per_request = float(total_tokens)
+            else:
+                self.avg_tokens_per_request += (
+                    total_tokens - self.avg_tokens_per_request
+                ) * 0.1
+
+    def on_rate_limit(self, retry_after: float, now: float) -> None:
+        self.in_flight -= 1
+        self.concurrency_limit = max(1.0, self.concurrency_limit / 2)
+        self.paused_until = max(self.paused_until, now + retry_after)
+
+    def on_failure(self) -> None:
+        self.in_flight -= 1
+
+    def _min_start_interval(self) -> float:
+        requests_per_minute: Optional[float] = self.rpm
+        if self.tpm and self.avg_tokens_per_request:
+            tpm_requests = self.tpm / self.avg_tokens_per_request
+            if requests_per_minute is None or tpm_requests < requests_per_minute:
+                requests_per_minute = tpm_requests
+        if not requests_per_minute:
+            return 0.0
+        return 60.0 / requests_per_minute
+
+
+class BatchCompletionCheckpoint:
+    """
+    Append-only JSONL record of finished requests.
+
+    One line per request: `{"index": 0, "response": {...}}` on success,
+    `{"index": 0, "error": "..."}` on failure. Only successful requests are
+    skipped on resume; failed ones are retried.
+    """
+
+    def __init__(self, path: Union[str, os.PathLike]):
+        self.path = path
+        self._file: Optional[Any] = None
+
+    def load_completed_indices(self) -> Set[int]:
+        """
+        Read finished requests and drop a partially written last line, left
+        behind if the previous run crashed mid-write.
+        """
+        completed: Set[int] = set()
+        if not os.path.exists(self.path):
+            return completed
+        with open(self.path, "rb+") as f:
+            valid_until = 0
+            for line in iter(f.readline, b""):
+                if not line.endswith(b"\n"):
+                    break
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    break
+                valid_until = f.tell()
+                if "response" in record:
+                    completed.add(record["index"])
+            if valid_until != f.seek(0, os.SEEK_END):
+                verbose_logger.warning(
+                    "batch completion checkpoint %s: dropping incomplete records after byte %s",
+                    self.path,
+                    valid_until,
+                )
+                f.truncate(valid_until)
+        return completed
+
+    def write(self, index: int, result: Any) -> None:
+        if self._file is None:
+            self._file = open(self.path, "a", encoding="utf-8")
+        if isinstance(result, Exception):
+            record: Dict[str, Any] = {"index": index, "error": str(result)}
+        else:
+            record = {"index": index, "response": _to_jsonable(result)}
+        # one write per record, so a crash can only truncate the last line
+        self._file.write(json.dumps(record, default=str) + "\n")
+        self._file.flush()
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+def _to_jsonable(response: Any) -> Any:
+    if hasattr(response, "model_dump"):
+        return response.model_dump()
+    return response
+
+
+def _get_total_tokens(response: Any) -> Optional[int]:
+    usage = getattr(response, "usage", None)
+    return getattr(usage, "total_tokens", None)
+
+
+def _get_rate_limit_retry_after(
+    exception: Exception, attempt: int, max_retries: int
+) -> float:
+    from litellm.utils import _calculate_retry_after
+
+    return _calculate_retry_after(
+        remaining_retries=max_retries - attempt,
+        max_retries=max_retries,
+        response_headers=_get_response_headers(exception),
+    )
+
+
+def _get_deployment_limit(deployment: dict, key: str) -> Optional[int]:
+    """Same lookup order the router uses: deployment, litellm_params, model_info."""
+    for source in (
+        deployment,
+        deployment.get("litellm_params") or {},
+        deployment.get("model_info") or {},
+    ):
+        value = source.get(key)
+        if value is not None:
+            return int(value)
+    return None
+
+
+def get_router_deployment_limiters(
+    router: "Router",
+    model: str,
+    max_concurrency: int = DEFAULT_BATCH_COMPLETION_MAX_CONCURRENCY,
+) -> List[BatchDeploymentLimiter]:
+    """
+    One limiter per deployment in the model group, using the deployment's
+    configured rpm / tpm.
+    """
+    deployments = router.get_model_list(model_name=model) or []
+    limiters = [
+        BatchDeploymentLimiter(
+            deployment=deployment["model_info"]["id"],
+            max_concurrency=max_concurrency,
+            rpm=_get_deployment_limit(deployment, "rpm"),  # type: ignore
+            tpm=_get_deployment_limit(deployment, "tpm"),  # type: ignore
+        )
+        for deployment in deployments
+        if (deployment.get("model_info") or {}).get("id")
+    ]
+    if not limiters:
+        raise ValueError(f"No deployments found for model={model} on the router")
+    return limiters
+
+
+def _pick_limiter(
+    limiters: List[BatchDeploymentLimiter], now: float
+) -> Tuple[Optional[BatchDeploymentLimiter], float]:
+    """
+    Deployment that can start a request soonest, preferring the one with the
+    most free slots. Returns (None, 0) if every deployment is at capacity.
+    """
+    best: Optional[BatchDeploymentLimiter] = None
+    best_key: Tuple[float, int] = (0.0, 0)
+    for limiter in limiters:
+        free_slots = limiter.free_slots()
+        if free_slots <= 0:
+            continue
+        key = (max(0.0, limiter.start_delay(now)), -free_slots)
+        if best is None or key < best_key:
+            best, best_key = limiter, key
+    return best, best_key[0]
+
+
+def _start_requests(
+    limiters: List[BatchDeploymentLimiter],
+    running: Dict[asyncio.Task, Tuple[int, List, int, BatchDeploymentLimiter]],
+    next_request: Optional[Tuple[int, List, int]],
+    get_next_request: Callable[[], Optional[Tuple[int, List, int]]],
+    completion_fn: Callable[[str, List], Awaitable[Any]],
+) -> Tuple[Optional[Tuple[int, List, int]], Optional[float]]:
+    """
+    Start requests until every deployment is at capacity or has to wait.
+    Returns (first request not started, seconds until a deployment can start it).
+    """
+    now = time.monotonic()
+    while next_request is not None:
+        limiter, delay = _pick_limiter(limiters, now)
+        if limiter is None:
+            return next_request, None
+        if delay > 0:
+            return next_request, delay
+        idx, request_messages, attempt = next_request
+        limiter.on_start(now)
+        task = asyncio.create_task(
+            completion_fn(limiter.deployment, request_messages)  # type: ignore
+        )
+        running[task] = (idx, request_messages, attempt, limiter)
+        next_request = get_next_request()
+    return None, None
+
+
+def _finish_task(
+    task: asyncio.Task,
+    idx: int,
+    attempt: int,
+    limiter: BatchDeploymentLimiter,
+    max_rate_limit_retries: int,
+) -> Tuple[Any, bool]:
+    """
+    Record a finished request on its deployment's limiter.
+    Returns (response_or_exception, whether the request should be retried).
+    """
+    exception = task.exception()
+    if exception is None:
+        response = task.result()
+        limiter.on_success(_get_total_tokens(response))
+        return response, False
+    if (
+        isinstance(exception, litellm.RateLimitError)
+        and attempt < max_rate_limit_retries
+    ):
+        retry_after = _get_rate_limit_retry_after(
+            exception, attempt, max_rate_limit_retries
+        )
+        verbose_logger.debug(
+            "batch completion: deployment %s rate limited, retrying request %s in %.2fs",
+            limiter.deployment,
+            idx,
+            retry_after,
+        )
+        limiter.on_rate_limit(retry_after, time.monotonic())
+        return exception, True
+    limiter.on_failure()
+    return exception, False
+
+
+async def run_batch_completion(
+    messages: Iterable[List],
+    limiters: List[BatchDeploymentLimiter],
+    completion_fn: Callable[[str, List], Awaitable[Any]],
+    checkpoint_file: Optional[Union[str, os.PathLike]] = None,
+    max_rate_limit_retries: int = DEFAULT_BATCH_COMPLETION_RATE_LIMIT_RETRIES,
+) -> AsyncIterator[BatchCompletionResult]:
+    """
+    Run `completion_fn(deployment, messages)` for every request in `messages`
+    and yield `(response_or_exception, index)` in completion order.
+
+    `messages` is consumed lazily, so it can be a generator over a large input.
+    """
+    checkpoint = (
+        BatchCompletionCheckpoint(checkpoint_file)
+        if checkpoint_file is not None
+        else None
+    )
+    completed = checkpoint.load_completed_indices() if checkpoint else set()
+    requests = (
+        (idx, request_messages, 0)
+        for idx, request_messages in enumerate(messages)
+        if idx not in completed
+    )
+    retries: Deque[Tuple[int, List, int]] = deque()
+    running: Dict[asyncio.Task, Tuple[int, List, int, BatchDeploymentLimiter]] = {}
+    requests_exhausted = False
+
+    def _next_request() -> Optional[Tuple[int, List, int]]:
+        nonlocal requests_exhausted
+        if retries:
+            return retries.popleft()
+        if requests_exhausted:
+            return None
+        request = next(requests, None)
+        if request is None:
+            requests_exhausted = True
+        return request
+
+    try:
+        next_request = _next_request()
+        while next_request is not None or running:
+            next_request, wait_timeout = _start_requests(
+                limiters, running, next_request, _next_request, completion_fn
+            )
+
+            if not running:
+                await asyncio.sleep(wait_timeout or 0)
+                continue
+
+            done, _ = await asyncio.wait(
+                running, timeout=wait_timeout, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                idx, request_messages, attempt, limiter = running.pop(task)
+                result, should_retry = _finish_task(
+                    task, idx, attempt, limiter, max_rate_limit_retries
+                )
+                if should_retry:
+                    if next_request is not None:
+                        retries.appendleft(next_request)
+                    next_request = (idx, request_messages, attempt + 1)
+                    continue
+                if checkpoint is not None:
+                    checkpoint.write(idx, result)
+                yield result, idx
+    finally:
+        for task in running:
+            task.cancel()
+        if checkpoint is not None:
+            checkpoint.close()
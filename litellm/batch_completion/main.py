@@ -1,12 +1,26 @@
+import os
 from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
-from typing import List, Optional
+from typing import TYPE_CHECKING, AsyncIterator, Iterable, List, Optional, Union
 
 import litellm
 from litellm._logging import print_verbose
+from litellm.batch_completion.batch_engine import (
+    BatchCompletionResult,
+    BatchDeploymentLimiter,
+    get_router_deployment_limiters,
+    run_batch_completion,
+)
+from litellm.constants import (
+    DEFAULT_BATCH_COMPLETION_MAX_CONCURRENCY,
+    DEFAULT_BATCH_COMPLETION_RATE_LIMIT_RETRIES,
+)
 from litellm.utils import get_optional_params
 
 from ..llms.vllm.completion import handler as vllm_handler
 
+if TYPE_CHECKING:
+    from litellm.router import Router
+
 
 def batch_completion(
     model: str,
@@ -124,6 +138,81 @@ def batch_completion(
     return results
 
 
+async def abatch_completion(
+    model: str,
+    messages: Iterable[List],
+    max_concurrency: int = DEFAULT_BATCH_COMPLETION_MAX_CONCURRENCY,
+    checkpoint_file: Optional[Union[str, os.PathLike]] = None,
+    max_rate_limit_retries: int = DEFAULT_BATCH_COMPLETION_RATE_LIMIT_RETRIES,
+    rpm: Optional[int] = None,
+    tpm: Optional[int] = None,
+    router: Optional["Router"] = None,
+    **kwargs,
+) -> AsyncIterator[BatchCompletionResult]:
+    """
+    Async batch litellm.acompletion for a given model. Yields results as they complete.
+
+    Args:
+        model (str): The model to use. With `router`, the model group name.
+        messages (Iterable[List]): One list of messages per request. Consumed lazily, so it can be a generator.
+        max_concurrency (int, optional): Maximum in-flight requests per deployment. Halved on each rate limit error and grown back on success.
+        checkpoint_file (str, optional): JSONL file to append results to. Requests already completed in this file are skipped, so a crashed job can be re-run with the same arguments.
+        max_rate_limit_retries (int, optional): How many times a rate limited request is re-queued before its error is returned.
+        rpm (int, optional): Requests per minute to pace requests at. With `router`, each deployment's configured rpm is used.
+        tpm (int, optional): Tokens per minute to pace requests at, based on the average usage of completed requests. With `router`, each deployment's configured tpm is used.
+        router (Router, optional): Spread requests across the deployments of `model` on this router.
+        **kwargs: Passed through to `acompletion`.
+
+    Yields:
+        tuple: `(response, idx)` where `response` is the ModelResponse or the exception raised for `messages[idx]`.
+        Requests completed in a previous run are not yielded again, they are in `checkpoint_file`.
+
+    Example:
+        ```
+        async for response, idx in litellm.abatch_completion(
+            model="gpt-4o-mini",
+            messages=([{"role": "user", "content": prompt}] for prompt in prompts),
+            checkpoint_file="batch_results.jsonl",
+        ):
+            ...
+        ```
+    """
+    if kwargs.get("stream"):
+        raise ValueError("abatch_completion does not support stream=True")
+
+    if router is not None:
+        limiters = get_router_deployment_limiters(
+            router=router, model=model, max_concurrency=max_concurrency
+        )
+
+        async def _completion(deployment_id: str, request_messages: List):
+            # call the deployment the limiter picked, by model id
+            return await router.acompletion(
+                model=deployment_id, messages=request_messages, **kwargs
+            )
+
+    else:
+        limiters = [
+            BatchDeploymentLimiter(
+                deployment=model, max_concurrency=max_concurrency, rpm=rpm, tpm=tpm
+            )
+        ]
+
+        async def _completion(deployment_id: str, request_messages: List):
+            return await litellm.acompletion(
+                model=deployment_id, messages=request_messages, **kwargs
+            )
+
+    async for result in run_batch_completion(
+        messages=messages,
+        limiters=limiters,
+        completion_fn=_completion,
+        checkpoint_file=checkpoint_file,
+        max_rate_limit_retries=max_rate_limit_retries,
+    ):
+        yield result
+
+
 # send one request to multiple models
 # return as soon as one of the llms responds
 def batch_completion_models(*args, **kwargs):
@@ -1,38 +1,45 @@
-import json
 import time
-from typing import Any, List, Literal, Optional, Tuple
+from typing import (
+    Any,
+    AsyncIterator,
+    Iterable,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+)
 
 import httpx
 
 import litellm
 from litellm._logging import verbose_logger
 from litellm._uuid import uuid
+from litellm.litellm_core_utils.jsonl_utils import aiter_jsonl, iter_jsonl
 from litellm.types.llms.openai import Batch
 from litellm.types.utils import CallTypes, ModelResponse, Usage
 from litellm.utils import token_counter
 
+# providers whose file content is fetched with the openai sdk - it returns the
+# response unread when asked to stream it, so the output file isn't buffered
+_STREAMING_FILE_CONTENT_PROVIDERS = {"openai", "azure", "hosted_vllm"}
+_STREAM_FILE_CONTENT_HEADERS = {"X-Stainless-Raw-Response": "stream"}
+
 
 async def calculate_batch_cost_and_usage(
-    file_content_dictionary: List[dict],
+    file_content_dictionary: Iterable[dict],
     custom_llm_provider: Literal["openai", "azure", "vertex_ai", "hosted_vllm", "anthropic"],
     model_name: Optional[str] = None,
 ) -> Tuple[float, Usage, List[str]]:
     """
     Calculate the cost and usage of a batch
+
+    `file_content_dictionary` is consumed once, so it can be a generator (e.g. `iter_jsonl`)
     """
-    batch_cost = _batch_cost_calculator(
-        custom_llm_provider=custom_llm_provider,
-        file_content_dictionary=file_content_dictionary,
-        model_name=model_name,
-    )
-    batch_usage = _get_batch_job_total_usage_from_file_content(
+    return _get_batch_cost_usage_and_models_from_file_content(
         file_content_dictionary=file_content_dictionary,
         custom_llm_provider=custom_llm_provider,
         model_name=model_name,
     )
-    batch_models = _get_batch_models_from_file_content(file_content_dictionary, model_name)
-
-    return batch_cost, batch_usage, batch_models
 
 
 async def _handle_completed_batch(
@@ -41,30 +48,84 @@ async def _handle_completed_batch(
     model_name: Optional[str] = None,
 ) -> Tuple[float, Usage, List[str]]:
     """Helper function to process a completed batch and handle logging"""
-    # Get batch results
-    file_content_dictionary = await _get_batch_output_file_content_as_dictionary(
-        batch, custom_llm_provider
-    )
+    batch_cost_and_usage = _BatchCostAndUsage(custom_llm_provider, model_name)
+    # Batch results are streamed from the provider and decoded one line at a time
+    async for _item in _aiter_batch_output_file_content(batch, custom_llm_provider):
+        batch_cost_and_usage.add(_item)
+    return batch_cost_and_usage.result()
+
+
+class _BatchCostAndUsage:
+    """Running cost, usage and models of the records of a batch output file"""
+
+    def __init__(
+        self,
+        custom_llm_provider: Literal["openai", "azure", "vertex_ai", "hosted_vllm", "anthropic"],
+        model_name: Optional[str] = None,
+    ):
+        self.custom_llm_provider = custom_llm_provider
+        self.model_name = model_name
+        self.total_cost: float = 0.0
+        self.total_tokens: int = 0
+        self.prompt_tokens: int = 0
+        self.completion_tokens: int = 0
+        self.batch_models: List[str] = []
+
+    def add(self, _item: dict) -> None:
+        if not _batch_response_was_successful(_item):
+            return
+        _response_body = _get_response_from_batch_job_output_file(_item)
+        self.total_cost += litellm.completion_cost(
+            completion_response=_response_body,
+            custom_llm_provider=self.custom_llm_provider,
+            call_type=CallTypes.aretrieve_batch.value,
+        )
+        usage: Usage = _get_batch_job_usage_from_response_body(_response_body)
+        self.total_tokens += usage.total_tokens
+        self.prompt_tokens += usage.prompt_tokens
+        self.completion_tokens += usage.completion_tokens
+        if not self.model_name:
+            _model = _response_body.get("model")
+            if _model:
+                self.batch_models.append(_model)
+
+    def result(self) -> Tuple[float, Usage, List[str]]:
+        verbose_logger.debug("total_cost=%s", self.total_cost)
+        return (
+            self.total_cost,
+            Usage(
+                total_tokens=self.total_tokens,
+                prompt_tokens=self.prompt_tokens,
+                completion_tokens=self.completion_tokens,
+            ),
+            [self.model_name] if self.model_name else self.batch_models,
+        )
 
-    # Calculate costs and usage
-    batch_cost = _batch_cost_calculator(
-        custom_llm_provider=custom_llm_provider,
-        file_content_dictionary=file_content_dictionary,
-        model_name=model_name,
-    )
-    batch_usage = _get_batch_job_total_usage_from_file_content(
-        file_content_dictionary=file_content_dictionary,
-        custom_llm_provider=custom_llm_provider,
-        model_name=model_name,
-    )
 
-    batch_models = _get_batch_models_from_file_content(file_content_dictionary, model_name)
+def _get_batch_cost_usage_and_models_from_file_content(
+    file_content_dictionary: Iterable[dict],
+    custom_llm_provider: Literal["openai", "azure", "vertex_ai", "hosted_vllm", "anthropic"] = "openai",
+    model_name: Optional[str] = None,
+) -> Tuple[float, Usage, List[str]]:
+    """
+    Get the cost, usage and models of a batch job in a single pass over the file content
+    """
+    # Handle Vertex AI with specialized method
+    if custom_llm_provider == "vertex_ai" and model_name:
+        batch_cost, batch_usage = calculate_vertex_ai_batch_cost_and_usage(
+            file_content_dictionary, model_name
+        )
+        verbose_logger.debug("vertex_ai_total_cost=%s", batch_cost)
+        return batch_cost, batch_usage, [model_name]
 
-    return batch_cost, batch_usage, batch_models
+    batch_cost_and_usage = _BatchCostAndUsage(custom_llm_provider, model_name)
+    for _item in file_content_dictionary:
+        batch_cost_and_usage.add(_item)
+    return batch_cost_and_usage.result()
 
 
 def _get_batch_models_from_file_content(
-    file_content_dictionary: List[dict],
+    file_content_dictionary: Iterable[dict],
     model_name: Optional[str] = None,
 ) -> List[str]:
     """
@@ -83,7 +144,7 @@ def _get_batch_models_from_file_content(
 
 
 def _batch_cost_calculator(
-    file_content_dictionary: List[dict],
+    file_content_dictionary: Iterable[dict],
     custom_llm_provider: Literal["openai", "azure", "vertex_ai", "hosted_vllm", "anthropic"] = "openai",
     model_name: Optional[str] = None,
 ) -> float:
@@ -106,7 +167,7 @@ def _batch_cost_calculator(
 
 
 def calculate_vertex_ai_batch_cost_and_usage(
-    vertex_ai_batch_responses: List[dict],
+    vertex_ai_batch_responses: Iterable[dict],
     model_name: Optional[str] = None,
 ) -> Tuple[float, Usage]:
     """
@@ -184,12 +245,12 @@ def calculate_vertex_ai_batch_cost_and_usage(
     )
 
 
-async def _get_batch_output_file_content_as_dictionary(
+async def _aiter_batch_output_file_content(
     batch: Batch,
     custom_llm_provider: Literal["openai", "azure", "vertex_ai", "hosted_vllm", "anthropic"] = "openai",
-) -> List[dict]:
+) -> AsyncIterator[dict]:
     """
-    Get the batch output file content as a list of dictionaries
+    Stream the batch output file, yielding its records one at a time
     """
     from litellm.files.main import afile_content
 
@@ -202,29 +263,30 @@ async def _get_batch_output_file_content_as_dictionary(
     _file_content = await afile_content(
         file_id=batch.output_file_id,
         custom_llm_provider=custom_llm_provider,
+        extra_headers=(
+            _STREAM_FILE_CONTENT_HEADERS
+            if custom_llm_provider in _STREAMING_FILE_CONTENT_PROVIDERS
+            else None
+        ),
     )
-    return _get_file_content_as_dictionary(_file_content.content)
+    try:
+        async for _item in aiter_jsonl(await _file_content.aiter_bytes()):
+            yield _item
+    finally:
+        await _file_content.aclose()
 
 
 def _get_file_content_as_dictionary(file_content: bytes) -> List[dict]:
     """
     Get the file content as a list of dictionaries from JSON Lines format
+
+    Prefer `iter_jsonl(file_content)` when the records only need to be read once
     """
-    try:
-        _file_content_str = file_content.decode("utf-8")
-        # Split by newlines and parse each line as a separate JSON object
-        json_objects = []
-        for line in _file_content_str.strip().split("\n"):
-            if line:  # Skip empty lines
-                json_objects.append(json.loads(line))
-        verbose_logger.debug("json_objects=%s", json.dumps(json_objects, indent=4))
-        return json_objects
-    except Exception as e:
-        raise e
+    return list(iter_jsonl(file_content))
 
 
 def _get_batch_job_cost_from_file_content(
-    file_content_dictionary: List[dict],
+    file_content_dictionary: Iterable[dict],
     custom_llm_provider: Literal["openai", "azure", "vertex_ai", "hosted_vllm", "anthropic"] = "openai",
 ) -> float:
     """
@@ -232,10 +294,6 @@ def _get_batch_job_cost_from_file_content(
     """
     try:
         total_cost: float = 0.0
-        # parse the file content as json
-        verbose_logger.debug(
-            "file_content_dictionary=%s", json.dumps(file_content_dictionary, indent=4)
-        )
         for _item in file_content_dictionary:
             if _batch_response_was_successful(_item):
                 _response_body = _get_response_from_batch_job_output_file(_item)
@@ -252,7 +310,7 @@ def _get_batch_job_cost_from_file_content(
 
 
 def _get_batch_job_total_usage_from_file_content(
-    file_content_dictionary: List[dict],
+    file_content_dictionary: Iterable[dict],
     custom_llm_provider: Literal["openai", "azure", "vertex_ai", "hosted_vllm", "anthropic"] = "openai",
     model_name: Optional[str] = None,
 ) -> Usage:
@@ -282,7 +340,7 @@ def _get_batch_job_total_usage_from_file_content(
     )
 
 def _get_batch_job_input_file_usage(
-    file_content_dictionary: List[dict],
+    file_content_dictionary: Iterable[dict],
     custom_llm_provider: Literal["openai", "azure", "vertex_ai"] = "openai",
     model_name: Optional[str] = None,
 ) -> Usage:
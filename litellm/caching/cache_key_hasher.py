@@ -0,0 +1,100 @@
+"""
+Incremental, canonical hashing of request params for cache keys.
+
+Instead of building one large string out of every param and hashing it, the
+request structure is walked and a type-tagged, order-stable byte encoding is
+fed straight into a SHA-256 digest:
+
+    - dict keys are sorted, so key order never changes the cache key
+    - every value is tagged with its type and length, so "1" != 1 and
+      ["ab"] != ["a", "b"]
+    - strings / bytes larger than CACHE_KEY_LARGE_VALUE_THRESHOLD (long prompts,
+      base64 images) are encoded as their own digest, hashed straight from the
+      value - nothing is retained between requests
+"""
+
+import hashlib
+from typing import Any, Callable
+
+from pydantic import BaseModel
+
+from litellm.constants import CACHE_KEY_LARGE_VALUE_THRESHOLD
+
+# bump when the encoding changes, so old and new keys never collide
+CACHE_KEY_ENCODING_VERSION = b"litellm-cache-key-v1"
+
+
+def _update_with_value(update: Callable[[bytes], None], value: Any) -> None:
+    """
+    Feed the canonical encoding of value into update()
+    """
+    if value is None:
+        update(b"N")
+    elif value is True:
+        update(b"T")
+    elif value is False:
+        update(b"F")
+    elif isinstance(value, str):
+        if len(value) >= CACHE_KEY_LARGE_VALUE_THRESHOLD:
+            update(b"H")
+            update(hashlib.sha256(value.encode("utf-8", "surrogatepass")).digest())
+        else:
+            encoded = value.encode("utf-8", "surrogatepass")
+            update(b"s%d:" % len(encoded))
+            update(encoded)
+    elif isinstance(value, int):
+        update(b"i%d;" % value)
+    elif isinstance(value, float):
+        update(b"f" + repr(value).encode() + b";")
+    elif isinstance(value, dict):
+        update(b"d%d:" % len(value))
+        try:
+            keys = sorted(value)
+        except TypeError:  # mixed key types
+            keys = sorted(value, key=repr)
+        for key in keys:
+            _update_with_value(update, key)
+            _update_with_value(update, value[key])
+    elif isinstance(value, (list, tuple)):
+        update(b"l%d:" % len(value))
+        for item in value:
+            _update_with_value(update, item)
+    elif isinstance(value, (bytes, bytearray)):
+        if len(value) >= CACHE_KEY_LARGE_VALUE_THRESHOLD and isinstance(value, bytes):
+            update(b"H")
+            update(hashlib.sha256(value).digest())
+        else:
+            update(b"b%d:" % len(value))
+            update(bytes(value))
+    elif isinstance(value, BaseModel):
+        update(b"m")
+        _update_with_value(update, value.model_dump())
+    elif isinstance(value, (set, frozenset)):
+        update(b"e%d:" % len(value))
+        for item in sorted(repr(item) for item in value):
+            _update_with_value(update, item)
+    else:
+        _update_with_value(update, str(value))
+
+
+class CacheKeyHasher:
+    """
+    Builds a cache key by streaming (param, value) pairs into a SHA-256 digest.
+
+    Usage:
+        hasher = CacheKeyHasher()
+        hasher.update_param("model", "gpt-4o")
+        hasher.update_param("messages", messages)
+        cache_key = hasher.hexdigest()
+    """
+
+    def __init__(self):
+        self._hash = hashlib.sha256(CACHE_KEY_ENCODING_VERSION)
+
+    def update_param(self, param: str, value: Any) -> None:
+        update = self._hash.update
+        _update_with_value(update, param)
+        _update_with_value(update, value)
+
+    def hexdigest(self) -> str:
+        return self._hash.hexdigest()
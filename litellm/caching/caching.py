@@ -26,6 +26,7 @@ from litellm.types.utils import EmbeddingResponse, all_litellm_params
 
 from .azure_blob_cache import AzureBlobCache
 from .base_cache import BaseCache
+from .cache_key_hasher import CacheKeyHasher
 from .disk_cache import DiskCache
 from .dual_cache import DualCache  # noqa
 from .gcs_cache import GCSCache
@@ -108,6 +109,8 @@ class Cache:
         qdrant_collection_name: Optional[str] = None,
         qdrant_quantization_config: Optional[str] = None,
         qdrant_semantic_cache_embedding_model: str = "text-embedding-ada-002",
+        semantic_cache_local_index_size: Optional[int] = None,
+        semantic_cache_local_index_path: Optional[str] = None,
         # GCP IAM authentication parameters
         gcp_service_account: Optional[str] = None,
         gcp_ssl_ca_certs: Optional[str] = None,
@@ -127,6 +130,9 @@ class Cache:
             ttl (float, optional): The ttl for the Redis cache
             redis_flush_size (int, optional): The number of keys to flush at a time. Defaults to 1000. Only used if batch redis set caching is used.
             redis_startup_nodes (list, optional): The list of startup nodes for the Redis cache. Defaults to None.
+            serializer (str, optional): How values are stored in Redis, "json" or "msgpack" (requires msgpack). Defaults to REDIS_CACHE_SERIALIZER ("json").
+            compression (str, optional): "zstd" to compress large values (requires zstandard). Defaults to REDIS_CACHE_COMPRESSION (no compression).
+            compression_min_bytes (int, optional): Values smaller than this are stored uncompressed. Defaults to REDIS_CACHE_COMPRESSION_MIN_BYTES.
 
             # Qdrant Cache Args
             qdrant_api_base (str, optional): The url for your qdrant cluster. Required if type is "qdrant-semantic".
@@ -134,6 +140,10 @@ class Cache:
             qdrant_collection_name (str, optional): The name for your qdrant collection. Required if type is "qdrant-semantic".
             similarity_threshold (float, optional): The similarity threshold for semantic-caching, Required if type is "redis-semantic" or "qdrant-semantic".
 
+            # Semantic Cache Args
+            semantic_cache_local_index_size (int, optional): Number of recently cached prompts answered in-process before querying redis/qdrant. Defaults to SEMANTIC_CACHE_LOCAL_INDEX_SIZE, 0 disables.
+            semantic_cache_local_index_path (str, optional): File to memory-map the local index vectors into (requires numpy). Each index uses its own file next to this path. Defaults to None.
+
             # Disk Cache Args
             disk_cache_dir (str, optional): The directory for the disk cache. Defaults to None.
 
@@ -197,6 +207,8 @@ class Cache:
                 similarity_threshold=similarity_threshold,
                 embedding_model=redis_semantic_cache_embedding_model,
                 index_name=redis_semantic_cache_index_name,
+                local_index_size=semantic_cache_local_index_size,
+                local_index_path=semantic_cache_local_index_path,
                 **kwargs,
             )
         elif type == LiteLLMCacheType.QDRANT_SEMANTIC:
@@ -207,6 +219,8 @@ class Cache:
                 similarity_threshold=similarity_threshold,
                 quantization_config=qdrant_quantization_config,
                 embedding_model=qdrant_semantic_cache_embedding_model,
+                local_index_size=semantic_cache_local_index_size,
+                local_index_path=semantic_cache_local_index_path,
             )
         elif type == LiteLLMCacheType.LOCAL:
             self.cache = InMemoryCache()
@@ -273,7 +287,6 @@ class Cache:
         Returns:
             str: The cache key generated from the arguments, or None if no cache key could be generated.
         """
-        cache_key = ""
         # verbose_logger.debug("\nGetting Cache key. Kwargs: %s", kwargs)
 
         preset_cache_key = self._get_preset_cache_key_from_kwargs(**kwargs)
@@ -281,13 +294,15 @@ class Cache:
             verbose_logger.debug("\nReturning preset cache key: %s", preset_cache_key)
             return preset_cache_key
 
+        # params are hashed in sorted order, so kwarg order never changes the key
+        hasher = CacheKeyHasher()
         combined_kwargs = ModelParamHelper._get_all_llm_api_params()
         litellm_param_kwargs = all_litellm_params
-        for param in kwargs:
+        for param in sorted(kwargs):
             if param in combined_kwargs:
-                param_value: Optional[str] = self._get_param_value(param, kwargs)
+                param_value: Optional[Any] = self._get_param_value(param, kwargs)
                 if param_value is not None:
-                    cache_key += f"{str(param)}: {str(param_value)}"
+                    hasher.update_param(param, param_value)
             elif (
                 param not in litellm_param_kwargs
             ):  # check if user passed in optional param - e.g. top_k
@@ -296,11 +311,10 @@ class Cache:
                 ):  # feature flagged for now
                     if kwargs[param] is None:
                         continue  # ignore None params
-                    param_value = kwargs[param]
-                    cache_key += f"{str(param)}: {str(param_value)}"
+                    hasher.update_param(param, kwargs[param])
 
-        verbose_logger.debug("\nCreated cache key: %s", cache_key)
-        hashed_cache_key = Cache._get_hashed_cache_key(cache_key)
+        hashed_cache_key = hasher.hexdigest()
+        verbose_logger.debug("Hashed cache key (SHA-256): %s", hashed_cache_key)
         hashed_cache_key = self._add_namespace_to_cache_key(hashed_cache_key, **kwargs)
         self._set_preset_cache_key_in_kwargs(
             preset_cache_key=hashed_cache_key, **kwargs
@@ -311,7 +325,7 @@ class Cache:
         self,
         param: str,
         kwargs: dict,
-    ) -> Optional[str]:
+    ) -> Optional[Any]:
         """
         Get the value for the given param from kwargs
         """
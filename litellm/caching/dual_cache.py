@@ -6,20 +6,34 @@ Has 4 primary methods:
     - get_cache
     - async_set_cache
     - async_get_cache
+
+Read path:
+    - concurrent async_get_cache misses for the same key share one Redis GET
+    - Redis misses can be remembered for default_negative_cache_ttl seconds
+    - with an invalidation_channel, writes publish the written keys on Redis pub/sub
+      and every other DualCache on the channel drops them from its in-memory cache
+    - get_cache_metrics() reports the in-memory hit ratio and Redis GETs per request
 """
 
 import asyncio
+import json
 import time
 import traceback
 from concurrent.futures import ThreadPoolExecutor
-from typing import TYPE_CHECKING, Any, List, Optional, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
 
 if TYPE_CHECKING:
     from litellm.types.caching import RedisPipelineIncrementOperation
 
 import litellm
 from litellm._logging import print_verbose, verbose_logger
-from litellm.constants import DEFAULT_MAX_REDIS_BATCH_CACHE_SIZE
+from litellm._uuid import uuid
+from litellm.constants import (
+    DEFAULT_MAX_NEGATIVE_CACHE_SIZE,
+    DEFAULT_MAX_REDIS_BATCH_CACHE_SIZE,
+    DEFAULT_NEGATIVE_CACHE_TTL,
+)
+from litellm.types.caching import DualCacheMetrics
 
 from .base_cache import BaseCache
 from .in_memory_cache import InMemoryCache
@@ -62,6 +76,8 @@ class DualCache(BaseCache):
         default_redis_ttl: Optional[float] = None,
         default_redis_batch_cache_expiry: Optional[float] = None,
         default_max_redis_batch_cache_size: int = DEFAULT_MAX_REDIS_BATCH_CACHE_SIZE,
+        default_negative_cache_ttl: Optional[float] = None,
+        invalidation_channel: Optional[str] = None,
     ) -> None:
         super().__init__()
         # If in_memory_cache is not provided, use the default InMemoryCache
@@ -81,6 +97,28 @@ class DualCache(BaseCache):
         )
         self.default_redis_ttl = default_redis_ttl or litellm.default_redis_ttl
 
+        # resolved on use, so litellm settings loaded after init still apply
+        self._default_negative_cache_ttl = default_negative_cache_ttl
+        self._invalidation_channel = invalidation_channel
+
+        # key -> time until which redis is known not to have the key
+        self.negative_cache_expiry = LimitedSizeOrderedDict(
+            max_size=DEFAULT_MAX_NEGATIVE_CACHE_SIZE
+        )
+        # key -> redis GET shared by concurrent async_get_cache misses
+        self._inflight_redis_gets: Dict[str, asyncio.Future] = {}
+
+        self._instance_id = str(uuid.uuid4())
+        self._invalidation_listener: Optional[asyncio.Task] = None
+
+        # read path counters, see get_cache_metrics()
+        self.get_requests = 0
+        self.in_memory_hits = 0
+        self.negative_cache_hits = 0
+        self.coalesced_redis_gets = 0
+        self.redis_get_calls = 0
+        self.invalidations_received = 0
+
     def update_cache_ttl(
         self, default_in_memory_ttl: Optional[float], default_redis_ttl: Optional[float]
     ):
@@ -90,6 +128,172 @@ class DualCache(BaseCache):
         if default_redis_ttl is not None:
             self.default_redis_ttl = default_redis_ttl
 
+    @property
+    def default_negative_cache_ttl(self) -> float:
+        return (
+            self._default_negative_cache_ttl
+            or litellm.default_negative_cache_ttl
+            or DEFAULT_NEGATIVE_CACHE_TTL
+        )
+
+    @property
+    def invalidation_channel(self) -> Optional[str]:
+        return self._invalidation_channel or litellm.dual_cache_invalidation_channel
+
+    def get_cache_metrics(self) -> DualCacheMetrics:
+        requests = self.get_requests
+        return DualCacheMetrics(
+            get_requests=requests,
+            in_memory_hits=self.in_memory_hits,
+            negative_cache_hits=self.negative_cache_hits,
+            coalesced_redis_gets=self.coalesced_redis_gets,
+            redis_get_calls=self.redis_get_calls,
+            invalidations_received=self.invalidations_received,
+            in_memory_hit_ratio=self.in_memory_hits / requests if requests else 0.0,
+            redis_ops_per_request=(
+                self.redis_get_calls / requests if requests else 0.0
+            ),
+        )
+
+    def _is_negative_cached(self, key) -> bool:
+        expiry = self.negative_cache_expiry.get(key)
+        if expiry is None:
+            return False
+        if expiry > time.time():
+            return True
+        self.negative_cache_expiry.pop(key, None)
+        return False
+
+    def _remember_redis_miss(self, key) -> None:
+        if self.default_negative_cache_ttl:
+            self.negative_cache_expiry[key] = (
+                time.time() + self.default_negative_cache_ttl
+            )
+
+    def _forget_read_state(self, key) -> None:
+        """
+        The key was written - a remembered redis miss or an in-flight redis GET for
+        it is stale now. Dropping the in-flight entry stops its result from being
+        written to the in-memory cache.
+        """
+        self.negative_cache_expiry.pop(key, None)
+        self._inflight_redis_gets.pop(key, None)
+
+    async def _async_get_from_redis(
+        self, key, parent_otel_span: Optional[Span]
+    ) -> Tuple[Any, bool]:
+        """
+        GET from redis, sharing the call with concurrent callers for the same key.
+
+        Returns - (value, True if the caller should populate the in-memory cache)
+        """
+        assert self.redis_cache is not None
+        loop = asyncio.get_running_loop()
+        inflight = self._inflight_redis_gets.get(key)
+        if inflight is not None and inflight.get_loop() is loop:
+            self.coalesced_redis_gets += 1
+            try:
+                return await asyncio.shield(inflight), False
+            except asyncio.CancelledError:
+                if not inflight.cancelled():
+                    raise
+                # the request that issued the GET was cancelled, issue our own
+
+        future: asyncio.Future = loop.create_future()
+        self._inflight_redis_gets[key] = future
+        self.redis_get_calls += 1
+        try:
+            result = await self.redis_cache.async_get_cache(
+                key, parent_otel_span=parent_otel_span
+            )
+        except BaseException as e:
+            if self._inflight_redis_gets.get(key) is future:
+                del self._inflight_redis_gets[key]
+            if isinstance(e, asyncio.CancelledError):
+                future.cancel()
+            else:
+                future.set_exception(e)
+                future.exception()  # waiters re-raise it, don't log it as unretrieved
+            raise
+
+        is_current = self._inflight_redis_gets.get(key) is future
+        if is_current:
+            del self._inflight_redis_gets[key]
+        future.set_result(result)
+        return result, is_current
+
+    def _ensure_invalidation_listener(self) -> None:
+        if self.redis_cache is None or self.invalidation_channel is None:
+            return
+        listener = self._invalidation_listener
+        if listener is not None and not listener.done():
+            return
+        self._invalidation_listener = asyncio.create_task(
+            self._listen_for_invalidations()
+        )
+
+    async def _listen_for_invalidations(self) -> None:
+        assert self.redis_cache is not None
+        while True:
+            pubsub = None
+            try:
+                pubsub = self.redis_cache.init_async_client().pubsub()
+                await pubsub.subscribe(self.invalidation_channel)
+                async for message in pubsub.listen():
+                    if message.get("type") == "message":
+                        self._handle_invalidation_message(message.get("data"))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                verbose_logger.debug(
+                    f"DualCache: invalidation listener error, resubscribing: {str(e)}"
+                )
+                await asyncio.sleep(1)
+            finally:
+                if pubsub is not None:
+                    try:
+                        await pubsub.reset()
+                    except Exception:
+                        pass
+
+    def _handle_invalidation_message(self, data: Any) -> None:
+        try:
+            if isinstance(data, bytes):
+                data = data.decode("utf-8")
+            message = json.loads(data)
+        except (TypeError, ValueError, UnicodeDecodeError):
+            return
+        if message.get("source") == self._instance_id:
+            return
+        self.invalidations_received += 1
+        for key in message.get("keys", []):
+            self.in_memory_cache.delete_cache(key)
+            self._forget_read_state(key)
+
+    def _invalidation_message(self, keys: List[str]) -> str:
+        return json.dumps({"source": self._instance_id, "keys": keys})
+
+    async def _async_publish_invalidation(self, keys: List[str]) -> None:
+        if self.redis_cache is None or self.invalidation_channel is None:
+            return
+        self._ensure_invalidation_listener()
+        try:
+            await self.redis_cache.async_publish(
+                self.invalidation_channel, self._invalidation_message(keys)
+            )
+        except Exception as e:
+            verbose_logger.debug(f"DualCache: failed to publish invalidation: {e}")
+
+    def _publish_invalidation(self, keys: List[str]) -> None:
+        if self.redis_cache is None or self.invalidation_channel is None:
+            return
+        try:
+            self.redis_cache.publish(
+                self.invalidation_channel, self._invalidation_message(keys)
+            )
+        except Exception as e:
+            verbose_logger.debug(f"DualCache: failed to publish invalidation: {e}")
+
     def set_cache(self, key, value, local_only: bool = False, **kwargs):
         # Update both Redis and in-memory cache
         try:
@@ -99,8 +303,11 @@ class DualCache(BaseCache):
 
                 self.in_memory_cache.set_cache(key, value, **kwargs)
 
+            self._forget_read_state(key)
+
             if self.redis_cache is not None and local_only is False:
                 self.redis_cache.set_cache(key, value, **kwargs)
+                self._publish_invalidation([key])
         except Exception as e:
             print_verbose(e)
 
@@ -116,6 +323,7 @@ class DualCache(BaseCache):
         """
         try:
             result: int = value
+            self._forget_read_state(key)
             if self.in_memory_cache is not None:
                 result = self.in_memory_cache.increment_cache(key, value, **kwargs)
 
@@ -137,14 +345,21 @@ class DualCache(BaseCache):
         # Try to fetch from in-memory cache first
         try:
             result = None
+            self.get_requests += 1
             if self.in_memory_cache is not None:
                 in_memory_result = self.in_memory_cache.get_cache(key, **kwargs)
 
                 if in_memory_result is not None:
                     result = in_memory_result
+                    self.in_memory_hits += 1
 
             if result is None and self.redis_cache is not None and local_only is False:
+                if self._is_negative_cached(key):
+                    self.negative_cache_hits += 1
+                    return None
+
                 # If not found in in-memory cache, try fetching from Redis
+                self.redis_get_calls += 1
                 redis_result = self.redis_cache.get_cache(
                     key, parent_otel_span=parent_otel_span
                 )
@@ -152,6 +367,8 @@ class DualCache(BaseCache):
                 if redis_result is not None:
                     # Update in-memory cache with the value from Redis
                     self.in_memory_cache.set_cache(key, redis_result, **kwargs)
+                else:
+                    self._remember_redis_miss(key)
 
                 result = redis_result
 
@@ -208,6 +425,7 @@ class DualCache(BaseCache):
                 f"async get cache: cache key: {key}; local_only: {local_only}"
             )
             result = None
+            self.get_requests += 1
             if self.in_memory_cache is not None:
                 in_memory_result = await self.in_memory_cache.async_get_cache(
                     key, **kwargs
@@ -216,18 +434,27 @@ class DualCache(BaseCache):
                 print_verbose(f"in_memory_result: {in_memory_result}")
                 if in_memory_result is not None:
                     result = in_memory_result
+                    self.in_memory_hits += 1
 
             if result is None and self.redis_cache is not None and local_only is False:
+                self._ensure_invalidation_listener()
+                if self._is_negative_cached(key):
+                    self.negative_cache_hits += 1
+                    return None
+
                 # If not found in in-memory cache, try fetching from Redis
-                redis_result = await self.redis_cache.async_get_cache(
+                redis_result, should_cache = await self._async_get_from_redis(
                     key, parent_otel_span=parent_otel_span
                 )
 
-                if redis_result is not None:
-                    # Update in-memory cache with the value from Redis
-                    await self.in_memory_cache.async_set_cache(
-                        key, redis_result, **kwargs
-                    )
+                if should_cache:
+                    if redis_result is not None:
+                        # Update in-memory cache with the value from Redis
+                        await self.in_memory_cache.async_set_cache(
+                            key, redis_result, **kwargs
+                        )
+                    else:
+                        self._remember_redis_miss(key)
 
                 result = redis_result
 
@@ -262,6 +489,7 @@ class DualCache(BaseCache):
     ):
         try:
             result = [None] * len(keys)
+            self.get_requests += len(keys)
             if self.in_memory_cache is not None:
                 in_memory_result = await self.in_memory_cache.async_batch_get_cache(
                     keys, **kwargs
@@ -269,6 +497,7 @@ class DualCache(BaseCache):
 
                 if in_memory_result is not None:
                     result = in_memory_result
+                    self.in_memory_hits += sum(v is not None for v in result)
 
             if None in result and self.redis_cache is not None and local_only is False:
                 """
@@ -281,6 +510,7 @@ class DualCache(BaseCache):
                 # Only hit Redis if the last access time was more than 5 seconds ago
                 if len(sublist_keys) > 0:
                     # If not found in in-memory cache, try fetching from Redis
+                    self.redis_get_calls += 1
                     redis_result = await self.redis_cache.async_batch_get_cache(
                         sublist_keys, parent_otel_span=parent_otel_span
                     )
@@ -318,8 +548,11 @@ class DualCache(BaseCache):
             if self.in_memory_cache is not None:
                 await self.in_memory_cache.async_set_cache(key, value, **kwargs)
 
+            self._forget_read_state(key)
+
             if self.redis_cache is not None and local_only is False:
                 await self.redis_cache.async_set_cache(key, value, **kwargs)
+                await self._async_publish_invalidation([key])
         except Exception as e:
             verbose_logger.exception(
                 f"LiteLLM Cache: Excepton async add_cache: {str(e)}"
@@ -341,10 +574,16 @@ class DualCache(BaseCache):
                     cache_list=cache_list, **kwargs
                 )
 
+            for key, _ in cache_list:
+                self._forget_read_state(key)
+
             if self.redis_cache is not None and local_only is False:
                 await self.redis_cache.async_set_cache_pipeline(
                     cache_list=cache_list, ttl=kwargs.pop("ttl", None), **kwargs
                 )
+                await self._async_publish_invalidation(
+                    [key for key, _ in cache_list]
+                )
         except Exception as e:
             verbose_logger.exception(
                 f"LiteLLM Cache: Excepton async add_cache: {str(e)}"
@@ -367,6 +606,7 @@ class DualCache(BaseCache):
         """
         try:
             result: float = value
+            self._forget_read_state(key)
             if self.in_memory_cache is not None:
                 result = await self.in_memory_cache.async_increment(
                     key, value, **kwargs
@@ -427,16 +667,21 @@ class DualCache(BaseCache):
                     key, value, ttl=kwargs.get("ttl", None)
                 )
 
+            self._forget_read_state(key)
+
             if self.redis_cache is not None and local_only is False:
                 _ = await self.redis_cache.async_set_cache_sadd(
                     key, value, ttl=kwargs.get("ttl", None)
                 )
+                await self._async_publish_invalidation([key])
 
             return None
         except Exception as e:
             raise e  # don't log, if exception is raised
 
     def flush_cache(self):
+        self.negative_cache_expiry.clear()
+        self._inflight_redis_gets.clear()
         if self.in_memory_cache is not None:
             self.in_memory_cache.flush_cache()
         if self.redis_cache is not None:
@@ -448,8 +693,10 @@ class DualCache(BaseCache):
         """
         if self.in_memory_cache is not None:
             self.in_memory_cache.delete_cache(key)
+        self._forget_read_state(key)
         if self.redis_cache is not None:
             self.redis_cache.delete_cache(key)
+            self._publish_invalidation([key])
 
     async def async_delete_cache(self, key: str):
         """
@@ -457,8 +704,10 @@ class DualCache(BaseCache):
         """
         if self.in_memory_cache is not None:
             self.in_memory_cache.delete_cache(key)
+        self._forget_read_state(key)
         if self.redis_cache is not None:
             await self.redis_cache.async_delete_cache(key)
+            await self._async_publish_invalidation([key])
 
     async def async_get_ttl(self, key: str) -> Optional[int]:
         """
@@ -6,23 +6,104 @@ Has 4 methods:
     - get_cache
     - async_set_cache
     - async_get_cache
+
+Eviction is true LRU (OrderedDict) with O(1) get/set. Expired entries are
+tracked in a timer wheel of per-second buckets, so expiry sweeps only touch
+keys that are actually due. Memory is bounded by an estimated byte budget in
+addition to the item count.
 """
 
+import heapq
 import json
 import sys
 import time
-import heapq
-from typing import TYPE_CHECKING, Any, List, Optional
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set
 
 if TYPE_CHECKING:
     from litellm.types.caching import RedisPipelineIncrementOperation
 
 from pydantic import BaseModel
 
-from litellm.constants import MAX_SIZE_PER_ITEM_IN_MEMORY_CACHE_IN_KB
+from litellm.constants import (
+    IN_MEMORY_CACHE_EXPIRY_BUCKET_SECONDS,
+    MAX_SIZE_IN_MEMORY_CACHE_IN_MB,
+    MAX_SIZE_PER_ITEM_IN_MEMORY_CACHE_IN_KB,
+)
 
 from .base_cache import BaseCache
 
+# Containers larger than this are sized from a sample of their items
+_SIZE_SAMPLE_LIMIT = 100
+_SIZE_MAX_DEPTH = 6
+
+_JSON_START_CHARS = frozenset('{["-0123456789')
+_JSON_LITERALS = frozenset(("true", "false", "null"))
+_SCALAR_TYPES = frozenset((str, bytes, bytearray, int, float, bool, type(None)))
+_MISSING = object()
+
+
+def _estimate_size(value: Any, depth: int = 0) -> int:
+    """
+    Cheaply estimate the memory footprint of a value in bytes.
+
+    Walks containers (sampling large ones) instead of serializing the value.
+    """
+    if type(value) in _SCALAR_TYPES:
+        return sys.getsizeof(value)
+    if depth >= _SIZE_MAX_DEPTH:
+        return sys.getsizeof(value)
+
+    if isinstance(value, BaseModel):
+        return sys.getsizeof(value) + _estimate_size(value.__dict__, depth + 1)
+
+    if isinstance(value, dict):
+        size = sys.getsizeof(value)
+        n = len(value)
+        if n == 0:
+            return size
+        sampled = 0
+        items_size = 0
+        for k, v in value.items():
+            items_size += _estimate_size(k, depth + 1) + _estimate_size(v, depth + 1)
+            sampled += 1
+            if sampled >= _SIZE_SAMPLE_LIMIT:
+                break
+        return size + items_size * n // sampled
+
+    if isinstance(value, (list, tuple, set, frozenset)):
+        size = sys.getsizeof(value)
+        n = len(value)
+        if n == 0:
+            return size
+        sampled = 0
+        items_size = 0
+        for item in value:
+            items_size += _estimate_size(item, depth + 1)
+            sampled += 1
+            if sampled >= _SIZE_SAMPLE_LIMIT:
+                break
+        return size + items_size * n // sampled
+
+    return sys.getsizeof(value)
+
+
+def _decode_if_json(value: Any) -> Any:
+    """
+    Decode JSON strings once on write, so reads never have to.
+
+    Only strings that can be JSON documents are parsed; anything else is
+    stored as-is.
+    """
+    if not isinstance(value, str) or not value:
+        return value
+    if value[0] not in _JSON_START_CHARS and value not in _JSON_LITERALS:
+        return value
+    try:
+        return json.loads(value)
+    except Exception:
+        return value
+
 
 class InMemoryCache(BaseCache):
     def __init__(
@@ -32,9 +113,11 @@ class InMemoryCache(BaseCache):
             int
         ] = 600,  # default ttl is 10 minutes. At maximum litellm rate limiting logic requires objects to be in memory for 1 minute
         max_size_per_item: Optional[int] = 1024,  # 1MB = 1024KB
+        max_size_in_bytes: Optional[int] = None,
     ):
         """
         max_size_in_memory [int]: Maximum number of items in cache. done to prevent memory leaks. Use 200 items as a default
+        max_size_in_bytes [int]: Estimated byte budget for all items. Defaults to MAX_SIZE_IN_MEMORY_CACHE_IN_MB
         """
         self.max_size_in_memory = (
             max_size_in_memory if max_size_in_memory is not None else 200
@@ -43,11 +126,38 @@ class InMemoryCache(BaseCache):
         self.max_size_per_item = (
             max_size_per_item or MAX_SIZE_PER_ITEM_IN_MEMORY_CACHE_IN_KB
         )  # 1MB = 1024KB
-
-        # in-memory cache
-        self.cache_dict: dict = {}
-        self.ttl_dict: dict = {}
-        self.expiration_heap: list[tuple[float, str]] = []
+        self.max_size_in_bytes = (
+            max_size_in_bytes
+            if max_size_in_bytes is not None
+            else int(MAX_SIZE_IN_MEMORY_CACHE_IN_MB * 1024 * 1024)
+        )
+
+        # in-memory cache, ordered from least to most recently used
+        self.cache_dict: "OrderedDict[str, Any]" = OrderedDict()
+        self.ttl_dict: Dict[str, float] = {}
+        self.size_dict: Dict[str, int] = {}
+        self.total_size_in_bytes = 0
+
+        # expiry timer wheel: bucket id -> keys expiring in that bucket, plus a
+        # heap holding each bucket id once
+        self._expiry_buckets: Dict[int, Set[str]] = {}
+        self._expiry_bucket_heap: List[int] = []
+        self._next_expiry_sweep = 0.0
+
+        # counters
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def _get_size_in_bytes(self, value: Any) -> int:
+        """
+        Estimate the in-memory size of value, without serializing it
+        """
+        try:
+            return _estimate_size(value)
+        except Exception:
+            return sys.getsizeof(value)
 
     def check_value_size(self, value: Any):
         """
@@ -55,40 +165,30 @@ class InMemoryCache(BaseCache):
         Returns True if value size is acceptable, False otherwise
         """
         try:
-            # Fast path for common primitive types that are typically small
-            if (
-                isinstance(value, (bool, int, float, str))
-                and len(str(value))
-                < self.max_size_per_item * MAX_SIZE_PER_ITEM_IN_MEMORY_CACHE_IN_KB
-            ):  # Conservative estimate
-                return True
-
-            # Direct size check for bytes objects
-            if isinstance(value, bytes):
-                return sys.getsizeof(value) / 1024 <= self.max_size_per_item
-
-            # Handle special types without full conversion when possible
-            if hasattr(value, "__sizeof__"):  # Use __sizeof__ if available
-                size = value.__sizeof__() / 1024
-                return size <= self.max_size_per_item
-
-            # Fallback for complex types
-            if isinstance(value, BaseModel) and hasattr(
-                value, "model_dump"
-            ):  # Pydantic v2
-                value = value.model_dump()
-            elif hasattr(value, "isoformat"):  # datetime objects
-                return True  # datetime strings are always small
-
-            # Only convert to JSON if absolutely necessary
-            if not isinstance(value, (str, bytes)):
-                value = json.dumps(value, default=str)
-
-            return sys.getsizeof(value) / 1024 <= self.max_size_per_item
-
+            return self._get_size_in_bytes(value) / 1024 <= self.max_size_per_item
         except Exception:
             return False
 
+    @staticmethod
+    def _get_expiry_bucket(expiry: float) -> int:
+        return int(expiry // IN_MEMORY_CACHE_EXPIRY_BUCKET_SECONDS)
+
+    def _schedule_expiry(self, key: str, expiry: float) -> None:
+        bucket_id = self._get_expiry_bucket(expiry)
+        bucket = self._expiry_buckets.get(bucket_id)
+        if bucket is None:
+            bucket = self._expiry_buckets[bucket_id] = set()
+            heapq.heappush(self._expiry_bucket_heap, bucket_id)
+        bucket.add(key)
+
+    def _unschedule_expiry(self, key: str) -> None:
+        expiry = self.ttl_dict.get(key)
+        if expiry is None:
+            return
+        bucket = self._expiry_buckets.get(self._get_expiry_bucket(expiry))
+        if bucket is not None:
+            bucket.discard(key)
+
     def _is_key_expired(self, key: str) -> bool:
         """
         Check if a specific key is expired
@@ -97,52 +197,60 @@ class InMemoryCache(BaseCache):
 
     def _remove_key(self, key: str) -> None:
         """
-        Remove a key from both cache_dict and ttl_dict
+        Remove a key from cache_dict, ttl_dict and the expiry wheel
         """
+        self._unschedule_expiry(key)
         self.cache_dict.pop(key, None)
         self.ttl_dict.pop(key, None)
+        self.total_size_in_bytes -= self.size_dict.pop(key, 0)
 
-    def evict_cache(self):
+    def _evict_expired(self, current_time: float) -> None:
+        """
+        Remove expired keys from every expiry bucket that is due
+        """
+        current_bucket = self._get_expiry_bucket(current_time)
+        while (
+            self._expiry_bucket_heap and self._expiry_bucket_heap[0] <= current_bucket
+        ):
+            bucket_id = self._expiry_bucket_heap[0]
+            bucket = self._expiry_buckets.get(bucket_id, set())
+            for key in list(bucket):
+                if self.ttl_dict.get(key, float("inf")) <= current_time:
+                    self._remove_key(key)
+                    self.expirations += 1
+            if bucket_id < current_bucket or not bucket:
+                # bucket fully elapsed (or emptied) - drop it
+                heapq.heappop(self._expiry_bucket_heap)
+                self._expiry_buckets.pop(bucket_id, None)
+            else:
+                # current bucket still holds keys expiring later this second
+                break
+        self._next_expiry_sweep = current_time + IN_MEMORY_CACHE_EXPIRY_BUCKET_SECONDS
+
+    def evict_cache(self, incoming_size: int = 0):
         """
         Eviction policy:
         1. First, remove expired items from ttl_dict and cache_dict
-        2. If cache is still at or above max_size_in_memory, evict items with earliest expiration times
+        2. If cache is still at or above max_size_in_memory, or adding incoming_size bytes
+           would exceed max_size_in_bytes, evict least recently used items
 
 
         This guarantees the following:
-        - 1. When item ttl not set: At minimum each item will remain in memory for the default ttl
+        - 1. When item ttl not set: At minimum each item will remain in memory for the default ttl, unless cache size requires eviction
         - 2. When ttl is set: the item will remain in memory for at least that amount of time, unless cache size requires eviction
-        - 3. the size of in-memory cache is bounded
+        - 3. the size of in-memory cache is bounded, both in items and in (estimated) bytes
 
         """
-        current_time = time.time()
+        # Step 1: Remove expired items
+        self._evict_expired(time.time())
 
-        # Step 1: Remove expired or outdated items
-        while self.expiration_heap:
-            expiration_time, key = self.expiration_heap[0]
-
-            # Case 1: Heap entry is outdated
-            if expiration_time != self.ttl_dict.get(key):
-                heapq.heappop(self.expiration_heap)
-            # Case 2: Entry is valid but expired
-            elif expiration_time <= current_time:
-                heapq.heappop(self.expiration_heap)
-                self._remove_key(key)
-            else:
-                # Case 3: Entry is valid and not expired
-                break
-
-        # Step 2: Evict if cache is still full
-        while len(self.cache_dict) >= self.max_size_in_memory:
-            expiration_time, key = heapq.heappop(self.expiration_heap)
-            # Skip if key was removed or updated
-            if self.ttl_dict.get(key) == expiration_time:
-                self._remove_key(key)
-
-        # de-reference the removed item
-        # https://www.geeksforgeeks.org/diagnosing-and-fixing-memory-leaks-in-python/
-        # One of the most common causes of memory leaks in Python is the retention of objects that are no longer being used.
-        # This can occur when an object is referenced by another object, but the reference is never removed.
+        # Step 2: Evict least recently used items if cache is still full
+        while self.cache_dict and (
+            len(self.cache_dict) >= self.max_size_in_memory
+            or self.total_size_in_bytes + incoming_size > self.max_size_in_bytes
+        ):
+            self._remove_key(next(iter(self.cache_dict)))
+            self.evictions += 1
 
     def allow_ttl_override(self, key: str) -> bool:
         """
@@ -161,20 +269,46 @@ class InMemoryCache(BaseCache):
         if self.max_size_in_memory == 0:
             return  # Don't cache anything if max size is 0
 
-        if len(self.cache_dict) >= self.max_size_in_memory:
+        value = _decode_if_json(value)
+        existing = self.cache_dict.get(key, _MISSING)
+        if existing is value:
+            # re-setting the same object - reuse its size estimate
+            size = self.size_dict[key]
+        else:
+            size = self._get_size_in_bytes(value)
+            if size / 1024 > self.max_size_per_item:
+                return
+
+        current_time = time.time()
+        if current_time >= self._next_expiry_sweep:
+            self._evict_expired(current_time)
+
+        # replacing a value frees its old size before the budget check
+        self.total_size_in_bytes -= self.size_dict.pop(key, 0)
+        is_new_key = existing is _MISSING
+        if (
+            is_new_key and len(self.cache_dict) >= self.max_size_in_memory
+        ) or self.total_size_in_bytes + size > self.max_size_in_bytes:
             # only evict when cache is full
-            self.evict_cache()
-        if not self.check_value_size(value):
-            return
+            self.evict_cache(incoming_size=size)
+            is_new_key = key not in self.cache_dict
 
         self.cache_dict[key] = value
-        if self.allow_ttl_override(key):  # if ttl is not set, set it to default ttl
+        if not is_new_key:
+            self.cache_dict.move_to_end(key)
+        self.size_dict[key] = size
+        self.total_size_in_bytes += size
+
+        ttl_time = self.ttl_dict.get(key)
+        if (
+            ttl_time is None or ttl_time < current_time
+        ):  # if ttl is not set (or expired), set it - default ttl if not provided
+            self._unschedule_expiry(key)
             if "ttl" in kwargs and kwargs["ttl"] is not None:
-                self.ttl_dict[key] = time.time() + float(kwargs["ttl"])
-                heapq.heappush(self.expiration_heap, (self.ttl_dict[key], key))
+                self.ttl_dict[key] = current_time + float(kwargs["ttl"])
             else:
-                self.ttl_dict[key] = time.time() + self.default_ttl
-                heapq.heappush(self.expiration_heap, (self.ttl_dict[key], key))
+                self.ttl_dict[key] = current_time + self.default_ttl
+            self._schedule_expiry(key, self.ttl_dict[key])
 
     async def async_set_cache(self, key, value, **kwargs):
         self.set_cache(key=key, value=value, **kwargs)
@@ -205,20 +339,24 @@ class InMemoryCache(BaseCache):
         """
         if self._is_key_expired(key):
             self._remove_key(key)
+            self.expirations += 1
             return True
         return False
 
     def get_cache(self, key, **kwargs):
-        if key in self.cache_dict:
-            if self.evict_element_if_expired(key):
-                return None
-            original_cached_response = self.cache_dict[key]
-            try:
-                cached_response = json.loads(original_cached_response)
-            except Exception:
-                cached_response = original_cached_response
-            return cached_response
-        return None
+        value = self.cache_dict.get(key, _MISSING)
+        if value is _MISSING:
+            self.misses += 1
+            return None
+        expiry = self.ttl_dict.get(key)
+        if expiry is not None and time.time() > expiry:
+            self._remove_key(key)
+            self.expirations += 1
+            self.misses += 1
+            return None
+        self.cache_dict.move_to_end(key)
+        self.hits += 1
+        return value
 
     def batch_get_cache(self, keys: list, **kwargs):
         return_val = []
@@ -265,7 +403,10 @@ class InMemoryCache(BaseCache):
     def flush_cache(self):
         self.cache_dict.clear()
         self.ttl_dict.clear()
-        self.expiration_heap.clear()
+        self.size_dict.clear()
+        self.total_size_in_bytes = 0
+        self._expiry_buckets.clear()
+        self._expiry_bucket_heap.clear()
 
     async def disconnect(self):
         pass
@@ -273,6 +414,22 @@ class InMemoryCache(BaseCache):
     def delete_cache(self, key):
         self._remove_key(key)
 
+    def get_stats(self) -> dict:
+        """
+        Get hit/miss/eviction counters and current utilization
+        """
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "num_items": len(self.cache_dict),
+            "size_in_bytes": self.total_size_in_bytes,
+            "max_size_in_bytes": self.max_size_in_bytes,
+        }
+
     async def async_get_ttl(self, key: str) -> Optional[int]:
         """
         Get the remaining TTL of a key in in-memory cache
@@ -37,3 +37,10 @@ class LLMClientCache(InMemoryCache):
         key = self.update_cache_key_with_event_loop(key)
 
         return await super().async_get_cache(key, **kwargs)
+
+    def flush_cache(self):
+        super().flush_cache()
+        # shared httpx clients live in their own pool, flush them along with the rest
+        from litellm.llms.custom_httpx.http_client_pool import http_client_pool_manager
+
+        http_client_pool_manager.clear()
@@ -0,0 +1,225 @@
+"""
+In-process tier for the semantic caches (RedisSemanticCache, QdrantSemanticCache)
+
+Keeps:
+    - an exact prompt -> embedding memo, so repeated prompts skip the embedding call
+    - a bounded ring buffer of recently cached prompt embeddings and their responses,
+      searched with a flat cosine-similarity scan (NumPy matrix product). NumPy is
+      optional - without it only the embedding memo is used, since a pure python
+      scan is slower than the remote lookup it would save
+
+A lookup that scores above the cache's similarity_threshold is answered without
+touching the remote vector store. Writes go to the remote store first and are then
+added here (write-through). Local entries expire after
+SEMANTIC_CACHE_LOCAL_INDEX_TTL seconds so deletions in the remote store are
+eventually observed.
+"""
+
+import hashlib
+import os
+import threading
+import time
+import weakref
+from array import array
+from typing import Any, List, NamedTuple, Optional, Sequence
+
+from litellm._logging import print_verbose
+from litellm._uuid import uuid
+from litellm.constants import (
+    SEMANTIC_CACHE_EMBEDDING_MEMO_SIZE,
+    SEMANTIC_CACHE_LOCAL_INDEX_SIZE,
+    SEMANTIC_CACHE_LOCAL_INDEX_TTL,
+)
+
+from .in_memory_cache import InMemoryCache
+
+
+_numpy: Any = None
+_numpy_checked = False
+
+
+def _get_numpy() -> Any:
+    """numpy is optional - imported once, on first use"""
+    global _numpy, _numpy_checked
+    if not _numpy_checked:
+        try:
+            import numpy
+
+            _numpy = numpy
+        except ImportError:
+            _numpy = None
+        _numpy_checked = True
+    return _numpy
+
+
+def _remove_file(path: str) -> None:
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+class LocalSemanticMatch(NamedTuple):
+    similarity: float
+    prompt: str
+    response: str
+
+
+class LocalSemanticIndex:
+    """
+    Bounded in-process semantic index used in front of a remote vector store.
+
+    Args:
+        similarity_threshold: minimum cosine similarity for a local hit
+        max_size: number of recent prompts kept, 0 disables the index
+            (the embedding memo still works). Requires NumPy, the index is
+            disabled when it's not installed
+        ttl: max seconds an entry is served locally
+        mmap_path: optional file backing the vector matrix, keeps large indexes
+            out of the python heap. Each index gets its own file next to it
+            (`<name>.<pid>-<id><ext>`, removed when the index is garbage
+            collected), so proxy workers sharing the setting don't overwrite
+            each other's vectors
+        embedding_memo_size: number of exact prompt -> embedding entries kept
+    """
+
+    def __init__(
+        self,
+        similarity_threshold: float,
+        max_size: Optional[int] = None,
+        ttl: Optional[int] = None,
+        mmap_path: Optional[str] = None,
+        embedding_memo_size: Optional[int] = None,
+    ):
+        self.similarity_threshold = similarity_threshold
+        self.max_size = (
+            max_size if max_size is not None else SEMANTIC_CACHE_LOCAL_INDEX_SIZE
+        )
+        self.ttl = ttl if ttl is not None else SEMANTIC_CACHE_LOCAL_INDEX_TTL
+        self.mmap_path: Optional[str] = None
+        if mmap_path is not None:
+            root, ext = os.path.splitext(mmap_path)
+            self.mmap_path = f"{root}.{os.getpid()}-{uuid.uuid4().hex[:8]}{ext}"
+            weakref.finalize(self, _remove_file, self.mmap_path)
+        self.embedding_memo = InMemoryCache(
+            max_size_in_memory=(
+                embedding_memo_size
+                if embedding_memo_size is not None
+                else SEMANTIC_CACHE_EMBEDDING_MEMO_SIZE
+            ),
+            default_ttl=self.ttl,
+        )
+
+        self._np = _get_numpy()
+        if self.max_size > 0 and self._np is None:
+            print_verbose(
+                "semantic-cache local index: numpy is not installed, only memoizing "
+                "embeddings"
+            )
+            self.max_size = 0
+        self._lock = threading.Lock()
+        self._dimensions: Optional[int] = None
+        self._vectors: Any = None  # numpy matrix
+        self._entries: List[Optional[tuple]] = []  # (prompt, response, expires_at)
+        self._next = 0
+
+    # embedding memo
+
+    @staticmethod
+    def _embedding_key(model: str, prompt: str) -> str:
+        digest = hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+        return f"semantic_cache_embedding:{model}:{digest}"
+
+    def get_embedding(self, model: str, prompt: str) -> Optional[List[float]]:
+        embedding = self.embedding_memo.get_cache(self._embedding_key(model, prompt))
+        if embedding is None:
+            return None
+        return embedding.tolist()
+
+    def set_embedding(self, model: str, prompt: str, embedding: Sequence[float]):
+        # array('f') is ~8x smaller than a list of python floats
+        self.embedding_memo.set_cache(
+            self._embedding_key(model, prompt), array("f", embedding)
+        )
+
+    # vector index
+
+    def _normalize(self, embedding: Sequence[float]) -> Any:
+        vector = self._np.asarray(embedding, dtype=self._np.float32)
+        norm = float(self._np.linalg.norm(vector))
+        return vector / norm if norm else None
+
+    def _allocate(self, dimensions: int) -> None:
+        self._dimensions = dimensions
+        self._entries = [None] * self.max_size
+        self._next = 0
+        np = self._np
+        if self.mmap_path is not None:
+            self._vectors = np.lib.format.open_memmap(
+                self.mmap_path,
+                mode="w+",
+                dtype=np.float32,
+                shape=(self.max_size, dimensions),
+            )
+        else:
+            self._vectors = np.zeros((self.max_size, dimensions), dtype=np.float32)
+
+    def add(
+        self,
+        embedding: Sequence[float],
+        prompt: str,
+        response: str,
+        ttl: Optional[float] = None,
+    ) -> None:
+        """Add a cached prompt, evicting the oldest entry once the index is full."""
+        if self.max_size <= 0 or not embedding:
+            return
+        vector = self._normalize(embedding)
+        if vector is None:
+            return
+        ttl = self.ttl if ttl is None else min(ttl, self.ttl)
+        with self._lock:
+            if self._dimensions != len(vector):
+                if self._dimensions is not None:
+                    print_verbose(
+                        "semantic-cache local index: embedding size changed from "
+                        f"{self._dimensions} to {len(vector)}, resetting index"
+                    )
+                self._allocate(len(vector))
+            slot = self._next
+            self._vectors[slot] = vector
+            self._entries[slot] = (prompt, response, time.time() + ttl)
+            self._next = (slot + 1) % self.max_size
+
+    def search(self, embedding: Sequence[float]) -> Optional[LocalSemanticMatch]:
+        """Return the most similar live entry scoring >= similarity_threshold."""
+        if self._dimensions is None or len(embedding) != self._dimensions:
+            return None
+        query = self._normalize(embedding)
+        if query is None:
+            return None
+        now = time.time()
+        with self._lock:
+            scores = self._vectors @ query
+            while True:
+                slot = int(scores.argmax())
+                similarity = float(scores[slot])
+                if similarity < self.similarity_threshold:
+                    return None
+                entry = self._entries[slot]
+                if entry is not None and entry[2] > now:
+                    return LocalSemanticMatch(similarity, entry[0], entry[1])
+                self._evict(slot)
+                scores[slot] = -2.0
+
+    def _evict(self, slot: int) -> None:
+        self._entries[slot] = None
+        self._vectors[slot] = 0.0
+
+    def flush(self) -> None:
+        with self._lock:
+            self._dimensions = None
+            self._vectors = None
+            self._entries = []
+            self._next = 0
+        self.embedding_memo.flush_cache()
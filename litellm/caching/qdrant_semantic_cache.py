@@ -6,12 +6,15 @@ Has 4 methods:
     - get_cache
     - async_set_cache
     - async_get_cache
+
+Prompt embeddings are memoized and recently cached prompts are answered from a
+LocalSemanticIndex before searching the qdrant collection.
 """
 
 import ast
 import asyncio
 import json
-from typing import Any, cast
+from typing import Any, List, Optional, cast
 
 import litellm
 from litellm._logging import print_verbose
@@ -19,6 +22,7 @@ from litellm.constants import QDRANT_SCALAR_QUANTILE, QDRANT_VECTOR_SIZE
 from litellm.types.utils import EmbeddingResponse
 
 from .base_cache import BaseCache
+from .local_semantic_index import LocalSemanticIndex
 
 
 class QdrantSemanticCache(BaseCache):
@@ -31,6 +35,8 @@ class QdrantSemanticCache(BaseCache):
         quantization_config=None,
         embedding_model="text-embedding-ada-002",
         host_type=None,
+        local_index_size: Optional[int] = None,
+        local_index_path: Optional[str] = None,
     ):
         import os
 
@@ -53,6 +59,11 @@ class QdrantSemanticCache(BaseCache):
             raise Exception("similarity_threshold must be provided, passed None")
         self.similarity_threshold = similarity_threshold
         self.embedding_model = embedding_model
+        self.local_index = LocalSemanticIndex(
+            similarity_threshold=similarity_threshold,
+            max_size=local_index_size,
+            mmap_path=local_index_path,
+        )
         headers = {}
 
         # check if defined as os.environ/ variable
@@ -166,17 +177,11 @@ class QdrantSemanticCache(BaseCache):
             cached_response = ast.literal_eval(cached_response)
         return cached_response
 
-    def set_cache(self, key, value, **kwargs):
-        print_verbose(f"qdrant semantic-cache set_cache, kwargs: {kwargs}")
-        from litellm._uuid import uuid
-
-        # get the prompt
-        messages = kwargs["messages"]
-        prompt = ""
-        for message in messages:
-            prompt += message["content"]
+    def _get_embedding(self, prompt: str) -> List[float]:
+        embedding = self.local_index.get_embedding(self.embedding_model, prompt)
+        if embedding is not None:
+            return embedding
 
-        # create an embedding for prompt
         embedding_response = cast(
             EmbeddingResponse,
             litellm.embedding(
@@ -185,9 +190,58 @@ class QdrantSemanticCache(BaseCache):
                 cache={"no-store": True, "no-cache": True},
             ),
         )
+        embedding = embedding_response["data"][0]["embedding"]
+        self.local_index.set_embedding(self.embedding_model, prompt, embedding)
+        return embedding
+
+    async def _get_async_embedding(self, prompt: str, **kwargs) -> List[float]:
+        embedding = self.local_index.get_embedding(self.embedding_model, prompt)
+        if embedding is not None:
+            return embedding
+
+        from litellm.proxy.proxy_server import llm_model_list, llm_router
+
+        router_model_names = (
+            [m["model_name"] for m in llm_model_list]
+            if llm_model_list is not None
+            else []
+        )
+        if llm_router is not None and self.embedding_model in router_model_names:
+            user_api_key = kwargs.get("metadata", {}).get("user_api_key", "")
+            embedding_response = await llm_router.aembedding(
+                model=self.embedding_model,
+                input=prompt,
+                cache={"no-store": True, "no-cache": True},
+                metadata={
+                    "user_api_key": user_api_key,
+                    "semantic-cache-embedding": True,
+                    "trace_id": kwargs.get("metadata", {}).get("trace_id", None),
+                },
+            )
+        else:
+            # convert to embedding
+            embedding_response = await litellm.aembedding(
+                model=self.embedding_model,
+                input=prompt,
+                cache={"no-store": True, "no-cache": True},
+            )
 
-        # get the embedding
         embedding = embedding_response["data"][0]["embedding"]
+        self.local_index.set_embedding(self.embedding_model, prompt, embedding)
+        return embedding
+
+    def set_cache(self, key, value, **kwargs):
+        print_verbose(f"qdrant semantic-cache set_cache, kwargs: {kwargs}")
+        from litellm._uuid import uuid
+
+        # get the prompt
+        messages = kwargs["messages"]
+        prompt = ""
+        for message in messages:
+            prompt += message["content"]
+
+        # create an embedding for prompt
+        embedding = self._get_embedding(prompt)
 
         value = str(value)
         assert isinstance(value, str)
@@ -209,8 +263,23 @@ class QdrantSemanticCache(BaseCache):
             headers=self.headers,
             json=data,
         )
+        self.local_index.add(embedding, prompt, value)
         return
 
+    def _add_remote_hit_to_local_index(
+        self, result: dict, cached_prompt: str, cached_value: str
+    ) -> None:
+        """
+        Index a Qdrant hit locally under the stored point's vector.
+
+        The query's embedding would widen the hit radius around the stored prompt -
+        later prompts close to the query, but not to the stored prompt, would be
+        answered locally although Qdrant would reject them.
+        """
+        cached_vector = result.get("vector")
+        if isinstance(cached_vector, list):
+            self.local_index.add(cached_vector, cached_prompt, cached_value)
+
     def get_cache(self, key, **kwargs):
         print_verbose(f"sync qdrant semantic-cache get_cache, kwargs: {kwargs}")
 
@@ -221,17 +290,14 @@ class QdrantSemanticCache(BaseCache):
             prompt += message["content"]
 
         # convert to embedding
-        embedding_response = cast(
-            EmbeddingResponse,
-            litellm.embedding(
-                model=self.embedding_model,
-                input=prompt,
-                cache={"no-store": True, "no-cache": True},
-            ),
-        )
+        embedding = self._get_embedding(prompt)
 
-        # get the embedding
-        embedding = embedding_response["data"][0]["embedding"]
+        local_match = self.local_index.search(embedding)
+        if local_match is not None:
+            print_verbose(
+                f"got a local cache hit, similarity: {local_match.similarity}, Current prompt: {prompt}, cached_prompt: {local_match.prompt}"
+            )
+            return self._get_cache_logic(cached_response=local_match.response)
 
         data = {
             "vector": embedding,
@@ -244,6 +310,7 @@ class QdrantSemanticCache(BaseCache):
             },
             "limit": 1,
             "with_payload": True,
+            "with_vector": True,
         }
 
         search_response = self.sync_client.post(
@@ -272,6 +339,7 @@ class QdrantSemanticCache(BaseCache):
             print_verbose(
                 f"got a cache hit, similarity: {similarity}, Current prompt: {prompt}, cached_prompt: {cached_prompt}"
             )
+            self._add_remote_hit_to_local_index(results[0], cached_prompt, cached_value)
             return self._get_cache_logic(cached_response=cached_value)
         else:
             # cache miss !
@@ -281,8 +349,6 @@ class QdrantSemanticCache(BaseCache):
     async def async_set_cache(self, key, value, **kwargs):
         from litellm._uuid import uuid
 
-        from litellm.proxy.proxy_server import llm_model_list, llm_router
-
         print_verbose(f"async qdrant semantic-cache set_cache, kwargs: {kwargs}")
 
         # get the prompt
@@ -291,33 +357,7 @@ class QdrantSemanticCache(BaseCache):
         for message in messages:
             prompt += message["content"]
         # create an embedding for prompt
-        router_model_names = (
-            [m["model_name"] for m in llm_model_list]
-            if llm_model_list is not None
-            else []
-        )
-        if llm_router is not None and self.embedding_model in router_model_names:
-            user_api_key = kwargs.get("metadata", {}).get("user_api_key", "")
-            embedding_response = await llm_router.aembedding(
-                model=self.embedding_model,
-                input=prompt,
-                cache={"no-store": True, "no-cache": True},
-                metadata={
-                    "user_api_key": user_api_key,
-                    "semantic-cache-embedding": True,
-                    "trace_id": kwargs.get("metadata", {}).get("trace_id", None),
-                },
-            )
-        else:
-            # convert to embedding
-            embedding_response = await litellm.aembedding(
-                model=self.embedding_model,
-                input=prompt,
-                cache={"no-store": True, "no-cache": True},
-            )
-
-        # get the embedding
-        embedding = embedding_response["data"][0]["embedding"]
+        embedding = await self._get_async_embedding(prompt, **kwargs)
 
         value = str(value)
         assert isinstance(value, str)
@@ -340,11 +380,11 @@ class QdrantSemanticCache(BaseCache):
             headers=self.headers,
             json=data,
         )
+        self.local_index.add(embedding, prompt, value)
         return
 
     async def async_get_cache(self, key, **kwargs):
         print_verbose(f"async qdrant semantic-cache get_cache, kwargs: {kwargs}")
-        from litellm.proxy.proxy_server import llm_model_list, llm_router
 
         # get the messages
         messages = kwargs["messages"]
@@ -352,33 +392,18 @@ class QdrantSemanticCache(BaseCache):
         for message in messages:
             prompt += message["content"]
 
-        router_model_names = (
-            [m["model_name"] for m in llm_model_list]
-            if llm_model_list is not None
-            else []
-        )
-        if llm_router is not None and self.embedding_model in router_model_names:
-            user_api_key = kwargs.get("metadata", {}).get("user_api_key", "")
-            embedding_response = await llm_router.aembedding(
-                model=self.embedding_model,
-                input=prompt,
-                cache={"no-store": True, "no-cache": True},
-                metadata={
-                    "user_api_key": user_api_key,
-                    "semantic-cache-embedding": True,
-                    "trace_id": kwargs.get("metadata", {}).get("trace_id", None),
-                },
-            )
-        else:
-            # convert to embedding
-            embedding_response = await litellm.aembedding(
-                model=self.embedding_model,
-                input=prompt,
-                cache={"no-store": True, "no-cache": True},
-            )
+        # convert to embedding
+        embedding = await self._get_async_embedding(prompt, **kwargs)
 
-        # get the embedding
-        embedding = embedding_response["data"][0]["embedding"]
+        local_match = self.local_index.search(embedding)
+        if local_match is not None:
+            kwargs.setdefault("metadata", {})[
+                "semantic-similarity"
+            ] = local_match.similarity
+            print_verbose(
+                f"got a local cache hit, similarity: {local_match.similarity}, Current prompt: {prompt}, cached_prompt: {local_match.prompt}"
+            )
+            return self._get_cache_logic(cached_response=local_match.response)
 
         data = {
             "vector": embedding,
@@ -391,6 +416,7 @@ class QdrantSemanticCache(BaseCache):
             },
             "limit": 1,
             "with_payload": True,
+            "with_vector": True,
         }
 
         search_response = await self.async_client.post(
@@ -426,6 +452,7 @@ class QdrantSemanticCache(BaseCache):
             print_verbose(
                 f"got a cache hit, similarity: {similarity}, Current prompt: {prompt}, cached_prompt: {cached_prompt}"
             )
+            self._add_remote_hit_to_local_index(results[0], cached_prompt, cached_value)
             return self._get_cache_logic(cached_response=cached_value)
         else:
             # cache miss !
@@ -8,14 +8,24 @@ Has 4 primary methods:
     - async_get_cache
 """
 
-import ast
 import asyncio
 import hashlib
 import inspect
 import json
 import time
 from datetime import timedelta
-from typing import TYPE_CHECKING, Any, List, Optional, Tuple, Union, cast
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Union,
+    cast,
+)
 
 import litellm
 from litellm._logging import print_verbose, verbose_logger
@@ -26,6 +36,7 @@ from litellm.types.caching import RedisPipelineIncrementOperation
 from litellm.types.services import ServiceTypes
 
 from .base_cache import BaseCache
+from .redis_codec import RedisCacheCodec
 
 if TYPE_CHECKING:
     from opentelemetry.trace import Span as _Span
@@ -97,6 +108,9 @@ class RedisCache(BaseCache):
         namespace: Optional[str] = None,
         startup_nodes: Optional[List] = None,  # for redis-cluster
         socket_timeout: Optional[float] = 5.0,  # default 5 second timeout
+        serializer: Optional[str] = None,
+        compression: Optional[str] = None,
+        compression_min_bytes: Optional[int] = None,
         **kwargs,
     ):
         from litellm._service_logger import ServiceLogging
@@ -123,6 +137,13 @@ class RedisCache(BaseCache):
         else:
             self.service_logger_obj = ServiceLogging()
 
+        # value codec - json (default), msgpack, optional zstd compression
+        self.codec = RedisCacheCodec(
+            serializer=serializer,
+            compression=compression,
+            compression_min_bytes=compression_min_bytes,
+        )
+
         redis_kwargs.update(kwargs)
         self.redis_client = get_redis_client(**redis_kwargs)
         self.redis_async_client: Optional[
@@ -298,7 +319,7 @@ class RedisCache(BaseCache):
         key = self.check_and_fix_namespace(key=key)
         try:
             start_time = time.time()
-            self.redis_client.set(name=key, value=str(value), ex=ttl)
+            self.redis_client.set(name=key, value=self.codec.encode(value), ex=ttl)
             end_time = time.time()
             _duration = end_time - start_time
             self.service_logger_obj.service_success_hook(
@@ -484,7 +505,7 @@ class RedisCache(BaseCache):
                 raise Exception("Redis client cannot set cache. Attribute not found.")
             result = await _redis_client.set(
                 name=key,
-                value=json.dumps(value),
+                value=self.codec.encode(value),
                 nx=nx,
                 ex=ttl,
             )
@@ -542,14 +563,14 @@ class RedisCache(BaseCache):
             print_verbose(
                 f"Set ASYNC Redis Cache PIPELINE: key: {cache_key}\nValue {cache_value}\nttl={ttl}"
             )
-            json_cache_value = json.dumps(cache_value)
+            encoded_cache_value = self.codec.encode(cache_value)
             # Set the value with a TTL if it's provided.
             _td: Optional[timedelta] = None
             if ttl is not None:
                 _td = timedelta(seconds=ttl)
             pipe.set(  # type: ignore
                 name=cache_key,
-                value=json_cache_value,
+                value=encoded_cache_value,
                 ex=_td,
             )
         # Execute the pipeline and return the results.
@@ -785,15 +806,8 @@ class RedisCache(BaseCache):
         """
         if cached_response is None:
             return cached_response
-        # cached_response is in `b{} convert it to ModelResponse
-        cached_response = cached_response.decode("utf-8")  # Convert bytes to string
-        try:
-            cached_response = json.loads(
-                cached_response
-            )  # Convert string to dictionary
-        except Exception:
-            cached_response = ast.literal_eval(cached_response)
-        return cached_response
+        # versioned binary entries (msgpack / zstd) or legacy json / str(value)
+        return self.codec.decode(cached_response)
 
     def get_cache(self, key, parent_otel_span: Optional[Span] = None, **kwargs):
         try:
@@ -1155,6 +1169,18 @@ class RedisCache(BaseCache):
     def delete_cache(self, key):
         self.redis_client.delete(key)
 
+    async def async_publish(self, channel: str, message: str) -> int:
+        """
+        Publish a message on a redis pub/sub channel
+
+        Returns - int - the number of subscribers that received the message
+        """
+        _redis_client: Any = self.init_async_client()
+        return await _redis_client.publish(channel, message)
+
+    def publish(self, channel: str, message: str) -> int:
+        return self.redis_client.publish(channel, message)
+
     async def _pipeline_increment_helper(
         self,
         pipe: pipeline,
@@ -1316,6 +1342,108 @@ class RedisCache(BaseCache):
             )
             raise e
 
+    async def _async_sorted_set_operation(
+        self, call_type: str, operation: Callable[[Any], Awaitable[Any]]
+    ) -> Any:
+        """
+        Run a sorted-set command on the async client, with service logging
+        """
+        _redis_client: Any = self.init_async_client()
+        start_time = time.time()
+        try:
+            response = await operation(_redis_client)
+            ## LOGGING ##
+            end_time = time.time()
+            _duration = end_time - start_time
+            asyncio.create_task(
+                self.service_logger_obj.async_service_success_hook(
+                    service=ServiceTypes.REDIS,
+                    duration=_duration,
+                    call_type=f"{call_type} <- {_get_call_stack_info()}",
+                )
+            )
+            return response
+        except Exception as e:
+            # NON blocking - notify users Redis is throwing an exception
+            ## LOGGING ##
+            end_time = time.time()
+            _duration = end_time - start_time
+            asyncio.create_task(
+                self.service_logger_obj.async_service_failure_hook(
+                    service=ServiceTypes.REDIS,
+                    duration=_duration,
+                    error=e,
+                    call_type=f"{call_type} <- {_get_call_stack_info()}",
+                )
+            )
+            verbose_logger.error(
+                f"LiteLLM Redis Cache {call_type}: - Got exception from REDIS : {str(e)}"
+            )
+            raise e
+
+    async def async_zadd(
+        self, key: str, mapping: Dict[str, float], ttl: Optional[int] = None
+    ) -> int:
+        """
+        Add members with scores to a sorted set - O(log n) per member
+
+        Args:
+            key: The Redis key of the sorted set
+            mapping: member -> score
+            ttl: Optional expiry (seconds) of the sorted set, refreshed on every add
+
+        Returns:
+            int: The number of members added
+        """
+        key = self.check_and_fix_namespace(key=key)
+
+        async def _zadd(client: Any) -> int:
+            if ttl is None:
+                return await client.zadd(key, mapping)
+            async with client.pipeline(transaction=False) as pipe:
+                pipe.zadd(key, mapping)
+                pipe.expire(key, ttl)
+                results = await pipe.execute()
+            return results[0]
+
+        return await self._async_sorted_set_operation("async_zadd", _zadd)
+
+    async def async_zrem(self, key: str, *members: str) -> int:
+        """
+        Remove members from a sorted set - O(log n) per member
+
+        Returns:
+            int: The number of members removed
+        """
+        key = self.check_and_fix_namespace(key=key)
+        return await self._async_sorted_set_operation(
+            "async_zrem", lambda client: client.zrem(key, *members)
+        )
+
+    async def async_zrange(
+        self, key: str, start: int, end: int, withscores: bool = False
+    ) -> List[Any]:
+        """
+        Return members of a sorted set by rank, lowest score first - O(log n + m)
+        """
+        key = self.check_and_fix_namespace(key=key)
+        response = await self._async_sorted_set_operation(
+            "async_zrange",
+            lambda client: client.zrange(key, start, end, withscores=withscores),
+        )
+        results: List[Any] = []
+        for item in response or []:
+            if isinstance(item, (list, tuple)):
+                member, score = item
+                if isinstance(member, bytes):
+                    member = member.decode("utf-8")
+                results.append((member, score))
+            elif isinstance(item, bytes):
+                results.append(item.decode("utf-8"))
+            else:
+                results.append(item)
+        return results
+
     async def handle_lpop_count_for_older_redis_versions(
         self, pipe: pipeline, key: str, count: int
     ) -> List[bytes]:
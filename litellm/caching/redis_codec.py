@@ -0,0 +1,211 @@
+"""
+Value codec for RedisCache
+
+Controls how cached values are serialized before they are written to Redis:
+
+    - serializer="json" (default): plain JSON, encoded with orjson when it is
+      installed and the stdlib json module otherwise. Entries are readable by
+      older litellm versions.
+    - serializer="msgpack": binary msgpack, smaller and faster to (de)serialize
+      for embedding vectors. Requires `pip install msgpack`.
+    - compression="zstd": zstandard-compress payloads of at least
+      compression_min_bytes. Requires `pip install zstandard`.
+
+Binary entries (msgpack and/or compressed) are prefixed with a versioned header:
+
+    b"\\x00lc" | version (1 byte) | format (1 byte) | compression (1 byte) | payload
+
+JSON and python literals never start with a NUL byte, so entries written before
+the header existed - json.dumps() output and str(value) - still decode. Decoding
+does not depend on the codec settings, so the serializer / compression can be
+changed on a live deployment without flushing the cache.
+
+Numbers are always written as plain JSON, so INCRBY / Lua scripts keep working
+on keys that are also read through the cache.
+"""
+
+import ast
+import json
+from typing import Any, Optional, Union
+
+from litellm.constants import (
+    REDIS_CACHE_COMPRESSION,
+    REDIS_CACHE_COMPRESSION_MIN_BYTES,
+    REDIS_CACHE_SERIALIZER,
+)
+
+CODEC_HEADER_MAGIC = b"\x00lc"
+CODEC_HEADER_VERSION = 1
+CODEC_HEADER_SIZE = len(CODEC_HEADER_MAGIC) + 3
+
+FORMAT_JSON = 1
+FORMAT_MSGPACK = 2
+COMPRESSION_NONE = 0
+COMPRESSION_ZSTD = 1
+
+_SERIALIZERS = {"json": FORMAT_JSON, "msgpack": FORMAT_MSGPACK}
+_COMPRESSIONS = {"none": COMPRESSION_NONE, "zstd": COMPRESSION_ZSTD}
+
+_optional_modules: dict = {}
+
+
+def _import_optional(name: str, pip_name: str) -> Any:
+    """Import an optional dependency once, raising an actionable error if missing."""
+    module = _optional_modules.get(name)
+    if module is None:
+        try:
+            module = __import__(name)
+        except ImportError as e:
+            raise ImportError(
+                f"Redis cache codec requires `{pip_name}`. "
+                f"Run `pip install {pip_name}`."
+            ) from e
+        _optional_modules[name] = module
+    return module
+
+
+def _get_orjson() -> Any:
+    """orjson is optional - None when it is not installed"""
+    if "orjson" not in _optional_modules:
+        try:
+            import orjson
+
+            _optional_modules["orjson"] = orjson
+        except ImportError:
+            _optional_modules["orjson"] = None
+    return _optional_modules["orjson"]
+
+
+class RedisCacheCodec:
+    """
+    Encodes values written to Redis and decodes values read back.
+
+    Args:
+        serializer: "json" or "msgpack"
+        compression: None / "none" or "zstd"
+        compression_min_bytes: payloads smaller than this are stored uncompressed
+        compression_level: zstd compression level
+    """
+
+    def __init__(
+        self,
+        serializer: Optional[str] = None,
+        compression: Optional[str] = None,
+        compression_min_bytes: Optional[int] = None,
+        compression_level: int = 3,
+    ):
+        serializer = (serializer or REDIS_CACHE_SERIALIZER).lower()
+        compression = (compression or REDIS_CACHE_COMPRESSION or "none").lower()
+        if serializer not in _SERIALIZERS:
+            raise ValueError(
+                f"Invalid redis cache serializer={serializer}. "
+                f"Supported: {list(_SERIALIZERS)}"
+            )
+        if compression not in _COMPRESSIONS:
+            raise ValueError(
+                f"Invalid redis cache compression={compression}. "
+                f"Supported: {list(_COMPRESSIONS)}"
+            )
+        self.serializer = serializer
+        self.compression = compression
+        self.compression_min_bytes = (
+            compression_min_bytes
+            if compression_min_bytes is not None
+            else REDIS_CACHE_COMPRESSION_MIN_BYTES
+        )
+        self._format = _SERIALIZERS[serializer]
+        self._compression = _COMPRESSIONS[compression]
+        self._compressor: Any = None
+
+        # fail at startup, not on the first cache write
+        if self._format == FORMAT_MSGPACK:
+            _import_optional("msgpack", "msgpack")
+        if self._compression == COMPRESSION_ZSTD:
+            zstandard = _import_optional("zstandard", "zstandard")
+            self._compressor = zstandard.ZstdCompressor(level=compression_level)
+
+    @staticmethod
+    def _json_dumps(value: Any) -> bytes:
+        orjson = _get_orjson()
+        if orjson is not None:
+            try:
+                return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+            except TypeError:  # e.g. ints > 64 bits, fall back to stdlib json
+                pass
+        return json.dumps(value).encode("utf-8")
+
+    def encode(self, value: Any) -> bytes:
+        if value is None or isinstance(value, (bool, int, float)):
+            return json.dumps(value).encode("utf-8")
+
+        fmt = self._format
+        payload: Optional[bytes] = None
+        if fmt == FORMAT_MSGPACK:
+            try:
+                payload = _import_optional("msgpack", "msgpack").packb(
+                    value, use_bin_type=True
+                )
+            except (TypeError, ValueError, OverflowError):
+                fmt = FORMAT_JSON
+        if payload is None:
+            payload = self._json_dumps(value)
+
+        compression = COMPRESSION_NONE
+        if self._compressor is not None and len(payload) >= self.compression_min_bytes:
+            payload = self._compressor.compress(payload)
+            compression = COMPRESSION_ZSTD
+
+        if fmt == FORMAT_JSON and compression == COMPRESSION_NONE:
+            return payload
+        return (
+            CODEC_HEADER_MAGIC
+            + bytes((CODEC_HEADER_VERSION, fmt, compression))
+            + payload
+        )
+
+    def decode(self, raw: Union[bytes, str, None]) -> Any:
+        if raw is None:
+            return None
+        if isinstance(raw, (bytes, bytearray, memoryview)):
+            raw = bytes(raw)
+            if raw.startswith(CODEC_HEADER_MAGIC):
+                return self._decode_with_header(raw)
+        return self._decode_legacy(raw)
+
+    @staticmethod
+    def _decode_with_header(raw: bytes) -> Any:
+        if len(raw) < CODEC_HEADER_SIZE:
+            raise ValueError("Truncated redis cache entry header")
+        version, fmt, compression = raw[len(CODEC_HEADER_MAGIC) : CODEC_HEADER_SIZE]
+        if version != CODEC_HEADER_VERSION:
+            raise ValueError(f"Unsupported redis cache entry version={version}")
+        payload = raw[CODEC_HEADER_SIZE:]
+        if compression == COMPRESSION_ZSTD:
+            zstandard = _import_optional("zstandard", "zstandard")
+            payload = zstandard.ZstdDecompressor().decompress(payload)
+        elif compression != COMPRESSION_NONE:
+            raise ValueError(f"Unsupported redis cache compression={compression}")
+
+        if fmt == FORMAT_MSGPACK:
+            return _import_optional("msgpack", "msgpack").unpackb(
+                payload, raw=False, strict_map_key=False
+            )
+        if fmt == FORMAT_JSON:
+            return RedisCacheCodec._decode_legacy(payload)
+        raise ValueError(f"Unsupported redis cache format={fmt}")
+
+    @staticmethod
+    def _decode_legacy(raw: Union[bytes, str]) -> Any:
+        orjson = _get_orjson()
+        if orjson is not None:
+            try:
+                return orjson.loads(raw)
+            except orjson.JSONDecodeError:
+                pass
+        if isinstance(raw, bytes):
+            raw = raw.decode("utf-8")
+        try:
+            return json.loads(raw)
+        except Exception:
+            # entries written with str(value) by older versions
+            return ast.literal_eval(raw)
@@ -6,7 +6,8 @@ This cache stores responses based on the semantic similarity of prompts rather t
 exact matching, allowing for more flexible caching of LLM responses.
 
 This implementation uses RedisVL's SemanticCache to find semantically similar prompts
-and their cached responses.
+and their cached responses. A LocalSemanticIndex in front of it memoizes prompt
+embeddings and answers hits on recently cached prompts in-process.
 """
 
 import ast
@@ -23,6 +24,7 @@ from litellm.litellm_core_utils.prompt_templates.common_utils import (
 from litellm.types.utils import EmbeddingResponse
 
 from .base_cache import BaseCache
+from .local_semantic_index import LocalSemanticIndex
 
 
 class RedisSemanticCache(BaseCache):
@@ -45,6 +47,8 @@ class RedisSemanticCache(BaseCache):
         similarity_threshold: Optional[float] = None,
         embedding_model: str = "text-embedding-ada-002",
         index_name: Optional[str] = None,
+        local_index_size: Optional[int] = None,
+        local_index_path: Optional[str] = None,
         **kwargs,
     ):
         """
@@ -59,6 +63,9 @@ class RedisSemanticCache(BaseCache):
                 where 1.0 requires exact matches and 0.0 accepts any match
             embedding_model: Model to use for generating embeddings
             index_name: Name for the Redis index
+            local_index_size: Number of recent prompts answered in-process
+                (defaults to SEMANTIC_CACHE_LOCAL_INDEX_SIZE, 0 disables)
+            local_index_path: Optional file to memory-map the local index vectors
             ttl: Default time-to-live for cache entries in seconds
             **kwargs: Additional arguments passed to the Redis client
 
@@ -86,6 +93,11 @@ class RedisSemanticCache(BaseCache):
         # While similarity: 1 = most similar, 0 = least similar
         self.distance_threshold = 1 - similarity_threshold
         self.embedding_model = embedding_model
+        self.local_index = LocalSemanticIndex(
+            similarity_threshold=similarity_threshold,
+            max_size=local_index_size,
+            mmap_path=local_index_path,
+        )
 
         # Set up Redis connection
         if redis_url is None:
@@ -142,6 +154,10 @@ class RedisSemanticCache(BaseCache):
         Returns:
             List[float]: The embedding vector
         """
+        embedding = self.local_index.get_embedding(self.embedding_model, prompt)
+        if embedding is not None:
+            return embedding
+
         # Create an embedding from prompt
         embedding_response = cast(
             EmbeddingResponse,
@@ -152,6 +168,7 @@ class RedisSemanticCache(BaseCache):
             ),
         )
         embedding = embedding_response["data"][0]["embedding"]
+        self.local_index.set_embedding(self.embedding_model, prompt, embedding)
         return embedding
 
     def _get_cache_logic(self, cached_response: Any) -> Any:
@@ -205,18 +222,42 @@ class RedisSemanticCache(BaseCache):
 
             prompt = get_str_from_messages(messages)
             value_str = str(value)
+            prompt_embedding = self._get_embedding(prompt)
 
             # Get TTL and store in Redis semantic cache
             ttl = self._get_ttl(**kwargs)
             if ttl is not None:
-                self.llmcache.store(prompt, value_str, ttl=int(ttl))
+                self.llmcache.store(
+                    prompt, value_str, vector=prompt_embedding, ttl=int(ttl)
+                )
             else:
-                self.llmcache.store(prompt, value_str)
+                self.llmcache.store(prompt, value_str, vector=prompt_embedding)
+            self.local_index.add(prompt_embedding, prompt, value_str, ttl=ttl)
         except Exception as e:
             print_verbose(
                 f"Error setting {value_str or value} in the Redis semantic cache: {str(e)}"
             )
 
+    def _add_remote_hit_to_local_index(
+        self, cached_prompt: str, cached_response: str
+    ) -> None:
+        """
+        Index a Redis hit locally under the stored prompt's own embedding.
+
+        The query's embedding would widen the hit radius around the stored prompt -
+        later prompts close to the query, but not to the stored prompt, would be
+        answered locally although Redis would reject them. Redis doesn't return
+        the stored vector, so the hit is only indexed if this process has the
+        stored prompt's embedding memoized.
+        """
+        cached_prompt_embedding = self.local_index.get_embedding(
+            self.embedding_model, cached_prompt
+        )
+        if cached_prompt_embedding is not None:
+            self.local_index.add(
+                cached_prompt_embedding, cached_prompt, cached_response
+            )
+
     def get_cache(self, key: str, **kwargs) -> Any:
         """
         Retrieve a semantically similar cached response.
@@ -238,8 +279,18 @@ class RedisSemanticCache(BaseCache):
                 return None
 
             prompt = get_str_from_messages(messages)
+            prompt_embedding = self._get_embedding(prompt)
+
+            local_match = self.local_index.search(prompt_embedding)
+            if local_match is not None:
+                print_verbose(
+                    f"Local semantic cache hit: similarity: {local_match.similarity}, "
+                    f"current prompt: {prompt}, cached prompt: {local_match.prompt}"
+                )
+                return self._get_cache_logic(cached_response=local_match.response)
+
             # Check the cache for semantically similar prompts
-            results = self.llmcache.check(prompt=prompt)
+            results = self.llmcache.check(prompt=prompt, vector=prompt_embedding)
 
             # Return None if no similar prompts found
             if not results:
@@ -264,6 +315,7 @@ class RedisSemanticCache(BaseCache):
                 f"cached prompt: {cached_prompt}"
             )
 
+            self._add_remote_hit_to_local_index(cached_prompt, cached_response)
             return self._get_cache_logic(cached_response=cached_response)
         except Exception as e:
             print_verbose(f"Error retrieving from Redis semantic cache: {str(e)}")
@@ -279,6 +331,10 @@ class RedisSemanticCache(BaseCache):
         Returns:
             List[float]: The embedding vector
         """
+        embedding = self.local_index.get_embedding(self.embedding_model, prompt)
+        if embedding is not None:
+            return embedding
+
         from litellm.proxy.proxy_server import llm_model_list, llm_router
 
         # Route the embedding request through the proxy if appropriate
@@ -311,7 +367,9 @@ class RedisSemanticCache(BaseCache):
                 )
 
             # Extract and return the embedding vector
-            return embedding_response["data"][0]["embedding"]
+            embedding = embedding_response["data"][0]["embedding"]
+            self.local_index.set_embedding(self.embedding_model, prompt, embedding)
+            return embedding
         except Exception as e:
             print_verbose(f"Error generating async embedding: {str(e)}")
             raise ValueError(f"Failed to generate embedding: {str(e)}") from e
@@ -356,6 +414,7 @@ class RedisSemanticCache(BaseCache):
                     value_str,
                     vector=prompt_embedding,  # Pass through custom embedding
                 )
+            self.local_index.add(prompt_embedding, prompt, value_str, ttl=ttl)
         except Exception as e:
             print_verbose(f"Error in async_set_cache: {str(e)}")
 
@@ -385,6 +444,18 @@ class RedisSemanticCache(BaseCache):
             # Generate embedding for the prompt
             prompt_embedding = await self._get_async_embedding(prompt, **kwargs)
 
+            # Answer from the local index before going to Redis
+            local_match = self.local_index.search(prompt_embedding)
+            if local_match is not None:
+                kwargs.setdefault("metadata", {})[
+                    "semantic-similarity"
+                ] = local_match.similarity
+                print_verbose(
+                    f"Local semantic cache hit: similarity: {local_match.similarity}, "
+                    f"current prompt: {prompt}, cached prompt: {local_match.prompt}"
+                )
+                return self._get_cache_logic(cached_response=local_match.response)
+
             # Check the cache for semantically similar prompts
             results = await self.llmcache.acheck(prompt=prompt, vector=prompt_embedding)
 
@@ -416,6 +487,7 @@ class RedisSemanticCache(BaseCache):
                 f"cached prompt: {cached_prompt}"
             )
 
+            self._add_remote_hit_to_local_index(cached_prompt, cached_response)
             return self._get_cache_logic(cached_response=cached_response)
         except Exception as e:
             print_verbose(f"Error in async_get_cache: {str(e)}")
@@ -121,6 +121,14 @@ AIOHTTP_NEEDS_CLEANUP_CLOSED = (
     (3, 13, 0) <= sys.version_info < (3, 13, 1) or sys.version_info < (3, 12, 7)
 )
 
+# Shared httpx clients (get_async_httpx_client / _get_httpx_client) - see http_client_pool.py
+# Least recently used clients are drained once more than this many are pooled
+HTTP_CLIENT_POOL_MAX_CLIENTS = int(os.getenv("HTTP_CLIENT_POOL_MAX_CLIENTS", 500))
+# Seconds a drained client stays open so in-flight requests / streams can finish
+HTTP_CLIENT_POOL_DRAIN_TIMEOUT = float(
+    os.getenv("HTTP_CLIENT_POOL_DRAIN_TIMEOUT", 600)
+)
+
 # WebSocket constants
 # Default to None (unlimited) to match OpenAI's official agents SDK behavior
 # https://github.com/openai/openai-agents-python/blob/cf1b933660e44fd37b4350c41febab8221801409/src/agents/realtime/openai_realtime.py#L235
@@ -236,6 +244,12 @@ DEFAULT_IN_MEMORY_TTL = int(
 DEFAULT_MAX_REDIS_BATCH_CACHE_SIZE = int(
     os.getenv("DEFAULT_MAX_REDIS_BATCH_CACHE_SIZE", 1000)
 )  # default max size for redis batch cache
+DEFAULT_NEGATIVE_CACHE_TTL = float(
+    os.getenv("DEFAULT_NEGATIVE_CACHE_TTL", 0)
+)  # seconds DualCache skips redis for keys redis just reported missing, 0 disables
+DEFAULT_MAX_NEGATIVE_CACHE_SIZE = int(
+    os.getenv("DEFAULT_MAX_NEGATIVE_CACHE_SIZE", 10000)
+)  # max keys DualCache remembers as missing in redis
 DEFAULT_POLLING_INTERVAL = float(
     os.getenv("DEFAULT_POLLING_INTERVAL", 0.03)
 )  # default polling interval for the scheduler
@@ -251,6 +265,19 @@ REDIS_CONNECTION_POOL_TIMEOUT = int(os.getenv("REDIS_CONNECTION_POOL_TIMEOUT", 5
 # Default Redis major version to assume when version cannot be determined
 # Using 7 as it's the modern version that supports LPOP with count parameter
 DEFAULT_REDIS_MAJOR_VERSION = int(os.getenv("DEFAULT_REDIS_MAJOR_VERSION", 7))
+# Redis cache value codec - serializer: "json" | "msgpack", compression: "zstd"
+REDIS_CACHE_SERIALIZER = os.getenv("REDIS_CACHE_SERIALIZER", "json")
+REDIS_CACHE_COMPRESSION = os.getenv("REDIS_CACHE_COMPRESSION", None)
+REDIS_CACHE_COMPRESSION_MIN_BYTES = int(
+    os.getenv("REDIS_CACHE_COMPRESSION_MIN_BYTES", 4096)
+)
+# Model cost map - opt-in: fetch the hosted map in a background thread instead of blocking import
+MODEL_COST_MAP_BACKGROUND_REFRESH = os.getenv(
+    "LITELLM_MODEL_COST_MAP_BACKGROUND_REFRESH", "False"
+).lower() in ["true", "1"]
+MODEL_COST_MAP_FETCH_TIMEOUT = float(os.getenv("LITELLM_MODEL_COST_MAP_FETCH_TIMEOUT", 5))
+# Directory for the precompiled model cost index, defaults to the package dir / ~/.cache
+MODEL_COST_INDEX_DIR = os.getenv("LITELLM_MODEL_COST_INDEX_DIR", None)
 NON_LLM_CONNECTION_TIMEOUT = int(
     os.getenv("NON_LLM_CONNECTION_TIMEOUT", 15)
 )  # timeout for adjacent services (e.g. jwt auth)
@@ -273,6 +300,15 @@ TOGETHER_AI_EMBEDDING_150_M = int(os.getenv("TOGETHER_AI_EMBEDDING_150_M", 150))
 TOGETHER_AI_EMBEDDING_350_M = int(os.getenv("TOGETHER_AI_EMBEDDING_350_M", 350))
 QDRANT_SCALAR_QUANTILE = float(os.getenv("QDRANT_SCALAR_QUANTILE", 0.99))
 QDRANT_VECTOR_SIZE = int(os.getenv("QDRANT_VECTOR_SIZE", 1536))
+SEMANTIC_CACHE_LOCAL_INDEX_SIZE = int(
+    os.getenv("SEMANTIC_CACHE_LOCAL_INDEX_SIZE", 1024)
+)  # recent prompts answered in-process by semantic caches, 0 disables the local tier
+SEMANTIC_CACHE_LOCAL_INDEX_TTL = int(
+    os.getenv("SEMANTIC_CACHE_LOCAL_INDEX_TTL", 600)
+)  # max seconds a semantic cache entry is served locally without asking the remote store
+SEMANTIC_CACHE_EMBEDDING_MEMO_SIZE = int(
+    os.getenv("SEMANTIC_CACHE_EMBEDDING_MEMO_SIZE", 4096)
+)  # exact prompt -> embedding entries kept by semantic caches
 CACHED_STREAMING_CHUNK_DELAY = float(os.getenv("CACHED_STREAMING_CHUNK_DELAY", 0.02))
 AUDIO_SPEECH_CHUNK_SIZE = int(
     os.getenv("AUDIO_SPEECH_CHUNK_SIZE", 8192)
@@ -280,12 +316,48 @@ AUDIO_SPEECH_CHUNK_SIZE = int(
 MAX_SIZE_PER_ITEM_IN_MEMORY_CACHE_IN_KB = int(
     os.getenv("MAX_SIZE_PER_ITEM_IN_MEMORY_CACHE_IN_KB", 512)
 )
+MAX_SIZE_IN_MEMORY_CACHE_IN_MB = float(
+    os.getenv("MAX_SIZE_IN_MEMORY_CACHE_IN_MB", 256)
+)  # total byte budget per InMemoryCache instance
+IN_MEMORY_CACHE_EXPIRY_BUCKET_SECONDS = float(
+    os.getenv("IN_MEMORY_CACHE_EXPIRY_BUCKET_SECONDS", 1)
+)  # resolution of the InMemoryCache expiry timer wheel
+CACHE_KEY_LARGE_VALUE_THRESHOLD = int(
+    os.getenv("CACHE_KEY_LARGE_VALUE_THRESHOLD", 4096)
+)  # strings / bytes at least this long are hashed separately when building cache keys
+PATTERN_MATCH_ROUTER_CACHE_SIZE = int(
+    os.getenv("PATTERN_MATCH_ROUTER_CACHE_SIZE", 1000)
+)  # resolved model names cached per wildcard PatternMatchRouter
+MODEL_ACCESS_MATCHER_CACHE_SIZE = int(
+    os.getenv("MODEL_ACCESS_MATCHER_CACHE_SIZE", 1000)
+)  # compiled key / team model allow-lists kept in memory
+MODEL_ACCESS_MATCHER_MEMO_SIZE = int(
+    os.getenv("MODEL_ACCESS_MATCHER_MEMO_SIZE", 256)
+)  # recent model access answers memoized per allow-list
+TOKEN_COUNTER_MESSAGE_CACHE_SIZE = int(
+    os.getenv("TOKEN_COUNTER_MESSAGE_CACHE_SIZE", 4096)
+)  # token counts of text-only messages memoized by token_counter
+LOWEST_LATENCY_SKETCH_RELATIVE_ACCURACY = float(
+    os.getenv("LOWEST_LATENCY_SKETCH_RELATIVE_ACCURACY", 0.02)
+)  # relative error of latency quantiles tracked by latency-based routing
+JSONL_READ_CHUNK_SIZE = int(
+    os.getenv("JSONL_READ_CHUNK_SIZE", 1024 * 1024)
+)  # bytes decoded at a time when streaming batch JSONL files
+DEFAULT_BATCH_COMPLETION_MAX_CONCURRENCY = int(
+    os.getenv("DEFAULT_BATCH_COMPLETION_MAX_CONCURRENCY", 10)
+)  # in-flight requests per deployment for litellm.abatch_completion
+DEFAULT_BATCH_COMPLETION_RATE_LIMIT_RETRIES = int(
+    os.getenv("DEFAULT_BATCH_COMPLETION_RATE_LIMIT_RETRIES", 5)
+)  # times a rate limited request is re-queued by litellm.abatch_completion
 DEFAULT_MAX_TOKENS_FOR_TRITON = int(os.getenv("DEFAULT_MAX_TOKENS_FOR_TRITON", 2000))
 #### Networking settings ####
 request_timeout: float = float(os.getenv("REQUEST_TIMEOUT", 6000))  # time in seconds
 DEFAULT_A2A_AGENT_TIMEOUT: float = float(os.getenv("DEFAULT_A2A_AGENT_TIMEOUT", 6000))  # 10 minutes
 STREAM_SSE_DONE_STRING: str = "[DONE]"
 STREAM_SSE_DATA_PREFIX: str = "data: "
+# Max milliseconds a proxy SSE frame (/v1/messages, google streaming) is held back so it is
+# written together with the frames arriving right after it. 0 = write every frame at once
+PROXY_SSE_COALESCE_WINDOW_MS = float(os.getenv("PROXY_SSE_COALESCE_WINDOW_MS", 0))
 ### SPEND TRACKING ###
 DEFAULT_REPLICATE_GPU_PRICE_PER_SECOND = float(
     os.getenv("DEFAULT_REPLICATE_GPU_PRICE_PER_SECOND", 0.001400)
@@ -1073,6 +1145,19 @@ CLOUDZERO_EXPORT_INTERVAL_MINUTES = int(
     os.getenv("CLOUDZERO_EXPORT_INTERVAL_MINUTES", 60)
 )
 MCP_TOOL_NAME_PREFIX = "mcp_tool"
+# MCP client sessions are kept open and reused per (server, transport / auth config)
+MCP_SESSION_POOL_ENABLED = os.getenv("MCP_SESSION_POOL_ENABLED", "True").lower() in [
+    "true",
+    "1",
+]
+MCP_SESSION_POOL_MAX_SESSIONS = int(os.getenv("MCP_SESSION_POOL_MAX_SESSIONS", 100))
+MCP_SESSION_POOL_IDLE_TTL = float(os.getenv("MCP_SESSION_POOL_IDLE_TTL", 300))
+# pooled sessions idle for longer than this are pinged before being reused
+MCP_SESSION_POOL_HEALTH_CHECK_INTERVAL = float(
+    os.getenv("MCP_SESSION_POOL_HEALTH_CHECK_INTERVAL", 30)
+)
+# tools listed by an MCP server are cached per (server, auth context). 0 = no caching
+MCP_TOOL_CATALOG_CACHE_TTL = float(os.getenv("MCP_TOOL_CATALOG_CACHE_TTL", 60))
 MAXIMUM_TRACEBACK_LINES_TO_LOG = int(os.getenv("MAXIMUM_TRACEBACK_LINES_TO_LOG", 100))
 
 # Headers to control callbacks
@@ -1151,6 +1236,15 @@ LITELLM_KEY_ROTATION_CHECK_INTERVAL_SECONDS = int(
 UI_SESSION_TOKEN_TEAM_ID = "litellm-dashboard"
 LITELLM_PROXY_ADMIN_NAME = "default_user_id"
 
+# Secret detection guardrail (enterprise): results cached by content hash, large texts
+# are scanned in worker threads instead of on the event loop
+SECRET_DETECTION_CACHE_SIZE = int(os.getenv("SECRET_DETECTION_CACHE_SIZE", 1000))
+SECRET_DETECTION_CACHE_TTL = int(os.getenv("SECRET_DETECTION_CACHE_TTL", 600))
+SECRET_DETECTION_OFFLOAD_MIN_CHARS = int(
+    os.getenv("SECRET_DETECTION_OFFLOAD_MIN_CHARS", 4096)
+)
+SECRET_DETECTION_MAX_WORKERS = int(os.getenv("SECRET_DETECTION_MAX_WORKERS", 4))
+
 ########################### CLI SSO AUTHENTICATION CONSTANTS ###########################
 LITELLM_CLI_SOURCE_IDENTIFIER = "litellm-cli"
 LITELLM_CLI_SESSION_TOKEN_PREFIX = "litellm-session-token"
@@ -1169,6 +1263,23 @@ SPEND_LOG_RUN_LOOPS = int(os.getenv("SPEND_LOG_RUN_LOOPS", 500))
 SPEND_LOG_CLEANUP_BATCH_SIZE = int(os.getenv("SPEND_LOG_CLEANUP_BATCH_SIZE", 1000))
 SPEND_LOG_QUEUE_SIZE_THRESHOLD = int(os.getenv("SPEND_LOG_QUEUE_SIZE_THRESHOLD", 100))
 SPEND_LOG_QUEUE_POLL_INTERVAL = float(os.getenv("SPEND_LOG_QUEUE_POLL_INTERVAL", 2.0))
+# Durable on-disk spool for spend logs - disabled unless a directory is set
+SPEND_LOG_SPOOL_DIR = os.getenv("SPEND_LOG_SPOOL_DIR", None)
+SPEND_LOG_SPOOL_FSYNC = os.getenv(
+    "SPEND_LOG_SPOOL_FSYNC", "interval"
+)  # "always", "interval" or "never"
+SPEND_LOG_SPOOL_FSYNC_INTERVAL = float(
+    os.getenv("SPEND_LOG_SPOOL_FSYNC_INTERVAL", 1.0)
+)
+SPEND_LOG_SPOOL_SEGMENT_MAX_BYTES = int(
+    os.getenv("SPEND_LOG_SPOOL_SEGMENT_MAX_BYTES", 8 * 1024 * 1024)
+)  # 8MB
+SPEND_LOG_SPOOL_MAX_BYTES = int(
+    os.getenv("SPEND_LOG_SPOOL_MAX_BYTES", 1024 * 1024 * 1024)
+)  # 1GB - spend logs are dropped once the spool holds this much
+SPEND_LOG_SPOOL_LOAD_BATCH_SIZE = int(
+    os.getenv("SPEND_LOG_SPOOL_LOAD_BATCH_SIZE", 5000)
+)
 DEFAULT_CRON_JOB_LOCK_TTL_SECONDS = int(
     os.getenv("DEFAULT_CRON_JOB_LOCK_TTL_SECONDS", 60)
 )  # 1 minute
@@ -1236,6 +1347,7 @@ LITELLM_SETTINGS_SAFE_DB_OVERRIDES = [
     "public_model_groups_links",
     "cost_discount_config",
     "cost_margin_config",
+    "http_client_pool_settings",
 ]
 SPECIAL_LITELLM_AUTH_TOKEN = ["ui-token"]
 DEFAULT_MANAGEMENT_OBJECT_IN_MEMORY_CACHE_TTL = int(
@@ -1317,6 +1429,20 @@ COROUTINE_CHECKER_MAX_SIZE_IN_MEMORY = int(
 DEFAULT_CHUNK_SIZE = int(os.getenv("DEFAULT_CHUNK_SIZE", 1000))
 DEFAULT_CHUNK_OVERLAP = int(os.getenv("DEFAULT_CHUNK_OVERLAP", 200))
 
+########################### RAG Embedding Constants ###########################
+DEFAULT_RAG_EMBEDDING_BATCH_SIZE = int(
+    os.getenv("DEFAULT_RAG_EMBEDDING_BATCH_SIZE", 100)
+)  # chunks per embedding request
+DEFAULT_RAG_EMBEDDING_MAX_CONCURRENCY = int(
+    os.getenv("DEFAULT_RAG_EMBEDDING_MAX_CONCURRENCY", 4)
+)  # embedding requests in flight per ingestion
+RAG_EMBEDDING_CACHE_SIZE = int(
+    os.getenv("RAG_EMBEDDING_CACHE_SIZE", 10000)
+)  # chunk embeddings kept in memory, keyed by content hash
+RAG_EMBEDDING_CACHE_TTL = int(
+    os.getenv("RAG_EMBEDDING_CACHE_TTL", 86400)
+)  # seconds a cached chunk embedding is reused on re-ingestion
+
 ########################### Microsoft SSO Constants ###########################
 MICROSOFT_USER_EMAIL_ATTRIBUTE = str(
     os.getenv("MICROSOFT_USER_EMAIL_ATTRIBUTE", "userPrincipalName")
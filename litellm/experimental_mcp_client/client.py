@@ -4,8 +4,22 @@ LiteLLM Proxy uses this MCP Client to connnect to other MCP servers.
 
 import asyncio
 import base64
+import hashlib
+import json
 from datetime import timedelta
-from typing import Awaitable, Callable, Dict, List, Optional, TypeVar, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncContextManager,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
 
 import httpx
 from mcp import ClientSession, ReadResourceResult, Resource, StdioServerParameters
@@ -35,6 +49,9 @@ from litellm.types.mcp import (
     MCPTransportType,
 )
 
+if TYPE_CHECKING:
+    from litellm.experimental_mcp_client.session_pool import MCPSessionPool
+
 
 def to_basic_auth(auth_value: str) -> str:
     """Convert auth value to Basic Auth format."""
@@ -62,6 +79,8 @@ class MCPClient:
         stdio_config: Optional[MCPStdioConfig] = None,
         extra_headers: Optional[Dict[str, str]] = None,
         ssl_verify: Optional[VerifyTypes] = None,
+        session_pool: Optional["MCPSessionPool"] = None,
+        session_pool_server_id: Optional[str] = None,
     ):
         self.server_url: str = server_url
         self.transport_type: MCPTransport = transport_type
@@ -71,52 +90,82 @@ class MCPClient:
         self.stdio_config: Optional[MCPStdioConfig] = stdio_config
         self.extra_headers: Optional[Dict[str, str]] = extra_headers
         self.ssl_verify: Optional[VerifyTypes] = ssl_verify
+        # if set, sessions are taken from / kept open in the pool instead of being
+        # opened and closed around every operation
+        self.session_pool: Optional["MCPSessionPool"] = session_pool
+        self.session_pool_server_id: Optional[str] = session_pool_server_id
         # handle the basic auth value if provided
         if auth_value:
             self.update_auth_value(auth_value)
 
+    def create_transport_context(self) -> AsyncContextManager[Tuple[Any, ...]]:
+        """Transport context for this client, yields (read_stream, write_stream, ...)"""
+        if self.transport_type == MCPTransport.stdio:
+            if not self.stdio_config:
+                raise ValueError("stdio_config is required for stdio transport")
+
+            server_params = StdioServerParameters(
+                command=self.stdio_config.get("command", ""),
+                args=self.stdio_config.get("args", []),
+                env=self.stdio_config.get("env", {}),
+            )
+            return stdio_client(server_params)
+        elif self.transport_type == MCPTransport.sse:
+            headers = self._get_auth_headers()
+            httpx_client_factory = self._create_httpx_client_factory()
+            return sse_client(
+                url=self.server_url,
+                timeout=self.timeout,
+                headers=headers,
+                httpx_client_factory=httpx_client_factory,
+            )
+        else:
+            headers = self._get_auth_headers()
+            httpx_client_factory = self._create_httpx_client_factory()
+            verbose_logger.debug(
+                "litellm headers for streamablehttp_client: %s", headers
+            )
+            return streamablehttp_client(
+                url=self.server_url,
+                timeout=timedelta(seconds=self.timeout),
+                headers=headers,
+                httpx_client_factory=httpx_client_factory,
+            )
+
+    def get_session_pool_key(self) -> Tuple[str, str]:
+        """
+        (server id, hash of the transport / auth config). Pooled sessions are only
+        shared between clients with the same key.
+        """
+        config = {
+            "transport": self.transport_type,
+            "url": self.server_url,
+            "headers": self._get_auth_headers(),
+            "stdio_config": self.stdio_config,
+            "timeout": self.timeout,
+            "ssl_verify": self.ssl_verify,
+        }
+        config_hash = hashlib.sha256(
+            json.dumps(config, sort_keys=True, default=str).encode("utf-8")
+        ).hexdigest()
+        return self.session_pool_server_id or "", config_hash
+
     async def run_with_session(
         self, operation: Callable[[ClientSession], Awaitable[TSessionResult]]
     ) -> TSessionResult:
         """Open a session, run the provided coroutine, and clean up."""
-        transport_ctx = None
-
-        try:
-            if self.transport_type == MCPTransport.stdio:
-                if not self.stdio_config:
-                    raise ValueError("stdio_config is required for stdio transport")
-
-                server_params = StdioServerParameters(
-                    command=self.stdio_config.get("command", ""),
-                    args=self.stdio_config.get("args", []),
-                    env=self.stdio_config.get("env", {}),
-                )
-                transport_ctx = stdio_client(server_params)
-            elif self.transport_type == MCPTransport.sse:
-                headers = self._get_auth_headers()
-                httpx_client_factory = self._create_httpx_client_factory()
-                transport_ctx = sse_client(
-                    url=self.server_url,
-                    timeout=self.timeout,
-                    headers=headers,
-                    httpx_client_factory=httpx_client_factory,
-                )
-            else:
-                headers = self._get_auth_headers()
-                httpx_client_factory = self._create_httpx_client_factory()
-                verbose_logger.debug(
-                    "litellm headers for streamablehttp_client: %s", headers
-                )
-                transport_ctx = streamablehttp_client(
-                    url=self.server_url,
-                    timeout=timedelta(seconds=self.timeout),
-                    headers=headers,
-                    httpx_client_factory=httpx_client_factory,
+        if self.session_pool is not None:
+            try:
+                return await self.session_pool.run_with_session(self, operation)
+            except Exception:
+                verbose_logger.warning(
+                    "MCP client run_with_session failed for %s (pooled session)",
+                    self.server_url or "stdio",
                 )
+                raise
 
-            if transport_ctx is None:
-                raise RuntimeError("Failed to create transport context")
-
+        try:
+            transport_ctx = self.create_transport_context()
             async with transport_ctx as transport:
                 read_stream, write_stream = transport[0], transport[1]
                 session_ctx = ClientSession(read_stream, write_stream)
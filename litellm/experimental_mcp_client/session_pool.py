@@ -0,0 +1,317 @@
+"""
+Pool of long-lived MCP client sessions.
+
+Without a pool, `MCPClient.run_with_session` opens the transport, runs the
+`initialize` handshake, runs one operation and closes everything again. With a
+session pool set on the client, the session is kept open and reused by later
+operations of clients with the same pool key (server id + transport / auth config):
+    - each session is owned by a background task, which enters and exits the
+      transport and `ClientSession` contexts (anyio requires both in one task)
+    - a session idle for longer than `health_check_interval` is pinged before it
+      is reused, and replaced if the ping fails
+    - a reused session that fails with a connection error is replaced, and the
+      operation retried once on a new session
+    - sessions idle for longer than `idle_ttl` are closed, and the least recently
+      used idle sessions once the pool holds more than `max_sessions`
+    - `notifications/tools/list_changed` sent by a server on a pooled session is
+      passed to `on_tools_list_changed` with the server id
+"""
+
+import asyncio
+import time
+from collections import OrderedDict
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+import anyio
+import httpx
+from mcp import ClientSession
+from mcp.shared.exceptions import McpError
+from mcp.types import CONNECTION_CLOSED, ServerNotification, ToolListChangedNotification
+
+from litellm._logging import verbose_logger
+from litellm.constants import (
+    MCP_SESSION_POOL_HEALTH_CHECK_INTERVAL,
+    MCP_SESSION_POOL_IDLE_TTL,
+    MCP_SESSION_POOL_MAX_SESSIONS,
+)
+
+if TYPE_CHECKING:
+    from litellm.experimental_mcp_client.client import MCPClient
+
+# (server id, hash of the transport / auth config of the client)
+MCPSessionPoolKey = Tuple[str, str]
+
+TSessionResult = TypeVar("TSessionResult")
+
+# errors meaning the session's connection is gone, rather than the request failing
+_CONNECTION_ERRORS = (
+    anyio.ClosedResourceError,
+    anyio.BrokenResourceError,
+    anyio.EndOfStream,
+    ConnectionError,
+    httpx.TransportError,
+)
+
+_HEALTH_CHECK_TIMEOUT = 5.0
+
+
+def _is_connection_error(error: BaseException) -> bool:
+    if isinstance(error, McpError):
+        return error.error.code == CONNECTION_CLOSED
+    return isinstance(error, _CONNECTION_ERRORS)
+
+
+class _PooledSession:
+    def __init__(self, key: MCPSessionPoolKey):
+        self.key = key
+        self.loop = asyncio.get_running_loop()
+        self.ready: "asyncio.Future[ClientSession]" = self.loop.create_future()
+        self.closing = asyncio.Event()
+        self.owner_task: Optional[asyncio.Task] = None
+        self.in_use = 0
+        self.last_used = time.monotonic()
+        # removed from the pool - closed once the last operation using it is done
+        self.retired = False
+
+    @property
+    def session(self) -> ClientSession:
+        return self.ready.result()
+
+    def is_idle(self) -> bool:
+        return self.in_use == 0 and self.ready.done()
+
+
+class MCPSessionPool:
+    def __init__(
+        self,
+        max_sessions: int = MCP_SESSION_POOL_MAX_SESSIONS,
+        idle_ttl: float = MCP_SESSION_POOL_IDLE_TTL,
+        health_check_interval: float = MCP_SESSION_POOL_HEALTH_CHECK_INTERVAL,
+        on_tools_list_changed: Optional[Callable[[str], None]] = None,
+    ):
+        self.max_sessions = max_sessions
+        self.idle_ttl = idle_ttl
+        self.health_check_interval = health_check_interval
+        self.on_tools_list_changed = on_tools_list_changed
+        self._sessions: "OrderedDict[MCPSessionPoolKey, _PooledSession]" = OrderedDict()
+        self._reaper_task: Optional[asyncio.Task] = None
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    async def run_with_session(
+        self,
+        client: "MCPClient",
+        operation: Callable[[ClientSession], Awaitable[TSessionResult]],
+    ) -> TSessionResult:
+        """Run `operation` on the pooled session for `client`, opening it if needed."""
+        key = client.get_session_pool_key()
+        pooled, reused = await self._acquire(key, client)
+        try:
+            return await operation(pooled.session)
+        except Exception as e:
+            if not _is_connection_error(e):
+                raise
+            self._discard(pooled)
+            if not reused:
+                raise
+            verbose_logger.debug(
+                "MCP session pool: pooled session for %s lost its connection (%s), "
+                "retrying on a new session",
+                key[0],
+                type(e).__name__,
+            )
+        finally:
+            self._release(pooled)
+
+        pooled, _ = await self._acquire(key, client)
+        try:
+            return await operation(pooled.session)
+        except Exception as e:
+            if _is_connection_error(e):
+                self._discard(pooled)
+            raise
+        finally:
+            self._release(pooled)
+
+    def close_server(self, server_id: str) -> None:
+        """Close the pooled sessions of a server, e.g. after its config changed."""
+        for pooled in list(self._sessions.values()):
+            if pooled.key[0] == server_id:
+                self._discard(pooled)
+
+    async def close_all(self) -> None:
+        """Close every pooled session, including ones in use."""
+        pooled_sessions = list(self._sessions.values())
+        self._sessions.clear()
+        owner_tasks: List[asyncio.Task] = []
+        for pooled in pooled_sessions:
+            pooled.retired = True
+            pooled.closing.set()
+            if pooled.owner_task is not None:
+                owner_tasks.append(pooled.owner_task)
+        if self._reaper_task is not None:
+            self._reaper_task.cancel()
+            self._reaper_task = None
+        if owner_tasks:
+            await asyncio.gather(*owner_tasks, return_exceptions=True)
+
+    async def _acquire(
+        self, key: MCPSessionPoolKey, client: "MCPClient"
+    ) -> Tuple[_PooledSession, bool]:
+        """The session for `key` and whether it was already open, marked in use."""
+        self._drop_sessions_of_other_loops()
+        self._evict_idle_sessions()
+
+        pooled = self._sessions.get(key)
+        if pooled is not None:
+            self._sessions.move_to_end(key)
+            await self._wait_until_ready(pooled)
+            if await self._is_healthy(pooled):
+                return pooled, True
+            self._discard(pooled)
+            self._release(pooled)
+
+        pooled = self._open(key, client)
+        await self._wait_until_ready(pooled)
+        return pooled, False
+
+    async def _wait_until_ready(self, pooled: _PooledSession) -> None:
+        pooled.in_use += 1
+        try:
+            # shielded: the future is shared by every operation waiting for the session
+            await asyncio.shield(pooled.ready)
+        except BaseException:
+            pooled.in_use -= 1
+            raise
+
+    async def _is_healthy(self, pooled: _PooledSession) -> bool:
+        if (
+            pooled.in_use > 1
+            or time.monotonic() - pooled.last_used < self.health_check_interval
+        ):
+            return True
+        try:
+            await asyncio.wait_for(
+                pooled.session.send_ping(), timeout=_HEALTH_CHECK_TIMEOUT
+            )
+        except Exception as e:
+            verbose_logger.debug(
+                "MCP session pool: health check failed for %s: %s",
+                pooled.key[0],
+                str(e),
+            )
+            return False
+        pooled.last_used = time.monotonic()
+        return True
+
+    def _open(self, key: MCPSessionPoolKey, client: "MCPClient") -> _PooledSession:
+        pooled = _PooledSession(key)
+        self._sessions[key] = pooled
+        pooled.owner_task = asyncio.create_task(self._hold_session(pooled, client))
+        self._evict_least_recently_used()
+        if self._reaper_task is None or self._reaper_task.done():
+            self._reaper_task = asyncio.create_task(self._reap_idle_sessions())
+        return pooled
+
+    async def _hold_session(self, pooled: _PooledSession, client: "MCPClient"):
+        """Owner task of a pooled session: open it, then keep it open until closed."""
+        try:
+            async with client.create_transport_context() as transport:
+                read_stream, write_stream = transport[0], transport[1]
+                async with ClientSession(
+                    read_stream,
+                    write_stream,
+                    message_handler=self._create_message_handler(pooled.key[0]),
+                ) as session:
+                    await session.initialize()
+                    pooled.ready.set_result(session)
+                    verbose_logger.debug(
+                        "MCP session pool: opened session for %s (%s pooled)",
+                        pooled.key[0],
+                        len(self._sessions),
+                    )
+                    await pooled.closing.wait()
+        except Exception as e:
+            if not pooled.ready.done():
+                pooled.ready.set_exception(e)
+                # raised to the waiting operations - not an unretrieved exception
+                pooled.ready.exception()
+            else:
+                verbose_logger.debug(
+                    "MCP session pool: session for %s closed with %s: %s",
+                    pooled.key[0],
+                    type(e).__name__,
+                    str(e),
+                )
+        finally:
+            if not pooled.ready.done():
+                pooled.ready.cancel()
+            if self._sessions.get(pooled.key) is pooled:
+                del self._sessions[pooled.key]
+
+    def _create_message_handler(self, server_id: str):
+        async def _message_handler(message: Any) -> None:
+            if (
+                isinstance(message, ServerNotification)
+                and isinstance(message.root, ToolListChangedNotification)
+                and self.on_tools_list_changed is not None
+            ):
+                verbose_logger.debug(
+                    "MCP session pool: tools/list_changed from %s", server_id
+                )
+                self.on_tools_list_changed(server_id)
+
+        return _message_handler
+
+    def _release(self, pooled: _PooledSession) -> None:
+        pooled.in_use -= 1
+        pooled.last_used = time.monotonic()
+        if pooled.retired and pooled.in_use == 0:
+            pooled.closing.set()
+
+    def _discard(self, pooled: _PooledSession) -> None:
+        """Remove from the pool; closed now, or when its last operation is done."""
+        if self._sessions.get(pooled.key) is pooled:
+            del self._sessions[pooled.key]
+        pooled.retired = True
+        if pooled.in_use == 0 and not pooled.loop.is_closed():
+            pooled.closing.set()
+
+    def _drop_sessions_of_other_loops(self) -> None:
+        """Sessions opened on another (e.g. closed) event loop can't be used or closed."""
+        loop = asyncio.get_running_loop()
+        for key, pooled in list(self._sessions.items()):
+            if pooled.loop is not loop:
+                del self._sessions[key]
+        if self._reaper_task is not None and self._reaper_task.get_loop() is not loop:
+            self._reaper_task = None
+
+    def _evict_idle_sessions(self) -> None:
+        now = time.monotonic()
+        for pooled in list(self._sessions.values()):
+            if pooled.is_idle() and now - pooled.last_used > self.idle_ttl:
+                self._discard(pooled)
+
+    def _evict_least_recently_used(self) -> None:
+        if len(self._sessions) <= self.max_sessions:
+            return
+        for pooled in list(self._sessions.values()):
+            if len(self._sessions) <= self.max_sessions:
+                break
+            if pooled.is_idle():
+                self._discard(pooled)
+
+    async def _reap_idle_sessions(self) -> None:
+        while self._sessions:
+            await asyncio.sleep(max(self.idle_ttl / 2, 1.0))
+            self._evict_idle_sessions()
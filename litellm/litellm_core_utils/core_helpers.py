@@ -323,6 +323,33 @@ def safe_deep_copy(data):
     return new_data
 
 
+_SNAPSHOT_SHARED_TYPES = frozenset({str, bytes, int, float, bool, type(None)})
+
+
+def snapshot_messages(messages: Any) -> Any:
+    """
+    Copy of a request's messages, safe to keep while the original is mutated
+
+    Equivalent to copy.deepcopy for json-like data, but much cheaper: lists / dicts
+    are rebuilt, while immutable leaves (eg. long prompts, base64 images) are shared
+    with the original instead of going through deepcopy's memo. Anything else is
+    deep-copied.
+    """
+    value_type = type(messages)
+    if value_type in _SNAPSHOT_SHARED_TYPES:
+        return messages
+    if value_type is dict:
+        return {k: snapshot_messages(v) for k, v in messages.items()}
+    if value_type is list:
+        return [snapshot_messages(v) for v in messages]
+    if value_type is tuple:
+        return tuple(snapshot_messages(v) for v in messages)
+
+    import copy
+
+    return copy.deepcopy(messages)
+
+
 def filter_exceptions_from_params(data: Any, max_depth: int = 20) -> Any:
     """
     Recursively filter out Exception objects and callable objects from dicts/lists.
@@ -6,42 +6,114 @@ This can be disabled by setting the LITELLM_LOCAL_MODEL_COST_MAP environment var
 ```
 export LITELLM_LOCAL_MODEL_COST_MAP=True
 ```
+
+Set LITELLM_MODEL_COST_MAP_BACKGROUND_REFRESH=True to load the bundled map on import
+(from a precompiled index, see model_cost_index.py) and fetch the hosted map in a
+background thread instead of blocking import on the fetch. It's opt-in: import would
+otherwise start a thread, and litellm.model_cost would change from the bundled to the
+hosted prices while the process runs.
 """
 
 import os
+import threading
+from typing import Optional
 
 import httpx
 
+from litellm.constants import MODEL_COST_MAP_FETCH_TIMEOUT
 
-def get_model_cost_map(url: str) -> dict:
-    if (
+# guards updates of litellm.model_cost - `register_model` and the background refresh
+model_cost_lock = threading.RLock()
+
+
+def use_local_model_cost_map() -> bool:
+    return bool(
         os.getenv("LITELLM_LOCAL_MODEL_COST_MAP", False)
         or os.getenv("LITELLM_LOCAL_MODEL_COST_MAP", False) == "True"
-    ):
-        from importlib.resources import files
-        import json
-
-        content = json.loads(
-            files("litellm")
-            .joinpath("model_prices_and_context_window_backup.json")
-            .read_text(encoding="utf-8")
-        )
-        return content
+    )
+
+
+def get_local_model_cost_map() -> dict:
+    from litellm.litellm_core_utils.model_cost_index import load_model_cost_index
+
+    model_cost, _ = load_model_cost_index()
+    return model_cost
+
+
+def fetch_remote_model_cost_map(url: str) -> dict:
+    response = httpx.get(url, timeout=MODEL_COST_MAP_FETCH_TIMEOUT)
+    response.raise_for_status()  # Raise an exception if the request is unsuccessful
+    return response.json()
+
+
+def get_model_cost_map(url: str) -> dict:
+    if use_local_model_cost_map():
+        return get_local_model_cost_map()
 
     try:
-        response = httpx.get(
-            url, timeout=5
-        )  # set a 5 second timeout for the get request
-        response.raise_for_status()  # Raise an exception if the request is unsuccessful
-        content = response.json()
-        return content
+        return fetch_remote_model_cost_map(url)
     except Exception:
-        from importlib.resources import files
-        import json
+        return get_local_model_cost_map()
+
+
+def apply_remote_model_cost_map(
+    remote_model_cost: dict, loaded_model_cost: dict
+) -> bool:
+    """
+    Swap the hosted map into `litellm.model_cost`, keeping runtime changes.
+
+    Entries added / changed since import (e.g. `litellm.register_model`) win over the
+    hosted map. Skipped if `litellm.model_cost` was replaced since import - e.g. by
+    the proxy's `/reload/model_cost_map` or a re-import.
+
+    Returns:
+        bool: True if the hosted map was applied
+    """
+    import litellm
+    from litellm.utils import _invalidate_model_cost_lowercase_map
+
+    if litellm.model_cost is not loaded_model_cost:
+        return False
+    bundled_model_cost = get_local_model_cost_map()
+    with model_cost_lock:
+        if litellm.model_cost is not loaded_model_cost:
+            return False
+        merged_model_cost = dict(remote_model_cost)
+        for key, value in loaded_model_cost.items():
+            if bundled_model_cost.get(key) != value:
+                merged_model_cost[key] = value
+        litellm.model_cost = merged_model_cost
+        _invalidate_model_cost_lowercase_map()
+        litellm.add_known_models(model_cost_map=merged_model_cost)
+    return True
 
-        content = json.loads(
-            files("litellm")
-            .joinpath("model_prices_and_context_window_backup.json")
-            .read_text(encoding="utf-8")
+
+def _refresh_model_cost_map(url: str, loaded_model_cost: dict) -> None:
+    from litellm._logging import verbose_logger
+
+    try:
+        remote_model_cost = fetch_remote_model_cost_map(url)
+        if apply_remote_model_cost_map(remote_model_cost, loaded_model_cost):
+            verbose_logger.debug(
+                "Loaded hosted model cost map: %s models", len(remote_model_cost)
+            )
+    except Exception as e:
+        verbose_logger.debug(
+            "Failed to fetch hosted model cost map, using bundled map: %s", str(e)
         )
-        return content
+
+
+def start_model_cost_map_refresh(
+    url: str, loaded_model_cost: dict
+) -> Optional[threading.Thread]:
+    """Fetch the hosted model cost map in a daemon thread. No-op in local mode."""
+    if use_local_model_cost_map():
+        return None
+    thread = threading.Thread(
+        target=_refresh_model_cost_map,
+        args=(url, loaded_model_cost),
+        name="litellm-model-cost-map-refresh",
+        daemon=True,
+    )
+    thread.start()
+    return thread
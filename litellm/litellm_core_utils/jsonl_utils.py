@@ -0,0 +1,164 @@
+"""
+Streaming JSON Lines reader / writer.
+
+Batch input and output files can be several GB, so they are decoded in
+fixed-size chunks and yielded one record at a time instead of being loaded
+into a list of dicts.
+
+Records are normally one per line, but a record may also span several lines
+(pretty-printed objects, or raw newlines inside string values). A line that is
+cut off mid-record is joined with the following lines until it parses; a line
+that is invalid anywhere else raises `json.JSONDecodeError` right away.
+"""
+
+import codecs
+import json
+from typing import (
+    IO,
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Iterable,
+    Iterator,
+    List,
+    Union,
+)
+
+from litellm.constants import JSONL_READ_CHUNK_SIZE
+
+JSONLChunk = Union[str, bytes, bytearray, memoryview]
+JSONLSource = Union[str, bytes, bytearray, memoryview, IO, Iterable[JSONLChunk]]
+
+# strict=False accepts raw control characters (e.g. "\n") inside strings
+_json_decoder = json.JSONDecoder(strict=False)
+
+
+class JSONLDecoder:
+    """
+    Incremental JSONL decoder.
+
+    `feed()` accepts str or utf-8 bytes chunks split at arbitrary positions and
+    returns the records completed by that chunk. It raises `json.JSONDecodeError`
+    on a corrupt record. `close()` returns the last record (one without a trailing
+    newline) and raises `json.JSONDecodeError` if anything unparseable is left over.
+    """
+
+    def __init__(self):
+        self._bytes_decoder = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._record_start = 0  # start of the pending record in _buffer
+        self._scan_from = 0  # where to look for the next newline in _buffer
+
+    def feed(self, chunk: JSONLChunk) -> List[Any]:
+        if not isinstance(chunk, str):
+            chunk = self._bytes_decoder.decode(chunk)
+        if self._record_start:
+            # drop consumed records so the buffer only holds the pending one
+            self._buffer = self._buffer[self._record_start :]
+            self._scan_from -= self._record_start
+            self._record_start = 0
+        self._buffer += chunk
+        return self._drain()
+
+    def close(self) -> List[Any]:
+        self._buffer += self._bytes_decoder.decode(b"", final=True)
+        records = self._drain()
+        remainder = self._buffer[self._record_start :]
+        self._buffer = ""
+        self._record_start = self._scan_from = 0
+        if remainder.strip():
+            records.append(_json_decoder.decode(remainder))
+        return records
+
+    def _drain(self) -> List[Any]:
+        records: List[Any] = []
+        buffer = self._buffer
+        while True:
+            newline = buffer.find("\n", self._scan_from)
+            if newline == -1:
+                return records
+            self._scan_from = newline + 1
+            record = buffer[self._record_start : newline]
+            if record.strip():
+                try:
+                    records.append(_json_decoder.decode(record))
+                except json.JSONDecodeError as e:
+                    if _is_truncated(record, e):
+                        continue  # record continues on the next line
+                    raise
+            self._record_start = newline + 1
+
+
+def _is_truncated(record: str, error: json.JSONDecodeError) -> bool:
+    """
+    Whether `record` failed to parse only because it ends too early - a multi-line
+    record - rather than being invalid JSON.
+    """
+    return error.pos >= len(record.rstrip()) or error.msg.startswith(
+        "Unterminated string"
+    )
+
+
+def _iter_chunks(source: JSONLSource, chunk_size: int) -> Iterator[JSONLChunk]:
+    if isinstance(source, (str, bytes, bytearray, memoryview)):
+        if isinstance(source, (bytes, bytearray)):
+            source = memoryview(source)  # slice without copying
+        for start in range(0, len(source), chunk_size):
+            yield source[start : start + chunk_size]
+    elif hasattr(source, "read"):
+        while True:
+            chunk = source.read(chunk_size)  # type: ignore
+            if not chunk:
+                return
+            yield chunk
+    else:
+        yield from source  # type: ignore
+
+
+def iter_jsonl(
+    source: JSONLSource, chunk_size: int = JSONL_READ_CHUNK_SIZE
+) -> Iterator[Any]:
+    """
+    Yield the records of JSONL content one at a time.
+
+    `source` can be str / bytes content, a file object opened in text or binary
+    mode, or an iterable of str / bytes chunks (e.g. `httpx.Response.iter_bytes()`).
+    """
+    decoder = JSONLDecoder()
+    for chunk in _iter_chunks(source, chunk_size):
+        yield from decoder.feed(chunk)
+    yield from decoder.close()
+
+
+async def aiter_jsonl(source: AsyncIterable[JSONLChunk]) -> AsyncIterator[Any]:
+    """
+    Async version of `iter_jsonl`, for async byte iterators such as
+    `httpx.Response.aiter_bytes()`.
+    """
+    decoder = JSONLDecoder()
+    async for chunk in source:
+        for record in decoder.feed(chunk):
+            yield record
+    for record in decoder.close():
+        yield record
+
+
+def iter_jsonl_lines(records: Iterable[Any]) -> Iterator[bytes]:
+    """
+    Encode records as utf-8 JSONL, separated by newlines.
+    """
+    separator = b""
+    for record in records:
+        yield separator + json.dumps(record).encode("utf-8")
+        separator = b"\n"
+
+
+def write_jsonl(records: Iterable[Any], file: IO[bytes]) -> int:
+    """
+    Write records to a binary file object as JSONL. Returns the record count.
+    """
+    count = 0
+    for line in iter_jsonl_lines(records):
+        file.write(line)
+        count += 1
+    return count
@@ -1,7 +1,6 @@
 # What is this?
 ## Common Utility file for Logging handler
 # Logging function -> log the exact model details + what's being sent | Non-Blocking
-import copy
 import datetime
 import json
 import os
@@ -59,7 +58,10 @@ from litellm.integrations.custom_logger import CustomLogger
 from litellm.integrations.deepeval.deepeval import DeepEvalLogger
 from litellm.integrations.mlflow import MlflowLogger
 from litellm.integrations.sqs import SQSLogger
-from litellm.litellm_core_utils.core_helpers import reconstruct_model_name
+from litellm.litellm_core_utils.core_helpers import (
+    reconstruct_model_name,
+    snapshot_messages,
+)
 from litellm.litellm_core_utils.get_litellm_params import get_litellm_params
 from litellm.litellm_core_utils.llm_cost_calc.tool_call_cost_tracking import (
     StandardBuiltInToolCostTracking,
@@ -325,7 +327,7 @@ class Logging(LiteLLMLoggingBaseClass):
                 messages = new_messages
 
         self.model = model
-        self.messages = copy.deepcopy(messages)
+        self.messages = snapshot_messages(messages)
         self.stream = stream
         self.start_time = start_time  # log the call start time
         self.call_type = call_type
@@ -970,10 +972,8 @@ class Logging(LiteLLMLoggingBaseClass):
                             print_verbose=print_verbose,
                         )
                     elif callback == "sentry" and add_breadcrumb:
-                        try:
-                            details_to_log = copy.deepcopy(self.model_call_details)
-                        except Exception:
-                            details_to_log = self.model_call_details
+                        # only top-level keys are removed - a shallow copy is enough
+                        details_to_log = dict(self.model_call_details)
                         if litellm.turn_off_message_logging:
                             # make a copy of the _model_Call_details and log it
                             details_to_log.pop("messages", None)
@@ -1172,10 +1172,8 @@ class Logging(LiteLLMLoggingBaseClass):
                 try:
                     if callback == "sentry" and add_breadcrumb:
                         verbose_logger.debug("reaches sentry breadcrumbing")
-                        try:
-                            details_to_log = copy.deepcopy(self.model_call_details)
-                        except Exception:
-                            details_to_log = self.model_call_details
+                        # only top-level keys are removed - a shallow copy is enough
+                        details_to_log = dict(self.model_call_details)
                         if litellm.turn_off_message_logging:
                             # make a copy of the _model_Call_details and log it
                             details_to_log.pop("messages", None)
@@ -0,0 +1,147 @@
+"""
+Precompiled index of the bundled model cost map (model_prices_and_context_window_backup.json)
+
+Parsing the 1.2MB json on every import is the largest fixed cost of loading the local
+model cost map. The index stores the parsed map - plus the model names grouped by
+`litellm_provider`, used to build the provider model sets - as a marshal file, which
+loads ~2x faster than json.loads.
+
+The index is keyed on the json file's size + mtime and the python version, and is
+rebuilt on first use when missing or stale. It is written next to the json (so
+docker images / wheels installed in a writable location can ship it prebuilt), or in
+~/.cache/litellm when the package directory is read-only.
+
+Build it ahead of time (e.g. at image build):
+
+```
+python -m litellm.litellm_core_utils.model_cost_index
+```
+"""
+
+import marshal
+import os
+import sys
+from collections import defaultdict
+from importlib.resources import files
+from typing import Dict, List, Optional, Tuple
+
+from litellm.constants import MODEL_COST_INDEX_DIR
+
+MODEL_COST_INDEX_VERSION = 1
+MODEL_COST_MAP_FILE_NAME = "model_prices_and_context_window_backup.json"
+
+
+def get_model_cost_map_path() -> str:
+    return str(files("litellm").joinpath(MODEL_COST_MAP_FILE_NAME))
+
+
+def group_models_by_provider(model_cost: dict) -> Dict[str, List[str]]:
+    """Group model cost map keys by their `litellm_provider` in a single pass."""
+    provider_models: Dict[str, List[str]] = defaultdict(list)
+    for key, value in model_cost.items():
+        provider = value.get("litellm_provider") if isinstance(value, dict) else None
+        if provider is not None:
+            provider_models[provider].append(key)
+    return dict(provider_models)
+
+
+def _get_index_paths() -> List[str]:
+    index_file_name = (
+        f"{MODEL_COST_MAP_FILE_NAME[: -len('.json')]}."
+        f"{sys.implementation.cache_tag}.idx"
+    )
+    if MODEL_COST_INDEX_DIR:
+        return [os.path.join(MODEL_COST_INDEX_DIR, index_file_name)]
+    return [
+        os.path.join(os.path.dirname(get_model_cost_map_path()), index_file_name),
+        os.path.join(os.path.expanduser("~"), ".cache", "litellm", index_file_name),
+    ]
+
+
+def _get_index_header(source_path: str) -> tuple:
+    stat = os.stat(source_path)
+    return (MODEL_COST_INDEX_VERSION, stat.st_size, stat.st_mtime_ns)
+
+
+def _read_index(index_path: str, header: tuple) -> Optional[Tuple[dict, dict]]:
+    try:
+        with open(index_path, "rb") as f:
+            # marshal.loads on the whole file, marshal.load(f) reads in small chunks
+            index_header, model_cost, provider_models = marshal.loads(f.read())
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+    if index_header != header:
+        return None
+    return model_cost, provider_models
+
+
+def _write_index(
+    index_path: str, header: tuple, model_cost: dict, provider_models: dict
+) -> bool:
+    tmp_path = f"{index_path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(index_path), exist_ok=True)
+        with open(tmp_path, "wb") as f:
+            f.write(marshal.dumps((header, model_cost, provider_models)))
+        # atomic - concurrent workers never read a partially written index
+        os.replace(tmp_path, index_path)
+        return True
+    except (OSError, ValueError):
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        return False
+
+
+def build_model_cost_index(
+    source_path: Optional[str] = None,
+) -> Tuple[dict, Dict[str, List[str]], Optional[str]]:
+    """
+    Parse the bundled json and write the index to the first writable location.
+
+    Returns:
+        (model_cost, provider_models, index_path) - index_path is None if no
+        location was writable
+    """
+    import json
+
+    source_path = source_path or get_model_cost_map_path()
+    header = _get_index_header(source_path)
+    with open(source_path, encoding="utf-8") as f:
+        model_cost = json.load(f)
+    provider_models = group_models_by_provider(model_cost)
+    for index_path in _get_index_paths():
+        if _write_index(index_path, header, model_cost, provider_models):
+            return model_cost, provider_models, index_path
+    return model_cost, provider_models, None
+
+
+def load_model_cost_index() -> Tuple[dict, Dict[str, List[str]]]:
+    """
+    Load the bundled model cost map and its provider -> model names grouping.
+
+    Every call returns new objects, callers are free to mutate them.
+    """
+    source_path = get_model_cost_map_path()
+    try:
+        header = _get_index_header(source_path)
+    except OSError:
+        header = None
+    if header is not None:
+        for index_path in _get_index_paths():
+            index = _read_index(index_path, header)
+            if index is not None:
+                return index
+    model_cost, provider_models, _ = build_model_cost_index(source_path)
+    return model_cost, provider_models
+
+
+if __name__ == "__main__":
+    _model_cost, _, _index_path = build_model_cost_index()
+    if _index_path is None:
+        print(  # noqa: T201
+            "model cost index: no writable location found", file=sys.stderr
+        )
+        sys.exit(1)
+    print(f"model cost index: {len(_model_cost)} models -> {_index_path}")  # noqa: T201
@@ -3,9 +3,12 @@
 import base64
 import io
 import struct
+from functools import lru_cache
 from typing import (
     Any,
     Callable,
+    Dict,
+    Hashable,
     List,
     Literal,
     Mapping,
@@ -23,10 +26,12 @@ from litellm.constants import (
     DEFAULT_IMAGE_HEIGHT,
     DEFAULT_IMAGE_TOKEN_COUNT,
     DEFAULT_IMAGE_WIDTH,
+    DEFAULT_MAX_LRU_CACHE_SIZE,
     MAX_LONG_SIDE_FOR_IMAGE_HIGH_RES,
     MAX_SHORT_SIDE_FOR_IMAGE_HIGH_RES,
     MAX_TILE_HEIGHT,
     MAX_TILE_WIDTH,
+    TOKEN_COUNTER_MESSAGE_CACHE_SIZE,
 )
 from litellm.litellm_core_utils.default_encoding import encoding as default_encoding
 from litellm.llms.custom_httpx.http_handler import _get_httpx_client
@@ -346,6 +351,112 @@ class _MessageCountParams:
         self.count_function = _get_count_function(model, custom_tokenizer)
 
 
+@lru_cache(maxsize=DEFAULT_MAX_LRU_CACHE_SIZE)
+def _get_default_message_count_params(model: str) -> _MessageCountParams:
+    """
+    Tokenizer selection for a model without a custom tokenizer only depends on the model name - build it once
+    """
+    return _MessageCountParams(model, None)
+
+
+# (model, message content hash) -> token count, for messages made up of text only.
+# A multi-turn conversation re-sends its history on every request; only new
+# messages need to be encoded.
+_message_token_count_cache: Dict[Hashable, int] = {}
+
+
+def _get_message_token_count_cache_key(model: str, message: Any) -> Optional[Hashable]:
+    """
+    Return a key identifying the token count of a text-only message, or None if the message can't be memoized
+    (images, tool calls, files - anything that isn't plain text).
+    """
+    if not isinstance(message, dict):
+        return None
+    items: List[Any] = []
+    for key, value in message.items():
+        if value is None:
+            continue
+        if isinstance(value, str):
+            items.append((key, value))
+        elif key == "content" and isinstance(value, list):
+            parts: List[Any] = []
+            for part in value:
+                if not isinstance(part, dict) or part.get("type") != "text":
+                    return None
+                part_items = tuple(part.items())
+                for _, part_value in part_items:
+                    if not isinstance(part_value, str):
+                        return None
+                parts.append(part_items)
+            items.append((key, tuple(parts)))
+        else:
+            return None
+    content = tuple(items)
+    return (model, hash(content), len(content))
+
+
+def _set_message_token_count(key: Hashable, num_tokens: int) -> None:
+    if TOKEN_COUNTER_MESSAGE_CACHE_SIZE <= 0:
+        return
+    while len(_message_token_count_cache) >= TOKEN_COUNTER_MESSAGE_CACHE_SIZE:
+        try:
+            _message_token_count_cache.pop(next(iter(_message_token_count_cache)), None)
+        except (StopIteration, RuntimeError):
+            break
+    _message_token_count_cache[key] = num_tokens
+
+
+def get_token_count_upper_bound(messages: Optional[List[Any]]) -> Optional[int]:
+    """
+    Cheap upper bound on the token count of text-only messages, without tokenizing.
+
+    BPE / sentencepiece tokens cover at least one byte, so a string never has more
+    tokens than utf-8 bytes (at most 4 per character). Only the content, name and
+    tool_call_id are measured - standard roles are a single token, covered by the
+    per-message overhead.
+
+    Returns None if the messages contain anything but text (images, tool calls, ...),
+    in which case the exact count is needed.
+    """
+    if messages is None:
+        return None
+    upper_bound = 3  # every reply is primed with <|start|>assistant<|message|>
+    for message in messages:
+        if not isinstance(message, dict):
+            return None
+        upper_bound += 5  # tokens_per_message + role + tokens_per_name
+        for key, value in message.items():
+            if value is None:
+                continue
+            if key == "role":
+                if value not in _SINGLE_TOKEN_ROLES:
+                    return None
+            elif key in _UPPER_BOUND_STR_KEYS and isinstance(value, str):
+                upper_bound += _str_token_upper_bound(value)
+            elif key == "content" and isinstance(value, list):
+                for part in value:
+                    if not isinstance(part, dict) or part.get("type") != "text":
+                        return None
+                    text = part.get("text")
+                    if not isinstance(text, str):
+                        return None
+                    upper_bound += _str_token_upper_bound(text)
+            else:
+                return None
+    return upper_bound
+
+
+_SINGLE_TOKEN_ROLES = frozenset(
+    ["system", "developer", "user", "assistant", "tool", "function"]
+)
+_UPPER_BOUND_STR_KEYS = frozenset(["content", "name", "tool_call_id"])
+
+
+def _str_token_upper_bound(value: str) -> int:
+    # str.isascii() is O(1) - CPython tracks it on the string object
+    return len(value) if value.isascii() else 4 * len(value)
+
+
 def token_counter(
     model="",
     custom_tokenizer: Optional[Union[dict, SelectTokenizerResponse]] = None,
@@ -386,7 +497,7 @@ def token_counter(
         return 0
 
     verbose_logger.debug(
-        f"messages in token_counter: {messages}, text in token_counter: {text}"
+        "messages in token_counter: %s, text in token_counter: %s", messages, text
     )
     if text is not None and messages is not None:
         raise ValueError("text and messages cannot both be set")
@@ -407,9 +518,16 @@ def token_counter(
         new_messages = cast(
             List[AllMessageValues], convert_list_message_to_dict(messages)
         )
-        params = _MessageCountParams(model, custom_tokenizer)
+        if custom_tokenizer is None:
+            params = _get_default_message_count_params(model)
+        else:
+            params = _MessageCountParams(model, custom_tokenizer)
         num_tokens = _count_messages(
-            params, new_messages, use_default_image_token_count, default_token_count
+            params,
+            new_messages,
+            use_default_image_token_count,
+            default_token_count,
+            memoize_model=model if custom_tokenizer is None else None,
         )
         if count_response_tokens is False:
             includes_system_message = any(
@@ -430,6 +548,7 @@ def _count_messages(
     messages: List[AllMessageValues],
     use_default_image_token_count: bool,
     default_token_count: Optional[int],
+    memoize_model: Optional[str] = None,
 ) -> int:
     """
     Count the number of tokens in a list of messages.
@@ -439,45 +558,73 @@ def _count_messages(
         messages (List[AllMessageValues]): The list of messages to count tokens in.
         use_default_image_token_count (bool): When True, will NOT make a GET request to the image URL and instead return the default image dimensions.
         default_token_count (Optional[int]): The default number of tokens to return for a message block, if an error occurs.
+        memoize_model (Optional[str]): If set, token counts of text-only messages are memoized under this model's tokenizer.
     """
     num_tokens = 0
     if len(messages) == 0:
         return num_tokens
     for message in messages:
-        num_tokens += params.tokens_per_message
-        for key, value in message.items():
-            if value is None:
-                pass
-            elif key == "tool_calls":
-                if isinstance(value, List):
-                    for tool_call in value:
-                        if "function" in tool_call:
-                            function_arguments = tool_call["function"].get(
-                                "arguments", []
-                            )
-                            num_tokens += params.count_function(str(function_arguments))
-                        else:
-                            raise ValueError(
-                                f"Unsupported tool call {tool_call} must contain a function key"
-                            )
-                else:
-                    raise ValueError(
-                        f"Unsupported type {type(value)} for key tool_calls in message {message}"
-                    )
-            elif isinstance(value, str):
-                num_tokens += params.count_function(value)
-                if key == "name":
-                    num_tokens += params.tokens_per_name
-            elif key == "content" and isinstance(value, List):
-                num_tokens += _count_content_list(
-                    params.count_function,
-                    value,
-                    use_default_image_token_count,
-                    default_token_count,
+        cache_key = (
+            _get_message_token_count_cache_key(memoize_model, message)
+            if memoize_model is not None
+            else None
+        )
+        if cache_key is not None:
+            cached_tokens = _message_token_count_cache.get(cache_key)
+            if cached_tokens is None:
+                cached_tokens = _count_message(
+                    params, message, use_default_image_token_count, default_token_count
                 )
+                _set_message_token_count(cache_key, cached_tokens)
+            num_tokens += cached_tokens
+        else:
+            num_tokens += _count_message(
+                params, message, use_default_image_token_count, default_token_count
+            )
+    return num_tokens
+
+
+def _count_message(
+    params: _MessageCountParams,
+    message: AllMessageValues,
+    use_default_image_token_count: bool,
+    default_token_count: Optional[int],
+) -> int:
+    """
+    Count the number of tokens in a single message.
+    """
+    num_tokens = params.tokens_per_message
+    for key, value in message.items():
+        if value is None:
+            pass
+        elif key == "tool_calls":
+            if isinstance(value, List):
+                for tool_call in value:
+                    if "function" in tool_call:
+                        function_arguments = tool_call["function"].get("arguments", [])
+                        num_tokens += params.count_function(str(function_arguments))
+                    else:
+                        raise ValueError(
+                            f"Unsupported tool call {tool_call} must contain a function key"
+                        )
             else:
-                # Skip unsupported keys instead of raising an error
-                continue
+                raise ValueError(
+                    f"Unsupported type {type(value)} for key tool_calls in message {message}"
+                )
+        elif isinstance(value, str):
+            num_tokens += params.count_function(value)
+            if key == "name":
+                num_tokens += params.tokens_per_name
+        elif key == "content" and isinstance(value, List):
+            num_tokens += _count_content_list(
+                params.count_function,
+                value,
+                use_default_image_token_count,
+                default_token_count,
+            )
+        else:
+            # Skip unsupported keys instead of raising an error
+            continue
     return num_tokens
 
 
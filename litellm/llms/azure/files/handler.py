@@ -91,7 +91,7 @@ class AzureOpenAIFilesAPI(BaseAzureLLM):
         openai_client: AsyncAzureOpenAI,
     ) -> HttpxBinaryResponseContent:
         response = await openai_client.files.content(**file_content_request)
-        return HttpxBinaryResponseContent(response=response.response)
+        return HttpxBinaryResponseContent.from_openai_file_content(response)
 
     def file_content(
         self,
@@ -135,7 +135,7 @@ class AzureOpenAIFilesAPI(BaseAzureLLM):
             **file_content_request
         )
 
-        return HttpxBinaryResponseContent(response=response.response)
+        return HttpxBinaryResponseContent.from_openai_file_content(response)
 
     async def aretrieve_file(
         self,
@@ -14,6 +14,14 @@ async def close_litellm_async_clients():
     # Import here to avoid circular import
     import litellm
     from litellm.llms.custom_httpx.aiohttp_handler import BaseLLMAIOHTTPHandler
+    from litellm.llms.custom_httpx.http_client_pool import http_client_pool_manager
+
+    # Clients handed out by get_async_httpx_client
+    try:
+        await http_client_pool_manager.aclose()
+    except Exception:
+        # Silently ignore errors during cleanup
+        pass
 
     cache_dict = getattr(litellm.in_memory_llm_clients_cache, "cache_dict", {})
 
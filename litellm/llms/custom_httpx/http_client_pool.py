@@ -0,0 +1,389 @@
+"""
+Pool of the shared httpx clients from `get_async_httpx_client` / `_get_httpx_client`
+
+Clients were cached in `litellm.in_memory_llm_clients_cache` under a key built by
+string-concatenating their params, with a 1h TTL and a 200 item cap - so a busy client
+could be evicted mid-traffic and silently recreated, dropping its warm connections.
+
+HTTPClientPoolManager instead:
+    - keys clients on (provider, event loop, params) with params normalized into a
+      hashable, order-independent key
+    - never expires clients; closed clients and clients of closed event loops are
+      replaced, and past HTTP_CLIENT_POOL_MAX_CLIENTS the least recently used client
+      is drained
+    - applies `litellm.http_client_pool_settings` (per-provider connection limits,
+      keep-alive, http2 - see HTTPClientPoolSettings). When the settings change, e.g.
+      on a proxy config reload, existing clients are drained: new requests get new
+      clients, old clients are closed after HTTP_CLIENT_POOL_DRAIN_TIMEOUT seconds so
+      in-flight requests / streams can finish
+    - reports per-client connection pool utilization (`get_metrics()`)
+"""
+
+import asyncio
+import copy
+import ssl
+import threading
+import time
+import weakref
+from typing import Any, Callable, Dict, Hashable, List, Optional, Union
+
+import litellm
+from litellm._logging import verbose_logger
+from litellm.constants import (
+    HTTP_CLIENT_POOL_DRAIN_TIMEOUT,
+    HTTP_CLIENT_POOL_MAX_CLIENTS,
+)
+from litellm.types.llms.custom_http import HTTPClientPoolMetrics, HTTPClientPoolSettings
+
+_UNSET = object()
+
+
+def _freeze(value: Any) -> Hashable:
+    """Hashable, order-independent representation of a client param."""
+    if isinstance(value, dict):
+        return tuple(sorted((str(k), _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple, set)):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, (str, int, float, bool, type(None))):
+        return value
+    as_dict = getattr(value, "as_dict", None)  # httpx.Timeout / httpx.Limits
+    if callable(as_dict):
+        return (type(value).__name__, _freeze(as_dict()))
+    if isinstance(value, ssl.SSLContext):
+        return ("SSLContext", id(value))
+    try:
+        hash(value)
+        return value
+    except TypeError:
+        return (type(value).__name__, id(value))
+
+
+class _PooledHTTPClient:
+    __slots__ = (
+        "handler",
+        "provider",
+        "loop_ref",
+        "owns_transport",
+        "last_used",
+        "draining",
+    )
+
+    def __init__(
+        self,
+        handler: Any,
+        provider: str,
+        loop: Optional[Any],
+        owns_transport: bool = True,
+    ):
+        self.handler = handler
+        self.provider = provider
+        self.loop_ref = weakref.ref(loop) if loop is not None else None
+        # False when built on a caller's aiohttp session - never closed by the pool
+        self.owns_transport = owns_transport
+        self.last_used = time.monotonic()
+        self.draining = False
+
+    @property
+    def loop(self) -> Optional[asyncio.AbstractEventLoop]:
+        return self.loop_ref() if self.loop_ref is not None else None
+
+    def is_usable(self) -> bool:
+        if self.loop_ref is not None:
+            loop = self.loop_ref()
+            if loop is None or loop.is_closed():
+                return False
+        client = getattr(self.handler, "client", None)
+        return not getattr(client, "is_closed", False)
+
+
+class HTTPClientPoolManager:
+    def __init__(
+        self,
+        max_clients: Optional[int] = None,
+        drain_timeout: Optional[float] = None,
+    ):
+        self.max_clients = (
+            max_clients if max_clients is not None else HTTP_CLIENT_POOL_MAX_CLIENTS
+        )
+        self.drain_timeout = (
+            drain_timeout
+            if drain_timeout is not None
+            else HTTP_CLIENT_POOL_DRAIN_TIMEOUT
+        )
+        self._clients: Dict[tuple, _PooledHTTPClient] = {}
+        self._draining: List[_PooledHTTPClient] = []
+        self._lock = threading.Lock()
+        self._settings_ref: Any = _UNSET
+        self._settings_snapshot: Any = None
+
+        self.clients_created = 0
+        self.clients_reused = 0
+        self.clients_replaced = 0
+        self.clients_drained = 0
+
+    # settings
+
+    def _check_settings(self) -> None:
+        settings = getattr(litellm, "http_client_pool_settings", None)
+        if settings is self._settings_ref:
+            return
+        snapshot = copy.deepcopy(settings)
+        changed = (
+            self._settings_ref is not _UNSET and snapshot != self._settings_snapshot
+        )
+        self._settings_ref = settings
+        self._settings_snapshot = snapshot
+        if changed:
+            verbose_logger.info(
+                "http_client_pool_settings changed, draining %s pooled http clients",
+                len(self._clients),
+            )
+            self.drain()
+
+    def get_pool_settings(self, provider: str) -> Optional[HTTPClientPoolSettings]:
+        """`default` settings merged with the provider's, None if nothing is set."""
+        settings = self._settings_snapshot
+        if not settings:
+            return None
+        pool_settings: HTTPClientPoolSettings = {
+            **settings.get("default", {}),  # type: ignore
+            **settings.get(provider, {}),
+        }
+        return pool_settings or None
+
+    # lookup
+
+    @staticmethod
+    def _get_running_loop() -> Optional[asyncio.AbstractEventLoop]:
+        try:
+            return asyncio.get_running_loop()
+        except RuntimeError:
+            return None
+
+    def get_client(
+        self,
+        kind: str,
+        provider: Any,
+        params: Optional[dict],
+        factory: Callable[[Optional[HTTPClientPoolSettings]], Any],
+        owns_transport: bool = True,
+    ) -> Any:
+        """
+        Return the pooled client for (kind, provider, event loop, params), creating it
+        with `factory(pool_settings)` if needed.
+        """
+        self._check_settings()
+        provider_name = str(getattr(provider, "value", provider))
+        loop = self._get_running_loop() if kind == "async" else None
+        key = (
+            kind,
+            provider_name,
+            id(loop) if loop is not None else None,
+            _freeze(params or {}),
+        )
+        entry = self._clients.get(key)
+        if entry is not None and entry.loop is loop and entry.is_usable():
+            entry.last_used = time.monotonic()
+            self.clients_reused += 1
+            return entry.handler
+
+        with self._lock:
+            entry = self._clients.get(key)
+            if entry is not None and entry.loop is loop and entry.is_usable():
+                entry.last_used = time.monotonic()
+                self.clients_reused += 1
+                return entry.handler
+            if entry is not None:
+                self.clients_replaced += 1
+            handler = factory(self.get_pool_settings(provider_name))
+            self._clients[key] = _PooledHTTPClient(
+                handler, provider_name, loop, owns_transport
+            )
+            self.clients_created += 1
+            self._prune_locked()
+        return handler
+
+    def _prune_locked(self) -> None:
+        for key, entry in list(self._clients.items()):
+            if not entry.is_usable():
+                del self._clients[key]
+        while self.max_clients > 0 and len(self._clients) > self.max_clients:
+            key = min(self._clients, key=lambda k: self._clients[k].last_used)
+            self._drain_entry(self._clients.pop(key))
+
+    # draining
+
+    def drain(self, timeout: Optional[float] = None) -> int:
+        """
+        Stop handing out the current clients and close them after `timeout` seconds
+        (default HTTP_CLIENT_POOL_DRAIN_TIMEOUT). Returns the number of clients drained.
+        """
+        with self._lock:
+            entries = list(self._clients.values())
+            self._clients.clear()
+        for entry in entries:
+            self._drain_entry(entry, timeout)
+        return len(entries)
+
+    def clear(self) -> None:
+        """Forget all pooled clients without closing them."""
+        with self._lock:
+            self._clients.clear()
+
+    def _drain_entry(
+        self, entry: _PooledHTTPClient, timeout: Optional[float] = None
+    ) -> None:
+        timeout = self.drain_timeout if timeout is None else timeout
+        self.clients_drained += 1
+        if not entry.owns_transport:
+            return
+        entry.draining = True
+        self._draining.append(entry)
+
+        if entry.loop_ref is None:
+            timer = threading.Timer(timeout, self._close_sync, args=(entry,))
+            timer.daemon = True
+            timer.start()
+            return
+
+        loop = entry.loop
+        if loop is None or loop.is_closed():
+            self._forget_draining(entry)
+            return
+
+        def _schedule_close():
+            loop.call_later(timeout, lambda: loop.create_task(self._close_async(entry)))
+
+        if self._get_running_loop() is loop:
+            _schedule_close()
+        else:
+            try:
+                loop.call_soon_threadsafe(_schedule_close)
+            except RuntimeError:  # loop closed in the meantime
+                self._forget_draining(entry)
+
+    def _forget_draining(self, entry: _PooledHTTPClient) -> None:
+        try:
+            self._draining.remove(entry)
+        except ValueError:
+            pass
+
+    def _close_sync(self, entry: _PooledHTTPClient) -> None:
+        try:
+            entry.handler.close()
+        except Exception as e:
+            verbose_logger.debug("Error closing drained http client: %s", str(e))
+        self._forget_draining(entry)
+
+    async def _close_async(self, entry: _PooledHTTPClient) -> None:
+        if not entry.owns_transport:
+            return
+        try:
+            await entry.handler.close()
+        except Exception as e:
+            verbose_logger.debug("Error closing drained http client: %s", str(e))
+        self._forget_draining(entry)
+
+    async def aclose(self) -> None:
+        """Close every pooled and draining async client, e.g. at exit."""
+        with self._lock:
+            entries = [
+                entry
+                for entry in [*self._clients.values(), *self._draining]
+                if entry.loop_ref is not None
+            ]
+            self._clients = {
+                key: entry
+                for key, entry in self._clients.items()
+                if entry.loop_ref is None
+            }
+        for entry in entries:
+            await self._close_async(entry)
+
+    # metrics
+
+    @staticmethod
+    def _get_transport_pool_stats(handler: Any) -> dict:
+        """
+        Connection counts from the client's transport. Reads private attributes of
+        aiohttp / httpcore, so anything unexpected reports zeros.
+        """
+        stats: Dict[str, Any] = {
+            "transport": "httpx",
+            "http2": False,
+            "in_use_connections": 0,
+            "idle_connections": 0,
+            "max_connections": None,
+        }
+        transport = getattr(getattr(handler, "client", None), "_transport", None)
+        try:
+            session = getattr(transport, "client", None)
+            connector = getattr(session, "connector", None)
+            if connector is not None:  # aiohttp ClientSession
+                stats["transport"] = "aiohttp"
+                stats["in_use_connections"] = len(getattr(connector, "_acquired", ()))
+                stats["idle_connections"] = sum(
+                    len(conns) for conns in getattr(connector, "_conns", {}).values()
+                )
+                stats["max_connections"] = connector.limit or None
+                return stats
+            if session is not None:  # aiohttp session not created yet
+                stats["transport"] = "aiohttp"
+                return stats
+
+            pool = getattr(transport, "_pool", None)
+            if pool is not None:  # httpcore connection pool
+                stats["http2"] = bool(getattr(pool, "_http2", False))
+                connections = list(getattr(pool, "connections", []))
+                idle = sum(1 for connection in connections if connection.is_idle())
+                stats["idle_connections"] = idle
+                stats["in_use_connections"] = len(connections) - idle
+                stats["max_connections"] = getattr(pool, "_max_connections", None)
+        except Exception as e:
+            verbose_logger.debug("Could not read http client pool stats: %s", str(e))
+        return stats
+
+    def get_metrics(self) -> List[HTTPClientPoolMetrics]:
+        """Connection pool utilization of every pooled and draining client."""
+        metrics: List[HTTPClientPoolMetrics] = []
+        for entry in [*self._clients.values(), *self._draining]:
+            stats = self._get_transport_pool_stats(entry.handler)
+            max_connections = stats["max_connections"]
+            metrics.append(
+                HTTPClientPoolMetrics(
+                    provider=entry.provider,
+                    transport=stats["transport"],
+                    http2=stats["http2"],
+                    draining=entry.draining,
+                    in_use_connections=stats["in_use_connections"],
+                    idle_connections=stats["idle_connections"],
+                    max_connections=max_connections,
+                    utilization=(
+                        stats["in_use_connections"] / max_connections
+                        if max_connections
+                        else None
+                    ),
+                )
+            )
+        return metrics
+
+    def get_stats(self) -> Dict[str, Union[int, float]]:
+        return {
+            "pooled_clients": len(self._clients),
+            "draining_clients": len(self._draining),
+            "clients_created": self.clients_created,
+            "clients_reused": self.clients_reused,
+            "clients_replaced": self.clients_replaced,
+            "clients_drained": self.clients_drained,
+        }
+
+
+http_client_pool_manager = HTTPClientPoolManager()
+
+
+def get_http_client_pool_metrics() -> List[HTTPClientPoolMetrics]:
+    return http_client_pool_manager.get_metrics()
+
+
+def drain_http_client_pool(timeout: Optional[float] = None) -> int:
+    return http_client_pool_manager.drain(timeout=timeout)
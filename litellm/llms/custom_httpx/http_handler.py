@@ -24,7 +24,6 @@ from httpx._types import RequestFiles
 import litellm
 from litellm._logging import verbose_logger
 from litellm.constants import (
-    _DEFAULT_TTL_FOR_HTTPX_CLIENTS,
     AIOHTTP_CONNECTOR_LIMIT,
     AIOHTTP_CONNECTOR_LIMIT_PER_HOST,
     AIOHTTP_KEEPALIVE_TIMEOUT,
@@ -296,6 +295,50 @@ class MaskedHTTPStatusError(httpx.HTTPStatusError):
         self.text = text
 
 
+def _get_httpx_transport_kwargs(
+    pool_settings: HTTPClientPoolSettings,
+    ssl_context: Optional[ssl.SSLContext] = None,
+    ssl_verify: Optional[bool] = None,
+) -> Dict[str, Any]:
+    """
+    httpx (Async)HTTPTransport kwargs for pool_settings.
+
+    An explicit transport ignores the client's verify / cert, so they are set here.
+    """
+    http2 = bool(pool_settings.get("http2", False))
+    if http2:
+        try:
+            import h2  # noqa: F401
+        except ImportError:
+            verbose_logger.warning(
+                "http2 is enabled in http_client_pool_settings but the `h2` package "
+                "is not installed, using HTTP/1.1. Run `pip install httpx[http2]`."
+            )
+            http2 = False
+    max_connections = pool_settings.get("max_connections")
+    limits = httpx.Limits(
+        max_connections=max_connections or None,
+        max_keepalive_connections=pool_settings.get(
+            "max_keepalive_connections", max_connections or None
+        ),
+        keepalive_expiry=pool_settings.get(
+            "keepalive_timeout", AIOHTTP_KEEPALIVE_TIMEOUT
+        ),
+    )
+    verify: VerifyTypes = True
+    if ssl_context is not None:
+        verify = ssl_context
+    elif ssl_verify is not None:
+        verify = ssl_verify
+    return {
+        "verify": verify,
+        "cert": os.getenv("SSL_CERTIFICATE", litellm.ssl_certificate),
+        "http2": http2,
+        "limits": limits,
+        "local_address": "0.0.0.0" if litellm.force_ipv4 else None,
+    }
+
+
 class AsyncHTTPHandler:
     def __init__(
         self,
@@ -305,14 +348,17 @@ class AsyncHTTPHandler:
         client_alias: Optional[str] = None,  # name for client in logs
         ssl_verify: Optional[VerifyTypes] = None,
         shared_session: Optional["ClientSession"] = None,
+        pool_settings: Optional[HTTPClientPoolSettings] = None,
     ):
         self.timeout = timeout
         self.event_hooks = event_hooks
+        self.pool_settings = pool_settings
         self.client = self.create_client(
             timeout=timeout,
             event_hooks=event_hooks,
             ssl_verify=ssl_verify,
             shared_session=shared_session,
+            pool_settings=pool_settings,
         )
         self.client_alias = client_alias
 
@@ -322,6 +368,7 @@ class AsyncHTTPHandler:
         event_hooks: Optional[Mapping[str, List[Callable[..., Any]]]],
         ssl_verify: Optional[VerifyTypes] = None,
         shared_session: Optional["ClientSession"] = None,
+        pool_settings: Optional[HTTPClientPoolSettings] = None,
     ) -> httpx.AsyncClient:
         # Get unified SSL configuration
         ssl_config = get_ssl_configuration(ssl_verify)
@@ -338,6 +385,7 @@ class AsyncHTTPHandler:
             ssl_context=ssl_config if isinstance(ssl_config, ssl.SSLContext) else None,
             ssl_verify=ssl_config if isinstance(ssl_config, bool) else None,
             shared_session=shared_session,
+            pool_settings=pool_settings,
         )
 
         return httpx.AsyncClient(
@@ -687,6 +735,7 @@ class AsyncHTTPHandler:
         ssl_context: Optional[ssl.SSLContext] = None,
         ssl_verify: Optional[bool] = None,
         shared_session: Optional["ClientSession"] = None,
+        pool_settings: Optional[HTTPClientPoolSettings] = None,
     ) -> Optional[Union[LiteLLMAiohttpTransport, AsyncHTTPTransport]]:
         """
         - Creates a transport for httpx.AsyncClient
@@ -701,21 +750,29 @@ class AsyncHTTPHandler:
 
         - Why force ipv4?
             - Some users have seen httpx ConnectionError when using ipv6 - forcing ipv4 resolves the issue for them
+
+        - pool_settings: connection limits / keep-alive for this client. HTTP/2 is only
+          supported by the httpx transport, so `http2: True` selects it.
         """
         #########################################################
         # AIOHTTP TRANSPORT is off by default
         #########################################################
-        if AsyncHTTPHandler._should_use_aiohttp_transport():
+        if AsyncHTTPHandler._should_use_aiohttp_transport() and not (
+            pool_settings and pool_settings.get("http2")
+        ):
             return AsyncHTTPHandler._create_aiohttp_transport(
                 ssl_context=ssl_context,
                 ssl_verify=ssl_verify,
                 shared_session=shared_session,
+                pool_settings=pool_settings,
             )
 
         #########################################################
         # HTTPX TRANSPORT is used when aiohttp is not installed
         #########################################################
-        return AsyncHTTPHandler._create_httpx_transport()
+        return AsyncHTTPHandler._create_httpx_transport(
+            ssl_context=ssl_context, ssl_verify=ssl_verify, pool_settings=pool_settings
+        )
 
     @staticmethod
     def _should_use_aiohttp_transport() -> bool:
@@ -778,6 +835,7 @@ class AsyncHTTPHandler:
         ssl_verify: Optional[bool] = None,
         ssl_context: Optional[ssl.SSLContext] = None,
         shared_session: Optional["ClientSession"] = None,
+        pool_settings: Optional[HTTPClientPoolSettings] = None,
     ) -> LiteLLMAiohttpTransport:
         """
         Creates an AiohttpTransport with RequestNotRead error handling
@@ -813,18 +871,23 @@ class AsyncHTTPHandler:
         verbose_logger.debug(
             "NEW SESSION: Creating new ClientSession (no shared session provided)"
         )
+        pool_settings = pool_settings or {}
         transport_connector_kwargs = {
-            "keepalive_timeout": AIOHTTP_KEEPALIVE_TIMEOUT,
+            "keepalive_timeout": pool_settings.get(
+                "keepalive_timeout", AIOHTTP_KEEPALIVE_TIMEOUT
+            ),
             "ttl_dns_cache": AIOHTTP_TTL_DNS_CACHE,
             "enable_cleanup_closed": True,
             **connector_kwargs,
         }
-        if AIOHTTP_CONNECTOR_LIMIT > 0:
-            transport_connector_kwargs["limit"] = AIOHTTP_CONNECTOR_LIMIT
-        if AIOHTTP_CONNECTOR_LIMIT_PER_HOST > 0:
-            transport_connector_kwargs["limit_per_host"] = (
-                AIOHTTP_CONNECTOR_LIMIT_PER_HOST
-            )
+        connector_limit = pool_settings.get("max_connections", AIOHTTP_CONNECTOR_LIMIT)
+        connector_limit_per_host = pool_settings.get(
+            "max_connections_per_host", AIOHTTP_CONNECTOR_LIMIT_PER_HOST
+        )
+        if connector_limit > 0:
+            transport_connector_kwargs["limit"] = connector_limit
+        if connector_limit_per_host > 0:
+            transport_connector_kwargs["limit_per_host"] = connector_limit_per_host
 
         return LiteLLMAiohttpTransport(
             client=lambda: ClientSession(
@@ -834,13 +897,24 @@ class AsyncHTTPHandler:
         )
 
     @staticmethod
-    def _create_httpx_transport() -> Optional[AsyncHTTPTransport]:
+    def _create_httpx_transport(
+        ssl_context: Optional[ssl.SSLContext] = None,
+        ssl_verify: Optional[bool] = None,
+        pool_settings: Optional[HTTPClientPoolSettings] = None,
+    ) -> Optional[AsyncHTTPTransport]:
         """
         Creates an AsyncHTTPTransport
 
+        - If pool_settings are set, it will create an AsyncHTTPTransport with those limits / http2
         - If force_ipv4 is True, it will create an AsyncHTTPTransport with local_address set to "0.0.0.0"
         - [Default] If force_ipv4 is False, it will return None
         """
+        if pool_settings:
+            return AsyncHTTPTransport(
+                **_get_httpx_transport_kwargs(
+                    pool_settings, ssl_context=ssl_context, ssl_verify=ssl_verify
+                )
+            )
         if litellm.force_ipv4:
             return AsyncHTTPTransport(local_address="0.0.0.0")
         else:
@@ -857,6 +931,7 @@ class HTTPHandler:
         disable_default_headers: Optional[
             bool
         ] = False,  # arize phoenix returns different API responses when user agent header in request
+        pool_settings: Optional[HTTPClientPoolSettings] = None,
     ):
         if timeout is None:
             timeout = _DEFAULT_TIMEOUT
@@ -869,7 +944,9 @@ class HTTPHandler:
         cert = os.getenv("SSL_CERTIFICATE", litellm.ssl_certificate)
 
         if client is None:
-            transport = self._create_sync_transport()
+            transport = self._create_sync_transport(
+                ssl_config=ssl_config, pool_settings=pool_settings
+            )
 
             # Create a client with a connection pool
             self.client = httpx.Client(
@@ -1120,13 +1197,29 @@ class HTTPHandler:
         except Exception:
             pass
 
-    def _create_sync_transport(self) -> Optional[HTTPTransport]:
+    def _create_sync_transport(
+        self,
+        ssl_config: Optional[VerifyTypes] = None,
+        pool_settings: Optional[HTTPClientPoolSettings] = None,
+    ) -> Optional[HTTPTransport]:
         """
         Create an HTTP transport with IPv4 only if litellm.force_ipv4 is True.
         Otherwise, return None.
 
         Some users have seen httpx ConnectionError when using ipv6 - forcing ipv4 resolves the issue for them
+
+        If pool_settings are set, the transport uses those connection limits / http2.
         """
+        if pool_settings:
+            return HTTPTransport(
+                **_get_httpx_transport_kwargs(
+                    pool_settings,
+                    ssl_context=(
+                        ssl_config if isinstance(ssl_config, ssl.SSLContext) else None
+                    ),
+                    ssl_verify=ssl_config if isinstance(ssl_config, bool) else None,
+                )
+            )
         if litellm.force_ipv4:
             return HTTPTransport(local_address="0.0.0.0")
         else:
@@ -1139,89 +1232,58 @@ def get_async_httpx_client(
     shared_session: Optional["ClientSession"] = None,
 ) -> AsyncHTTPHandler:
     """
-    Retrieves the async HTTP client from the cache
+    Retrieves the async HTTP client from the shared client pool
     If not present, creates a new client
 
-    Caches the new client and returns it.
+    Clients are kept per (provider, event loop, params) and get the provider's
+    `litellm.http_client_pool_settings`, see http_client_pool.py.
     """
-    _params_key_name = ""
-    if params is not None:
-        for key, value in params.items():
-            try:
-                _params_key_name += f"{key}_{value}"
-            except Exception:
-                pass
-
-    _cache_key_name = "async_httpx_client" + _params_key_name + llm_provider
-
-    # Lazily initialize the global in-memory client cache to avoid relying on
-    # litellm globals being fully populated during import time.
-    cache = getattr(litellm, "in_memory_llm_clients_cache", None)
-    if cache is None:
-        from litellm.caching.llm_caching_handler import LLMClientCache
-
-        cache = LLMClientCache()
-        setattr(litellm, "in_memory_llm_clients_cache", cache)
-
-    _cached_client = cache.get_cache(_cache_key_name)
-    if _cached_client:
-        return _cached_client
-
-    if params is not None:
-        params["shared_session"] = shared_session
-        _new_client = AsyncHTTPHandler(**params)
-    else:
-        _new_client = AsyncHTTPHandler(
+    from litellm.llms.custom_httpx.http_client_pool import http_client_pool_manager
+
+    def _create_client(
+        pool_settings: Optional[HTTPClientPoolSettings],
+    ) -> AsyncHTTPHandler:
+        if params is not None:
+            return AsyncHTTPHandler(
+                **{
+                    **params,
+                    "shared_session": shared_session,
+                    "pool_settings": pool_settings,
+                }
+            )
+        return AsyncHTTPHandler(
             timeout=httpx.Timeout(timeout=600.0, connect=5.0),
             shared_session=shared_session,
+            pool_settings=pool_settings,
         )
 
-    cache.set_cache(
-        key=_cache_key_name,
-        value=_new_client,
-        ttl=_DEFAULT_TTL_FOR_HTTPX_CLIENTS,
+    return http_client_pool_manager.get_client(
+        kind="async",
+        provider=llm_provider,
+        params=params,
+        factory=_create_client,
+        owns_transport=shared_session is None,
     )
-    return _new_client
 
 
 def _get_httpx_client(params: Optional[dict] = None) -> HTTPHandler:
     """
-    Retrieves the HTTP client from the cache
+    Retrieves the HTTP client from the shared client pool
     If not present, creates a new client
-
-    Caches the new client and returns it.
     """
-    _params_key_name = ""
-    if params is not None:
-        for key, value in params.items():
-            try:
-                _params_key_name += f"{key}_{value}"
-            except Exception:
-                pass
-
-    _cache_key_name = "httpx_client" + _params_key_name
-
-    # Lazily initialize the global in-memory client cache to avoid relying on
-    # litellm globals being fully populated during import time.
-    cache = getattr(litellm, "in_memory_llm_clients_cache", None)
-    if cache is None:
-        from litellm.caching.llm_caching_handler import LLMClientCache
+    from litellm.llms.custom_httpx.http_client_pool import http_client_pool_manager
 
-        cache = LLMClientCache()
-        setattr(litellm, "in_memory_llm_clients_cache", cache)
-
-    _cached_client = cache.get_cache(_cache_key_name)
-    if _cached_client:
-        return _cached_client
-
-    if params is not None:
-        _new_client = HTTPHandler(**params)
-    else:
-        _new_client = HTTPHandler(timeout=httpx.Timeout(timeout=600.0, connect=5.0))
+    def _create_client(pool_settings: Optional[HTTPClientPoolSettings]) -> HTTPHandler:
+        if params is not None:
+            return HTTPHandler(**{**params, "pool_settings": pool_settings})
+        return HTTPHandler(
+            timeout=httpx.Timeout(timeout=600.0, connect=5.0),
+            pool_settings=pool_settings,
+        )
 
-    cache.set_cache(
-        key=_cache_key_name,
-        value=_new_client,
-        ttl=_DEFAULT_TTL_FOR_HTTPX_CLIENTS,
+    return http_client_pool_manager.get_client(
+        kind="sync",
+        provider="default",
+        params=params,
+        factory=_create_client,
     )
-    return _new_client
@@ -1599,7 +1599,7 @@ class OpenAIFilesAPI(BaseLLM):
         openai_client: AsyncOpenAI,
     ) -> HttpxBinaryResponseContent:
         response = await openai_client.files.content(**file_content_request)
-        return HttpxBinaryResponseContent(response=response.response)
+        return HttpxBinaryResponseContent.from_openai_file_content(response)
 
     def file_content(
         self,
@@ -1639,7 +1639,7 @@ class OpenAIFilesAPI(BaseLLM):
             )
         response = cast(OpenAI, openai_client).files.content(**file_content_request)
 
-        return HttpxBinaryResponseContent(response=response.response)
+        return HttpxBinaryResponseContent.from_openai_file_content(response)
 
     async def aretrieve_file(
         self,
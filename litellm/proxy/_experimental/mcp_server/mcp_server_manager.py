@@ -11,7 +11,19 @@ import datetime
 import hashlib
 import json
 import re
-from typing import Any, Dict, List, Literal, Optional, Set, Tuple, Union, cast
+import time
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Literal,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+    cast,
+)
 from urllib.parse import urlparse
 
 from fastapi import HTTPException
@@ -31,8 +43,10 @@ from pydantic import AnyUrl
 import litellm
 from litellm._logging import verbose_logger
 from litellm.types.utils import CallTypes
+from litellm.constants import MCP_SESSION_POOL_ENABLED, MCP_TOOL_CATALOG_CACHE_TTL
 from litellm.exceptions import BlockedPiiEntityError, GuardrailRaisedException
 from litellm.experimental_mcp_client.client import MCPClient
+from litellm.experimental_mcp_client.session_pool import MCPSessionPool
 from litellm.llms.custom_httpx.http_handler import get_async_httpx_client
 from litellm.proxy._experimental.mcp_server.auth.user_api_key_auth_mcp import (
     MCPRequestHandler,
@@ -84,10 +98,77 @@ def _deserialize_json_dict(data: Any) -> Optional[Dict[str, str]]:
         return data
 
 
+class _MCPServerRegistry(Dict[str, MCPServer]):
+    """
+    Registry dict that calls `on_change` whenever it is modified, so the manager
+    can rebuild its server lookup indexes lazily.
+    """
+
+    def __init__(
+        self,
+        servers: Optional[Dict[str, MCPServer]] = None,
+        on_change: Optional[Callable[[], None]] = None,
+    ):
+        super().__init__(servers or {})
+        self._on_change = on_change
+
+    def _changed(self) -> None:
+        if self._on_change is not None:
+            self._on_change()
+
+    def __setitem__(self, key: str, value: MCPServer) -> None:
+        super().__setitem__(key, value)
+        self._changed()
+
+    def __delitem__(self, key: str) -> None:
+        super().__delitem__(key)
+        self._changed()
+
+    def __ior__(self, other: Any) -> "_MCPServerRegistry":  # type: ignore[override]
+        super().__ior__(other)
+        self._changed()
+        return self
+
+    def pop(self, *args: Any) -> Any:  # type: ignore[override]
+        value = super().pop(*args)
+        self._changed()
+        return value
+
+    def popitem(self) -> Tuple[str, MCPServer]:
+        item = super().popitem()
+        self._changed()
+        return item
+
+    def setdefault(self, key: str, default: Any = None) -> Any:  # type: ignore[override]
+        value = super().setdefault(key, default)
+        self._changed()
+        return value
+
+    def update(self, *args: Any, **kwargs: Any) -> None:  # type: ignore[override]
+        super().update(*args, **kwargs)
+        self._changed()
+
+    def clear(self) -> None:
+        super().clear()
+        self._changed()
+
+
+# key of a server in each of the manager's server lookup indexes
+_SERVER_INDEX_KEY_FUNCTIONS: Dict[str, Callable[[MCPServer], Optional[str]]] = {
+    "server_id": lambda server: server.server_id,
+    "server_name": lambda server: server.server_name,
+    "name": lambda server: normalize_server_name(server.name),
+    "prefix": lambda server: normalize_server_name(
+        server.server_name if server.server_name is not None else server.name
+    ),
+}
+
+
 class MCPServerManager:
     _STDIO_ENV_TEMPLATE_PATTERN = re.compile(r"^\$\{(X-[^}]+)\}$")
 
     def __init__(self):
+        self._server_indexes: Optional[Dict[str, Dict[str, MCPServer]]] = None
         self.registry: Dict[str, MCPServer] = {}
         self.config_mcp_servers: Dict[str, MCPServer] = {}
         """
@@ -113,6 +194,76 @@ class MCPServerManager:
         }
         """
 
+        self.session_pool: Optional[MCPSessionPool] = (
+            MCPSessionPool(on_tools_list_changed=self.invalidate_tool_catalog)
+            if MCP_SESSION_POOL_ENABLED
+            else None
+        )
+
+        self.tool_catalog: Dict[
+            str, Dict[str, Tuple[float, MCPServer, List[MCPTool]]]
+        ] = {}
+        """
+        Tools listed by each server, per auth context
+        {
+            "server-1": {"<hash of the auth headers / stdio env>": (expires_at, server, tools)},
+        }
+        """
+
+    @property
+    def registry(self) -> Dict[str, MCPServer]:
+        return self._registry
+
+    @registry.setter
+    def registry(self, servers: Dict[str, MCPServer]) -> None:
+        self._registry = _MCPServerRegistry(
+            servers, on_change=self._invalidate_server_indexes
+        )
+        self._invalidate_server_indexes()
+
+    @property
+    def config_mcp_servers(self) -> Dict[str, MCPServer]:
+        return self._config_mcp_servers
+
+    @config_mcp_servers.setter
+    def config_mcp_servers(self, servers: Dict[str, MCPServer]) -> None:
+        self._config_mcp_servers = _MCPServerRegistry(
+            servers, on_change=self._invalidate_server_indexes
+        )
+        self._invalidate_server_indexes()
+
+    def _invalidate_server_indexes(self) -> None:
+        self._server_indexes = None
+
+    def _build_server_indexes(self) -> Dict[str, Dict[str, MCPServer]]:
+        indexes: Dict[str, Dict[str, MCPServer]] = {
+            index: {} for index in _SERVER_INDEX_KEY_FUNCTIONS
+        }
+        for server in self.get_registry().values():
+            for index, key_function in _SERVER_INDEX_KEY_FUNCTIONS.items():
+                key = key_function(server)
+                if key is not None:
+                    # first match wins, as it did when scanning the registry
+                    indexes[index].setdefault(key, server)
+        self._server_indexes = indexes
+        return indexes
+
+    def _lookup_server(self, index: str, key: str) -> Optional[MCPServer]:
+        """
+        O(1) lookup of a registered server by one of the index keys.
+
+        The indexes are dropped whenever the registries change, so a miss is a
+        miss. Servers are replaced rather than edited in place, a hit is still
+        checked against its key in case one was.
+        """
+        indexes = self._server_indexes
+        if indexes is None:
+            indexes = self._build_server_indexes()
+        server = indexes[index].get(key)
+        if server is not None and _SERVER_INDEX_KEY_FUNCTIONS[index](server) != key:
+            server = self._build_server_indexes()[index].get(key)
+        return server
+
     def get_registry(self) -> Dict[str, MCPServer]:
         """
         Get the registered MCP Servers from the registry and union with the config MCP Servers
@@ -426,9 +577,11 @@ class MCPServerManager:
         """
         if mcp_server.server_name in self.get_registry():
             del self.registry[mcp_server.server_name]
+            self._close_server_sessions(mcp_server.server_id)
             verbose_logger.debug(f"Removed MCP Server: {mcp_server.server_name}")
         elif mcp_server.server_id in self.get_registry():
             del self.registry[mcp_server.server_id]
+            self._close_server_sessions(mcp_server.server_id)
             verbose_logger.debug(f"Removed MCP Server: {mcp_server.server_id}")
         else:
             verbose_logger.warning(
@@ -571,6 +724,7 @@ class MCPServerManager:
             if mcp_server.server_id in self.registry:
                 new_server = await self.build_mcp_server_from_table(mcp_server)
                 self.registry[mcp_server.server_id] = new_server
+                self._close_server_sessions(mcp_server.server_id)
                 verbose_logger.debug(f"Updated MCP Server: {new_server.name}")
 
         except Exception as e:
@@ -750,7 +904,8 @@ class MCPServerManager:
             mcp_auth_header: MCP auth header to be passed to the MCP server. This is optional and will be used if provided.
 
         Returns:
-            MCPClient: Configured MCP client instance
+            MCPClient: Configured MCP client instance, running its operations on
+            pooled sessions if the session pool is enabled
         """
         transport = server.transport or MCPTransport.sse
 
@@ -774,6 +929,8 @@ class MCPServerManager:
                 timeout=60.0,
                 stdio_config=stdio_config,
                 extra_headers=extra_headers,
+                session_pool=self.session_pool,
+                session_pool_server_id=server.server_id,
             )
         else:
             # For HTTP/SSE transports
@@ -785,8 +942,73 @@ class MCPServerManager:
                 auth_value=mcp_auth_header or server.authentication_token,
                 timeout=60.0,
                 extra_headers=extra_headers,
+                session_pool=self.session_pool,
+                session_pool_server_id=server.server_id,
             )
 
+    def invalidate_tool_catalog(self, server_id: Optional[str] = None) -> None:
+        """Drop the cached tools of a server, or of all servers."""
+        if server_id is None:
+            self.tool_catalog.clear()
+        else:
+            self.tool_catalog.pop(server_id, None)
+
+    def _close_server_sessions(self, server_id: str) -> None:
+        """Drop the cached tools and pooled sessions of a changed / removed server."""
+        self.invalidate_tool_catalog(server_id)
+        if self.session_pool is not None:
+            self.session_pool.close_server(server_id)
+
+    async def close(self) -> None:
+        """Close the pooled MCP sessions."""
+        if self.session_pool is not None:
+            await self.session_pool.close_all()
+
+    async def _get_tool_catalog(
+        self,
+        client: MCPClient,
+        server: MCPServer,
+        mcp_auth_header: Optional[Union[str, Dict[str, str]]] = None,
+        extra_headers: Optional[Dict[str, str]] = None,
+        stdio_env: Optional[Dict[str, str]] = None,
+    ) -> List[MCPTool]:
+        """
+        The tools listed by `server`, cached per auth context for
+        MCP_TOOL_CATALOG_CACHE_TTL seconds. Empty lists are not cached, as failed
+        listings return one too.
+        """
+        if MCP_TOOL_CATALOG_CACHE_TTL <= 0:
+            return await self._fetch_tools_with_timeout(client, server.name)
+
+        auth_context = hashlib.sha256(
+            json.dumps(
+                [mcp_auth_header, extra_headers, stdio_env],
+                sort_keys=True,
+                default=str,
+            ).encode("utf-8")
+        ).hexdigest()
+        now = time.monotonic()
+        server_catalog = self.tool_catalog.get(server.server_id, {})
+        cached = server_catalog.get(auth_context)
+        # cached for this MCPServer object, not one replaced since by an update
+        if cached is not None and cached[0] > now and cached[1] is server:
+            return cached[2]
+
+        tools = await self._fetch_tools_with_timeout(client, server.name)
+        if tools:
+            server_catalog = {
+                key: entry
+                for key, entry in self.tool_catalog.get(server.server_id, {}).items()
+                if entry[0] > now and entry[1] is server
+            }
+            server_catalog[auth_context] = (
+                now + MCP_TOOL_CATALOG_CACHE_TTL,
+                server,
+                tools,
+            )
+            self.tool_catalog[server.server_id] = server_catalog
+        return tools
+
     async def _get_tools_from_server(
         self,
         server: MCPServer,
@@ -836,7 +1058,13 @@ class MCPServerManager:
                     _tools
                 )
             else:
-                tools = await self._fetch_tools_with_timeout(client, server.name)
+                tools = await self._get_tool_catalog(
+                    client=client,
+                    server=server,
+                    mcp_auth_header=mcp_auth_header,
+                    extra_headers=extra_headers,
+                    stdio_env=stdio_env,
+                )
 
             prefixed_or_original_tools = self._create_prefixed_tools(
                 tools, server, add_prefix=add_prefix
@@ -2040,11 +2268,9 @@ class MCPServerManager:
         # First try with the original tool name
         if tool_name in self.tool_name_to_mcp_server_name_mapping:
             server_name = self.tool_name_to_mcp_server_name_mapping[tool_name]
-            for server in self.get_registry().values():
-                if normalize_server_name(server.name) == normalize_server_name(
-                    server_name
-                ):
-                    return server
+            server = self._lookup_server("name", normalize_server_name(server_name))
+            if server is not None:
+                return server
 
         # If not found and tool name is prefixed, try extracting server name from prefix
         if is_tool_name_prefixed(tool_name):
@@ -2053,16 +2279,9 @@ class MCPServerManager:
                 server_name_from_prefix,
             ) = split_server_prefix_from_name(tool_name)
             if original_tool_name in self.tool_name_to_mcp_server_name_mapping:
-                for server in self.get_registry().values():
-                    if server.server_name is None:
-                        if normalize_server_name(server.name) == normalize_server_name(
-                            server_name_from_prefix
-                        ):
-                            return server
-                    elif normalize_server_name(
-                        server.server_name
-                    ) == normalize_server_name(server_name_from_prefix):
-                        return server
+                return self._lookup_server(
+                    "prefix", normalize_server_name(server_name_from_prefix)
+                )
 
         return None
 
@@ -2107,6 +2326,9 @@ class MCPServerManager:
             )
 
         self.registry = new_registry
+        for server_id, server in previous_registry.items():
+            if new_registry.get(server_id) is not server:
+                self._close_server_sessions(server_id)
 
         verbose_logger.debug(
             "MCP registry refreshed (%s servers in registry)", len(new_registry)
@@ -2124,11 +2346,7 @@ class MCPServerManager:
         """
         Get the MCP Server from the server id
         """
-        registry = self.get_registry()
-        for server in registry.values():
-            if server.server_id == server_id:
-                return server
-        return None
+        return self._lookup_server("server_id", server_id)
 
     def get_public_mcp_servers(self) -> List[MCPServer]:
         """
@@ -2147,11 +2365,7 @@ class MCPServerManager:
         """
         Get the MCP Server from the server name
         """
-        registry = self.get_registry()
-        for server in registry.values():
-            if server.server_name == server_name:
-                return server
-        return None
+        return self._lookup_server("server_name", server_name)
 
     def _generate_stable_server_id(
         self,
@@ -2246,6 +2460,8 @@ class MCPServerManager:
                 extra_headers=extra_headers,
                 stdio_env=None,
             )
+            # a health check opens a new session, rather than reusing a pooled one
+            client.session_pool = None
 
             try:
 
@@ -450,6 +450,8 @@ if MCP_AVAILABLE:
                 extra_headers=oauth2_headers,
                 stdio_env=stdio_env,
             )
+            # the server under test isn't registered, don't pool its sessions
+            client.session_pool = None
 
             return await operation(client)
 
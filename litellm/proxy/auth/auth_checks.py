@@ -11,6 +11,7 @@ Run checks for:
 import asyncio
 import re
 import time
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any, Dict, List, Literal, Optional, Union, cast
 
 from fastapi import HTTPException, Request, status
@@ -59,6 +60,7 @@ from litellm.utils import get_utc_datetime
 
 from .auth_checks_organization import organization_role_based_access_check
 from .auth_utils import get_model_from_request
+from .model_access_matcher import get_model_access_matcher
 
 if TYPE_CHECKING:
     from opentelemetry.trace import Span as _Span
@@ -1160,6 +1162,9 @@ async def _cache_team_object(
     ## CACHE REFRESH TIME!
     team_table.last_refreshed_at = time.time()
 
+    ## WARM MODEL ACCESS MATCHER
+    get_model_access_matcher(team_table.models or [])
+
     await _cache_management_object(
         key=key,
         value=team_table,
@@ -1179,6 +1184,9 @@ async def _cache_key_object(
     ## CACHE REFRESH TIME
     user_api_key_obj.last_refreshed_at = time.time()
 
+    ## WARM MODEL ACCESS MATCHER
+    get_model_access_matcher(user_api_key_obj.models or [])
+
     await _cache_management_object(
         key=key,
         value=user_api_key_obj,
@@ -1885,25 +1893,33 @@ def _check_model_access_helper(
                 return True
 
     # Filter out models that are access_groups
-    filtered_models = [m for m in models if m not in access_groups]
+    filtered_models = (
+        [m for m in models if m not in access_groups] if access_groups else models
+    )
 
     if _model_in_team_aliases(model=model, team_model_aliases=team_model_aliases):
         return True
 
-    if _model_matches_any_wildcard_pattern_in_list(
-        model=model, allowed_model_list=filtered_models
-    ):
+    # compiled once per allow-list - exact entries in a set, wildcards in one regex
+    model_access_matcher = get_model_access_matcher(filtered_models)
+    if model_access_matcher.matches_wildcard(model):
         return True
 
     all_model_access: bool = False
 
-    if (len(filtered_models) == 0 and len(models) == 0) or "*" in filtered_models:
+    if (
+        len(filtered_models) == 0 and len(models) == 0
+    ) or "*" in model_access_matcher.exact_models:
         all_model_access = True
 
-    if SpecialModelNames.all_proxy_models.value in filtered_models:
+    if SpecialModelNames.all_proxy_models.value in model_access_matcher.exact_models:
         all_model_access = True
 
-    if model is not None and model not in filtered_models and all_model_access is False:
+    if (
+        model is not None
+        and model not in model_access_matcher.exact_models
+        and all_model_access is False
+    ):
         return False
     return True
 
@@ -2494,12 +2510,16 @@ def is_model_allowed_by_pattern(model: str, allowed_model_pattern: str) -> bool:
         bool: True if model matches the pattern, False otherwise
     """
     if "*" in allowed_model_pattern:
-        pattern = f"^{allowed_model_pattern.replace('*', '.*')}$"
-        return bool(re.match(pattern, model))
+        return bool(_compile_wildcard_model_pattern(allowed_model_pattern).match(model))
 
     return False
 
 
+@lru_cache(maxsize=1024)
+def _compile_wildcard_model_pattern(allowed_model_pattern: str) -> re.Pattern:
+    return re.compile(f"^{allowed_model_pattern.replace('*', '.*')}$")
+
+
 def _model_matches_any_wildcard_pattern_in_list(
     model: str, allowed_model_list: list
 ) -> bool:
@@ -2511,26 +2531,7 @@ def _model_matches_any_wildcard_pattern_in_list(
     - model=`bedrock/us.amazon.nova-micro-v1:0`, allowed_models=`bedrock/us.*` returns True
     - model=`bedrockzzzz/us.amazon.nova-micro-v1:0`, allowed_models=`bedrock/*` returns False
     """
-
-    if any(
-        _is_wildcard_pattern(allowed_model_pattern)
-        and is_model_allowed_by_pattern(
-            model=model, allowed_model_pattern=allowed_model_pattern
-        )
-        for allowed_model_pattern in allowed_model_list
-    ):
-        return True
-
-    if any(
-        _is_wildcard_pattern(allowed_model_pattern)
-        and _model_custom_llm_provider_matches_wildcard_pattern(
-            model=model, allowed_model_pattern=allowed_model_pattern
-        )
-        for allowed_model_pattern in allowed_model_list
-    ):
-        return True
-
-    return False
+    return get_model_access_matcher(allowed_model_list).matches_wildcard(model)
 
 
 def _model_custom_llm_provider_matches_wildcard_pattern(
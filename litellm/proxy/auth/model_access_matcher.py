@@ -0,0 +1,118 @@
+"""
+Precompiled model access checks for keys / teams / orgs.
+
+A key or team with a long `models` allow-list used to pay, on every request, a
+regex build + compile for every wildcard entry and a `get_llm_provider` call per
+wildcard entry. `ModelAccessMatcher` compiles an allow-list once:
+
+- exact entries go into a frozenset
+- wildcard entries are combined into a single anchored regex
+- answers for recently checked models are memoized
+
+Matchers are cached per allow-list, and warmed when a key / team object is
+written to the auth cache.
+"""
+
+import re
+from typing import Dict, Iterable, Optional, Pattern, Tuple
+
+from litellm._logging import verbose_proxy_logger
+from litellm.caching.dual_cache import LimitedSizeOrderedDict
+from litellm.constants import (
+    MODEL_ACCESS_MATCHER_CACHE_SIZE,
+    MODEL_ACCESS_MATCHER_MEMO_SIZE,
+)
+from litellm.litellm_core_utils.get_llm_provider_logic import get_llm_provider
+
+
+def _wildcard_pattern_to_regex(allowed_model_pattern: str) -> str:
+    """
+    Same conversion as `is_model_allowed_by_pattern` - `*` becomes `.*`, everything else is kept as-is
+    """
+    return allowed_model_pattern.replace("*", ".*")
+
+
+class ModelAccessMatcher:
+    """
+    Answers "does this allow-list permit model X" for one allow-list
+    """
+
+    def __init__(self, allowed_models: Tuple[str, ...]):
+        self.allowed_models = allowed_models
+        self.exact_models = frozenset(allowed_models)
+        self.wildcard_patterns: Tuple[str, ...] = tuple(
+            m for m in allowed_models if "*" in m
+        )
+        self._combined_regex: Optional[Pattern] = None
+        self._use_combined_regex = False
+        if self.wildcard_patterns:
+            try:
+                self._combined_regex = re.compile(
+                    "|".join(
+                        f"(?:{_wildcard_pattern_to_regex(p)})"
+                        for p in self.wildcard_patterns
+                    )
+                )
+                self._use_combined_regex = True
+            except re.error as e:
+                # fall back to checking entries one by one, as before
+                verbose_proxy_logger.debug(
+                    "ModelAccessMatcher: unable to combine wildcard patterns: %s", e
+                )
+        self._memo: Dict[str, bool] = LimitedSizeOrderedDict(
+            max_size=MODEL_ACCESS_MATCHER_MEMO_SIZE
+        )
+
+    def _matches_any_pattern(self, model: str) -> bool:
+        if self._use_combined_regex and self._combined_regex is not None:
+            return self._combined_regex.fullmatch(model) is not None
+
+        from litellm.proxy.auth.auth_checks import is_model_allowed_by_pattern
+
+        return any(
+            is_model_allowed_by_pattern(model=model, allowed_model_pattern=p)
+            for p in self.wildcard_patterns
+        )
+
+    def matches_wildcard(self, model: str) -> bool:
+        """
+        Returns True if `model` - or `{custom_llm_provider}/{model}` - matches any wildcard entry
+
+        eg.
+        - model=`bedrock/us.amazon.nova-micro-v1:0`, allowed_models=`bedrock/*` returns True
+        - model=`gpt-4o`, allowed_models=`openai/*` returns True
+        """
+        if not self.wildcard_patterns:
+            return False
+
+        cached = self._memo.get(model)
+        if cached is not None:
+            return cached
+
+        result = self._matches_any_pattern(model)
+        if result is False:
+            try:
+                _model, custom_llm_provider, _, _ = get_llm_provider(model=model)
+                result = self._matches_any_pattern(f"{custom_llm_provider}/{_model}")
+            except Exception:
+                result = False
+
+        self._memo[model] = result
+        return result
+
+
+_model_access_matchers: Dict[
+    Tuple[str, ...], ModelAccessMatcher
+] = LimitedSizeOrderedDict(max_size=MODEL_ACCESS_MATCHER_CACHE_SIZE)
+
+
+def get_model_access_matcher(allowed_models: Iterable[str]) -> ModelAccessMatcher:
+    """
+    Get the compiled matcher for an allow-list, building it on first use
+    """
+    key = tuple(allowed_models)
+    matcher = _model_access_matchers.get(key)
+    if matcher is None:
+        matcher = ModelAccessMatcher(allowed_models=key)
+        _model_access_matchers[key] = matcher
+    return matcher
@@ -7,7 +7,9 @@ from typing import (
     TYPE_CHECKING,
     Any,
     AsyncGenerator,
+    AsyncIterator,
     Callable,
+    List,
     Literal,
     Optional,
     Tuple,
@@ -24,6 +26,7 @@ from litellm._logging import verbose_proxy_logger
 from litellm._uuid import uuid
 from litellm.constants import (
     DD_TRACER_STREAMING_CHUNK_YIELD_RESOURCE,
+    PROXY_SSE_COALESCE_WINDOW_MS,
     STREAM_SSE_DATA_PREFIX,
 )
 from litellm.litellm_core_utils.dd_tracing import tracer
@@ -261,6 +264,91 @@ def _get_cost_breakdown_from_logging_obj(
     return original_cost, discount_amount, margin_total_amount, margin_percent
 
 
+def _sse_json_default(obj: Any) -> Any:
+    """orjson fallback for types it can't serialize, matching safe_dumps"""
+    if isinstance(obj, set):
+        return sorted(obj)
+    return str(obj)
+
+
+_SSE_STREAM_END = object()
+
+
+async def _next_sse_frame(frames: AsyncIterator[Any]) -> Any:
+    try:
+        return await frames.__anext__()
+    except StopAsyncIteration:
+        return _SSE_STREAM_END
+
+
+def _join_sse_frames(batch: List[Any]) -> Any:
+    if len(batch) == 1:
+        return batch[0]
+    if isinstance(batch[0], bytes):
+        return b"".join(batch)
+    return "".join(batch)
+
+
+async def _coalesce_sse_frames(
+    frames: AsyncGenerator[Any, None], window: float
+) -> AsyncGenerator[Any, None]:
+    """
+    Write SSE frames that arrive within `window` seconds of each other as one chunk.
+
+    A frame is never held back for longer than `window`. The first frame is always
+    passed through alone - it keeps time to first token, and create_response checks
+    it for errors.
+    """
+    loop = asyncio.get_running_loop()
+    pending: Optional[asyncio.Future] = None
+    try:
+        frame = await _next_sse_frame(frames)
+        if frame is _SSE_STREAM_END:
+            return
+        yield frame
+
+        while True:
+            if pending is not None:
+                frame = await pending
+                pending = None
+            else:
+                frame = await _next_sse_frame(frames)
+            if frame is _SSE_STREAM_END:
+                return
+
+            batch = [frame]
+            deadline = loop.time() + window
+            while True:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                pending = asyncio.ensure_future(_next_sse_frame(frames))
+                done, _ = await asyncio.wait((pending,), timeout=remaining)
+                if not done:
+                    break  # next frame is picked up by the next batch
+                frame = pending.result()
+                pending = None
+                if frame is _SSE_STREAM_END:
+                    yield _join_sse_frames(batch)
+                    return
+                if (isinstance(frame, str) and isinstance(batch[0], str)) or (
+                    isinstance(frame, bytes) and isinstance(batch[0], bytes)
+                ):
+                    batch.append(frame)
+                else:
+                    yield _join_sse_frames(batch)
+                    batch = [frame]
+            yield _join_sse_frames(batch)
+    finally:
+        if pending is not None and not pending.done():
+            # cancelling the read closes the frame generator
+            pending.cancel()
+        else:
+            if pending is not None and not pending.cancelled():
+                pending.exception()  # retrieved, not logged as unhandled
+            await frames.aclose()
+
+
 class ProxyBaseLLMRequestProcessing:
     def __init__(self, data: dict):
         self.data = data
@@ -1044,51 +1132,112 @@ class ProxyBaseLLMRequestProcessing:
             return chunk
 
     @staticmethod
-    async def async_sse_data_generator(
+    def _encode_sse_chunk(chunk: Any) -> Any:
+        """
+        return_sse_chunk for the streaming fast path - dicts are serialized with
+        orjson, falling back to safe_dumps for what orjson rejects (e.g. circular
+        references, integers over 64 bits)
+        """
+        if isinstance(chunk, dict):
+            try:
+                chunk_str = orjson.dumps(
+                    chunk,
+                    default=_sse_json_default,
+                    option=orjson.OPT_NON_STR_KEYS,
+                ).decode("utf-8")
+            except TypeError:  # orjson.JSONEncodeError
+                return ProxyBaseLLMRequestProcessing.return_sse_chunk(chunk)
+            return f"{STREAM_SSE_DATA_PREFIX}{chunk_str}\n\n"
+        return chunk
+
+    @staticmethod
+    def async_sse_data_generator(
         response,
         user_api_key_dict: UserAPIKeyAuth,
         request_data: dict,
         proxy_logging_obj: ProxyLogging,
-    ):
+    ) -> AsyncGenerator[Any, None]:
         """
         Anthropic /messages and Google /generateContent streaming data generator require SSE events
+
+        With PROXY_SSE_COALESCE_WINDOW_MS set, frames arriving within that window are
+        written to the client together.
         """
+        frames = ProxyBaseLLMRequestProcessing._async_sse_frame_generator(
+            response=response,
+            user_api_key_dict=user_api_key_dict,
+            request_data=request_data,
+            proxy_logging_obj=proxy_logging_obj,
+        )
+        if PROXY_SSE_COALESCE_WINDOW_MS > 0:
+            return _coalesce_sse_frames(
+                frames, window=PROXY_SSE_COALESCE_WINDOW_MS / 1000
+            )
+        return frames
 
+    @staticmethod
+    async def _async_sse_frame_generator(
+        response,
+        user_api_key_dict: UserAPIKeyAuth,
+        request_data: dict,
+        proxy_logging_obj: ProxyLogging,
+    ):
         verbose_proxy_logger.debug("inside generator")
         try:
-            str_so_far = ""
-            async for (
-                chunk
-            ) in proxy_logging_obj.async_post_call_streaming_iterator_hook(
-                user_api_key_dict=user_api_key_dict,
-                response=response,
-                request_data=request_data,
-            ):
-                verbose_proxy_logger.debug(
-                    "async_data_generator: received streaming chunk - {}".format(chunk)
-                )
-                ### CALL HOOKS ### - modify outgoing data
-                chunk = await proxy_logging_obj.async_post_call_streaming_hook(
+            model_name = request_data.get("model", "")
+            if proxy_logging_obj.has_async_post_call_streaming_hook():
+                str_so_far_parts: List[str] = []
+                async for (
+                    chunk
+                ) in proxy_logging_obj.async_post_call_streaming_iterator_hook(
                     user_api_key_dict=user_api_key_dict,
-                    response=chunk,
-                    data=request_data,
-                    str_so_far=str_so_far,
-                )
+                    response=response,
+                    request_data=request_data,
+                ):
+                    verbose_proxy_logger.debug(
+                        "async_data_generator: received streaming chunk - %s", chunk
+                    )
+                    ### CALL HOOKS ### - modify outgoing data
+                    chunk = await proxy_logging_obj.async_post_call_streaming_hook(
+                        user_api_key_dict=user_api_key_dict,
+                        response=chunk,
+                        data=request_data,
+                        str_so_far_parts=str_so_far_parts,
+                    )
 
-                if isinstance(chunk, (ModelResponse, ModelResponseStream)):
-                    response_str = litellm.get_response_string(response_obj=chunk)
-                    str_so_far += response_str
+                    if isinstance(chunk, (ModelResponse, ModelResponseStream)):
+                        response_str = litellm.get_response_string(response_obj=chunk)
+                        str_so_far_parts.append(response_str)
 
-                # Inject cost into Anthropic-style SSE usage for /v1/messages for any provider
-                model_name = request_data.get("model", "")
-                chunk = (
-                    ProxyBaseLLMRequestProcessing._process_chunk_with_cost_injection(
+                    # Inject cost into Anthropic-style SSE usage for /v1/messages for any provider
+                    chunk = ProxyBaseLLMRequestProcessing._process_chunk_with_cost_injection(
                         chunk, model_name
                     )
-                )
 
-                # Format chunk using helper function
-                yield ProxyBaseLLMRequestProcessing.return_sse_chunk(chunk)
+                    # Format chunk using helper function
+                    yield ProxyBaseLLMRequestProcessing.return_sse_chunk(chunk)
+            else:
+                # Fast path - no callback can replace chunks, so there is no
+                # per-chunk hook to run and no streamed text to track
+                inject_cost = getattr(litellm, "include_cost_in_streaming_usage", False)
+                log_chunks = verbose_proxy_logger.isEnabledFor(logging.DEBUG)
+                async for (
+                    chunk
+                ) in proxy_logging_obj.async_post_call_streaming_iterator_hook(
+                    user_api_key_dict=user_api_key_dict,
+                    response=response,
+                    request_data=request_data,
+                ):
+                    if log_chunks:
+                        verbose_proxy_logger.debug(
+                            "async_data_generator: received streaming chunk - %s",
+                            chunk,
+                        )
+                    if inject_cost:
+                        chunk = ProxyBaseLLMRequestProcessing._process_chunk_with_cost_injection(
+                            chunk, model_name
+                        )
+                    yield ProxyBaseLLMRequestProcessing._encode_sse_chunk(chunk)
         except Exception as e:
             verbose_proxy_logger.exception(
                 "litellm.proxy.proxy_server.async_data_generator(): Exception occured - {}".format(
@@ -41,6 +41,7 @@ from litellm.proxy.db.db_transaction_queue.daily_spend_update_queue import (
 )
 from litellm.proxy.db.db_transaction_queue.pod_lock_manager import PodLockManager
 from litellm.proxy.db.db_transaction_queue.redis_update_buffer import RedisUpdateBuffer
+from litellm.proxy.db.db_transaction_queue.spend_log_spool import get_spend_log_spool
 from litellm.proxy.db.db_transaction_queue.spend_update_queue import SpendUpdateQueue
 from litellm.proxy.route_llm_request import ROUTE_ENDPOINT_MAPPING
 
@@ -427,7 +428,14 @@ class DBSpendUpdateWriter:
                 payload.get("request_id"), payload.get("spend")
             )
         )
-        if prisma_client is not None and spend_logs_url is not None:
+        spend_log_spool = get_spend_log_spool()
+        if (
+            prisma_client is not None
+            and spend_logs_url is None
+            and spend_log_spool is not None
+        ):
+            await spend_log_spool.append(payload)
+        elif prisma_client is not None and spend_logs_url is not None:
             async with prisma_client._spend_log_transactions_lock:
                 prisma_client.spend_log_transactions.append(payload)
         elif prisma_client is not None:
@@ -0,0 +1,518 @@
+"""
+Durable on-disk spool for spend logs
+
+With SPEND_LOG_SPOOL_DIR set, spend logs are appended to segment files in that
+directory instead of the in-memory `PrismaClient.spend_log_transactions` list, and
+bulk loaded into LiteLLM_SpendLogs from there:
+    - segments are append-only, one JSON spend log per line. The active segment is
+      sealed once it holds SPEND_LOG_SPOOL_SEGMENT_MAX_BYTES, or when a load starts
+    - a segment is deleted only once all its spend logs are in the DB. Segments left
+      by a failed load, or by a crashed / restarted proxy, are loaded by a later load
+    - spend logs keep their request_id and are inserted with `ON CONFLICT DO NOTHING`,
+      so loading a segment again doesn't duplicate them
+    - segments are locked (flock) while they're written or loaded, so the workers of
+      a proxy can share a spool directory. Without fcntl (Windows), a spool
+      directory must only be used by one process
+    - a batch the DB rejects (e.g. a spend log violating a constraint) is retried
+      one spend log at a time. Spend logs rejected on their own are moved to a
+      `<segment>.failed` file next to the segment, instead of blocking the segment
+      forever. Renaming a `.failed` file to `.jsonl` loads it again
+"""
+
+import asyncio
+import json
+import os
+import time
+from datetime import date, datetime, timezone
+from typing import (
+    IO,
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Type,
+)
+
+from litellm._logging import verbose_proxy_logger
+from litellm._uuid import uuid
+from litellm.constants import (
+    SPEND_LOG_SPOOL_DIR,
+    SPEND_LOG_SPOOL_FSYNC,
+    SPEND_LOG_SPOOL_FSYNC_INTERVAL,
+    SPEND_LOG_SPOOL_LOAD_BATCH_SIZE,
+    SPEND_LOG_SPOOL_MAX_BYTES,
+    SPEND_LOG_SPOOL_SEGMENT_MAX_BYTES,
+)
+from litellm.proxy.db.db_transaction_queue.base_update_queue import service_logger_obj
+from litellm.types.services import ServiceTypes
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None  # type: ignore
+
+SEGMENT_SUFFIX = ".jsonl"
+FAILED_SUFFIX = ".failed"
+FSYNC_POLICIES = ("always", "interval", "never")
+
+# LiteLLM_SpendLogs columns (see schema.prisma): their type in the spooled JSON, and
+# the value inserted for a missing / null value into a NOT NULL column
+_SPEND_LOGS_COLUMNS: Dict[str, Tuple[str, Optional[str]]] = {
+    "request_id": ("text", None),
+    "call_type": ("text", None),
+    "api_key": ("text", "''"),
+    "spend": ("double precision", "0.0"),
+    "total_tokens": ("integer", "0"),
+    "prompt_tokens": ("integer", "0"),
+    "completion_tokens": ("integer", "0"),
+    "startTime": ("timestamptz", None),
+    "endTime": ("timestamptz", None),
+    "completionStartTime": ("timestamptz", None),
+    "model": ("text", "''"),
+    "model_id": ("text", None),
+    "model_group": ("text", None),
+    "custom_llm_provider": ("text", None),
+    "api_base": ("text", None),
+    "user": ("text", None),
+    "metadata": ("jsonb", None),
+    "cache_hit": ("text", None),
+    "cache_key": ("text", None),
+    "request_tags": ("jsonb", None),
+    "team_id": ("text", None),
+    "organization_id": ("text", None),
+    "end_user": ("text", None),
+    "requester_ip_address": ("text", None),
+    "messages": ("jsonb", None),
+    "response": ("jsonb", None),
+    "session_id": ("text", None),
+    "status": ("text", None),
+    "mcp_namespaced_tool_name": ("text", None),
+    "agent_id": ("text", None),
+    "proxy_server_request": ("jsonb", None),
+}
+
+_JSON_COLUMNS = tuple(
+    column
+    for column, (column_type, _) in _SPEND_LOGS_COLUMNS.items()
+    if column_type == "jsonb"
+)
+
+
+def _build_spend_logs_bulk_insert_query() -> str:
+    columns = []
+    values = []
+    definitions = []
+    for column, (column_type, default) in _SPEND_LOGS_COLUMNS.items():
+        columns.append(f'"{column}"')
+        definitions.append(f'"{column}" {column_type}')
+        value = f'spend_logs."{column}"'
+        if column_type == "timestamptz":
+            # LiteLLM_SpendLogs timestamps are UTC, without a time zone
+            value = f"{value} AT TIME ZONE 'UTC'"
+        if default is not None:
+            value = f"COALESCE({value}, {default})"
+        values.append(value)
+    return (
+        f'INSERT INTO "LiteLLM_SpendLogs" ({", ".join(columns)}) '
+        f"SELECT {', '.join(values)} "
+        f"FROM jsonb_to_recordset($1::jsonb) AS spend_logs({', '.join(definitions)}) "
+        'ON CONFLICT ("request_id") DO NOTHING'
+    )
+
+
+# Inserts a JSON array of spend logs in one statement. Prisma doesn't expose COPY,
+# and COPY can't skip the spend logs of an already (partially) loaded segment
+SPEND_LOGS_BULK_INSERT_QUERY = _build_spend_logs_bulk_insert_query()
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, datetime):
+        if value.tzinfo is None:
+            # naive datetimes are UTC, as when written by prisma
+            value = value.replace(tzinfo=timezone.utc)
+        return value.isoformat()
+    if isinstance(value, date):
+        return value.isoformat()
+    return str(value)
+
+
+def _read_segment(file: IO[bytes]) -> List[bytes]:
+    lines = file.read().split(b"\n")
+    if lines[-1]:
+        # a spend log only partially written, e.g. when the proxy crashed
+        verbose_proxy_logger.warning(
+            "Spend log spool: skipping incomplete spend log at the end of %s",
+            file.name,
+        )
+    return [line for line in lines[:-1] if line]
+
+
+def _to_rows_json(lines: List[bytes]) -> str:
+    rows = []
+    for line in lines:
+        try:
+            row = json.loads(line)
+        except ValueError:
+            verbose_proxy_logger.warning(
+                "Spend log spool: skipping spend log that isn't valid JSON"
+            )
+            continue
+        for column in _JSON_COLUMNS:
+            value = row.get(column)
+            if isinstance(value, str):
+                # JSON columns are JSON strings in the spend log payload
+                try:
+                    row[column] = json.loads(value)
+                except ValueError:
+                    pass
+        rows.append(row)
+    return json.dumps(rows)
+
+
+class _Segment:
+    def __init__(self, path: str):
+        self.path = path
+        # created under a name loads ignore and renamed once locked - otherwise
+        # another worker could claim the empty segment and delete it before it's
+        # locked, and the spend logs written to it would be lost
+        temp_path = path + ".tmp"
+        self.file = open(temp_path, "ab")
+        try:
+            if fcntl is not None:
+                fcntl.flock(self.file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            os.rename(temp_path, path)
+        except OSError:
+            self.file.close()
+            raise
+        self.size = 0
+        self.records = 0
+
+
+class SpendLogSpool:
+    """
+    Append-only on-disk spool of spend logs, bulk loaded into the DB
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        fsync: str = SPEND_LOG_SPOOL_FSYNC,
+        fsync_interval: float = SPEND_LOG_SPOOL_FSYNC_INTERVAL,
+        segment_max_bytes: int = SPEND_LOG_SPOOL_SEGMENT_MAX_BYTES,
+        max_bytes: int = SPEND_LOG_SPOOL_MAX_BYTES,
+        load_batch_size: int = SPEND_LOG_SPOOL_LOAD_BATCH_SIZE,
+    ):
+        if fsync not in FSYNC_POLICIES:
+            raise ValueError(
+                f"Invalid spend log spool fsync policy: {fsync}. "
+                f"Expected one of {FSYNC_POLICIES}"
+            )
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.fsync = fsync
+        self.fsync_interval = fsync_interval
+        self.segment_max_bytes = segment_max_bytes
+        self.max_bytes = max_bytes
+        self.load_batch_size = load_batch_size
+
+        self._active_segment: Optional[_Segment] = None
+        self._segment_counter = 0
+        self._last_fsync = time.monotonic()
+        self._write_lock = asyncio.Lock()
+        self._load_lock = asyncio.Lock()
+
+        # approximate when several workers share the spool directory
+        self.pending_records = 0
+        self.pending_bytes = 0
+        self.loaded_records = 0
+        self.dropped_records = 0
+        self.failed_records = 0
+        # segments left by an earlier run
+        for path in self._segment_paths():
+            try:
+                with open(path, "rb") as file:
+                    self.pending_records += len(_read_segment(file))
+                self.pending_bytes += os.path.getsize(path)
+            except OSError:
+                continue
+
+    async def append(self, payload: dict) -> bool:
+        """Spool a spend log. False if it was dropped, e.g. as the spool is full."""
+        if not payload.get("request_id"):
+            # the id makes loading the spend log again idempotent
+            payload = {**payload, "request_id": str(uuid.uuid4())}
+        line = json.dumps(payload, default=_json_default).encode("utf-8") + b"\n"
+        if self.pending_bytes + len(line) > self.max_bytes:
+            self._drop("the spool is full (SPEND_LOG_SPOOL_MAX_BYTES)")
+            return False
+
+        async with self._write_lock:
+            try:
+                segment = self._get_active_segment(len(line))
+                segment.file.write(line)
+                segment.file.flush()
+                if self.fsync == "always" or (
+                    self.fsync == "interval"
+                    and time.monotonic() - self._last_fsync >= self.fsync_interval
+                ):
+                    self._last_fsync = time.monotonic()
+                    await asyncio.get_running_loop().run_in_executor(
+                        None, os.fsync, segment.file.fileno()
+                    )
+            except OSError as e:
+                self._drop(f"writing to the spool failed: {str(e)}")
+                self._close_active_segment()
+                return False
+            segment.size += len(line)
+            segment.records += 1
+            self.pending_records += 1
+            self.pending_bytes += len(line)
+        return True
+
+    async def load(
+        self,
+        insert_rows: Callable[[str], Awaitable[Any]],
+        retryable_errors: Tuple[Type[BaseException], ...] = (),
+    ) -> int:
+        """
+        Load the spooled spend logs with `insert_rows`, called with JSON arrays of up
+        to `load_batch_size` spend logs. Returns the number of spend logs loaded.
+
+        A segment failing to load is kept for the next load. Loading stops at the
+        first `retryable_errors` (e.g. the DB being unreachable), and otherwise
+        carries on with the next segment. The first error is raised at the end.
+        """
+        async with self._load_lock:
+            async with self._write_lock:
+                self._close_active_segment()
+
+            loaded = 0
+            first_error: Optional[Exception] = None
+            for path in self._segment_paths():
+                try:
+                    loaded += await self._load_segment(
+                        path, insert_rows, retryable_errors
+                    )
+                except Exception as e:
+                    verbose_proxy_logger.warning(
+                        "Spend log spool: failed to load %s, keeping it for the "
+                        "next load: %s",
+                        path,
+                        str(e),
+                    )
+                    if first_error is None:
+                        first_error = e
+                    if isinstance(e, retryable_errors):
+                        break
+
+            self.loaded_records += loaded
+            if not self._segment_paths():
+                # everything spooled is loaded, except what's been appended since
+                active_segment = self._active_segment
+                self.pending_records = active_segment.records if active_segment else 0
+                self.pending_bytes = active_segment.size if active_segment else 0
+            self._emit_spool_metrics()
+            if first_error is not None:
+                raise first_error
+            return loaded
+
+    def close(self) -> None:
+        """Seal the active segment, e.g. on shutdown."""
+        self._close_active_segment()
+
+    def get_stats(self) -> Dict[str, int]:
+        return {
+            "pending_records": self.pending_records,
+            "pending_bytes": self.pending_bytes,
+            "loaded_records": self.loaded_records,
+            "dropped_records": self.dropped_records,
+            "failed_records": self.failed_records,
+        }
+
+    def _segment_paths(self) -> List[str]:
+        """Sealed segments, oldest first."""
+        active_path = self._active_segment.path if self._active_segment else None
+        return [
+            os.path.join(self.directory, name)
+            for name in sorted(os.listdir(self.directory))
+            if name.endswith(SEGMENT_SUFFIX)
+            and os.path.join(self.directory, name) != active_path
+        ]
+
+    def _get_active_segment(self, line_size: int) -> _Segment:
+        segment = self._active_segment
+        if (
+            segment is not None
+            and segment.records > 0
+            and segment.size + line_size > self.segment_max_bytes
+        ):
+            self._close_active_segment()
+            segment = None
+        if segment is None:
+            self._segment_counter += 1
+            # time first, so sorting the names orders segments oldest first
+            name = f"{time.time_ns():020d}-{os.getpid()}-{self._segment_counter}"
+            segment = _Segment(os.path.join(self.directory, name + SEGMENT_SUFFIX))
+            self._active_segment = segment
+        return segment
+
+    def _close_active_segment(self) -> None:
+        segment = self._active_segment
+        if segment is None:
+            return
+        self._active_segment = None
+        try:
+            segment.file.flush()
+            if self.fsync != "never":
+                os.fsync(segment.file.fileno())
+            segment.file.close()
+        except OSError as e:
+            verbose_proxy_logger.warning(
+                "Spend log spool: failed to sync %s: %s", segment.path, str(e)
+            )
+        if segment.records == 0:
+            try:
+                os.remove(segment.path)
+            except OSError:
+                pass
+
+    def _claim_segment(self, path: str) -> Optional[IO[bytes]]:
+        """Open and lock a sealed segment, unless another process is using it."""
+        try:
+            file = open(path, "rb")
+        except FileNotFoundError:
+            return None
+        if fcntl is not None:
+            try:
+                fcntl.flock(file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                file.close()
+                return None
+        if os.fstat(file.fileno()).st_nlink == 0:
+            # loaded and deleted by another process meanwhile
+            file.close()
+            return None
+        return file
+
+    async def _load_segment(
+        self,
+        path: str,
+        insert_rows: Callable[[str], Awaitable[Any]],
+        retryable_errors: Tuple[Type[BaseException], ...] = (),
+    ) -> int:
+        file = self._claim_segment(path)
+        if file is None:
+            return 0
+        loop = asyncio.get_running_loop()
+        try:
+            size = os.fstat(file.fileno()).st_size
+            lines = await loop.run_in_executor(None, _read_segment, file)
+            for start in range(0, len(lines), self.load_batch_size):
+                await self._load_batch(
+                    path,
+                    lines[start : start + self.load_batch_size],
+                    insert_rows,
+                    retryable_errors,
+                )
+            os.remove(path)
+        finally:
+            file.close()
+        self.pending_records = max(self.pending_records - len(lines), 0)
+        self.pending_bytes = max(self.pending_bytes - size, 0)
+        verbose_proxy_logger.debug(
+            "Spend log spool: loaded %s spend logs from %s", len(lines), path
+        )
+        return len(lines)
+
+    async def _load_batch(
+        self,
+        path: str,
+        lines: List[bytes],
+        insert_rows: Callable[[str], Awaitable[Any]],
+        retryable_errors: Tuple[Type[BaseException], ...],
+    ) -> None:
+        """
+        Insert a batch of spend logs. If the DB rejects the batch, retry its spend
+        logs one at a time and move the ones rejected on their own to the segment's
+        `.failed` file.
+        """
+        loop = asyncio.get_running_loop()
+        rows_json = await loop.run_in_executor(None, _to_rows_json, lines)
+        try:
+            await insert_rows(rows_json)
+            return
+        except retryable_errors:
+            raise
+        except Exception as e:
+            verbose_proxy_logger.warning(
+                "Spend log spool: failed to load a batch of %s, loading its spend "
+                "logs one at a time: %s",
+                path,
+                str(e),
+            )
+
+        for line in lines:
+            try:
+                await insert_rows(_to_rows_json([line]))
+            except retryable_errors:
+                raise
+            except Exception as e:
+                self._move_to_failed(path, line, e)
+
+    def _move_to_failed(self, path: str, line: bytes, error: Exception) -> None:
+        failed_path = path[: -len(SEGMENT_SUFFIX)] + FAILED_SUFFIX
+        with open(failed_path, "ab") as failed_file:
+            failed_file.write(line + b"\n")
+        self.failed_records += 1
+        verbose_proxy_logger.error(
+            "Spend log spool: the DB rejected a spend log, moved it to %s: %s",
+            failed_path,
+            str(error),
+        )
+
+    def _drop(self, reason: str) -> None:
+        self.dropped_records += 1
+        if self.dropped_records == 1 or self.dropped_records % 1000 == 0:
+            verbose_proxy_logger.warning(
+                "Spend log spool: dropping spend logs, %s. Dropped so far: %s",
+                reason,
+                self.dropped_records,
+            )
+
+    def _emit_spool_metrics(self) -> None:
+        for service, value in (
+            (ServiceTypes.SPEND_LOG_SPOOL, self.pending_records),
+            (ServiceTypes.SPEND_LOG_SPOOL_BYTES, self.pending_bytes),
+            (ServiceTypes.SPEND_LOG_SPOOL_DROPPED, self.dropped_records),
+        ):
+            asyncio.create_task(
+                service_logger_obj.async_service_success_hook(
+                    service=service,
+                    duration=0,
+                    call_type="_emit_spool_metrics",
+                    event_metadata={
+                        "gauge_labels": service,
+                        "gauge_value": value,
+                    },
+                )
+            )
+
+
+_spend_log_spool: Optional[SpendLogSpool] = None
+
+
+def get_spend_log_spool() -> Optional[SpendLogSpool]:
+    """The spend log spool, if SPEND_LOG_SPOOL_DIR is set."""
+    global _spend_log_spool
+    if _spend_log_spool is None and SPEND_LOG_SPOOL_DIR:
+        _spend_log_spool = SpendLogSpool(directory=SPEND_LOG_SPOOL_DIR)
+    return _spend_log_spool
+
+
+def close_spend_log_spool() -> None:
+    """Seal the active segment of the spend log spool, if it's open."""
+    if _spend_log_spool is not None:
+        _spend_log_spool.close()
@@ -50,9 +50,13 @@ from litellm.types.proxy.guardrails.guardrail_hooks.litellm_content_filter impor
     ContentFilterDetection,
     PatternDetection,
 )
+from .keyword_automaton import KeywordAutomaton
 from .patterns import PATTERN_EXTRA_CONFIG, get_compiled_pattern
 
 MAX_KEYWORD_VALUE_GAP_WORDS = 1
+# Streaming responses are re-checked for patterns from this many characters before
+# the new content, so a match split across chunks is still found
+STREAMING_PATTERN_OVERLAP_CHARS = 1024
 GAP_WORD_TOKENIZER = re.compile(r"\b\w+\b")
 
 
@@ -97,6 +101,46 @@ class CategoryConfig:
         self.exceptions = [e.lower() for e in exceptions]
 
 
+class KeywordAutomata:
+    """Keyword automata built from a guardrail's blocked words and categories."""
+
+    def __init__(
+        self,
+        blocked_words: Dict[str, Tuple[ContentFilterAction, Optional[str]]],
+        category_keywords: Dict[str, Tuple[str, str, ContentFilterAction]],
+        loaded_categories: Dict[str, CategoryConfig],
+    ):
+        self.blocked_words = KeywordAutomaton(blocked_words)
+        # single words match as whole words only ("men" should not match
+        # "recommend"), multi-word phrases as substrings
+        self.category_keywords = KeywordAutomaton(
+            category_keywords, whole_word=lambda keyword: " " not in keyword
+        )
+        self.category_exceptions = KeywordAutomaton(
+            dict.fromkeys(
+                exception
+                for category in loaded_categories.values()
+                for exception in category.exceptions
+            )
+        )
+
+
+class StreamingScanState:
+    """How far a streamed response has been checked, see _check_streaming_content."""
+
+    def __init__(self, automata: KeywordAutomata):
+        self.reset(automata)
+
+    def reset(self, automata: KeywordAutomata) -> None:
+        self.automata = automata
+        self.scanned_length = 0
+        self.scanned_lower_length = 0
+        self.blocked_words_state = 0
+        self.category_keywords_state = 0
+        self.category_exceptions_state = 0
+        self.category_exception_seen = False
+
+
 class ContentFilterGuardrail(CustomGuardrail):
     """
     Content filter guardrail that detects sensitive information using:
@@ -214,6 +258,10 @@ class ContentFilterGuardrail(CustomGuardrail):
         if blocked_words_file:
             self._load_blocked_words_file(blocked_words_file)
 
+        self._keyword_automata: Optional[KeywordAutomata] = None
+        self._keyword_automata_key: Optional[Tuple[int, ...]] = None
+        self._get_keyword_automata()
+
         verbose_proxy_logger.debug(
             f"ContentFilterGuardrail initialized with {len(self.compiled_patterns)} patterns "
             f"and {len(self.blocked_words)} blocked words"
@@ -339,6 +387,26 @@ class ContentFilterGuardrail(CustomGuardrail):
         severity_order = {"low": 0, "medium": 1, "high": 2}
         return severity_order.get(severity, 0) >= severity_order.get(threshold, 1)
 
+    def _get_keyword_automata(self) -> KeywordAutomata:
+        """
+        Return the keyword automata, (re)building them if blocked_words,
+        category_keywords or loaded_categories were replaced or changed size.
+        """
+        key = (
+            id(self.blocked_words),
+            len(self.blocked_words),
+            id(self.category_keywords),
+            len(self.category_keywords),
+            id(self.loaded_categories),
+            len(self.loaded_categories),
+        )
+        if self._keyword_automata is None or key != self._keyword_automata_key:
+            self._keyword_automata = KeywordAutomata(
+                self.blocked_words, self.category_keywords, self.loaded_categories
+            )
+            self._keyword_automata_key = key
+        return self._keyword_automata
+
     def _add_pattern(self, pattern_config: ContentFilterPattern) -> None:
         """
         Add a pattern to the compiled patterns list.
@@ -434,9 +502,14 @@ class ContentFilterGuardrail(CustomGuardrail):
             raise Exception(f"Error loading blocked words file {file_path}: {str(e)}")
 
     def _find_pattern_spans(
-        self, text: str, pattern_entry: Dict[str, Any]
+        self, text: str, pattern_entry: Dict[str, Any], start: int = 0
     ) -> List[Tuple[int, int]]:
-        """Return all match spans for a pattern, applying contextual rules if required."""
+        """
+        Return all match spans for a pattern, applying contextual rules if required.
+
+        Only matches starting at or after `start` are returned; lookbehinds and word
+        boundaries still see the text before it.
+        """
 
         regex: Pattern = pattern_entry["regex"]
         keyword_regex: Optional[Pattern] = pattern_entry.get("keyword_regex")
@@ -444,13 +517,13 @@ class ContentFilterGuardrail(CustomGuardrail):
 
         keyword_matches: Optional[List[re.Match]] = None
         if keyword_regex is not None:
-            keyword_matches = list(keyword_regex.finditer(text))
+            keyword_matches = list(keyword_regex.finditer(text, start))
             if not keyword_matches:
                 return []
 
         match_spans: List[Tuple[int, int]] = []
 
-        for match in regex.finditer(text):
+        for match in regex.finditer(text, start):
             if keyword_matches is not None and not self._match_near_keyword(
                 match.start(), match.end(), keyword_matches, text
             ):
@@ -458,7 +531,7 @@ class ContentFilterGuardrail(CustomGuardrail):
             match_spans.append((match.start(), match.end()))
 
         if allow_word_numbers:
-            for word_match in WORD_NUMBER_SEQUENCE_PATTERN.finditer(text):
+            for word_match in WORD_NUMBER_SEQUENCE_PATTERN.finditer(text, start):
                 digits = self._convert_word_number_sequence(word_match.group())
                 if not digits:
                     continue
@@ -583,61 +656,64 @@ class ContentFilterGuardrail(CustomGuardrail):
         return None
 
     def _check_category_keywords(
-        self, text: str, exceptions: List[str]
+        self, text: str, exceptions: Optional[List[str]] = None
     ) -> Optional[Tuple[str, str, str, ContentFilterAction]]:
         """
         Check text for category keywords.
 
         Args:
             text: Text to check
-            exceptions: List of exception phrases to ignore
+            exceptions: List of exception phrases to ignore, defaults to the
+                exceptions of all loaded categories
 
         Returns:
             Tuple of (keyword, category, severity, action) if match found, None otherwise
         """
+        automata = self._get_keyword_automata()
         text_lower = text.lower()
 
         # First check if any exception applies
-        for exception in exceptions:
-            if exception in text_lower:
+        if exceptions is None:
+            exception_index = automata.category_exceptions.first_match(text_lower)
+            if exception_index is not None:
                 verbose_proxy_logger.debug(
-                    f"Exception phrase '{exception}' found, skipping category keyword check"
+                    "Exception phrase '%s' found, skipping category keyword check",
+                    automata.category_exceptions.keywords[exception_index],
                 )
                 return None
+        else:
+            for exception in exceptions:
+                if exception in text_lower:
+                    verbose_proxy_logger.debug(
+                        f"Exception phrase '{exception}' found, skipping category keyword check"
+                    )
+                    return None
+
+        # Check category keywords, in the order they were loaded
+        matches, _ = automata.category_keywords.scan(text_lower)
+        for index in sorted({index for _, _, index in matches}):
+            keyword = automata.category_keywords.keywords[index]
+            category, severity, action = self.category_keywords[keyword]
+
+            # Check if this keyword has exceptions
+            category_obj = self.loaded_categories.get(category)
+            if category_obj:
+                # Check category-specific exceptions
+                exception_found = False
+                for exception in category_obj.exceptions:
+                    if exception in text_lower:
+                        verbose_proxy_logger.debug(
+                            f"Category exception '{exception}' found for keyword '{keyword}', skipping"
+                        )
+                        exception_found = True
+                        break
+                if exception_found:
+                    continue
 
-        # Check category keywords
-        for keyword, (category, severity, action) in self.category_keywords.items():
-            # Use word boundary matching for single words to avoid false positives
-            # (e.g., "men" should not match "recommend")
-            # For multi-word phrases, use substring matching
-            if " " in keyword:
-                # Multi-word phrase - use substring matching
-                keyword_found = keyword in text_lower
-            else:
-                # Single word - use word boundary matching to match whole words only
-                keyword_pattern = r"\b" + re.escape(keyword) + r"\b"
-                keyword_found = bool(re.search(keyword_pattern, text_lower))
-
-            if keyword_found:
-                # Check if this keyword has exceptions
-                category_obj = self.loaded_categories.get(category)
-                if category_obj:
-                    # Check category-specific exceptions
-                    exception_found = False
-                    for exception in category_obj.exceptions:
-                        if exception in text_lower:
-                            verbose_proxy_logger.debug(
-                                f"Category exception '{exception}' found for keyword '{keyword}', skipping"
-                            )
-                            exception_found = True
-                            break
-                    if exception_found:
-                        continue
-
-                verbose_proxy_logger.debug(
-                    f"Category keyword '{keyword}' found in category '{category}' with severity {severity}"
-                )
-                return (keyword, category, severity, action)
+            verbose_proxy_logger.debug(
+                f"Category keyword '{keyword}' found in category '{category}' with severity {severity}"
+            )
+            return (keyword, category, severity, action)
         return None
 
     def _check_blocked_words(
@@ -671,14 +747,16 @@ class ContentFilterGuardrail(CustomGuardrail):
         if not self.blocked_words:
             return None
 
-        text_lower = text.lower()
-        for keyword, (action, description) in self.blocked_words.items():
-            if keyword in text_lower:
-                verbose_proxy_logger.debug(
-                    f"Blocked word '{keyword}' found with action {action}"
-                )
-                return (keyword, action, description)
-        return None
+        automata = self._get_keyword_automata()
+        index = automata.blocked_words.first_match(text.lower())
+        if index is None:
+            return None
+        keyword = automata.blocked_words.keywords[index]
+        action, description = self.blocked_words[keyword]
+        verbose_proxy_logger.debug(
+            f"Blocked word '{keyword}' found with action {action}"
+        )
+        return (keyword, action, description)
 
     def _filter_single_text(
         self, text: str, detections: Optional[List[ContentFilterDetection]] = None
@@ -701,13 +779,8 @@ class ContentFilterGuardrail(CustomGuardrail):
         Raises:
             HTTPException: If sensitive content is detected and action is BLOCK
         """
-        # Collect all exceptions from loaded categories
-        all_exceptions = []
-        for category in self.loaded_categories.values():
-            all_exceptions.extend(category.exceptions)
-
-        # Check category keywords
-        category_keyword_match = self._check_category_keywords(text, all_exceptions)
+        # Check category keywords (skipped if an exception of a loaded category applies)
+        category_keyword_match = self._check_category_keywords(text)
         if category_keyword_match:
             keyword, category_name, severity, action = category_keyword_match
             if detections is not None:
@@ -779,12 +852,31 @@ class ContentFilterGuardrail(CustomGuardrail):
                     f"Masked all {pattern_name} matches in content"
                 )
 
-        # Check blocked words - iterate through ALL blocked words
-        # to ensure all matching keywords are processed, not just the first one
+        # Check blocked words - process ALL matching keywords, not just the first one
+        return self._filter_blocked_words(text, detections)
+
+    def _filter_blocked_words(
+        self, text: str, detections: Optional[List[ContentFilterDetection]] = None
+    ) -> str:
+        """
+        Check a single text for blocked keywords, processing all matches.
+
+        Returns:
+            Filtered text (with masking applied if action is MASK)
+
+        Raises:
+            HTTPException: If a blocked word with action BLOCK is detected
+        """
+        # The automaton finds the candidates in one pass; they are processed in
+        # blocked_words order and re-checked since masking may have removed them
         text_lower = text.lower()
-        for keyword, (action, description) in self.blocked_words.items():
+        blocked_words_automaton = self._get_keyword_automata().blocked_words
+        matches, _ = blocked_words_automaton.scan(text_lower)
+        for index in sorted({index for _, _, index in matches}):
+            keyword = blocked_words_automaton.keywords[index]
             if keyword not in text_lower:
                 continue
+            action, description = self.blocked_words[keyword]
 
             verbose_proxy_logger.debug(
                 f"Blocked word '{keyword}' found with action {action}"
@@ -1056,6 +1148,106 @@ class ContentFilterGuardrail(CustomGuardrail):
                 exception_str=exception_str,
             )
 
+    def _check_streaming_content(
+        self,
+        content: str,
+        content_lower: str,
+        scan_state: StreamingScanState,
+    ) -> None:
+        """
+        Check the content streamed so far for blocked patterns/keywords.
+
+        Only BLOCK actions are checked (masking streaming responses is not
+        supported). Content checked by a previous call for the same stream is not
+        re-scanned: keywords are found by resuming the automata from
+        `scan_state`, patterns are searched from STREAMING_PATTERN_OVERLAP_CHARS
+        before the new content.
+
+        Raises:
+            HTTPException: If blocked content is detected
+        """
+        automata = self._get_keyword_automata()
+        if automata is not scan_state.automata:  # keywords changed mid-stream
+            scan_state.reset(automata)
+
+        # Check patterns
+        pattern_start = max(
+            0, scan_state.scanned_length - STREAMING_PATTERN_OVERLAP_CHARS
+        )
+        scan_state.scanned_length = len(content)
+        for pattern_entry in self.compiled_patterns:
+            if pattern_entry["action"] != ContentFilterAction.BLOCK:
+                continue
+            if self._find_pattern_spans(content, pattern_entry, start=pattern_start):
+                pattern_name = pattern_entry["pattern_name"]
+                error_msg = f"Content blocked: {pattern_name} pattern detected"
+                verbose_proxy_logger.warning(error_msg)
+                raise HTTPException(
+                    status_code=403,
+                    detail={
+                        "error": error_msg,
+                        "pattern": pattern_name,
+                    },
+                )
+
+        lower_start = scan_state.scanned_lower_length
+        scan_state.scanned_lower_length = len(content_lower)
+
+        # Check blocked words
+        matches, scan_state.blocked_words_state = automata.blocked_words.scan(
+            content_lower, lower_start, scan_state.blocked_words_state
+        )
+        for index in sorted({index for _, _, index in matches}):
+            keyword = automata.blocked_words.keywords[index]
+            action, description = self.blocked_words[keyword]
+            if action == ContentFilterAction.BLOCK:
+                error_msg = f"Content blocked: keyword '{keyword}' detected"
+                if description:
+                    error_msg += f" ({description})"
+                verbose_proxy_logger.warning(error_msg)
+                raise HTTPException(
+                    status_code=403,
+                    detail={
+                        "error": error_msg,
+                        "keyword": keyword,
+                        "description": description,
+                    },
+                )
+
+        # Check category keywords - once an exception phrase was streamed, category
+        # keywords are skipped for the rest of the response
+        if scan_state.category_exception_seen:
+            return
+        matches, scan_state.category_exceptions_state = (
+            automata.category_exceptions.scan(
+                content_lower, lower_start, scan_state.category_exceptions_state
+            )
+        )
+        if matches:
+            scan_state.category_exception_seen = True
+            return
+        matches, scan_state.category_keywords_state = automata.category_keywords.scan(
+            content_lower, lower_start, scan_state.category_keywords_state
+        )
+        for index in sorted({index for _, _, index in matches}):
+            keyword = automata.category_keywords.keywords[index]
+            category_name, severity, action = self.category_keywords[keyword]
+            if action == ContentFilterAction.BLOCK:
+                error_msg = (
+                    f"Content blocked: {category_name} category keyword '{keyword}' detected "
+                    f"(severity: {severity})"
+                )
+                verbose_proxy_logger.warning(error_msg)
+                raise HTTPException(
+                    status_code=403,
+                    detail={
+                        "error": error_msg,
+                        "category": category_name,
+                        "keyword": keyword,
+                        "severity": severity,
+                    },
+                )
+
     async def async_post_call_streaming_iterator_hook(
         self,
         user_api_key_dict: UserAPIKeyAuth,
@@ -1071,83 +1263,27 @@ class ContentFilterGuardrail(CustomGuardrail):
 
         # Accumulate content as we iterate through chunks
         accumulated_content = ""
+        accumulated_lower = ""
+        scan_state = StreamingScanState(self._get_keyword_automata())
 
         async for item in response:
             # Accumulate content from this chunk before checking
             if isinstance(item, ModelResponseStream) and item.choices:
+                new_content = False
                 for choice in item.choices:
                     if hasattr(choice, "delta") and choice.delta:
                         content = getattr(choice.delta, "content", None)
                         if content and isinstance(content, str):
                             accumulated_content += content
+                            accumulated_lower += content.lower()
+                            new_content = True
 
-                # Check accumulated content for blocked patterns/keywords after processing all choices
-                # Only check for BLOCK actions, not MASK (masking streaming is not supported)
-                if accumulated_content:
+                # Check the new content for blocked patterns/keywords after processing all choices
+                if new_content:
                     try:
-                        # Check patterns
-                        pattern_match = self._check_patterns(accumulated_content)
-                        if pattern_match:
-                            matched_text, pattern_name, action = pattern_match
-                            if action == ContentFilterAction.BLOCK:
-                                error_msg = (
-                                    f"Content blocked: {pattern_name} pattern detected"
-                                )
-                                verbose_proxy_logger.warning(error_msg)
-                                raise HTTPException(
-                                    status_code=403,
-                                    detail={
-                                        "error": error_msg,
-                                        "pattern": pattern_name,
-                                    },
-                                )
-
-                        # Check blocked words
-                        blocked_word_match = self._check_blocked_words(
-                            accumulated_content
-                        )
-                        if blocked_word_match:
-                            keyword, action, description = blocked_word_match
-                            if action == ContentFilterAction.BLOCK:
-                                error_msg = (
-                                    f"Content blocked: keyword '{keyword}' detected"
-                                )
-                                if description:
-                                    error_msg += f" ({description})"
-                                verbose_proxy_logger.warning(error_msg)
-                                raise HTTPException(
-                                    status_code=403,
-                                    detail={
-                                        "error": error_msg,
-                                        "keyword": keyword,
-                                        "description": description,
-                                    },
-                                )
-
-                        # Check category keywords
-                        all_exceptions = []
-                        for category in self.loaded_categories.values():
-                            all_exceptions.extend(category.exceptions)
-                        category_match = self._check_category_keywords(
-                            accumulated_content, all_exceptions
+                        self._check_streaming_content(
+                            accumulated_content, accumulated_lower, scan_state
                         )
-                        if category_match:
-                            keyword, category_name, severity, action = category_match
-                            if action == ContentFilterAction.BLOCK:
-                                error_msg = (
-                                    f"Content blocked: {category_name} category keyword '{keyword}' detected "
-                                    f"(severity: {severity})"
-                                )
-                                verbose_proxy_logger.warning(error_msg)
-                                raise HTTPException(
-                                    status_code=403,
-                                    detail={
-                                        "error": error_msg,
-                                        "category": category_name,
-                                        "keyword": keyword,
-                                        "severity": severity,
-                                    },
-                                )
                     except HTTPException:
                         # Re-raise HTTPException (blocked content detected)
                         raise
@@ -0,0 +1,146 @@
+"""
+Aho-Corasick keyword automaton for the content filter guardrail.
+
+The guardrail used to check every keyword separately (`keyword in text` or a
+per-keyword `re.search(r"\\b...\\b")`), so each check was O(keywords * text). The
+automaton finds all keywords in one pass over the text, independent of how many
+keywords are loaded, and can be resumed on the next piece of a stream from the
+state returned by the previous scan.
+"""
+
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+
+def is_word_char(char: str) -> bool:
+    """Same definition of a word character as `\\w` in `re`."""
+    return char.isalnum() or char == "_"
+
+
+def _is_boundary(text: str, position: int) -> bool:
+    """True if `\\b` would match at `position` in `text`."""
+    before = position > 0 and is_word_char(text[position - 1])
+    after = position < len(text) and is_word_char(text[position])
+    return before != after
+
+
+class KeywordAutomaton:
+    """
+    Matches a fixed list of keywords in a single pass over the text.
+
+    Keywords are matched as given (callers lowercase both sides for
+    case-insensitive matching). Keywords for which `whole_word(keyword)` is True
+    only match where `\\b<keyword>\\b` would.
+    """
+
+    def __init__(
+        self,
+        keywords: Iterable[str],
+        whole_word: Optional[Callable[[str], bool]] = None,
+    ):
+        self.keywords: List[str] = []
+        self._lengths: List[int] = []
+        self._whole_word: List[bool] = []
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[Tuple[int, ...]] = [()]
+
+        for keyword in keywords:
+            if not keyword:
+                continue
+            self._add(keyword, bool(whole_word(keyword)) if whole_word else False)
+        self._build_fail_links()
+        self.max_keyword_length = max(self._lengths, default=0)
+
+    def __len__(self) -> int:
+        return len(self.keywords)
+
+    def _add(self, keyword: str, whole_word: bool) -> None:
+        state = 0
+        for char in keyword:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append(())
+            state = next_state
+        self._output[state] = self._output[state] + (len(self.keywords),)
+        self.keywords.append(keyword)
+        self._lengths.append(len(keyword))
+        self._whole_word.append(whole_word)
+
+    def _build_fail_links(self) -> None:
+        queue = list(self._goto[0].values())
+        for state in queue:  # breadth first, the list grows while iterating
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fail = self._fail[state]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                fail = self._goto[fail].get(char, 0)
+                self._fail[next_state] = fail
+                self._output[next_state] = self._output[next_state] + self._output[fail]
+
+    def scan(
+        self, text: str, start: int = 0, state: int = 0
+    ) -> Tuple[List[Tuple[int, int, int]], int]:
+        """
+        Find the keywords ending in `text[start:]`.
+
+        `state` is the automaton state after `text[:start]`, i.e. the state
+        returned by the previous scan of the same (growing) text. Word boundaries
+        are checked against the whole `text`, like `\\b` on the text so far: "kill"
+        matches at the end of "...kill" even if the stream continues with "er".
+
+        Returns:
+            (matches, state) - matches as (start, end, keyword index), in the order
+            they end in the text.
+        """
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+        matches: List[Tuple[int, int, int]] = []
+
+        if start > 0 and output[state] and not is_word_char(text[start - 1]):
+            # a whole word keyword ending in a non-word character failed its end
+            # boundary check at the end of the previous text - re-check it now
+            # that the next character is known
+            self._collect(text, state, start, matches, whole_word_only=True)
+
+        for position in range(start, len(text)):
+            char = text[position]
+            next_state = goto[state].get(char)
+            while next_state is None and state:
+                state = fail[state]
+                next_state = goto[state].get(char)
+            state = next_state or 0
+            if output[state]:
+                self._collect(text, state, position + 1, matches)
+        return matches, state
+
+    def _collect(
+        self,
+        text: str,
+        state: int,
+        end: int,
+        matches: List[Tuple[int, int, int]],
+        whole_word_only: bool = False,
+    ) -> None:
+        for index in self._output[state]:
+            whole_word = self._whole_word[index]
+            if whole_word_only and not whole_word:
+                continue
+            match_start = end - self._lengths[index]
+            if whole_word and not (
+                _is_boundary(text, match_start) and _is_boundary(text, end)
+            ):
+                continue
+            matches.append((match_start, end, index))
+
+    def first_match(self, text: str) -> Optional[int]:
+        """Index of the first keyword (in insertion order) found in `text`."""
+        matches, _ = self.scan(text)
+        if not matches:
+            return None
+        return min(index for _, _, index in matches)
@@ -67,6 +67,7 @@ from litellm.proxy.management_helpers.utils import management_endpoint_wrapper
 from litellm.proxy.spend_tracking.spend_tracking_utils import _is_master_key
 from litellm.proxy.utils import (
     PrismaClient,
+    ProxyLogging,
     _hash_token_if_needed,
     handle_exception_on_proxy,
     is_valid_api_key,
@@ -1426,6 +1427,41 @@ async def _handle_update_object_permission(
     return data_json
 
 
+async def _invalidate_orizon_user_key_cache(user_ids: List[Optional[str]]) -> None:
+    """
+    Drop Orizon's cached virtual keys for the owners of updated, rotated,
+    blocked or deleted keys, so its auth middleware stops injecting them.
+
+    No-op when Orizon is not installed or not configured.
+    """
+    try:
+        from orizon.auth.keycache import invalidate_user_id_key
+    except Exception:
+        return
+
+    for user_id in set(user_ids):
+        if user_id is not None:
+            await invalidate_user_id_key(user_id)
+
+
+async def _delete_regenerated_key_from_cache(
+    hashed_token: str,
+    user_id: Optional[str],
+    user_api_key_cache: DualCache,
+    proxy_logging_obj: Optional[ProxyLogging],
+) -> None:
+    """
+    Drop the old key from LiteLLM's key cache and its owner's cached key
+    from Orizon's user key cache.
+    """
+    await _delete_cache_key_object(
+        hashed_token=hashed_token,
+        user_api_key_cache=user_api_key_cache,
+        proxy_logging_obj=proxy_logging_obj,
+    )
+    await _invalidate_orizon_user_key_cache([user_id])
+
+
 def is_different_team(
     data: UpdateKeyRequest, existing_key_row: LiteLLM_VerificationToken
 ) -> bool:
@@ -1642,6 +1678,7 @@ async def update_key_fn(
             user_api_key_cache=user_api_key_cache,
             proxy_logging_obj=proxy_logging_obj,
         )
+        await _invalidate_orizon_user_key_cache([existing_key_row.user_id])
 
         asyncio.create_task(
             KeyManagementEventHooks.async_key_updated_hook(
@@ -1846,6 +1883,9 @@ async def delete_key_fn(
         verbose_proxy_logger.debug(
             f"/keys/delete - cache after delete: {user_api_key_cache.in_memory_cache.cache_dict}"
         )
+        await _invalidate_orizon_user_key_cache(
+            [key.user_id for key in _keys_being_deleted or []]
+        )
 
         asyncio.create_task(
             KeyManagementEventHooks.async_key_deleted_hook(
@@ -2965,12 +3005,12 @@ async def regenerate_key_fn(
         ### 3. remove existing key entry from cache
         ######################################################################
 
-        if hashed_api_key or key:
-            await _delete_cache_key_object(
-                hashed_token=hash_token(key),
-                user_api_key_cache=user_api_key_cache,
-                proxy_logging_obj=proxy_logging_obj,
-            )
+        await _delete_regenerated_key_from_cache(
+            hashed_token=hash_token(key),
+            user_id=_key_in_db.user_id,
+            user_api_key_cache=user_api_key_cache,
+            proxy_logging_obj=proxy_logging_obj,
+        )
 
         response = GenerateKeyResponse(
             **updated_token_dict,
@@ -3704,6 +3744,7 @@ async def block_key(
         user_api_key_cache=user_api_key_cache,
         proxy_logging_obj=proxy_logging_obj,
     )
+    await _invalidate_orizon_user_key_cache([key_object.user_id])
 
     return record
 
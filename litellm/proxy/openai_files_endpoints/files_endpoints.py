@@ -25,6 +25,7 @@ from fastapi import (
 import litellm
 from litellm import CreateFileRequest, get_secret_str
 from litellm._logging import verbose_proxy_logger
+from litellm.litellm_core_utils.jsonl_utils import iter_jsonl
 from litellm.llms.base_llm.files.transformation import BaseFileEndpoints
 from litellm.proxy._types import *
 from litellm.proxy.auth.user_api_key_auth import user_api_key_auth
@@ -92,13 +93,8 @@ def get_files_provider_config(
 
 def get_first_json_object(file_content_bytes: bytes) -> Optional[dict]:
     try:
-        # Decode the bytes to a string and split into lines
-        file_content = file_content_bytes.decode("utf-8")
-        first_line = file_content.splitlines()[0].strip()
-
-        # Parse the JSON object from the first line
-        json_object = json.loads(first_line)
-        return json_object
+        # Only decode up to the first JSON object, not the whole file
+        return next(iter_jsonl(file_content_bytes), None)
     except (json.JSONDecodeError, UnicodeDecodeError):
         return None
 
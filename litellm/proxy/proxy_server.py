@@ -623,6 +623,23 @@ async def proxy_shutdown_event():
     if db_writer_client is not None:
         await db_writer_client.close()  # type: ignore[reportGeneralTypeIssues]
 
+    from litellm.proxy.db.db_transaction_queue.spend_log_spool import (
+        close_spend_log_spool,
+    )
+
+    # spend logs still in the spool are loaded into the DB after the restart
+    close_spend_log_spool()
+
+    from litellm.proxy._experimental.mcp_server.utils import is_mcp_available
+
+    if is_mcp_available():
+        from litellm.proxy._experimental.mcp_server.mcp_server_manager import (
+            global_mcp_server_manager,
+        )
+
+        # close pooled MCP sessions (stdio server processes, open connections)
+        await global_mcp_server_manager.close()
+
     # flush remaining langfuse logs
     if "langfuse" in litellm.success_callback:
         try:
@@ -4403,7 +4420,7 @@ async def async_data_generator(
                 user_api_key_dict=user_api_key_dict,
                 response=chunk,
                 data=request_data,
-                str_so_far="".join(str_so_far_parts),
+                str_so_far_parts=str_so_far_parts,
             )
 
             if isinstance(chunk, (ModelResponse, ModelResponseStream)):
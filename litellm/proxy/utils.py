@@ -98,6 +98,11 @@ from litellm.proxy.db.create_views import (
     should_create_missing_views,
 )
 from litellm.proxy.db.db_spend_update_writer import DBSpendUpdateWriter
+from litellm.proxy.db.db_transaction_queue.spend_log_spool import (
+    SPEND_LOGS_BULK_INSERT_QUERY,
+    SpendLogSpool,
+    get_spend_log_spool,
+)
 from litellm.proxy.db.log_db_metrics import log_db_metrics
 from litellm.proxy.db.prisma_client import PrismaWrapper
 from litellm.proxy.guardrails.guardrail_hooks.unified_guardrail.unified_guardrail import (
@@ -1801,6 +1806,31 @@ class ProxyLogging:
             raise e
         return response
 
+    def has_async_post_call_streaming_hook(self) -> bool:
+        """
+        True if any callback implements `async_post_call_streaming_hook`, i.e. can
+        replace streamed chunks.
+
+        Streaming generators skip the per-chunk hook call - and tracking the text
+        streamed so far, which only the hook needs - when this is False.
+        """
+        for callback in litellm.callbacks:
+            _callback: Optional[CustomLogger] = None
+            if isinstance(callback, str):
+                _callback = litellm.litellm_core_utils.litellm_logging.get_custom_logger_compatible_class(
+                    cast(_custom_logger_compatible_callbacks_literal, callback)
+                )
+            else:
+                _callback = callback  # type: ignore
+            if (
+                _callback is not None
+                and isinstance(_callback, CustomLogger)
+                and _callback.__class__.async_post_call_streaming_hook
+                != CustomLogger.async_post_call_streaming_hook
+            ):
+                return True
+        return False
+
     async def async_post_call_streaming_hook(
         self,
         data: dict,
@@ -1809,16 +1839,21 @@ class ProxyLogging:
         ],
         user_api_key_dict: UserAPIKeyAuth,
         str_so_far: Optional[str] = None,
+        str_so_far_parts: Optional[List[str]] = None,
     ):
         """
         Allow user to modify outgoing streaming data -> per chunk
 
         Covers:
         1. /chat/completions
+
+        `str_so_far_parts` can be passed instead of `str_so_far` - the parts are
+        only joined if a callback is called, instead of on every chunk.
         """
         from litellm.proxy.proxy_server import llm_router
 
         response_str: Optional[str] = None
+        complete_response: Optional[str] = None
         if isinstance(response, (ModelResponse, ModelResponseStream)):
             response_str = litellm.get_response_string(response_obj=response)
         if response_str is not None:
@@ -1849,10 +1884,13 @@ class ProxyLogging:
                     else:
                         _callback = callback  # type: ignore
                     if _callback is not None and isinstance(_callback, CustomLogger):
-                        if str_so_far is not None:
-                            complete_response = str_so_far + response_str
-                        else:
-                            complete_response = response_str
+                        if complete_response is None:
+                            if str_so_far_parts is not None:
+                                str_so_far = "".join(str_so_far_parts)
+                            if str_so_far is not None:
+                                complete_response = str_so_far + response_str
+                            else:
+                                complete_response = response_str
                         potential_error_response = (
                             await _callback.async_post_call_streaming_hook(
                                 user_api_key_dict=user_api_key_dict,
@@ -1905,7 +1943,11 @@ class ProxyLogging:
                                 response=current_response,
                             )
                         )
-                    else:
+                    elif (
+                        _callback.__class__.async_post_call_streaming_iterator_hook
+                        != CustomLogger.async_post_call_streaming_iterator_hook
+                    ):
+                        # the default hook only re-yields chunks, skip that layer
                         current_response = (
                             _callback.async_post_call_streaming_iterator_hook(
                                 user_api_key_dict=user_api_key_dict,
@@ -3709,6 +3751,46 @@ class ProxyUpdateSpend:
             # Clean up logs_to_process after all processing is complete
             del logs_to_process
 
+    @staticmethod
+    async def load_spooled_spend_logs(
+        n_retry_times: int,
+        prisma_client: PrismaClient,
+        spend_log_spool: SpendLogSpool,
+        proxy_logging_obj: ProxyLogging,
+    ):
+        """
+        Bulk load the spend logs in the spend log spool into the DB.
+
+        Spend logs failing to load stay in the spool, for the next run. Spend logs
+        the DB rejects are moved to the spool's `.failed` files.
+        """
+
+        async def _insert_spend_logs(rows_json: str):
+            for i in range(n_retry_times + 1):
+                try:
+                    await prisma_client.db.execute_raw(
+                        SPEND_LOGS_BULK_INSERT_QUERY, rows_json
+                    )
+                    return
+                except DB_CONNECTION_ERROR_TYPES:
+                    if i >= n_retry_times:
+                        raise
+                    await asyncio.sleep(2**i)
+
+        start_time = time.time()
+        try:
+            loaded = await spend_log_spool.load(
+                insert_rows=_insert_spend_logs,
+                retryable_errors=DB_CONNECTION_ERROR_TYPES,
+            )
+            verbose_proxy_logger.debug(
+                f"{loaded} spooled logs loaded. Remaining in spool: {spend_log_spool.pending_records}"
+            )
+        except Exception as e:
+            _raise_failed_update_spend_exception(
+                e=e, start_time=start_time, proxy_logging_obj=proxy_logging_obj
+            )
+
     @staticmethod
     def disable_spend_updates() -> bool:
         """
@@ -3722,6 +3804,16 @@ class ProxyUpdateSpend:
         return False
 
 
+async def _get_spend_logs_queue_size(prisma_client: PrismaClient) -> int:
+    """Spend logs waiting to be written to the DB - in memory and in the spend log spool"""
+    async with prisma_client._spend_log_transactions_lock:
+        queue_size = len(prisma_client.spend_log_transactions)
+    spend_log_spool = get_spend_log_spool()
+    if spend_log_spool is not None:
+        queue_size += spend_log_spool.pending_records
+    return queue_size
+
+
 async def update_spend(  # noqa: PLR0915
     prisma_client: PrismaClient,
     db_writer_client: Optional[AsyncHTTPHandler],
@@ -3746,9 +3838,7 @@ async def update_spend(  # noqa: PLR0915
     )
 
     ### UPDATE SPEND LOGS ###
-    # Check queue size with lock protection
-    async with prisma_client._spend_log_transactions_lock:
-        queue_size = len(prisma_client.spend_log_transactions)
+    queue_size = await _get_spend_logs_queue_size(prisma_client)
     verbose_proxy_logger.debug("Spend Logs transactions: {}".format(queue_size))
 
     # Process spend log transactions when called directly.
@@ -3781,15 +3871,22 @@ async def update_spend_logs_job(
     async with prisma_client._spend_log_transactions_lock:
         queue_size = len(prisma_client.spend_log_transactions)
 
-    if queue_size == 0:
-        return
+    if queue_size > 0:
+        await ProxyUpdateSpend.update_spend_logs(
+            n_retry_times=n_retry_times,
+            prisma_client=prisma_client,
+            proxy_logging_obj=proxy_logging_obj,
+            db_writer_client=db_writer_client,
+        )
 
-    await ProxyUpdateSpend.update_spend_logs(
-        n_retry_times=n_retry_times,
-        prisma_client=prisma_client,
-        proxy_logging_obj=proxy_logging_obj,
-        db_writer_client=db_writer_client,
-    )
+    spend_log_spool = get_spend_log_spool()
+    if spend_log_spool is not None and spend_log_spool.pending_records > 0:
+        await ProxyUpdateSpend.load_spooled_spend_logs(
+            n_retry_times=n_retry_times,
+            prisma_client=prisma_client,
+            spend_log_spool=spend_log_spool,
+            proxy_logging_obj=proxy_logging_obj,
+        )
 
 
 async def _monitor_spend_logs_queue(
@@ -3821,11 +3918,12 @@ async def _monitor_spend_logs_queue(
         f"Starting spend logs queue monitor (threshold: {threshold}, poll_interval: {base_interval}s)"
     )
 
+    # opens the spend log spool, if enabled - counting spend logs left by an earlier run
+    get_spend_log_spool()
+
     while True:
         try:
-            # Check queue size with lock protection
-            async with prisma_client._spend_log_transactions_lock:
-                queue_size = len(prisma_client.spend_log_transactions)
+            queue_size = await _get_spend_logs_queue_size(prisma_client)
 
             if queue_size > 0:
                 if queue_size >= threshold:
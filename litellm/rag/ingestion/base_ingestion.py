@@ -12,14 +12,40 @@ Providers can inherit and override methods as needed.
 
 from __future__ import annotations
 
+import asyncio
 import base64
+import hashlib
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, cast
+from collections import deque
+from itertools import islice
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    cast,
+)
 
 import litellm
 from litellm._logging import verbose_logger
 from litellm._uuid import uuid4
-from litellm.constants import DEFAULT_CHUNK_OVERLAP, DEFAULT_CHUNK_SIZE
+from litellm.caching.in_memory_cache import InMemoryCache
+from litellm.constants import (
+    DEFAULT_CHUNK_OVERLAP,
+    DEFAULT_CHUNK_SIZE,
+    DEFAULT_MAX_RETRIES,
+    DEFAULT_RAG_EMBEDDING_BATCH_SIZE,
+    DEFAULT_RAG_EMBEDDING_MAX_CONCURRENCY,
+    RAG_EMBEDDING_CACHE_SIZE,
+    RAG_EMBEDDING_CACHE_TTL,
+)
+from litellm.litellm_core_utils.exception_mapping_utils import _get_response_headers
 from litellm.llms.custom_httpx.http_handler import (
     get_async_httpx_client,
     httpxSpecialProvider,
@@ -30,6 +56,30 @@ from litellm.types.rag import RAGIngestOptions, RAGIngestResponse
 if TYPE_CHECKING:
     from litellm import Router
 
+# chunk embeddings keyed by embedding model + chunk content hash, shared across
+# ingestions so re-ingesting a document only embeds the chunks that changed
+_embedding_cache = InMemoryCache(
+    max_size_in_memory=RAG_EMBEDDING_CACHE_SIZE,
+    default_ttl=RAG_EMBEDDING_CACHE_TTL,
+)
+
+_RETRYABLE_EMBEDDING_ERRORS = (
+    litellm.RateLimitError,
+    litellm.Timeout,
+    litellm.APIConnectionError,
+    litellm.InternalServerError,
+    litellm.ServiceUnavailableError,
+)
+
+
+def _batched(items: Iterable[str], batch_size: int) -> Iterator[List[str]]:
+    iterator = iter(items)
+    while True:
+        batch = list(islice(iterator, batch_size))
+        if not batch:
+            return
+        yield batch
+
 
 class BaseRAGIngestion(ABC):
     """
@@ -188,6 +238,21 @@ class BaseRAGIngestion(ABC):
         Returns:
             List of text chunks
         """
+        return list(
+            self.iter_chunks(
+                text=text, file_content=file_content, ocr_was_used=ocr_was_used
+            )
+        )
+
+    def iter_chunks(
+        self,
+        text: Optional[str],
+        file_content: Optional[bytes],
+        ocr_was_used: bool,
+    ) -> Iterator[str]:
+        """
+        Same as `chunk`, but chunks are generated lazily.
+        """
         # Get text to chunk
         text_to_chunk: Optional[str] = None
         if text:
@@ -197,10 +262,10 @@ class BaseRAGIngestion(ABC):
                 text_to_chunk = file_content.decode("utf-8")
             except UnicodeDecodeError:
                 verbose_logger.debug("Binary file detected, skipping text chunking")
-                return []
+                return iter(())
 
         if not text_to_chunk:
-            return []
+            return iter(())
 
         # Extract RecursiveCharacterTextSplitter args
         splitter_args = self.chunking_strategy or {}
@@ -217,7 +282,7 @@ class BaseRAGIngestion(ABC):
             splitter_kwargs["separators"] = separators
 
         text_splitter = RecursiveCharacterTextSplitter(**splitter_kwargs)
-        return text_splitter.split_text(text_to_chunk)
+        return text_splitter.iter_split_text(text_to_chunk)
 
     async def embed(
         self,
@@ -235,14 +300,139 @@ class BaseRAGIngestion(ABC):
         if not self.embedding_config or not chunks:
             return None
 
-        embedding_model = self.embedding_config.get("model", "text-embedding-3-small")
+        embeddings: List[List[float]] = []
+        async for _, batch_embeddings in self.aiter_embeddings(chunks):
+            embeddings.extend(batch_embeddings)
+        return embeddings
+
+    async def aiter_embeddings(
+        self,
+        chunks: Iterable[str],
+    ) -> AsyncIterator[Tuple[List[str], List[List[float]]]]:
+        """
+        Embed chunks in batches of `embedding.batch_size`, with up to
+        `embedding.max_concurrency` embedding requests in flight.
 
+        `chunks` is consumed lazily, as request slots free up.
+
+        Yields:
+            Tuple of (batch chunks, batch embeddings), in input order
+        """
+        embedding_config = self.embedding_config or {}
+        batch_size = max(
+            1, embedding_config.get("batch_size", DEFAULT_RAG_EMBEDDING_BATCH_SIZE)
+        )
+        max_concurrency = max(
+            1,
+            embedding_config.get(
+                "max_concurrency", DEFAULT_RAG_EMBEDDING_MAX_CONCURRENCY
+            ),
+        )
+
+        in_flight: Deque[Tuple[List[str], asyncio.Task]] = deque()
+        try:
+            for batch in _batched(chunks, batch_size):
+                in_flight.append(
+                    (batch, asyncio.create_task(self._embed_batch(batch)))
+                )
+                if len(in_flight) >= max_concurrency:
+                    batch, task = in_flight.popleft()
+                    yield batch, await task
+            while in_flight:
+                batch, task = in_flight.popleft()
+                yield batch, await task
+        finally:
+            for _, task in in_flight:
+                task.cancel()
+
+    async def _embed_batch(self, chunks: List[str]) -> List[List[float]]:
+        """
+        Embed one batch, skipping chunks whose embedding is cached.
+        """
+        embedding_config = self.embedding_config or {}
+        embedding_model = embedding_config.get("model", "text-embedding-3-small")
+        use_cache = embedding_config.get("cache", True)
+
+        embeddings: List[Optional[List[float]]] = [None] * len(chunks)
+        cache_keys: List[str] = []
+        if use_cache:
+            cache_keys = [
+                self._get_embedding_cache_key(embedding_model, chunk)
+                for chunk in chunks
+            ]
+            for idx, cache_key in enumerate(cache_keys):
+                embeddings[idx] = _embedding_cache.get_cache(cache_key)
+        missing = [idx for idx, embedding in enumerate(embeddings) if embedding is None]
+
+        if missing:
+            response = await self._aembedding(
+                model=embedding_model, input=[chunks[idx] for idx in missing]
+            )
+            for idx, item in zip(missing, response.data):
+                embeddings[idx] = item["embedding"]
+                if use_cache:
+                    _embedding_cache.set_cache(cache_keys[idx], item["embedding"])
+
+        return cast(List[List[float]], embeddings)
+
+    async def _aembedding(self, model: str, input: List[str]) -> Any:
+        """
+        Call aembedding, retrying rate limit / transient errors.
+
+        When a router is set, its own retry policy applies instead.
+        """
         if self.router is not None:
-            response = await self.router.aembedding(model=embedding_model, input=chunks)
-        else:
-            response = await litellm.aembedding(model=embedding_model, input=chunks)
+            return await self.router.aembedding(model=model, input=input)
 
-        return [item["embedding"] for item in response.data]
+        from litellm.utils import _calculate_retry_after
+
+        num_retries = (self.embedding_config or {}).get(
+            "num_retries", DEFAULT_MAX_RETRIES
+        )
+        for attempt in range(num_retries + 1):
+            try:
+                return await litellm.aembedding(model=model, input=input)
+            except _RETRYABLE_EMBEDDING_ERRORS as e:
+                if attempt >= num_retries:
+                    raise
+                retry_after = _calculate_retry_after(
+                    remaining_retries=num_retries - attempt,
+                    max_retries=num_retries,
+                    response_headers=_get_response_headers(e),
+                )
+                verbose_logger.debug(
+                    f"RAG embedding request failed ({e}), retrying in {retry_after:.2f}s"
+                )
+                await asyncio.sleep(retry_after)
+
+    @staticmethod
+    def _get_embedding_cache_key(embedding_model: str, chunk: str) -> str:
+        chunk_hash = hashlib.sha256(chunk.encode("utf-8")).hexdigest()
+        return f"rag_embedding:{embedding_model}:{chunk_hash}"
+
+    async def store_embeddings(
+        self,
+        chunks: List[str],
+        embeddings: List[List[float]],
+    ) -> None:
+        """
+        Write one batch of chunks and their embeddings to the vector store.
+
+        Optional. Providers that write vectors themselves can override this;
+        `ingest()` then passes each embedded batch here as it arrives, and
+        calls `store()` afterwards with no chunks or embeddings.
+
+        The default does nothing - `ingest()` keeps all chunks and embeddings
+        and passes them to `store()` instead.
+
+        Args:
+            chunks: Text chunks in this batch
+            embeddings: Embeddings for the chunks, in the same order
+        """
+        return None
+
+    def _supports_batched_store(self) -> bool:
+        return type(self).store_embeddings is not BaseRAGIngestion.store_embeddings
 
     @abstractmethod
     async def store(
@@ -304,15 +494,32 @@ class BaseRAGIngestion(ABC):
                 content_type=content_type,
             )
 
-            # Step 3: Chunking
-            chunks = self.chunk(
-                text=extracted_text,
-                file_content=file_content,
-                ocr_was_used=self.ocr_config is not None,
-            )
-
-            # Step 4: Embedding (optional - some providers handle this internally)
-            embeddings = await self.embed(chunks=chunks)
+            chunks: List[str] = []
+            embeddings: Optional[List[List[float]]] = None
+            if self.embedding_config and self._supports_batched_store():
+                # Steps 3 + 4: chunk lazily, embed in batches and write each
+                # batch to the vector store as it arrives
+                chunk_iterator = self.iter_chunks(
+                    text=extracted_text,
+                    file_content=file_content,
+                    ocr_was_used=self.ocr_config is not None,
+                )
+                async for batch_chunks, batch_embeddings in self.aiter_embeddings(
+                    chunk_iterator
+                ):
+                    await self.store_embeddings(
+                        chunks=batch_chunks, embeddings=batch_embeddings
+                    )
+            else:
+                # Step 3: Chunking
+                chunks = self.chunk(
+                    text=extracted_text,
+                    file_content=file_content,
+                    ocr_was_used=self.ocr_config is not None,
+                )
+
+                # Step 4: Embedding (optional - some providers handle this internally)
+                embeddings = await self.embed(chunks=chunks)
 
             # Step 5: Store in vector store
             vector_store_id, result_file_id = await self.store(
@@ -4,7 +4,8 @@ RecursiveCharacterTextSplitter for RAG ingestion.
 A simple implementation that splits text recursively by different separators.
 """
 
-from typing import List, Optional
+from collections import deque
+from typing import Deque, Iterator, List, Optional
 
 from litellm.constants import DEFAULT_CHUNK_OVERLAP, DEFAULT_CHUNK_SIZE
 
@@ -29,17 +30,21 @@ class RecursiveCharacterTextSplitter:
 
     def split_text(self, text: str) -> List[str]:
         """Split text into chunks."""
+        return list(self.iter_split_text(text))
+
+    def iter_split_text(self, text: str) -> Iterator[str]:
+        """Split text into chunks, yielding each chunk as soon as it is built."""
         return self._split_text(text, self.separators)
 
-    def _split_text(self, text: str, separators: List[str], depth: int = 0) -> List[str]:
+    def _split_text(self, text: str, separators: List[str], depth: int = 0) -> Iterator[str]:
         """Recursively split text using separators."""
         from litellm.constants import DEFAULT_MAX_RECURSE_DEPTH
 
         if depth > DEFAULT_MAX_RECURSE_DEPTH:
             # Max depth reached, return text as-is split into chunk_size pieces
-            return [text[i:i + self.chunk_size] for i in range(0, len(text), self.chunk_size)]
-
-        final_chunks: List[str] = []
+            for i in range(0, len(text), self.chunk_size):
+                yield text[i:i + self.chunk_size]
+            return
 
         # Get the appropriate separator
         separator = separators[-1]
@@ -68,29 +73,24 @@ class RecursiveCharacterTextSplitter:
             else:
                 # Chunk is too big, merge what we have and recurse
                 if good_splits:
-                    merged = self._merge_splits(good_splits, separator)
-                    final_chunks.extend(merged)
+                    yield from self._merge_splits(good_splits, separator)
                     good_splits = []
 
                 if new_separators:
                     # Recursively split with finer separators
-                    other_chunks = self._split_text(split, new_separators, depth + 1)
-                    final_chunks.extend(other_chunks)
+                    yield from self._split_text(split, new_separators, depth + 1)
                 else:
                     # No more separators, force split
-                    final_chunks.extend(self._force_split(split))
+                    yield from self._force_split(split)
 
         # Merge remaining good splits
         if good_splits:
-            merged = self._merge_splits(good_splits, separator)
-            final_chunks.extend(merged)
-
-        return final_chunks
+            yield from self._merge_splits(good_splits, separator)
 
     def _merge_splits(self, splits: List[str], separator: str) -> List[str]:
         """Merge splits into chunks respecting chunk_size and chunk_overlap."""
         chunks: List[str] = []
-        current_chunk: List[str] = []
+        current_chunk: Deque[str] = deque()
         current_length = 0
 
         for split in splits:
@@ -105,7 +105,7 @@ class RecursiveCharacterTextSplitter:
 
                     # Handle overlap
                     while current_length > self.chunk_overlap and len(current_chunk) > 1:
-                        removed = current_chunk.pop(0)
+                        removed = current_chunk.popleft()
                         current_length -= len(removed) + len(separator)
 
             current_chunk.append(split)
@@ -23,8 +23,10 @@ from typing import (
     TYPE_CHECKING,
     Any,
     AsyncGenerator,
+    AsyncIterator,
     Callable,
     Dict,
+    Iterable,
     List,
     Literal,
     Optional,
@@ -63,6 +65,7 @@ from litellm.litellm_core_utils.credential_accessor import CredentialAccessor
 from litellm.litellm_core_utils.dd_tracing import tracer
 from litellm.litellm_core_utils.litellm_logging import Logging as LiteLLMLogging
 from litellm.litellm_core_utils.sensitive_data_masker import SensitiveDataMasker
+from litellm.litellm_core_utils.token_counter import get_token_count_upper_bound
 from litellm.router_strategy.budget_limiter import RouterBudgetLimiting
 from litellm.router_strategy.least_busy import LeastBusyLoggingHandler
 from litellm.router_strategy.lowest_cost import LowestCostLoggingHandler
@@ -2001,6 +2004,32 @@ class Router:
         response = await asyncio.gather(*_tasks)
         return response
 
+    def abatch_completion_iter(
+        self, model: str, messages: Iterable[List[AllMessageValues]], **kwargs
+    ) -> AsyncIterator[Tuple[Any, int]]:
+        """
+        Async Batch Completion for large offline jobs - Batch Process many Messages to one model_group on litellm.Router
+
+        Unlike `abatch_completion_one_model_multiple_requests`, requests are spread over the model group's deployments
+        with bounded concurrency per deployment, throttled on 429s and paced by each deployment's rpm/tpm.
+        Results are yielded as they complete, optionally checkpointed to a JSONL file.
+
+        Args:
+            model (str): model group
+            messages (Iterable[List[Dict[str, str]]]): one list of messages per request, consumed lazily
+            **kwargs: `max_concurrency`, `checkpoint_file`, `max_rate_limit_retries` (see `litellm.abatch_completion`), other kwargs are passed to `acompletion`
+        Usage:
+            async for response, idx in router.abatch_completion_iter(
+                model="gpt-3.5-turbo",
+                messages=([{"role": "user", "content": prompt}] for prompt in prompts),
+                checkpoint_file="batch_results.jsonl",
+            ):
+                ...
+        """
+        from litellm.batch_completion.main import abatch_completion
+
+        return abatch_completion(model=model, messages=messages, router=self, **kwargs)
+
     # fmt: off
 
     @overload
@@ -2134,29 +2163,18 @@ class Router:
         )
         ### [fin] ###
 
-        ## ADDS REQUEST TO QUEUE ##
-        await self.scheduler.add_request(request=item)
-
-        ## POLL QUEUE
-        end_time = time.monotonic() + self.timeout
-        curr_time = time.monotonic()
-        poll_interval = self.scheduler.polling_interval  # poll every 3ms
-        make_request = False
-
-        while curr_time < end_time:
+        async def _get_healthy_deployments() -> list:
             _healthy_deployments, _ = await self._async_get_healthy_deployments(
                 model=model, parent_otel_span=parent_otel_span
             )
-            make_request = await self.scheduler.poll(  ## POLL QUEUE ## - returns 'True' if there's healthy deployments OR if request is at top of queue
-                id=item.request_id,
-                model_name=item.model_name,
-                health_deployments=_healthy_deployments,
-            )
-            if make_request:  ## IF TRUE -> MAKE REQUEST
-                break
-            else:  ## ELSE -> loop till default_timeout
-                await asyncio.sleep(poll_interval)
-                curr_time = time.monotonic()
+            return _healthy_deployments
+
+        ## ADDS REQUEST TO QUEUE + WAITS ## - returns 'True' if there's healthy deployments OR if request is at top of queue
+        make_request = await self.scheduler.wait_for_turn(
+            request=item,
+            get_healthy_deployments=_get_healthy_deployments,
+            timeout=self.timeout,
+        )
 
         if make_request:
             try:
@@ -2171,6 +2189,9 @@ class Router:
             except Exception as e:
                 setattr(e, "priority", priority)
                 raise e
+            finally:
+                ## WAKE QUEUED REQUESTS ##
+                self.scheduler.notify_capacity(model_name=item.model_name)
         else:
             raise litellm.Timeout(
                 message="Request timed out while polling queue",
@@ -2196,29 +2217,18 @@ class Router:
         )
         ### [fin] ###
 
-        ## ADDS REQUEST TO QUEUE ##
-        await self.scheduler.add_request(request=item)
-
-        ## POLL QUEUE
-        end_time = time.monotonic() + self.timeout
-        curr_time = time.monotonic()
-        poll_interval = self.scheduler.polling_interval  # poll every 3ms
-        make_request = False
-
-        while curr_time < end_time:
+        async def _get_healthy_deployments() -> list:
             _healthy_deployments, _ = await self._async_get_healthy_deployments(
                 model=model, parent_otel_span=parent_otel_span
             )
-            make_request = await self.scheduler.poll(  ## POLL QUEUE ## - returns 'True' if there's healthy deployments OR if request is at top of queue
-                id=item.request_id,
-                model_name=item.model_name,
-                health_deployments=_healthy_deployments,
-            )
-            if make_request:  ## IF TRUE -> MAKE REQUEST
-                break
-            else:  ## ELSE -> loop till default_timeout
-                await asyncio.sleep(poll_interval)
-                curr_time = time.monotonic()
+            return _healthy_deployments
+
+        ## ADDS REQUEST TO QUEUE + WAITS ## - returns 'True' if there's healthy deployments OR if request is at top of queue
+        make_request = await self.scheduler.wait_for_turn(
+            request=item,
+            get_healthy_deployments=_get_healthy_deployments,
+            timeout=self.timeout,
+        )
 
         if make_request:
             try:
@@ -2232,6 +2242,9 @@ class Router:
             except Exception as e:
                 setattr(e, "priority", priority)
                 raise e
+            finally:
+                ## WAKE QUEUED REQUESTS ##
+                self.scheduler.notify_capacity(model_name=item.model_name)
         else:
             raise litellm.Timeout(
                 message="Request timed out while polling queue",
@@ -5783,6 +5796,8 @@ class Router:
         self.model_list = []
         self.model_id_to_deployment_index_map = {}  # Reset the index
         self.model_name_to_deployment_indices = {}  # Reset the model_name index
+        self.pattern_router.clear()  # Reset wildcard routes
+        self.team_pattern_routers = {}
         # we add api_base/api_key each model so load balancing between azure/gpt on api_base1 and api_base2 works
 
         for model in original_model_list:
@@ -6132,6 +6147,9 @@ class Router:
                         self._update_deployment_indices_after_removal(
                             model_id=deployment_id, removal_idx=removal_idx
                         )
+                        self._remove_deployment_from_pattern_routers(
+                            model_id=deployment_id
+                        )
 
             # if the model_id is not in router
             self.add_deployment(deployment=deployment)
@@ -6145,6 +6163,14 @@ class Router:
             else:
                 raise e
 
+    def _remove_deployment_from_pattern_routers(self, model_id: str) -> None:
+        """
+        Drop a removed deployment from the wildcard pattern routers, so cached wildcard routes don't point at it
+        """
+        self.pattern_router.remove_deployment(model_id)
+        for team_pattern_router in self.team_pattern_routers.values():
+            team_pattern_router.remove_deployment(model_id)
+
     def delete_deployment(self, id: str) -> Optional[Deployment]:
         """
         Parameters:
@@ -6165,6 +6191,7 @@ class Router:
                 self._update_deployment_indices_after_removal(
                     model_id=id, removal_idx=deployment_idx
                 )
+                self._remove_deployment_from_pattern_routers(model_id=id)
                 return item
             else:
                 return None
@@ -7452,15 +7479,10 @@ class Router:
 
         invalid_model_indices = set()  # Use set for O(1) membership checks
 
-        try:
-            input_tokens = litellm.token_counter(messages=messages)
-        except Exception as e:
-            verbose_router_logger.error(
-                "litellm.router.py::_pre_call_checks: failed to count tokens. Returning initial list of deployments. Got - {}".format(
-                    str(e)
-                )
-            )
-            return _returned_deployments
+        # Exact token counting is only needed if a deployment's context window
+        # could be exceeded - use a cheap upper bound first, count lazily.
+        input_tokens: Optional[int] = None
+        input_tokens_upper_bound = get_token_count_upper_bound(messages)
 
         _context_window_error = False
         _potential_error_str = ""
@@ -7495,11 +7517,19 @@ class Router:
                 if (
                     isinstance(model_info, dict)
                     and model_info.get("max_input_tokens", None) is not None
+                    and isinstance(model_info["max_input_tokens"], int)
+                    and (
+                        input_tokens_upper_bound is None
+                        or input_tokens_upper_bound > model_info["max_input_tokens"]
+                    )
                 ):
-                    if (
-                        isinstance(model_info["max_input_tokens"], int)
-                        and input_tokens > model_info["max_input_tokens"]
-                    ):
+                    if input_tokens is None:
+                        input_tokens = self._get_input_tokens_for_pre_call_checks(
+                            messages=messages
+                        )
+                        if input_tokens is None:
+                            return list(healthy_deployments)
+                    if input_tokens > model_info["max_input_tokens"]:
                         invalid_model_indices.add(idx)
                         _context_window_error = True
                         _potential_error_str += (
@@ -7622,6 +7652,22 @@ class Router:
 
         return _returned_deployments
 
+    def _get_input_tokens_for_pre_call_checks(
+        self, messages: List[Dict[str, str]]
+    ) -> Optional[int]:
+        """
+        Count input tokens for the context window check. Returns None if counting fails.
+        """
+        try:
+            return litellm.token_counter(messages=messages)
+        except Exception as e:
+            verbose_router_logger.error(
+                "litellm.router.py::_pre_call_checks: failed to count tokens. Returning initial list of deployments. Got - {}".format(
+                    str(e)
+                )
+            )
+            return None
+
     def _get_model_from_alias(self, model: str) -> Optional[str]:
         """
         Get the model from the alias.
@@ -2,7 +2,7 @@
 #   picks based on response time (for streaming, this is time to first token)
 import random
 from datetime import datetime, timedelta
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
 
 import litellm
 from litellm import ModelResponse, token_counter, verbose_logger
@@ -10,6 +10,13 @@ from litellm.caching.caching import DualCache
 from litellm.integrations.custom_logger import CustomLogger
 from litellm.litellm_core_utils.core_helpers import safe_divide_seconds
 from litellm.litellm_core_utils.core_helpers import _get_parent_otel_span_from_kwargs
+from litellm.router_strategy.base_routing_strategy import BaseRoutingStrategy
+from litellm.router_utils.latency_stats import (
+    add_to_sketch,
+    get_ewma_alpha,
+    get_sketch_quantile,
+    update_ewma,
+)
 from litellm.types.utils import LiteLLMPydanticObjectBase
 
 if TYPE_CHECKING:
@@ -26,7 +33,34 @@ class RoutingArgs(LiteLLMPydanticObjectBase):
     max_latency_list_size: int = 10
 
 
-class LowestLatencyLoggingHandler(CustomLogger):
+def _get_precise_minute() -> str:
+    return datetime.now().strftime("%Y-%m-%d-%H-%M")
+
+
+class LowestLatencyLoggingHandler(BaseRoutingStrategy, CustomLogger):
+    """
+    Tracks per-deployment latency in `{model_group}_map`:
+
+    {
+        {model_group}_map: {
+            id: {
+                "latency": [..],  # most recent values
+                "latency_ewma": 0.5,
+                "latency_sketch": {bucket: count},
+                "time_to_first_token": [..],
+                "time_to_first_token_ewma": 0.1,
+                "time_to_first_token_sketch": {bucket: count},
+                "usage_minute": f"{date:hour:minute}",
+                f"{date:hour:minute}" : {"tpm": 34, "rpm": 3}
+            }
+        }
+    }
+
+    The map is updated in place in the in-memory cache. With Redis, per-deployment
+    latency counts / sums are shared across instances through batched increments,
+    and used for deployments this instance has no samples for yet.
+    """
+
     test_flag: bool = False
     logged_success: int = 0
     logged_failure: int = 0
@@ -36,154 +70,202 @@ class LowestLatencyLoggingHandler(CustomLogger):
     ):
         self.router_cache = router_cache
         self.routing_args = RoutingArgs(**routing_args)
+        BaseRoutingStrategy.__init__(
+            self,
+            dual_cache=router_cache,
+            should_batch_redis_writes=router_cache.redis_cache is not None,
+            default_sync_interval=None,
+        )
+
+    @staticmethod
+    def _get_shared_stats_key(model_group: str, deployment_id: str, stat: str) -> str:
+        return f"{model_group}_latency_stats:{deployment_id}:{stat}"
+
+    def _get_latency_map(self, latency_key: str) -> dict:
+        # in-memory only: the map is updated in place, and never written to redis
+        return self.router_cache.in_memory_cache.get_cache(key=latency_key) or {}
+
+    def _set_latency_map(self, latency_key: str, request_count_dict: dict) -> None:
+        self.router_cache.in_memory_cache.set_cache(
+            key=latency_key, value=request_count_dict, ttl=self.routing_args.ttl
+        )  # reset map within window
 
-    def log_success_event(  # noqa: PLR0915
+    def _get_request_latency_values(
         self, kwargs, response_obj, start_time, end_time
-    ):
-        try:
-            """
-            Update latency usage on success
-            """
-            metadata_field = self._select_metadata_field(kwargs)
-            if kwargs["litellm_params"].get(metadata_field) is None:
-                pass
-            else:
-                model_group = kwargs["litellm_params"][metadata_field].get(
-                    "model_group", None
-                )
+    ) -> Tuple[Union[float, timedelta], Optional[float], int]:
+        """
+        Returns - (latency per output token, time to first token per output token, total tokens)
+        """
+        response_ms = end_time - start_time
+        time_to_first_token_response_time = None
+        if kwargs.get("stream", None) is not None and kwargs["stream"] is True:
+            # only log ttft for streaming request
+            time_to_first_token_response_time = (
+                kwargs.get("completion_start_time", end_time) - start_time
+            )
 
-                id = kwargs["litellm_params"].get("model_info", {}).get("id", None)
-                if model_group is None or id is None:
-                    return
-                elif isinstance(id, int):
-                    id = str(id)
-
-                # ------------
-                # Setup values
-                # ------------
-                """
-                {
-                    {model_group}_map: {
-                        id: {
-                            "latency": [..]
-                            f"{date:hour:minute}" : {"tpm": 34, "rpm": 3}
-                        }
-                    }
-                }
-                """
-                latency_key = f"{model_group}_map"
-
-                current_date = datetime.now().strftime("%Y-%m-%d")
-                current_hour = datetime.now().strftime("%H")
-                current_minute = datetime.now().strftime("%M")
-                precise_minute = f"{current_date}-{current_hour}-{current_minute}"
-
-                response_ms = end_time - start_time
-                time_to_first_token_response_time = None
-
-                if kwargs.get("stream", None) is not None and kwargs["stream"] is True:
-                    # only log ttft for streaming request
-                    time_to_first_token_response_time = (
-                        kwargs.get("completion_start_time", end_time) - start_time
-                    )
+        final_value: Union[float, timedelta] = response_ms
+        time_to_first_token: Optional[float] = None
+        total_tokens = 0
 
-                final_value: Union[float, timedelta] = response_ms
-                time_to_first_token: Optional[float] = None
-                total_tokens = 0
-
-                if isinstance(response_obj, ModelResponse):
-                    _usage = getattr(response_obj, "usage", None)
-                    if _usage is not None:
-                        completion_tokens = _usage.completion_tokens
-                        total_tokens = _usage.total_tokens
-                        
-                        # Handle both timedelta and float response times
-                        if isinstance(response_ms, timedelta):
-                            response_seconds = response_ms.total_seconds()
-                        else:
-                            response_seconds = response_ms
-                            
-                        final_value = safe_divide_seconds(response_seconds, completion_tokens)
-                        if final_value is not None:
-                            final_value = float(final_value)
-                        else:
-                            final_value = response_seconds
-
-                        if time_to_first_token_response_time is not None:
-                            if isinstance(time_to_first_token_response_time, timedelta):
-                                ttft_seconds = time_to_first_token_response_time.total_seconds()
-                            else:
-                                ttft_seconds = time_to_first_token_response_time
-                            time_to_first_token = safe_divide_seconds(
-                                ttft_seconds, completion_tokens
-                            )
-
-                # ------------
-                # Update usage
-                # ------------
-                parent_otel_span = _get_parent_otel_span_from_kwargs(kwargs)
-                request_count_dict = (
-                    self.router_cache.get_cache(
-                        key=latency_key, parent_otel_span=parent_otel_span
-                    )
-                    or {}
-                )
+        if isinstance(response_obj, ModelResponse):
+            _usage = getattr(response_obj, "usage", None)
+            if _usage is not None:
+                completion_tokens = _usage.completion_tokens
+                total_tokens = _usage.total_tokens
 
-                if id not in request_count_dict:
-                    request_count_dict[id] = {}
+                # Handle both timedelta and float response times
+                if isinstance(response_ms, timedelta):
+                    response_seconds = response_ms.total_seconds()
+                else:
+                    response_seconds = response_ms
 
-                ## Latency
-                if (
-                    len(request_count_dict[id].get("latency", []))
-                    < self.routing_args.max_latency_list_size
-                ):
-                    request_count_dict[id].setdefault("latency", []).append(final_value)
+                final_value = safe_divide_seconds(response_seconds, completion_tokens)
+                if final_value is not None:
+                    final_value = float(final_value)
                 else:
-                    request_count_dict[id]["latency"] = request_count_dict[id][
-                        "latency"
-                    ][: self.routing_args.max_latency_list_size - 1] + [final_value]
-
-                ## Time to first token
-                if time_to_first_token is not None:
-                    if (
-                        len(request_count_dict[id].get("time_to_first_token", []))
-                        < self.routing_args.max_latency_list_size
-                    ):
-                        request_count_dict[id].setdefault(
-                            "time_to_first_token", []
-                        ).append(time_to_first_token)
+                    final_value = response_seconds
+
+                if time_to_first_token_response_time is not None:
+                    if isinstance(time_to_first_token_response_time, timedelta):
+                        ttft_seconds = time_to_first_token_response_time.total_seconds()
                     else:
-                        request_count_dict[id][
-                            "time_to_first_token"
-                        ] = request_count_dict[id]["time_to_first_token"][
-                            : self.routing_args.max_latency_list_size - 1
-                        ] + [
-                            time_to_first_token
-                        ]
-
-                if precise_minute not in request_count_dict[id]:
-                    request_count_dict[id][precise_minute] = {}
-
-                ## TPM
-                request_count_dict[id][precise_minute]["tpm"] = (
-                    request_count_dict[id][precise_minute].get("tpm", 0) + total_tokens
-                )
+                        ttft_seconds = time_to_first_token_response_time
+                    time_to_first_token = safe_divide_seconds(
+                        ttft_seconds, completion_tokens
+                    )
+        return final_value, time_to_first_token, total_tokens
+
+    def _record_latency(
+        self,
+        deployment_stats: dict,
+        stat: str,
+        value: Union[float, timedelta],
+        add_to_quantile_sketch: bool = True,
+    ) -> float:
+        """
+        O(1) update of the recent values, EWMA and sketch of `stat` ("latency" / "time_to_first_token")
+        """
+        max_size = self.routing_args.max_latency_list_size
+        recent_values = deployment_stats.setdefault(stat, [])
+        recent_values.append(value)
+        if len(recent_values) > max_size:
+            del recent_values[: len(recent_values) - max_size]
+
+        seconds = value.total_seconds() if isinstance(value, timedelta) else value
+        deployment_stats[f"{stat}_ewma"] = update_ewma(
+            deployment_stats.get(f"{stat}_ewma"),
+            seconds,
+            alpha=get_ewma_alpha(max_size),
+        )
+        if add_to_quantile_sketch:
+            add_to_sketch(deployment_stats.setdefault(f"{stat}_sketch", {}), seconds)
+        return seconds
+
+    def _update_deployment_stats(
+        self,
+        request_count_dict: dict,
+        id: str,
+        final_value: Union[float, timedelta],
+        time_to_first_token: Optional[float],
+        total_tokens: int,
+    ) -> Tuple[float, Optional[float]]:
+        """
+        Returns - (latency, time to first token) in seconds
+        """
+        deployment_stats = request_count_dict.setdefault(id, {})
 
-                ## RPM
-                request_count_dict[id][precise_minute]["rpm"] = (
-                    request_count_dict[id][precise_minute].get("rpm", 0) + 1
+        ## Latency
+        latency = self._record_latency(deployment_stats, "latency", final_value)
+
+        ## Time to first token
+        ttft: Optional[float] = None
+        if time_to_first_token is not None:
+            ttft = self._record_latency(
+                deployment_stats, "time_to_first_token", time_to_first_token
+            )
+
+        ## TPM / RPM - only the current minute is kept
+        precise_minute = _get_precise_minute()
+        usage_minute = deployment_stats.get("usage_minute")
+        if usage_minute != precise_minute:
+            if usage_minute is not None:
+                deployment_stats.pop(usage_minute, None)
+            deployment_stats["usage_minute"] = precise_minute
+        minute_usage = deployment_stats.setdefault(precise_minute, {})
+        minute_usage["tpm"] = minute_usage.get("tpm", 0) + total_tokens
+        minute_usage["rpm"] = minute_usage.get("rpm", 0) + 1
+        return latency, ttft
+
+    async def _increment_shared_latency_stats(
+        self, model_group: str, id: str, stat: str, value: float
+    ) -> None:
+        """
+        Queue count / sum increments for the batched Redis sync
+        """
+        if self.router_cache.redis_cache is None:
+            return
+        ttl = int(self.routing_args.ttl)
+        await self._increment_value_in_current_window(
+            key=self._get_shared_stats_key(model_group, id, f"{stat}_count"),
+            value=1,
+            ttl=ttl,
+        )
+        await self._increment_value_in_current_window(
+            key=self._get_shared_stats_key(model_group, id, f"{stat}_sum"),
+            value=value,
+            ttl=ttl,
+        )
+
+    def _get_logged_deployment(self, kwargs) -> Optional[Tuple[str, str]]:
+        """
+        Returns - (model_group, deployment id) of the logged request
+        """
+        metadata_field = self._select_metadata_field(kwargs)
+        if kwargs["litellm_params"].get(metadata_field) is None:
+            return None
+        model_group = kwargs["litellm_params"][metadata_field].get("model_group", None)
+        id = kwargs["litellm_params"].get("model_info", {}).get("id", None)
+        if model_group is None or id is None:
+            return None
+        return model_group, str(id)
+
+    def log_success_event(self, kwargs, response_obj, start_time, end_time):
+        try:
+            """
+            Update latency usage on success
+            """
+            logged_deployment = self._get_logged_deployment(kwargs)
+            if logged_deployment is None:
+                return
+            model_group, id = logged_deployment
+            latency_key = f"{model_group}_map"
+
+            final_value, time_to_first_token, total_tokens = (
+                self._get_request_latency_values(
+                    kwargs, response_obj, start_time, end_time
                 )
+            )
 
-                self.router_cache.set_cache(
-                    key=latency_key, value=request_count_dict, ttl=self.routing_args.ttl
-                )  # reset map within window
+            # ------------
+            # Update usage
+            # ------------
+            request_count_dict = self._get_latency_map(latency_key)
+            self._update_deployment_stats(
+                request_count_dict=request_count_dict,
+                id=id,
+                final_value=final_value,
+                time_to_first_token=time_to_first_token,
+                total_tokens=total_tokens,
+            )
+            self._set_latency_map(latency_key, request_count_dict)
 
-                ### TESTING ###
-                if self.test_flag:
-                    self.logged_success += 1
+            ### TESTING ###
+            if self.test_flag:
+                self.logged_success += 1
         except Exception as e:
             verbose_logger.exception(
-                "litellm.proxy.hooks.prompt_injection_detection.py::async_pre_call_hook(): Exception occured - {}".format(
+                "litellm.router_strategy.lowest_latency.py::log_success_event(): Exception occured - {}".format(
                     str(e)
                 )
             )
@@ -194,215 +276,82 @@ class LowestLatencyLoggingHandler(CustomLogger):
         Check if Timeout Error, if timeout set deployment latency -> 100
         """
         try:
-            metadata_field = self._select_metadata_field(kwargs)
             _exception = kwargs.get("exception", None)
-            if isinstance(_exception, litellm.Timeout):
-                if kwargs["litellm_params"].get(metadata_field) is None:
-                    pass
-                else:
-                    model_group = kwargs["litellm_params"][metadata_field].get(
-                        "model_group", None
-                    )
+            if not isinstance(_exception, litellm.Timeout):
+                # do nothing if it's not a timeout error
+                return
+            logged_deployment = self._get_logged_deployment(kwargs)
+            if logged_deployment is None:
+                return
+            model_group, id = logged_deployment
+            latency_key = f"{model_group}_map"
 
-                    id = kwargs["litellm_params"].get("model_info", {}).get("id", None)
-                    if model_group is None or id is None:
-                        return
-                    elif isinstance(id, int):
-                        id = str(id)
-
-                    # ------------
-                    # Setup values
-                    # ------------
-                    """
-                    {
-                        {model_group}_map: {
-                            id: {
-                                "latency": [..]
-                                f"{date:hour:minute}" : {"tpm": 34, "rpm": 3}
-                            }
-                        }
-                    }
-                    """
-                    latency_key = f"{model_group}_map"
-                    request_count_dict = (
-                        await self.router_cache.async_get_cache(key=latency_key) or {}
-                    )
+            request_count_dict = self._get_latency_map(latency_key)
 
-                    if id not in request_count_dict:
-                        request_count_dict[id] = {}
+            ## Latency - give 1000s penalty for failing. Not a real latency, so kept out of the quantile sketch
+            self._record_latency(
+                request_count_dict.setdefault(id, {}),
+                "latency",
+                1000.0,
+                add_to_quantile_sketch=False,
+            )
 
-                    ## Latency - give 1000s penalty for failing
-                    if (
-                        len(request_count_dict[id].get("latency", []))
-                        < self.routing_args.max_latency_list_size
-                    ):
-                        request_count_dict[id].setdefault("latency", []).append(1000.0)
-                    else:
-                        request_count_dict[id]["latency"] = request_count_dict[id][
-                            "latency"
-                        ][: self.routing_args.max_latency_list_size - 1] + [1000.0]
-
-                    await self.router_cache.async_set_cache(
-                        key=latency_key,
-                        value=request_count_dict,
-                        ttl=self.routing_args.ttl,
-                    )  # reset map within window
-            else:
-                # do nothing if it's not a timeout error
-                return
+            self._set_latency_map(latency_key, request_count_dict)
         except Exception as e:
             verbose_logger.exception(
-                "litellm.proxy.hooks.prompt_injection_detection.py::async_pre_call_hook(): Exception occured - {}".format(
+                "litellm.router_strategy.lowest_latency.py::async_log_failure_event(): Exception occured - {}".format(
                     str(e)
                 )
             )
             pass
 
-    async def async_log_success_event(  # noqa: PLR0915
+    async def async_log_success_event(
         self, kwargs, response_obj, start_time, end_time
     ):
         try:
             """
             Update latency usage on success
             """
-            metadata_field = self._select_metadata_field(kwargs)
-            if kwargs["litellm_params"].get(metadata_field) is None:
-                pass
-            else:
-                model_group = kwargs["litellm_params"][metadata_field].get(
-                    "model_group", None
-                )
-
-                id = kwargs["litellm_params"].get("model_info", {}).get("id", None)
-                if model_group is None or id is None:
-                    return
-                elif isinstance(id, int):
-                    id = str(id)
-
-                # ------------
-                # Setup values
-                # ------------
-                """
-                {
-                    {model_group}_map: {
-                        id: {
-                            "latency": [..]
-                            "time_to_first_token": [..]
-                            f"{date:hour:minute}" : {"tpm": 34, "rpm": 3}
-                        }
-                    }
-                }
-                """
-                latency_key = f"{model_group}_map"
-
-                current_date = datetime.now().strftime("%Y-%m-%d")
-                current_hour = datetime.now().strftime("%H")
-                current_minute = datetime.now().strftime("%M")
-                precise_minute = f"{current_date}-{current_hour}-{current_minute}"
-
-                response_ms = end_time - start_time
-                time_to_first_token_response_time = None
-                if kwargs.get("stream", None) is not None and kwargs["stream"] is True:
-                    # only log ttft for streaming request
-                    time_to_first_token_response_time = (
-                        kwargs.get("completion_start_time", end_time) - start_time
-                    )
+            logged_deployment = self._get_logged_deployment(kwargs)
+            if logged_deployment is None:
+                return
+            model_group, id = logged_deployment
+            latency_key = f"{model_group}_map"
 
-                final_value: Union[float, timedelta] = response_ms
-                total_tokens = 0
-                time_to_first_token: Optional[float] = None
-
-                if isinstance(response_obj, ModelResponse):
-                    _usage = getattr(response_obj, "usage", None)
-                    if _usage is not None:
-                        completion_tokens = _usage.completion_tokens
-                        total_tokens = _usage.total_tokens
-                        
-                        # Handle both timedelta and float response times
-                        if isinstance(response_ms, timedelta):
-                            response_seconds = response_ms.total_seconds()
-                        else:
-                            response_seconds = response_ms
-                            
-                        final_value = safe_divide_seconds(response_seconds, completion_tokens)
-                        if final_value is not None:
-                            final_value = float(final_value)
-                        else:
-                            final_value = response_ms
-
-                        if time_to_first_token_response_time is not None:
-                            if isinstance(time_to_first_token_response_time, timedelta):
-                                ttft_seconds = time_to_first_token_response_time.total_seconds()
-                            else:
-                                ttft_seconds = time_to_first_token_response_time
-                            time_to_first_token = safe_divide_seconds(
-                                ttft_seconds, completion_tokens
-                            )
-                # ------------
-                # Update usage
-                # ------------
-                parent_otel_span = _get_parent_otel_span_from_kwargs(kwargs)
-                request_count_dict = (
-                    await self.router_cache.async_get_cache(
-                        key=latency_key,
-                        parent_otel_span=parent_otel_span,
-                        local_only=True,
-                    )
-                    or {}
+            final_value, time_to_first_token, total_tokens = (
+                self._get_request_latency_values(
+                    kwargs, response_obj, start_time, end_time
                 )
+            )
 
-                if id not in request_count_dict:
-                    request_count_dict[id] = {}
-
-                ## Latency
-                if (
-                    len(request_count_dict[id].get("latency", []))
-                    < self.routing_args.max_latency_list_size
-                ):
-                    request_count_dict[id].setdefault("latency", []).append(final_value)
-                else:
-                    request_count_dict[id]["latency"] = request_count_dict[id][
-                        "latency"
-                    ][: self.routing_args.max_latency_list_size - 1] + [final_value]
-
-                ## Time to first token
-                if time_to_first_token is not None:
-                    if (
-                        len(request_count_dict[id].get("time_to_first_token", []))
-                        < self.routing_args.max_latency_list_size
-                    ):
-                        request_count_dict[id].setdefault(
-                            "time_to_first_token", []
-                        ).append(time_to_first_token)
-                    else:
-                        request_count_dict[id][
-                            "time_to_first_token"
-                        ] = request_count_dict[id]["time_to_first_token"][
-                            : self.routing_args.max_latency_list_size - 1
-                        ] + [
-                            time_to_first_token
-                        ]
-
-                if precise_minute not in request_count_dict[id]:
-                    request_count_dict[id][precise_minute] = {}
-
-                ## TPM
-                request_count_dict[id][precise_minute]["tpm"] = (
-                    request_count_dict[id][precise_minute].get("tpm", 0) + total_tokens
-                )
+            # ------------
+            # Update usage
+            # ------------
+            request_count_dict = self._get_latency_map(latency_key)
+            latency, ttft = self._update_deployment_stats(
+                request_count_dict=request_count_dict,
+                id=id,
+                final_value=final_value,
+                time_to_first_token=time_to_first_token,
+                total_tokens=total_tokens,
+            )
+            self._set_latency_map(latency_key, request_count_dict)
 
-                ## RPM
-                request_count_dict[id][precise_minute]["rpm"] = (
-                    request_count_dict[id][precise_minute].get("rpm", 0) + 1
+            ## share with other instances - compact increments, not the whole map
+            await self._increment_shared_latency_stats(
+                model_group=model_group, id=id, stat="latency", value=latency
+            )
+            if ttft is not None:
+                await self._increment_shared_latency_stats(
+                    model_group=model_group,
+                    id=id,
+                    stat="time_to_first_token",
+                    value=ttft,
                 )
 
-                await self.router_cache.async_set_cache(
-                    key=latency_key, value=request_count_dict, ttl=self.routing_args.ttl
-                )  # reset map within window
-
-                ### TESTING ###
-                if self.test_flag:
-                    self.logged_success += 1
+            ### TESTING ###
+            if self.test_flag:
+                self.logged_success += 1
         except Exception as e:
             verbose_logger.exception(
                 "litellm.router_strategy.lowest_latency.py::async_log_success_event(): Exception occured - {}".format(
@@ -411,6 +360,90 @@ class LowestLatencyLoggingHandler(CustomLogger):
             )
             pass
 
+    @staticmethod
+    def _get_latency_stat(request_kwargs: Optional[Dict]) -> str:
+        """
+        Streaming requests are routed on time to first token
+        """
+        if (
+            request_kwargs is not None
+            and request_kwargs.get("stream", None) is not None
+            and request_kwargs["stream"] is True
+        ):
+            return "time_to_first_token"
+        return "latency"
+
+    @staticmethod
+    def _get_local_latency(item_map: Optional[dict], stat: str) -> Optional[float]:
+        """
+        Returns - the deployment's latency EWMA, or None if there are no samples for it
+        """
+        if not item_map:
+            return None
+        if stat == "time_to_first_token" and item_map.get("time_to_first_token"):
+            ewma = item_map.get("time_to_first_token_ewma")
+        else:
+            ewma = item_map.get("latency_ewma")
+        if ewma is not None:
+            return ewma
+
+        # map written before EWMAs were tracked - average the recent values
+        item_latency = item_map.get("latency", [])
+        if len(item_latency) == 0:
+            return None
+        item_ttft_latency = item_map.get("time_to_first_token", [])
+        values = (
+            item_ttft_latency
+            if stat == "time_to_first_token" and len(item_ttft_latency) > 0
+            else item_latency
+        )
+        total = sum(v for v in values if isinstance(v, float))
+        return total / len(item_latency)
+
+    def _get_shared_latency_keys(
+        self, model_group: str, deployment_ids: List[str], stat: str
+    ) -> List[str]:
+        keys = []
+        for deployment_id in deployment_ids:
+            keys.append(
+                self._get_shared_stats_key(model_group, deployment_id, f"{stat}_count")
+            )
+            keys.append(
+                self._get_shared_stats_key(model_group, deployment_id, f"{stat}_sum")
+            )
+        return keys
+
+    @staticmethod
+    def _get_shared_latencies(
+        deployment_ids: List[str], values: List[Any]
+    ) -> Dict[str, float]:
+        """
+        values - [count, sum, count, sum, ..] in the order of deployment_ids
+        """
+        shared_latencies: Dict[str, float] = {}
+        for idx, deployment_id in enumerate(deployment_ids):
+            count = values[2 * idx]
+            total = values[2 * idx + 1]
+            if count and total is not None and float(count) > 0:
+                shared_latencies[deployment_id] = float(total) / float(count)
+        return shared_latencies
+
+    def _get_deployments_without_samples(
+        self,
+        healthy_deployments: list,
+        request_count_dict: Dict,
+        stat: str,
+    ) -> List[str]:
+        if self.router_cache.redis_cache is None:
+            return []
+        deployment_ids = []
+        for d in healthy_deployments:
+            deployment_id = d["model_info"]["id"]
+            item_map = request_count_dict.get(deployment_id)
+            if self._get_local_latency(item_map, stat) is None:
+                deployment_ids.append(deployment_id)
+        return deployment_ids
+
     def _get_available_deployments(  # noqa: PLR0915
         self,
         model_group: str,
@@ -419,128 +452,92 @@ class LowestLatencyLoggingHandler(CustomLogger):
         input: Optional[Union[str, List]] = None,
         request_kwargs: Optional[Dict] = None,
         request_count_dict: Optional[Dict] = None,
+        shared_latencies: Optional[Dict[str, float]] = None,
     ):
-        """Common logic for both sync and async get_available_deployments"""
+        """
+        Common logic for both sync and async get_available_deployments
+
+        Single pass over healthy_deployments. Input tokens are only counted if a deployment has a tpm limit.
+        """
 
         # -----------------------
         # Find lowest used model
         # ----------------------
         _latency_per_deployment = {}
-        lowest_latency = float("inf")
-
-        current_date = datetime.now().strftime("%Y-%m-%d")
-        current_hour = datetime.now().strftime("%H")
-        current_minute = datetime.now().strftime("%M")
-        precise_minute = f"{current_date}-{current_hour}-{current_minute}"
-
-        deployment = None
+        precise_minute = _get_precise_minute()
 
         if request_count_dict is None:  # base case
             return
 
-        all_deployments = request_count_dict
-        for d in healthy_deployments:
-            ## if healthy deployment not yet used
-            if d["model_info"]["id"] not in all_deployments:
-                all_deployments[d["model_info"]["id"]] = {
-                    "latency": [0],
-                    precise_minute: {"tpm": 0, "rpm": 0},
-                }
+        stat = self._get_latency_stat(request_kwargs)
+        shared_latencies = shared_latencies or {}
+        input_tokens: Optional[int] = None
 
-        try:
-            input_tokens = token_counter(messages=messages, text=input)
-        except Exception:
-            input_tokens = 0
-
-        # randomly sample from all_deployments, incase all deployments have latency=0.0
-        _items = all_deployments.items()
-
-        _all_deployments = random.sample(list(_items), len(_items))
-        all_deployments = dict(_all_deployments)
         ### GET AVAILABLE DEPLOYMENTS ### filter out any deployments > tpm/rpm limits
-
         potential_deployments = []
-        for item, item_map in all_deployments.items():
-            ## get the item from model list
-            _deployment = None
-            for m in healthy_deployments:
-                if item == m["model_info"]["id"]:
-                    _deployment = m
-
-            if _deployment is None:
-                continue  # skip to next one
-
-            _deployment_tpm = (
-                _deployment.get("tpm", None)
-                or _deployment.get("litellm_params", {}).get("tpm", None)
-                or _deployment.get("model_info", {}).get("tpm", None)
-                or float("inf")
-            )
-
-            _deployment_rpm = (
-                _deployment.get("rpm", None)
-                or _deployment.get("litellm_params", {}).get("rpm", None)
-                or _deployment.get("model_info", {}).get("rpm", None)
-                or float("inf")
-            )
-            item_latency = item_map.get("latency", [])
-            item_ttft_latency = item_map.get("time_to_first_token", [])
-            item_rpm = item_map.get(precise_minute, {}).get("rpm", 0)
-            item_tpm = item_map.get(precise_minute, {}).get("tpm", 0)
-
-            # get average latency or average ttft (depending on streaming/non-streaming)
-            total: float = 0.0
-            if (
-                request_kwargs is not None
-                and request_kwargs.get("stream", None) is not None
-                and request_kwargs["stream"] is True
-                and len(item_ttft_latency) > 0
-            ):
-                for _call_latency in item_ttft_latency:
-                    if isinstance(_call_latency, float):
-                        total += _call_latency
-            else:
-                for _call_latency in item_latency:
-                    if isinstance(_call_latency, float):
-                        total += _call_latency
-            item_latency = total / len(item_latency)
+        lowest_latency = float("inf")
+        for _deployment in healthy_deployments:
+            _litellm_params = _deployment.get("litellm_params", {})
+            _model_info = _deployment.get("model_info", {})
+            deployment_id = _model_info["id"]
+            item_map = request_count_dict.get(deployment_id)
+
+            # latency EWMA or ttft EWMA (depending on streaming/non-streaming).
+            # deployments not yet used have latency 0, so they get tried
+            item_latency = self._get_local_latency(item_map, stat)
+            if item_latency is None:
+                item_latency = shared_latencies.get(deployment_id, 0.0)
 
             # -------------- #
             # Debugging Logic
             # -------------- #
             # We use _latency_per_deployment to log to langfuse, slack - this is not used to make a decision on routing
             # this helps a user to debug why the router picked a specfic deployment      #
-            _deployment_api_base = _deployment.get("litellm_params", {}).get(
-                "api_base", ""
-            )
+            _deployment_api_base = _litellm_params.get("api_base", "")
             if _deployment_api_base is not None:
                 _latency_per_deployment[_deployment_api_base] = item_latency
             # -------------- #
             # End of Debugging Logic
             # -------------- #
 
-            if (
-                item_tpm + input_tokens > _deployment_tpm
-                or item_rpm + 1 > _deployment_rpm
-            ):  # if user passed in tpm / rpm in the model_list
-                continue
-            else:
-                potential_deployments.append((_deployment, item_latency))
+            _deployment_tpm = (
+                _deployment.get("tpm", None)
+                or _litellm_params.get("tpm", None)
+                or _model_info.get("tpm", None)
+            )
+            _deployment_rpm = (
+                _deployment.get("rpm", None)
+                or _litellm_params.get("rpm", None)
+                or _model_info.get("rpm", None)
+            )
+            if _deployment_tpm or _deployment_rpm:
+                minute_usage = (item_map or {}).get(precise_minute, {})
+                if (
+                    _deployment_rpm
+                    and minute_usage.get("rpm", 0) + 1 > _deployment_rpm
+                ):
+                    continue
+                if _deployment_tpm:
+                    if input_tokens is None:
+                        try:
+                            input_tokens = token_counter(messages=messages, text=input)
+                        except Exception:
+                            input_tokens = 0
+                    if minute_usage.get("tpm", 0) + input_tokens > _deployment_tpm:
+                        continue  # if user passed in tpm / rpm in the model_list
+
+            potential_deployments.append((_deployment, item_latency))
+            if item_latency < lowest_latency:
+                lowest_latency = item_latency
 
         if len(potential_deployments) == 0:
             return None
 
-        # Sort potential deployments by latency
-        sorted_deployments = sorted(potential_deployments, key=lambda x: x[1])
-
-        # Find lowest latency deployment
-        lowest_latency = sorted_deployments[0][1]
-
         # Find deployments within buffer of lowest latency
         buffer = self.routing_args.lowest_latency_buffer * lowest_latency
 
         valid_deployments = [
-            x for x in sorted_deployments if x[1] <= lowest_latency + buffer
+            x for x in potential_deployments if x[1] <= lowest_latency + buffer
         ]
 
         # Pick a random deployment from valid deployments
@@ -567,12 +564,21 @@ class LowestLatencyLoggingHandler(CustomLogger):
         parent_otel_span: Optional[Span] = _get_parent_otel_span_from_kwargs(
             request_kwargs
         )
-        request_count_dict = (
-            await self.router_cache.async_get_cache(
-                key=latency_key, parent_otel_span=parent_otel_span
-            )
-            or {}
+        request_count_dict = self._get_latency_map(latency_key)
+
+        ## latency other instances saw, for deployments this instance hasn't used yet
+        stat = self._get_latency_stat(request_kwargs)
+        deployment_ids = self._get_deployments_without_samples(
+            healthy_deployments, request_count_dict, stat
         )
+        shared_latencies: Dict[str, float] = {}
+        if len(deployment_ids) > 0:
+            values = await self.router_cache.async_batch_get_cache(
+                keys=self._get_shared_latency_keys(model_group, deployment_ids, stat),
+                parent_otel_span=parent_otel_span,
+            )
+            if values is not None:
+                shared_latencies = self._get_shared_latencies(deployment_ids, values)
 
         return self._get_available_deployments(
             model_group,
@@ -581,6 +587,7 @@ class LowestLatencyLoggingHandler(CustomLogger):
             input,
             request_kwargs,
             request_count_dict,
+            shared_latencies,
         )
 
     def get_available_deployments(
@@ -597,15 +604,20 @@ class LowestLatencyLoggingHandler(CustomLogger):
         # get list of potential deployments
         latency_key = f"{model_group}_map"
 
-        parent_otel_span: Optional[Span] = _get_parent_otel_span_from_kwargs(
-            request_kwargs
+        request_count_dict = self._get_latency_map(latency_key)
+
+        ## latency other instances saw - only what's already synced in-memory
+        stat = self._get_latency_stat(request_kwargs)
+        deployment_ids = self._get_deployments_without_samples(
+            healthy_deployments, request_count_dict, stat
         )
-        request_count_dict = (
-            self.router_cache.get_cache(
-                key=latency_key, parent_otel_span=parent_otel_span
+        shared_latencies: Dict[str, float] = {}
+        if len(deployment_ids) > 0:
+            values = self.router_cache.in_memory_cache.batch_get_cache(
+                keys=self._get_shared_latency_keys(model_group, deployment_ids, stat)
             )
-            or {}
-        )
+            if values is not None:
+                shared_latencies = self._get_shared_latencies(deployment_ids, values)
 
         return self._get_available_deployments(
             model_group,
@@ -614,4 +626,24 @@ class LowestLatencyLoggingHandler(CustomLogger):
             input,
             request_kwargs,
             request_count_dict,
+            shared_latencies,
         )
+
+    def get_latency_stats(self, model_group: str) -> Dict[str, Dict[str, Any]]:
+        """
+        Per-deployment latency / ttft EWMA and quantiles for the model group, as seen by this instance
+
+        Returns:
+            {deployment_id: {"latency_ewma", "latency_p50", "latency_p95", "time_to_first_token_ewma", ..}}
+        """
+        request_count_dict = self._get_latency_map(f"{model_group}_map")
+        latency_stats: Dict[str, Dict[str, Any]] = {}
+        for deployment_id, item_map in request_count_dict.items():
+            deployment_stats: Dict[str, Any] = {}
+            for stat in ("latency", "time_to_first_token"):
+                sketch = item_map.get(f"{stat}_sketch") or {}
+                deployment_stats[f"{stat}_ewma"] = item_map.get(f"{stat}_ewma")
+                deployment_stats[f"{stat}_p50"] = get_sketch_quantile(sketch, 0.5)
+                deployment_stats[f"{stat}_p95"] = get_sketch_quantile(sketch, 0.95)
+            latency_stats[deployment_id] = deployment_stats
+        return latency_stats
@@ -1,9 +1,10 @@
 import io
 import json
 from os import PathLike
-from typing import List, Optional
+from typing import Iterable, Iterator, List, Optional
 
 from litellm._logging import verbose_logger
+from litellm.litellm_core_utils.jsonl_utils import iter_jsonl, write_jsonl
 from litellm.types.llms.openai import FileTypes, OpenAIFilesPurpose
 
 
@@ -34,33 +35,11 @@ def parse_jsonl_with_embedded_newlines(content: str) -> List[dict]:
         >>> parse_jsonl_with_embedded_newlines(content)
         [{"id":1,"msg":"Line 1\\nLine 2"}, {"id":2,"msg":"test"}]
     """
-    json_objects = []
-    buffer = ""
-
-    for char in content:
-        buffer += char
-        if char == "\n":
-            # Try to parse what we have so far
-            try:
-                json_object = json.loads(buffer.strip())
-                json_objects.append(json_object)
-                buffer = ""  # Reset buffer for next JSON object
-            except json.JSONDecodeError:
-                # Not a complete JSON object yet, keep accumulating
-                continue
-
-    # Handle any remaining content in buffer
-    if buffer.strip():
-        try:
-            json_object = json.loads(buffer.strip())
-            json_objects.append(json_object)
-        except json.JSONDecodeError as e:
-            verbose_logger.error(
-                f"error parsing final buffer: {buffer[:100]}..., error: {e}"
-            )
-            raise e
-
-    return json_objects
+    try:
+        return list(iter_jsonl(content))
+    except json.JSONDecodeError as e:
+        verbose_logger.error(f"error parsing jsonl content, error: {e}")
+        raise e
 
 
 def should_replace_model_in_jsonl(
@@ -76,50 +55,51 @@ def should_replace_model_in_jsonl(
     return False
 
 
+def _replace_model_in_records(
+    json_objects: Iterable[dict], new_model_name: str
+) -> Iterator[dict]:
+    for json_object in json_objects:
+        # Replace the model name if it exists
+        if "body" in json_object:
+            json_object["body"]["model"] = new_model_name
+        yield json_object
+
+
 def replace_model_in_jsonl(file_content: FileTypes, new_model_name: str) -> FileTypes:
     try:
         ## if pathlike, return the original file content
         if isinstance(file_content, PathLike):
             return file_content
 
-        # Decode the bytes to a string and split into lines
-        # If file_content is a file-like object, read the bytes
+        # If file_content is a file-like object, stream it in chunks
         if hasattr(file_content, "read"):
-            file_content_bytes = file_content.read()  # type: ignore
+            jsonl_source = file_content
         elif isinstance(file_content, tuple):
-            file_content_bytes = file_content[1]
-        else:
-            file_content_bytes = file_content
-
-        # Decode the bytes to a string and split into lines
-        if isinstance(file_content_bytes, bytes):
-            file_content_str = file_content_bytes.decode("utf-8")
-        elif isinstance(file_content_bytes, str):
-            file_content_str = file_content_bytes
+            jsonl_source = file_content[1]
         else:
+            jsonl_source = file_content
 
+        if not hasattr(jsonl_source, "read") and not isinstance(
+            jsonl_source, (bytes, str)
+        ):
             return file_content
 
-        # Parse JSONL properly, handling potential multiline JSON objects
-        json_objects = parse_jsonl_with_embedded_newlines(file_content_str)
+        # Parse JSONL properly, handling potential multiline JSON objects, and
+        # re-encode record by record instead of building a list of objects
+        modified_file = InMemoryFile(
+            b"", name="modified_file.jsonl", content_type="application/jsonl"
+        )
+        records = iter_jsonl(jsonl_source)  # type: ignore
+        records_written = write_jsonl(
+            _replace_model_in_records(records, new_model_name), modified_file
+        )
 
         # If no valid JSON objects were found, return the original content
-        if len(json_objects) == 0:
+        if records_written == 0:
             return file_content
 
-        modified_lines = []
-        for json_object in json_objects:
-            # Replace the model name if it exists
-            if "body" in json_object:
-                json_object["body"]["model"] = new_model_name
-
-            # Convert the modified JSON object back to a string
-            modified_lines.append(json.dumps(json_object))
-
-        # Reassemble the modified lines and return as bytes
-        modified_file_content = "\n".join(modified_lines).encode("utf-8")
-
-        return InMemoryFile(modified_file_content, name="modified_file.jsonl", content_type="application/jsonl")  # type: ignore
+        modified_file.seek(0)
+        return modified_file  # type: ignore
 
     except (json.JSONDecodeError, UnicodeDecodeError, TypeError):
         # return the original file content if there is an error replacing the model name
@@ -0,0 +1,67 @@
+"""
+Streaming latency statistics for latency-based routing.
+
+Each deployment keeps, per model group:
+- an exponentially weighted moving average (EWMA) - used to pick deployments
+- a log-bucketed quantile sketch - mergeable across instances by summing buckets
+
+Both are updated in O(1) per request and stored as plain dicts, so they can live
+in the router cache like the rest of the routing state.
+"""
+
+import math
+from typing import Dict, Optional
+
+from litellm.constants import LOWEST_LATENCY_SKETCH_RELATIVE_ACCURACY
+
+# bucket i covers (gamma^(i-1), gamma^i] - quantiles are within the relative accuracy
+_SKETCH_GAMMA = (1 + LOWEST_LATENCY_SKETCH_RELATIVE_ACCURACY) / (
+    1 - LOWEST_LATENCY_SKETCH_RELATIVE_ACCURACY
+)
+_SKETCH_LOG_GAMMA = math.log(_SKETCH_GAMMA)
+_SKETCH_MIN_VALUE = 1e-6  # smaller values (incl. 0) share the lowest bucket
+
+
+def get_ewma_alpha(window_size: int) -> float:
+    """
+    Smoothing factor giving the EWMA the same center of mass as a mean over `window_size` values
+    """
+    return 2 / (max(window_size, 1) + 1)
+
+
+def update_ewma(current: Optional[float], value: float, alpha: float) -> float:
+    if current is None:
+        return value
+    return current + alpha * (value - current)
+
+
+def add_to_sketch(sketch: Dict[int, int], value: float) -> None:
+    bucket = math.ceil(math.log(max(value, _SKETCH_MIN_VALUE)) / _SKETCH_LOG_GAMMA)
+    sketch[bucket] = sketch.get(bucket, 0) + 1
+
+
+def merge_sketches(sketch: Dict[int, int], other: Dict[int, int]) -> Dict[int, int]:
+    """
+    Merge `other` into `sketch` - eg. to combine stats from multiple instances
+    """
+    for bucket, count in other.items():
+        bucket = int(bucket)  # keys become strings when sent through json
+        sketch[bucket] = sketch.get(bucket, 0) + count
+    return sketch
+
+
+def get_sketch_quantile(sketch: Dict[int, int], quantile: float) -> Optional[float]:
+    """
+    Returns the value at `quantile` (0-1), or None for an empty sketch
+    """
+    total = sum(sketch.values())
+    if total == 0:
+        return None
+    rank = quantile * (total - 1)
+    seen = 0
+    for bucket in sorted(sketch, key=int):
+        seen += sketch[bucket]
+        if seen > rank:
+            # midpoint of the bucket, so the relative error is at most the accuracy
+            return 2 * _SKETCH_GAMMA ** int(bucket) / (_SKETCH_GAMMA + 1)
+    return None
@@ -2,11 +2,14 @@
 Class to handle llm wildcard routing and regex pattern matching
 """
 
+import bisect
 import copy
 import re
-from re import Match
+from collections import OrderedDict
+from re import Match, Pattern
 from typing import Dict, List, Optional, Tuple
 
+from litellm.constants import PATTERN_MATCH_ROUTER_CACHE_SIZE
 from litellm.litellm_core_utils.get_llm_provider_logic import get_llm_provider
 from litellm._logging import verbose_router_logger
 
@@ -59,7 +62,35 @@ class PatternMatchRouter:
     """
 
     def __init__(self):
-        self.patterns: Dict[str, List] = {}
+        self._patterns: Dict[str, List] = {}
+
+        # patterns kept sorted by specificity (most specific first), as
+        # (sort_key, regex) pairs, with their compiled regexes
+        self._sorted_keys: List[Tuple[int, int, int]] = []
+        self._sorted_regexes: List[str] = []
+        self._compiled: Dict[str, Pattern] = {}
+        self._insertion_count = 0
+
+        # literal-prefix index (prefix -> positions in the sorted list), so a
+        # request is only matched against patterns whose fixed prefix it
+        # starts with. Built lazily after changes.
+        self._prefix_index: Dict[str, List[int]] = {}
+        self._prefix_lengths: List[int] = []
+        self._prefix_index_is_stale = True
+
+        # LRU of request -> (regex, match) | None, cleared on every change
+        self._resolved_cache: "OrderedDict[str, Optional[Tuple[str, Match]]]" = (
+            OrderedDict()
+        )
+
+    @property
+    def patterns(self) -> Dict[str, List]:
+        return self._patterns
+
+    @patterns.setter
+    def patterns(self, value: Dict[str, List]):
+        self._patterns = value
+        self._rebuild_index()
 
     def add_pattern(self, pattern: str, llm_deployment: Dict):
         """
@@ -71,9 +102,144 @@ class PatternMatchRouter:
         """
         # Convert the pattern to a regex
         regex = self._pattern_to_regex(pattern)
-        if regex not in self.patterns:
-            self.patterns[regex] = []
-        self.patterns[regex].append(llm_deployment)
+        if regex not in self._patterns:
+            self._patterns[regex] = []
+            self._insert_sorted(regex)
+        self._patterns[regex].append(llm_deployment)
+        self._invalidate()
+
+    def remove_deployment(self, model_id: str) -> None:
+        """
+        Remove all deployments with the given model_info.id, dropping patterns left without deployments
+        """
+        changed = False
+        for regex in list(self._patterns.keys()):
+            deployments = self._patterns[regex]
+            remaining = [
+                d
+                for d in deployments
+                if (d.get("model_info") or {}).get("id") != model_id
+            ]
+            if len(remaining) == len(deployments):
+                continue
+            changed = True
+            if remaining:
+                self._patterns[regex] = remaining
+            else:
+                del self._patterns[regex]
+        if changed:
+            self._rebuild_index()
+
+    def clear(self) -> None:
+        """
+        Remove all patterns
+        """
+        self._patterns = {}
+        self._rebuild_index()
+
+    def _insert_sorted(self, regex: str) -> None:
+        length, complexity = PatternUtils.calculate_pattern_specificity(regex)
+        # ties keep insertion order, same as a stable sort by specificity
+        sort_key = (-length, -complexity, self._insertion_count)
+        self._insertion_count += 1
+        idx = bisect.bisect(self._sorted_keys, sort_key)
+        self._sorted_keys.insert(idx, sort_key)
+        self._sorted_regexes.insert(idx, regex)
+        self._compiled[regex] = re.compile(regex)
+
+    def _rebuild_index(self) -> None:
+        self._sorted_keys = []
+        self._sorted_regexes = []
+        self._compiled = {}
+        self._insertion_count = 0
+        if isinstance(self._patterns, dict):
+            for regex in self._patterns:
+                self._insert_sorted(regex)
+        self._invalidate()
+
+    def _invalidate(self) -> None:
+        self._prefix_index_is_stale = True
+        self._resolved_cache.clear()
+
+    @staticmethod
+    def _get_literal_prefix(regex: str) -> str:
+        """
+        Return the fixed text every match of regex must start with
+
+        e.g. "openai/gpt\\-(.*)" -> "openai/gpt-"
+        """
+        if "|" in regex:  # top-level alternation has no common prefix
+            return ""
+        prefix = []
+        i = 0
+        while i < len(regex):
+            char = regex[i]
+            if char == "\\":
+                # re.escape only escapes non-alphanumerics - a backslash before a
+                # letter or digit is a character class / backreference
+                if i + 1 >= len(regex) or regex[i + 1].isalnum():
+                    break
+                prefix.append(regex[i + 1])
+                i += 2
+                continue
+            if char in ".^$*+?{}[]|()":
+                break
+            prefix.append(char)
+            i += 1
+        if i < len(regex) and regex[i] in "*?{" and prefix:
+            prefix.pop()  # the last char is optional / repeated
+        return "".join(prefix)
+
+    def _build_prefix_index(self) -> None:
+        prefix_index: Dict[str, List[int]] = {}
+        for idx, regex in enumerate(self._sorted_regexes):
+            prefix_index.setdefault(self._get_literal_prefix(regex), []).append(idx)
+        self._prefix_index = prefix_index
+        self._prefix_lengths = sorted({len(prefix) for prefix in prefix_index})
+        self._prefix_index_is_stale = False
+
+    def _resolve(self, request: str) -> Optional[Tuple[str, Match]]:
+        """
+        Find the most specific pattern matching the request.
+
+        Only patterns whose literal prefix the request starts with are tried,
+        in specificity order.
+
+        Returns:
+            (regex, match) for the matching pattern, or None
+        """
+        if self._prefix_index_is_stale:
+            self._build_prefix_index()
+
+        candidates: List[int] = []
+        for length in self._prefix_lengths:
+            if length > len(request):
+                break
+            indices = self._prefix_index.get(request[:length])
+            if indices:
+                candidates.extend(indices)
+        candidates.sort()
+
+        for idx in candidates:
+            regex = self._sorted_regexes[idx]
+            pattern_match = self._compiled[regex].match(request)
+            if pattern_match is not None:
+                return regex, pattern_match
+        return None
+
+    def _resolve_cached(self, request: str) -> Optional[Tuple[str, Match]]:
+        try:
+            resolved = self._resolved_cache[request]
+            self._resolved_cache.move_to_end(request)
+            return resolved
+        except KeyError:
+            pass
+
+        resolved = self._resolve(request)
+        self._resolved_cache[request] = resolved
+        while len(self._resolved_cache) > PATTERN_MATCH_ROUTER_CACHE_SIZE:
+            self._resolved_cache.popitem(last=False)
+        return resolved
 
     def _pattern_to_regex(self, pattern: str) -> str:
         """
@@ -121,7 +287,8 @@ class PatternMatchRouter:
         """
         Route a requested model to the corresponding llm deployments based on the regex pattern
 
-        loop through all the patterns and find the matching pattern
+        patterns are pre-sorted by specificity and looked up through a literal-prefix index;
+        resolved request names are cached until the patterns change.
         if a pattern is found, return the corresponding llm deployments
         if no pattern is found, return None
 
@@ -135,22 +302,30 @@ class PatternMatchRouter:
             if request is None:
                 return None
 
-            sorted_patterns = PatternUtils.sorted_patterns(self.patterns)
-            regex_filtered_model_names = (
-                [self._pattern_to_regex(m) for m in filtered_model_names]
-                if filtered_model_names is not None
-                else []
-            )
-            for pattern, llm_deployments in sorted_patterns:
-                if (
-                    filtered_model_names is not None
-                    and pattern not in regex_filtered_model_names
-                ):
+            if not isinstance(self._patterns, dict):
+                raise ValueError("PatternMatchRouter.patterns must be a dict")
+
+            if filtered_model_names is None:
+                resolved = self._resolve_cached(request)
+                if resolved is not None:
+                    regex, pattern_match = resolved
+                    return self._return_pattern_matched_deployments(
+                        matched_pattern=pattern_match,
+                        deployments=self._patterns[regex],
+                    )
+                return None
+
+            regex_filtered_model_names = {
+                self._pattern_to_regex(m) for m in filtered_model_names
+            }
+            for regex in self._sorted_regexes:
+                if regex not in regex_filtered_model_names:
                     continue
-                pattern_match = re.match(pattern, request)
+                pattern_match = self._compiled[regex].match(request)
                 if pattern_match:
                     return self._return_pattern_matched_deployments(
-                        matched_pattern=pattern_match, deployments=llm_deployments
+                        matched_pattern=pattern_match,
+                        deployments=self._patterns[regex],
                     )
         except Exception as e:
             verbose_router_logger.debug(f"Error in PatternMatchRouter.route: {str(e)}")
@@ -1,13 +1,21 @@
+import asyncio
 import enum
 import heapq
-from typing import Optional
+import itertools
+import time
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
 
 from pydantic import BaseModel
 
 from litellm import print_verbose
-from litellm.caching.caching import DualCache, RedisCache
+from litellm._logging import verbose_router_logger
+from litellm.caching.caching import RedisCache
 from litellm.constants import DEFAULT_IN_MEMORY_TTL, DEFAULT_POLLING_INTERVAL
 
+# sorted-set score = priority * _PRIORITY_SCORE_MULTIPLIER + enqueue time (ms), so
+# lower priority values go first and equal priorities are FIFO
+_PRIORITY_SCORE_MULTIPLIER = 10**13
+
 
 class SchedulerCacheKeys(enum.Enum):
     queue = "scheduler:queue"
@@ -22,8 +30,74 @@ class FlowItem(BaseModel):
     model_name: str
 
 
+class _ModelQueue:
+    """
+    In-process priority queue for one model group.
+
+    Entries are (priority, sequence, request_id). Removed entries are dropped
+    lazily when they reach the top of the heap.
+    """
+
+    def __init__(self):
+        self.heap: List[Tuple[int, int, str]] = []
+        self.entries: Dict[str, Tuple[int, int]] = {}
+        self.waiters: Dict[str, asyncio.Future] = {}
+
+    def push(self, priority: int, sequence: int, request_id: str) -> None:
+        heapq.heappush(self.heap, (priority, sequence, request_id))
+        self.entries[request_id] = (priority, sequence)
+
+    def remove(self, request_id: str) -> None:
+        self.entries.pop(request_id, None)
+
+    def head(self) -> Optional[str]:
+        while self.heap and self.heap[0][2] not in self.entries:
+            heapq.heappop(self.heap)
+        return self.heap[0][2] if self.heap else None
+
+    def items(self) -> List[Tuple[int, str]]:
+        return [
+            (priority, request_id)
+            for priority, _, request_id in sorted(self.heap)
+            if request_id in self.entries
+        ]
+
+    def wake_next(self) -> None:
+        """Wake the highest priority request that is waiting"""
+        if not self.waiters:
+            return
+        request_id = self.head()
+        if request_id not in self.waiters:
+            # top of the queue isn't waiting here (eg. added via add_request)
+            request_id = min(
+                self.waiters,
+                key=lambda waiter_id: self.entries.get(waiter_id, (256, 0)),
+            )
+        waiter = self.waiters[request_id]
+        if not waiter.done():
+            waiter.set_result(True)
+
+
+class SchedulerWaitTimeStats(BaseModel):
+    count: int = 0
+    total_wait_seconds: float = 0.0
+    max_wait_seconds: float = 0.0
+    timeouts: int = 0
+
+
 class Scheduler:
-    cache: DualCache
+    """
+    Priority scheduler for requests to a model group.
+
+    Waiting requests don't poll: each awaits a future, woken when the request
+    ahead of it leaves the queue or when `notify_capacity` is called. Only the
+    top of the queue rechecks deployment health on a timer.
+
+    With a redis_cache, queues are shared across instances through a Redis sorted
+    set per model group (O(log n) add / remove / head lookups). Only the oldest
+    local waiter of each model group checks the shared queue, every
+    polling_interval. If Redis is unavailable, the in-process queue is used.
+    """
 
     def __init__(
         self,
@@ -31,29 +105,109 @@ class Scheduler:
         redis_cache: Optional[RedisCache] = None,
     ):
         """
-        polling_interval: float or null - frequency of polling queue. Default is 3ms.
+        polling_interval: float or null - how often the top of the queue rechecks deployment health / the shared queue. Default is 30ms.
         """
-        self.queue: list = []
-        default_in_memory_ttl: Optional[float] = None
-        if redis_cache is not None:
-            # if redis-cache available frequently poll that instead of using in-memory.
-            default_in_memory_ttl = SchedulerCacheKeys.default_in_memory_ttl.value
-        self.cache = DualCache(
-            redis_cache=redis_cache, default_in_memory_ttl=default_in_memory_ttl
-        )
+        self.redis_cache = redis_cache
         self.polling_interval = (
             polling_interval or DEFAULT_POLLING_INTERVAL
-        )  # default to 3ms
+        )  # default to 30ms
+
+        self._queues: Dict[str, _ModelQueue] = {}
+        self._sequence = itertools.count()
+        self._enqueued_at: Dict[str, float] = {}
+        # shared-queue entries older than this are left over from a crashed instance
+        self._redis_stale_entry_seconds: float = 0.0
+
+        # priority -> wait time stats
+        self.wait_time_stats: Dict[int, SchedulerWaitTimeStats] = {}
+
+    def _get_model_queue(self, model_name: str) -> _ModelQueue:
+        model_queue = self._queues.get(model_name)
+        if model_queue is None:
+            model_queue = self._queues[model_name] = _ModelQueue()
+        return model_queue
+
+    @staticmethod
+    def _get_redis_queue_key(model_name: str) -> str:
+        return "{}:{}".format(SchedulerCacheKeys.queue.value, model_name)
 
     async def add_request(self, request: FlowItem):
         # We use the priority directly, as lower values indicate higher priority
-        # get the queue
-        queue = await self.get_queue(model_name=request.model_name)
-        # update the queue
-        heapq.heappush(queue, (request.priority, request.request_id))
+        enqueued_at = time.time()
+        self._enqueued_at[request.request_id] = enqueued_at
+        self._get_model_queue(request.model_name).push(
+            request.priority, next(self._sequence), request.request_id
+        )
 
-        # save the queue
-        await self.save_queue(queue=queue, model_name=request.model_name)
+        if self.redis_cache is not None:
+            score = request.priority * _PRIORITY_SCORE_MULTIPLIER + int(
+                enqueued_at * 1000
+            )
+            try:
+                await self.redis_cache.async_zadd(
+                    key=self._get_redis_queue_key(request.model_name),
+                    mapping={request.request_id: score},
+                    ttl=int(self._redis_stale_entry_seconds) or None,
+                )
+            except Exception as e:
+                # the request is still in the in-process queue
+                verbose_router_logger.debug(
+                    f"Scheduler: failed to add request to the shared queue: {str(e)}"
+                )
+
+    async def _get_head(self, model_name: str) -> Optional[str]:
+        """
+        Return the request id at the top of the queue for that model group
+        """
+        if self.redis_cache is None:
+            return self._get_model_queue(model_name).head()
+        try:
+            return await self._get_redis_head(self.redis_cache, model_name)
+        except Exception as e:
+            verbose_router_logger.debug(
+                f"Scheduler: shared queue unavailable, using in-process queue: {str(e)}"
+            )
+            return self._get_model_queue(model_name).head()
+
+    async def _get_redis_head(
+        self, redis_cache: RedisCache, model_name: str
+    ) -> Optional[str]:
+        key = self._get_redis_queue_key(model_name)
+        while True:
+            head = await redis_cache.async_zrange(
+                key=key, start=0, end=0, withscores=True
+            )
+            if not head:
+                # e.g. requests queued while redis was unavailable
+                return self._get_model_queue(model_name).head()
+            request_id, score = head[0]
+            enqueued_at = (int(score) % _PRIORITY_SCORE_MULTIPLIER) / 1000
+            if (
+                self._redis_stale_entry_seconds > 0
+                and request_id not in self._enqueued_at
+                and time.time() - enqueued_at > self._redis_stale_entry_seconds
+            ):
+                # owner gave up long ago without removing it - drop it
+                await redis_cache.async_zrem(key, request_id)
+                continue
+            return request_id
+
+    async def _remove_request(self, id: str, model_name: str) -> None:
+        model_queue = self._get_model_queue(model_name)
+        model_queue.remove(id)
+        self._enqueued_at.pop(id, None)
+        if self.redis_cache is not None:
+            try:
+                await self.redis_cache.async_zrem(
+                    self._get_redis_queue_key(model_name), id
+                )
+            except Exception as e:
+                # left in the shared queue - dropped once older than the timeout
+                verbose_router_logger.debug(
+                    f"Scheduler: failed to remove request from the shared queue: {str(e)}"
+                )
+        # next in line rechecks - it may be at the top now, or capacity may be free
+        model_queue.wake_next()
 
     async def poll(self, id: str, model_name: str, health_deployments: list) -> bool:
         """
@@ -66,71 +220,179 @@ class Scheduler:
         - False:
             * If no healthy deployments available
             * AND request not at the top of queue
+
+        The request is removed from the queue when True is returned.
         """
-        queue = await self.get_queue(model_name=model_name)
-        if not queue:
+        model_queue = self._get_model_queue(model_name)
+        if id not in model_queue.entries:
             raise Exception(
-                "Incorrectly setup. Queue is invalid. Queue={}".format(queue)
+                "Incorrectly setup. Request id={} not in queue for model={}".format(
+                    id, model_name
+                )
             )
 
-        # ------------
-        # Setup values
-        # ------------
-
         print_verbose(f"len(health_deployments): {len(health_deployments)}")
         if len(health_deployments) == 0:
-            print_verbose(f"queue: {queue}, seeking id={id}")
-            # Check if the id is at the top of the heap
-            if queue[0][1] == id:
-                # Remove the item from the queue
-                heapq.heappop(queue)
-                print_verbose(f"Popped id: {id}")
-                return True
-            else:
+            # Check if the id is at the top of the queue
+            if await self._get_head(model_name) != id:
                 return False
+            print_verbose(f"Popped id: {id}")
 
+        await self._remove_request(id=id, model_name=model_name)
         return True
 
     async def peek(self, id: str, model_name: str, health_deployments: list) -> bool:
-        """Return if the id is at the top of the queue. Don't pop the value from heap."""
-        queue = await self.get_queue(model_name=model_name)
-        if not queue:
+        """Return if the id is at the top of the queue. Don't pop the value from the queue."""
+        head = await self._get_head(model_name)
+        if head is None:
             raise Exception(
-                "Incorrectly setup. Queue is invalid. Queue={}".format(queue)
+                "Incorrectly setup. Queue is empty for model={}".format(model_name)
             )
+        return head == id
+
+    async def wait_for_turn(
+        self,
+        request: FlowItem,
+        get_healthy_deployments: Callable[[], Awaitable[list]],
+        timeout: float,
+    ) -> bool:
+        """
+        Queue the request and wait until it can be processed.
 
-        # ------------
-        # Setup values
-        # ------------
+        Returns:
+        - True: request can be processed (healthy deployments available, or it reached the top of the queue)
+        - False: timed out waiting
+        """
+        self._redis_stale_entry_seconds = max(self._redis_stale_entry_seconds, timeout)
+        model_queue = self._get_model_queue(request.model_name)
+        start_time = time.monotonic()
+        end_time = start_time + timeout
+        await self.add_request(request=request)
+        try:
+            while True:
+                healthy_deployments = await get_healthy_deployments()
+                if await self.poll(
+                    id=request.request_id,
+                    model_name=request.model_name,
+                    health_deployments=healthy_deployments,
+                ):
+                    self._record_wait_time(
+                        priority=request.priority,
+                        wait_seconds=time.monotonic() - start_time,
+                    )
+                    return True
 
-        # Check if the id is at the top of the heap
-        if queue[0][1] == id:
-            return True
+                remaining = end_time - time.monotonic()
+                if remaining <= 0:
+                    self._record_wait_time(
+                        priority=request.priority,
+                        wait_seconds=time.monotonic() - start_time,
+                        timed_out=True,
+                    )
+                    return False
 
-        return False
+                # only the top of the (local) queue rechecks on a timer - the
+                # rest wait until woken
+                wait_seconds = remaining
+                if model_queue.head() == request.request_id:
+                    wait_seconds = min(remaining, self.polling_interval)
+                waiter = asyncio.get_running_loop().create_future()
+                model_queue.waiters[request.request_id] = waiter
+                try:
+                    await asyncio.wait_for(waiter, timeout=wait_seconds)
+                except asyncio.TimeoutError:
+                    pass
+                finally:
+                    model_queue.waiters.pop(request.request_id, None)
+        finally:
+            if request.request_id in model_queue.entries:
+                # timed out / cancelled - leave the queue
+                await self._remove_request(
+                    id=request.request_id, model_name=request.model_name
+                )
+
+    def notify_capacity(self, model_name: str) -> None:
+        """
+        Wake the highest priority waiting request for the model group, so it rechecks deployment health.
+
+        Call when a request to the model group finishes. Each request that leaves the queue wakes the next one, so waiters go in priority order instead of all at once.
+        """
+        model_queue = self._queues.get(model_name)
+        if model_queue is not None:
+            model_queue.wake_next()
+
+    def _record_wait_time(
+        self, priority: int, wait_seconds: float, timed_out: bool = False
+    ) -> None:
+        stats = self.wait_time_stats.get(priority)
+        if stats is None:
+            stats = self.wait_time_stats[priority] = SchedulerWaitTimeStats()
+        stats.count += 1
+        stats.total_wait_seconds += wait_seconds
+        stats.max_wait_seconds = max(stats.max_wait_seconds, wait_seconds)
+        if timed_out:
+            stats.timeouts += 1
+
+    def get_wait_time_metrics(self) -> Dict[int, dict]:
+        """
+        Per-priority queue wait times
+
+        Returns:
+            {priority: {"count", "avg_wait_seconds", "max_wait_seconds", "timeouts"}}
+        """
+        return {
+            priority: {
+                "count": stats.count,
+                "avg_wait_seconds": (
+                    stats.total_wait_seconds / stats.count if stats.count else 0.0
+                ),
+                "max_wait_seconds": stats.max_wait_seconds,
+                "timeouts": stats.timeouts,
+            }
+            for priority, stats in sorted(self.wait_time_stats.items())
+        }
 
     def get_queue_status(self):
         """Get the status of items in the queue"""
-        return self.queue
+        return {
+            model_name: model_queue.items()
+            for model_name, model_queue in self._queues.items()
+            if model_queue.entries
+        }
 
     async def get_queue(self, model_name: str) -> list:
         """
-        Return a queue for that specific model group
+        Return the queued (priority, request_id) pairs for that specific model group, highest priority first
         """
-        if self.cache is not None:
-            _cache_key = "{}:{}".format(SchedulerCacheKeys.queue.value, model_name)
-            response = await self.cache.async_get_cache(key=_cache_key)
-            if response is None or not isinstance(response, list):
-                return []
-            elif isinstance(response, list):
-                return response
-        return self.queue
+        if self.redis_cache is not None:
+            try:
+                members = await self.redis_cache.async_zrange(
+                    key=self._get_redis_queue_key(model_name),
+                    start=0,
+                    end=-1,
+                    withscores=True,
+                )
+                return [
+                    (int(score) // _PRIORITY_SCORE_MULTIPLIER, request_id)
+                    for request_id, score in members
+                ]
+            except Exception as e:
+                verbose_router_logger.debug(
+                    f"Scheduler: shared queue unavailable, using in-process queue: {str(e)}"
+                )
+        return self._get_model_queue(model_name).items()
 
     async def save_queue(self, queue: list, model_name: str) -> None:
         """
-        Save the updated queue of the model group
+        Replace the queue of the model group with (priority, request_id) pairs
         """
-        if self.cache is not None:
-            _cache_key = "{}:{}".format(SchedulerCacheKeys.queue.value, model_name)
-            await self.cache.async_set_cache(key=_cache_key, value=queue)
+        model_queue = self._get_model_queue(model_name)
+        for request_id in list(model_queue.entries):
+            await self._remove_request(id=request_id, model_name=model_name)
+        for priority, request_id in queue:
+            await self.add_request(
+                FlowItem(
+                    priority=priority, request_id=request_id, model_name=model_name
+                )
+            )
         return None
@@ -52,6 +52,21 @@ class RedisPipelineSetOperation(TypedDict):
     ttl: Optional[int]
 
 
+class DualCacheMetrics(TypedDict):
+    """
+    TypeDict for DualCache read-path counters
+    """
+
+    get_requests: int
+    in_memory_hits: int
+    negative_cache_hits: int
+    coalesced_redis_gets: int
+    redis_get_calls: int
+    invalidations_received: int
+    in_memory_hit_ratio: float
+    redis_ops_per_request: float
+
+
 DynamicCacheControl = TypedDict(
     "DynamicCacheControl",
     {
@@ -1,6 +1,6 @@
 import ssl
 from enum import Enum
-from typing import Union
+from typing import Optional, TypedDict, Union
 
 
 class httpxSpecialProvider(str, Enum):
@@ -29,3 +29,29 @@ class httpxSpecialProvider(str, Enum):
 
 
 VerifyTypes = Union[str, bool, ssl.SSLContext]
+
+
+class HTTPClientPoolSettings(TypedDict, total=False):
+    """
+    Connection pool settings for the shared httpx clients of a provider.
+
+    Set per provider on `litellm.http_client_pool_settings`, e.g.
+    `{"default": {...}, "openai": {"max_connections": 500, "http2": True}}`
+    """
+
+    max_connections: int  # total connections per client, 0 = unlimited (aiohttp)
+    max_connections_per_host: int  # aiohttp transport only
+    max_keepalive_connections: int  # httpx transport only
+    keepalive_timeout: float  # seconds an idle connection is kept open
+    http2: bool  # multiplex requests over HTTP/2 (httpx transport, needs `h2`)
+
+
+class HTTPClientPoolMetrics(TypedDict):
+    provider: str
+    transport: str  # "aiohttp" | "httpx"
+    http2: bool
+    draining: bool
+    in_use_connections: int
+    idle_connections: int
+    max_connections: Optional[int]
+    utilization: Optional[float]  # in_use / max_connections
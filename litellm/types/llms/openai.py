@@ -100,7 +100,19 @@ EmbeddingInput = Union[str, List[str]]
 
 class HttpxBinaryResponseContent(_HttpxBinaryResponseContent):
     _hidden_params: dict = {}
-    pass
+
+    @classmethod
+    def from_openai_file_content(cls, response: Any) -> "HttpxBinaryResponseContent":
+        """
+        Wrap the result of the openai sdk's `files.content()`.
+
+        With `X-Stainless-Raw-Response: stream` in extra_headers the sdk returns the
+        response unread, so the file can be streamed with `aiter_bytes()`.
+        """
+        http_response = getattr(response, "http_response", None)
+        if http_response is None:
+            http_response = response.response
+        return cls(response=http_response)
 
 
 class NotGiven:
@@ -32,6 +32,10 @@ class RAGIngestEmbeddingOptions(TypedDict, total=False):
     """Embedding configuration for RAG ingest pipeline."""
 
     model: str  # e.g., "text-embedding-3-small"
+    batch_size: int  # Chunks per embedding request (default: 100)
+    max_concurrency: int  # Embedding requests in flight (default: 4)
+    num_retries: int  # Retries per embedding request (default: 2)
+    cache: bool  # Reuse embeddings of unchanged chunks (default: True)
 
 
 class OpenAIVectorStoreOptions(TypedDict, total=False):
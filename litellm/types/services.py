@@ -42,6 +42,10 @@ class ServiceTypes(str, enum.Enum):
     # spend update queue - current spend of key, user, team
     IN_MEMORY_SPEND_UPDATE_QUEUE = "in_memory_spend_update_queue"
     REDIS_SPEND_UPDATE_QUEUE = "redis_spend_update_queue"
+    # spend log spool - spend logs buffered on disk before they're loaded into the DB
+    SPEND_LOG_SPOOL = "spend_log_spool"
+    SPEND_LOG_SPOOL_BYTES = "spend_log_spool_bytes"
+    SPEND_LOG_SPOOL_DROPPED = "spend_log_spool_dropped"
 
 
 class ServiceConfig(TypedDict):
@@ -101,6 +105,9 @@ DEFAULT_SERVICE_CONFIGS = {
         "metrics": [ServiceMetrics.GAUGE]
     },
     ServiceTypes.REDIS_SPEND_UPDATE_QUEUE.value: {"metrics": [ServiceMetrics.GAUGE]},
+    ServiceTypes.SPEND_LOG_SPOOL.value: {"metrics": [ServiceMetrics.GAUGE]},
+    ServiceTypes.SPEND_LOG_SPOOL_BYTES.value: {"metrics": [ServiceMetrics.GAUGE]},
+    ServiceTypes.SPEND_LOG_SPOOL_DROPPED.value: {"metrics": [ServiceMetrics.GAUGE]},
 }
 
 
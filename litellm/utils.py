@@ -2663,6 +2663,8 @@ def register_model(model_cost: Union[str, dict]):  # noqa: PLR0915
     }
     """
 
+    from litellm.litellm_core_utils.get_model_cost_map import model_cost_lock
+
     loaded_model_cost = {}
     if isinstance(model_cost, dict):
         # Convert stringified numbers to appropriate numeric types
@@ -2676,78 +2678,79 @@ def register_model(model_cost: Union[str, dict]):  # noqa: PLR0915
         LlmProviders.GITHUB_COPILOT.value,
     }
 
-    for key, value in loaded_model_cost.items():
-        ## get model info ##
-        provider = value.get("litellm_provider", "")
-        if provider in _skip_get_model_info_providers or any(
-            key.startswith(f"{p}/") for p in _skip_get_model_info_providers
-        ):
-            existing_model = litellm.model_cost.get(key, {})
-            model_cost_key = key
-        else:
-            try:
-                existing_model = cast(dict, get_model_info(model=key))
-                model_cost_key = existing_model["key"]
-            except Exception:
-                existing_model = {}
+    with model_cost_lock:
+        for key, value in loaded_model_cost.items():
+            ## get model info ##
+            provider = value.get("litellm_provider", "")
+            if provider in _skip_get_model_info_providers or any(
+                key.startswith(f"{p}/") for p in _skip_get_model_info_providers
+            ):
+                existing_model = litellm.model_cost.get(key, {})
                 model_cost_key = key
-        ## override / add new keys to the existing model cost dictionary
-        updated_dictionary = _update_dictionary(existing_model, value)
-        litellm.model_cost.setdefault(model_cost_key, {}).update(updated_dictionary)
+            else:
+                try:
+                    existing_model = cast(dict, get_model_info(model=key))
+                    model_cost_key = existing_model["key"]
+                except Exception:
+                    existing_model = {}
+                    model_cost_key = key
+            ## override / add new keys to the existing model cost dictionary
+            updated_dictionary = _update_dictionary(existing_model, value)
+            litellm.model_cost.setdefault(model_cost_key, {}).update(updated_dictionary)
         
-        # Invalidate case-insensitive lookup map since model_cost was modified
-        _invalidate_model_cost_lowercase_map()
+            # Invalidate case-insensitive lookup map since model_cost was modified
+            _invalidate_model_cost_lowercase_map()
         
-        verbose_logger.debug(
-            f"added/updated model={model_cost_key} in litellm.model_cost: {model_cost_key}"
-        )
-        # add new model names to provider lists
-        if value.get("litellm_provider") == "openai":
-            if key not in litellm.open_ai_chat_completion_models:
-                litellm.open_ai_chat_completion_models.add(key)
-        elif value.get("litellm_provider") == "text-completion-openai":
-            if key not in litellm.open_ai_text_completion_models:
-                litellm.open_ai_text_completion_models.add(key)
-        elif value.get("litellm_provider") == "cohere":
-            if key not in litellm.cohere_models:
-                litellm.cohere_models.add(key)
-        elif value.get("litellm_provider") == "anthropic":
-            if key not in litellm.anthropic_models:
-                litellm.anthropic_models.add(key)
-        elif value.get("litellm_provider") == "openrouter":
-            split_string = key.split("/", 1)
-            if key not in litellm.openrouter_models:
-                litellm.openrouter_models.add(split_string[1])
-        elif value.get("litellm_provider") == "vercel_ai_gateway":
-            if key not in litellm.vercel_ai_gateway_models:
-                litellm.vercel_ai_gateway_models.add(key)
-        elif value.get("litellm_provider") == "vertex_ai-text-models":
-            if key not in litellm.vertex_text_models:
-                litellm.vertex_text_models.add(key)
-        elif value.get("litellm_provider") == "vertex_ai-code-text-models":
-            if key not in litellm.vertex_code_text_models:
-                litellm.vertex_code_text_models.add(key)
-        elif value.get("litellm_provider") == "vertex_ai-chat-models":
-            if key not in litellm.vertex_chat_models:
-                litellm.vertex_chat_models.add(key)
-        elif value.get("litellm_provider") == "vertex_ai-code-chat-models":
-            if key not in litellm.vertex_code_chat_models:
-                litellm.vertex_code_chat_models.add(key)
-        elif value.get("litellm_provider") == "ai21":
-            if key not in litellm.ai21_models:
-                litellm.ai21_models.add(key)
-        elif value.get("litellm_provider") == "nlp_cloud":
-            if key not in litellm.nlp_cloud_models:
-                litellm.nlp_cloud_models.add(key)
-        elif value.get("litellm_provider") == "aleph_alpha":
-            if key not in litellm.aleph_alpha_models:
-                litellm.aleph_alpha_models.add(key)
-        elif value.get("litellm_provider") == "bedrock":
-            if key not in litellm.bedrock_models:
-                litellm.bedrock_models.add(key)
-        elif value.get("litellm_provider") == "novita":
-            if key not in litellm.novita_models:
-                litellm.novita_models.add(key)
+            verbose_logger.debug(
+                f"added/updated model={model_cost_key} in litellm.model_cost: {model_cost_key}"
+            )
+            # add new model names to provider lists
+            if value.get("litellm_provider") == "openai":
+                if key not in litellm.open_ai_chat_completion_models:
+                    litellm.open_ai_chat_completion_models.add(key)
+            elif value.get("litellm_provider") == "text-completion-openai":
+                if key not in litellm.open_ai_text_completion_models:
+                    litellm.open_ai_text_completion_models.add(key)
+            elif value.get("litellm_provider") == "cohere":
+                if key not in litellm.cohere_models:
+                    litellm.cohere_models.add(key)
+            elif value.get("litellm_provider") == "anthropic":
+                if key not in litellm.anthropic_models:
+                    litellm.anthropic_models.add(key)
+            elif value.get("litellm_provider") == "openrouter":
+                split_string = key.split("/", 1)
+                if key not in litellm.openrouter_models:
+                    litellm.openrouter_models.add(split_string[1])
+            elif value.get("litellm_provider") == "vercel_ai_gateway":
+                if key not in litellm.vercel_ai_gateway_models:
+                    litellm.vercel_ai_gateway_models.add(key)
+            elif value.get("litellm_provider") == "vertex_ai-text-models":
+                if key not in litellm.vertex_text_models:
+                    litellm.vertex_text_models.add(key)
+            elif value.get("litellm_provider") == "vertex_ai-code-text-models":
+                if key not in litellm.vertex_code_text_models:
+                    litellm.vertex_code_text_models.add(key)
+            elif value.get("litellm_provider") == "vertex_ai-chat-models":
+                if key not in litellm.vertex_chat_models:
+                    litellm.vertex_chat_models.add(key)
+            elif value.get("litellm_provider") == "vertex_ai-code-chat-models":
+                if key not in litellm.vertex_code_chat_models:
+                    litellm.vertex_code_chat_models.add(key)
+            elif value.get("litellm_provider") == "ai21":
+                if key not in litellm.ai21_models:
+                    litellm.ai21_models.add(key)
+            elif value.get("litellm_provider") == "nlp_cloud":
+                if key not in litellm.nlp_cloud_models:
+                    litellm.nlp_cloud_models.add(key)
+            elif value.get("litellm_provider") == "aleph_alpha":
+                if key not in litellm.aleph_alpha_models:
+                    litellm.aleph_alpha_models.add(key)
+            elif value.get("litellm_provider") == "bedrock":
+                if key not in litellm.bedrock_models:
+                    litellm.bedrock_models.add(key)
+            elif value.get("litellm_provider") == "novita":
+                if key not in litellm.novita_models:
+                    litellm.novita_models.add(key)
     return model_cost
 
 
@@ -6,6 +6,7 @@ Integrates Orizon authentication, proxy, and portal into LiteLLM's FastAPI appli
 
 import logging
 import os
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.staticfiles import StaticFiles
 from fastapi.middleware.cors import CORSMiddleware
@@ -28,6 +29,7 @@ def setup_orizon(app: FastAPI) -> None:
     3. Registers auth API routes
     4. Registers portal routes
     5. Mounts static files
+    6. Hooks shared Redis/HTTP pools into the app lifespan
 
     Args:
         app: LiteLLM's FastAPI application instance
@@ -81,9 +83,59 @@ def setup_orizon(app: FastAPI) -> None:
     logger.info("  ↳ Mounting static files...")
     portal_routes.setup_static_files(app)
 
+    # 5. Open shared connection pools on startup, close them on shutdown
+    logger.info("  ↳ Registering connection pool lifecycle...")
+    _wrap_lifespan(app)
+
     logger.info("✅ Orizon setup complete!")
 
 
+def _wrap_lifespan(app: FastAPI) -> None:
+    """Run Orizon startup/shutdown around the app's existing lifespan.
+
+    LiteLLM's app uses a lifespan context, which makes Starlette ignore
+    on_event handlers, so we wrap the router's lifespan context instead.
+
+    Args:
+        app: FastAPI application instance
+    """
+    inner_lifespan = app.router.lifespan_context
+
+    @asynccontextmanager
+    async def orizon_lifespan(app_instance):
+        await startup_orizon()
+        try:
+            async with inner_lifespan(app_instance) as state:
+                yield state
+        finally:
+            await shutdown_orizon()
+
+    app.router.lifespan_context = orizon_lifespan
+
+
+async def startup_orizon() -> None:
+    """Open shared Orizon connection pools."""
+    from orizon.redis_client import init_redis
+
+    await init_redis()
+
+
+async def shutdown_orizon() -> None:
+    """Flush buffered metrics and close shared Orizon connection pools."""
+    from orizon.redis_client import close_redis
+    from orizon.auth.ratelimit import stop_rate_limit_metrics_flush
+    from orizon.auth.utils import close_admin_client
+    from orizon.proxy.client import close_http_client
+
+    await stop_rate_limit_metrics_flush()
+
+    for close in (close_redis, close_admin_client, close_http_client):
+        try:
+            await close()
+        except Exception as e:
+            logger.error(f"Error during Orizon shutdown ({close.__name__}): {e}")
+
+
 def create_app() -> FastAPI:
     """Create a standalone Orizon FastAPI application.
 
@@ -107,4 +159,4 @@ def create_app() -> FastAPI:
 
 
 # Export for convenience
-__all__ = ["setup_orizon", "create_app"]
+__all__ = ["setup_orizon", "create_app", "startup_orizon", "shutdown_orizon"]
@@ -6,6 +6,7 @@ Handles both internal (oauth2-proxy) and external (signup/login) authentication.
 Components:
 - middleware.py: FastAPI middleware for request authentication
 - utils.py: Helper functions (header extraction, user provisioning)
+- keycache.py: Cached, single-flight user/virtual key provisioning
 - sessions.py: Session management for portal access
 - email.py: Email service for magic link
 - oauth.py: GitHub OAuth integration
@@ -20,6 +21,7 @@ from .utils import (
     get_or_create_user_key,
     generate_user_id,
 )
+from .keycache import get_cached_user_key, invalidate_user_id_key, invalidate_user_key
 from .ratelimit import rate_limit, rate_limit_by_email, close_redis
 
 __all__ = [
@@ -28,6 +30,9 @@ __all__ = [
     "get_or_create_user",
     "get_or_create_user_key",
     "generate_user_id",
+    "get_cached_user_key",
+    "invalidate_user_key",
+    "invalidate_user_id_key",
     "rate_limit",
     "rate_limit_by_email",
     "close_redis",
@@ -0,0 +1,244 @@
+"""
+Orizon User Key Cache
+
+Caches email → (user_data, virtual_key) for internal (oauth2-proxy) users so
+the auth middleware does not call LiteLLM's admin API on every request:
+- In-process TTL + LRU cache (per gateway replica)
+- Single-flight de-duplication of concurrent misses for the same email
+- Redis-backed sharing so replicas reuse the same virtual key
+- Explicit invalidation on key update, rotation and revocation
+"""
+
+import asyncio
+import json
+import logging
+import os
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+from orizon.redis_client import get_redis
+
+from .utils import generate_user_id, get_or_create_user_key
+
+logger = logging.getLogger(__name__)
+
+# Cache configuration
+USER_KEY_CACHE_PREFIX = "orizon:userkey:"
+USER_KEY_CACHE_SIZE = int(os.getenv("ORIZON_USER_KEY_CACHE_SIZE", "10000"))
+USER_KEY_CACHE_TTL = int(os.getenv("ORIZON_USER_KEY_CACHE_TTL", "300"))  # 5 minutes
+USER_KEY_REDIS_TTL = int(os.getenv("ORIZON_USER_KEY_REDIS_TTL", "3600"))  # 1 hour
+
+UserKey = Tuple[Optional[dict], Optional[str]]
+
+
+class UserKeyCache:
+    """TTL + LRU cache of provisioned users and their virtual keys.
+
+    Lookups go local cache → Redis → LiteLLM admin API. Concurrent misses
+    for the same email share one in-flight provisioning call. Failed
+    provisioning results are never cached.
+    """
+
+    def __init__(
+        self,
+        max_size: int = USER_KEY_CACHE_SIZE,
+        ttl: int = USER_KEY_CACHE_TTL,
+        redis_ttl: int = USER_KEY_REDIS_TTL,
+    ):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.redis_ttl = redis_ttl
+        self._entries: "OrderedDict[str, Tuple[float, UserKey]]" = OrderedDict()
+        self._inflight: Dict[str, "asyncio.Future[UserKey]"] = {}
+
+    @staticmethod
+    def _normalize(email: str) -> str:
+        return email.strip().lower()
+
+    @staticmethod
+    def _redis_key(email: str) -> str:
+        return f"{USER_KEY_CACHE_PREFIX}{generate_user_id(email)}"
+
+    @staticmethod
+    async def _delete_shared(user_id: str) -> None:
+        """Drop a user's shared entry from Redis."""
+        try:
+            client = await get_redis()
+            await client.delete(f"{USER_KEY_CACHE_PREFIX}{user_id}")
+        except Exception as e:
+            logger.warning(f"User key cache Redis invalidation failed: {e}")
+
+    def get_local(self, email: str) -> Optional[UserKey]:
+        """Get a cached entry from the in-process cache.
+
+        Args:
+            email: User email address
+
+        Returns:
+            (user_data, virtual_key) or None if missing/expired
+        """
+        email = self._normalize(email)
+        entry = self._entries.get(email)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[email]
+            return None
+
+        self._entries.move_to_end(email)
+        return value
+
+    def set_local(self, email: str, value: UserKey) -> None:
+        """Store an entry in the in-process cache, evicting the LRU entry if full.
+
+        Args:
+            email: User email address
+            value: (user_data, virtual_key) tuple
+        """
+        email = self._normalize(email)
+        self._entries[email] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(email)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    async def _get_shared(self, email: str) -> Optional[UserKey]:
+        """Get an entry provisioned by another replica from Redis."""
+        try:
+            client = await get_redis()
+            raw = await client.get(self._redis_key(email))
+        except Exception as e:
+            logger.warning(f"User key cache Redis read failed: {e}")
+            return None
+
+        if not raw:
+            return None
+
+        try:
+            data = json.loads(raw)
+            return data.get("user_data"), data["virtual_key"]
+        except (ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Discarding malformed user key cache entry: {e}")
+            return None
+
+    async def _set_shared(self, email: str, value: UserKey) -> None:
+        """Share a freshly provisioned entry with other replicas via Redis."""
+        user_data, virtual_key = value
+        try:
+            client = await get_redis()
+            await client.set(
+                self._redis_key(email),
+                json.dumps({"user_data": user_data, "virtual_key": virtual_key}),
+                ex=self.redis_ttl,
+            )
+        except Exception as e:
+            logger.warning(f"User key cache Redis write failed: {e}")
+
+    async def _load(self, email: str) -> UserKey:
+        """Resolve a cache miss from Redis or by provisioning via LiteLLM."""
+        value = await self._get_shared(email)
+        if value is not None:
+            self.set_local(email, value)
+            return value
+
+        value = await get_or_create_user_key(email)
+        if value[1]:
+            self.set_local(email, value)
+            await self._set_shared(email, value)
+        return value
+
+    async def get_or_create(self, email: str) -> UserKey:
+        """Get the cached user and virtual key, provisioning on a miss.
+
+        Args:
+            email: User email address
+
+        Returns:
+            Tuple of (user_data, virtual_key) or (None, None) on failure
+        """
+        email = self._normalize(email)
+
+        cached = self.get_local(email)
+        if cached is not None:
+            return cached
+
+        future = self._inflight.get(email)
+        if future is None:
+            future = asyncio.ensure_future(self._load(email))
+            self._inflight[email] = future
+            future.add_done_callback(lambda _: self._inflight.pop(email, None))
+
+        # Shield so one cancelled waiter does not abort the shared load
+        return await asyncio.shield(future)
+
+    async def invalidate(self, email: str) -> None:
+        """Drop a user's cached key locally and in Redis.
+
+        Call this after rotating or revoking a user's virtual key. Other
+        replicas pick up the change once their local TTL expires.
+
+        Args:
+            email: User email address
+        """
+        email = self._normalize(email)
+        self._entries.pop(email, None)
+        await self._delete_shared(generate_user_id(email))
+
+    async def invalidate_user_id(self, user_id: str) -> None:
+        """Drop the cached key of a LiteLLM user id locally and in Redis.
+
+        Used by LiteLLM's key management endpoints, which only know the
+        key owner's user_id (see generate_user_id), not their email.
+
+        Args:
+            user_id: LiteLLM user id of the key owner
+        """
+        for email in [e for e in self._entries if generate_user_id(e) == user_id]:
+            del self._entries[email]
+        await self._delete_shared(user_id)
+
+    def clear(self) -> None:
+        """Drop all in-process entries."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# Module-level cache shared by the auth middleware
+user_key_cache = UserKeyCache()
+
+
+async def get_cached_user_key(email: str) -> UserKey:
+    """Get or provision a user's virtual key through the shared cache.
+
+    Args:
+        email: User email address
+
+    Returns:
+        Tuple of (user_data, virtual_key) or (None, None) on failure
+    """
+    return await user_key_cache.get_or_create(email)
+
+
+async def invalidate_user_key(email: str) -> None:
+    """Invalidate a user's cached virtual key (e.g. after key rotation).
+
+    Args:
+        email: User email address
+    """
+    await user_key_cache.invalidate(email)
+
+
+async def invalidate_user_id_key(user_id: str) -> None:
+    """Invalidate the cached virtual key of a LiteLLM user id.
+
+    Called by LiteLLM's /key/update, /key/delete, /key/regenerate and
+    /key/block, so a revoked key stops being injected straight away.
+
+    Args:
+        user_id: LiteLLM user id of the key owner
+    """
+    await user_key_cache.invalidate_user_id(user_id)
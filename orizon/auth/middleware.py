@@ -4,7 +4,7 @@ Orizon Authentication Middleware
 FastAPI middleware that:
 1. Extracts oauth2-proxy headers for internal users
 2. Auto-provisions users in LiteLLM
-3. Generates/retrieves virtual keys
+3. Generates/retrieves virtual keys (cached, see keycache.py)
 4. Adds Authorization header for LiteLLM
 """
 
@@ -15,7 +15,8 @@ from fastapi import Request, Response
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.datastructures import MutableHeaders
 
-from .utils import get_user_email, get_or_create_user_key
+from .keycache import get_cached_user_key
+from .utils import get_user_email
 
 logger = logging.getLogger(__name__)
 
@@ -60,8 +61,8 @@ class OrizonAuthMiddleware(BaseHTTPMiddleware):
             logger.info(f"Internal user detected: {user_email}")
 
             try:
-                # Auto-provision user and get virtual key
-                user_data, virtual_key = await get_or_create_user_key(user_email)
+                # Auto-provision user and get virtual key (cached per email)
+                user_data, virtual_key = await get_cached_user_key(user_email)
 
                 if virtual_key:
                     # Inject Authorization header into request
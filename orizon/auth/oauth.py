@@ -20,13 +20,9 @@ from urllib.parse import urlencode
 import httpx
 import redis.asyncio as redis
 
-logger = logging.getLogger(__name__)
+from orizon.redis_client import get_redis
 
-# Redis configuration for OAuth state
-REDIS_HOST = os.getenv("REDIS_HOST", "localhost")
-REDIS_PORT = os.getenv("REDIS_PORT", "6379")
-REDIS_PASSWORD = os.getenv("REDIS_PASSWORD", "")
-REDIS_URL = os.getenv("REDIS_URL", f"redis://{REDIS_HOST}:{REDIS_PORT}")
+logger = logging.getLogger(__name__)
 
 # OAuth state prefix and expiry
 OAUTH_STATE_PREFIX = "orizon:oauth_state:"
@@ -56,12 +52,8 @@ def generate_oauth_state() -> str:
 
 
 async def _get_redis_client() -> redis.Redis:
-    """Get Redis client for OAuth state storage."""
-    return redis.from_url(
-        REDIS_URL,
-        password=REDIS_PASSWORD if REDIS_PASSWORD else None,
-        decode_responses=True,
-    )
+    """Get the shared Redis client for OAuth state storage (do not close it)."""
+    return await get_redis()
 
 
 async def store_oauth_state(state: str) -> bool:
@@ -77,7 +69,6 @@ async def store_oauth_state(state: str) -> bool:
         client = await _get_redis_client()
         key = f"{OAUTH_STATE_PREFIX}{state}"
         await client.setex(key, OAUTH_STATE_EXPIRY_SECONDS, "1")
-        await client.aclose()
         logger.debug(f"Stored OAuth state: {state[:8]}...")
         return True
     except Exception as e:
@@ -100,7 +91,6 @@ async def verify_oauth_state(state: str) -> bool:
 
         # Get and delete in one operation (atomic)
         exists = await client.delete(key)
-        await client.aclose()
 
         if exists:
             logger.debug(f"Verified OAuth state: {state[:8]}...")
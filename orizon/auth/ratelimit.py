@@ -3,22 +3,28 @@ Orizon Rate Limiting
 
 Redis-based rate limiting for authentication endpoints.
 Protects against brute force attacks on login/signup.
+
+Uses a sliding-window log (one Redis sorted set per client/action) evaluated
+atomically by a single Lua script, so each check costs one Redis round-trip.
+Clients already known to be over their limit are rejected in-process until
+their window frees up, without touching Redis.
 """
 
+import asyncio
+import itertools
 import logging
+import math
 import os
-from datetime import timedelta
-from typing import Optional, Tuple
+import time
+from collections import Counter
+from typing import Dict, Optional, Tuple
 
 import redis.asyncio as redis
 from fastapi import Request, HTTPException
 
-logger = logging.getLogger(__name__)
+from orizon import redis_client
 
-# Redis configuration
-REDIS_HOST = os.getenv("REDIS_HOST", "localhost")
-REDIS_PORT = int(os.getenv("REDIS_PORT", "6379"))
-REDIS_PASSWORD = os.getenv("REDIS_PASSWORD", "")
+logger = logging.getLogger(__name__)
 
 # Rate limit configuration
 # Format: (max_requests, window_seconds)
@@ -30,36 +36,142 @@ RATE_LIMITS = {
     "default": (30, 60),    # 30 requests per minute default
 }
 
-# Redis connection pool
-_redis_pool: Optional[redis.Redis] = None
+# Local pre-check configuration
+LOCAL_BLOCK_MAX_ENTRIES = int(os.getenv("ORIZON_RATELIMIT_LOCAL_MAX_ENTRIES", "10000"))
+
+# Metrics are aggregated in-process and flushed in the background this often
+METRICS_FLUSH_INTERVAL = float(os.getenv("ORIZON_RATELIMIT_METRICS_FLUSH_SECONDS", "5"))
+
+# Sliding-window log limiter.
+# KEYS[1] = sorted set of request timestamps (ms)
+# ARGV = now_ms, window_ms, max_requests, unique member
+# Returns {allowed, count_in_window, reset_ms}. Rejected requests are not
+# recorded, and the key expiry is refreshed in the same script, so no key
+# can outlive its window.
+SLIDING_WINDOW_SCRIPT = """
+local key = KEYS[1]
+local now = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+local limit = tonumber(ARGV[3])
+
+redis.call('ZREMRANGEBYSCORE', key, '-inf', now - window)
+local count = redis.call('ZCARD', key)
+local allowed = 0
+if count < limit then
+    redis.call('ZADD', key, now, ARGV[4])
+    count = count + 1
+    allowed = 1
+end
+redis.call('PEXPIRE', key, window)
+
+local reset = window
+local oldest = redis.call('ZRANGE', key, 0, 0, 'WITHSCORES')
+if oldest[2] then
+    reset = tonumber(oldest[2]) + window - now
+end
+return {allowed, count, reset}
+"""
 
+# key -> monotonic deadline until which the client is known to be over limit
+_local_blocks: Dict[str, float] = {}
 
-async def get_redis() -> redis.Redis:
-    """Get Redis connection with connection pooling."""
-    global _redis_pool
-
-    if _redis_pool is None:
-        _redis_pool = redis.Redis(
-            host=REDIS_HOST,
-            port=REDIS_PORT,
-            password=REDIS_PASSWORD or None,
-            decode_responses=True,
-            socket_connect_timeout=5,
-            socket_timeout=5,
-        )
-        logger.info(f"Created Redis connection pool: {REDIS_HOST}:{REDIS_PORT}")
+# (endpoint, action) -> rate limit hits not yet flushed to metrics
+_pending_hits: Counter = Counter()
+_metrics_flush_task: Optional[asyncio.Task] = None
+
+# Unique sorted-set members for requests landing in the same millisecond
+_member_counter = itertools.count()
+_member_prefix = f"{os.getpid()}-{os.urandom(3).hex()}"
 
-    return _redis_pool
+
+async def get_redis() -> redis.Redis:
+    """Get the shared Orizon Redis client."""
+    return await redis_client.get_redis()
 
 
 async def close_redis():
-    """Close Redis connection pool."""
-    global _redis_pool
+    """Close the shared Orizon Redis pool."""
+    await redis_client.close_redis()
+
 
-    if _redis_pool is not None:
-        await _redis_pool.close()
-        _redis_pool = None
-        logger.info("Closed Redis connection pool")
+def _local_block_remaining(key: str) -> float:
+    """Get seconds left on a local block for key, or 0 if not blocked."""
+    deadline = _local_blocks.get(key)
+    if deadline is None:
+        return 0.0
+
+    remaining = deadline - time.monotonic()
+    if remaining <= 0:
+        del _local_blocks[key]
+        return 0.0
+    return remaining
+
+
+def _set_local_block(key: str, seconds: float) -> None:
+    """Remember that key is over its limit for the next `seconds`."""
+    now = time.monotonic()
+    if len(_local_blocks) >= LOCAL_BLOCK_MAX_ENTRIES:
+        # Drop expired blocks; if still full, forget the oldest one
+        for stale in [k for k, d in _local_blocks.items() if d <= now]:
+            del _local_blocks[stale]
+        if len(_local_blocks) >= LOCAL_BLOCK_MAX_ENTRIES:
+            del _local_blocks[next(iter(_local_blocks))]
+    _local_blocks[key] = now + seconds
+
+
+def clear_local_blocks() -> None:
+    """Forget all in-process rate limit blocks."""
+    _local_blocks.clear()
+
+
+def flush_rate_limit_metrics() -> None:
+    """Flush aggregated rate limit hits to Prometheus."""
+    if not _pending_hits:
+        return
+
+    pending = dict(_pending_hits)
+    _pending_hits.clear()
+    try:
+        from orizon.metrics import record_rate_limit_hit
+    except ImportError:
+        return  # Metrics module not available
+
+    for (endpoint, action), count in pending.items():
+        record_rate_limit_hit(endpoint, action, count)
+
+
+async def _flush_rate_limit_metrics_periodically() -> None:
+    while True:
+        await asyncio.sleep(METRICS_FLUSH_INTERVAL)
+        try:
+            flush_rate_limit_metrics()
+        except Exception as e:
+            logger.error(f"Failed to flush rate limit metrics: {e}")
+
+
+async def stop_rate_limit_metrics_flush() -> None:
+    """Stop the background metrics flush and flush what is still buffered."""
+    global _metrics_flush_task
+
+    task, _metrics_flush_task = _metrics_flush_task, None
+    if task is not None and not task.done():
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+    flush_rate_limit_metrics()
+
+
+def _record_hit(endpoint: str, action: str) -> None:
+    """Aggregate a rate limit hit, flushed within METRICS_FLUSH_INTERVAL."""
+    global _metrics_flush_task
+
+    _pending_hits[(endpoint, action)] += 1
+    if _metrics_flush_task is None or _metrics_flush_task.done():
+        _metrics_flush_task = asyncio.get_running_loop().create_task(
+            _flush_rate_limit_metrics_periodically()
+        )
 
 
 def get_client_ip(request: Request) -> str:
@@ -103,25 +215,35 @@ async def check_rate_limit(
     client_id = identifier or get_client_ip(request)
     key = f"ratelimit:{action}:{client_id}"
 
-    try:
-        redis_client = await get_redis()
-
-        # Use Redis INCR with expiry for sliding window
-        current = await redis_client.incr(key)
+    # Reject clients known to be over limit without a Redis round-trip.
+    # Rejections are never recorded in the window, so the client stays over
+    # limit at least until the block expires.
+    blocked_for = _local_block_remaining(key)
+    if blocked_for > 0:
+        return False, 0, math.ceil(blocked_for)
 
-        if current == 1:
-            # First request - set expiry
-            await redis_client.expire(key, window_seconds)
-
-        # Get TTL for reset time
-        ttl = await redis_client.ttl(key)
-        reset_seconds = max(ttl, 0)
+    try:
+        client = await get_redis()
+
+        now_ms = int(time.time() * 1000)
+        member = f"{now_ms}-{_member_prefix}-{next(_member_counter)}"
+        allowed, current, reset_ms = await client.eval(
+            SLIDING_WINDOW_SCRIPT,
+            1,
+            key,
+            now_ms,
+            window_seconds * 1000,
+            max_requests,
+            member,
+        )
+        allowed = bool(int(allowed))
+        current = int(current)
+        reset_seconds = max(math.ceil(int(reset_ms) / 1000), 0)
 
-        # Check if over limit
         remaining = max(0, max_requests - current)
-        allowed = current <= max_requests
 
         if not allowed:
+            _set_local_block(key, int(reset_ms) / 1000)
             logger.warning(
                 f"Rate limit exceeded: {action} from {client_id} "
                 f"({current}/{max_requests})"
@@ -158,13 +280,8 @@ async def rate_limit(
     request.state.ratelimit_reset = reset_seconds
 
     if not allowed:
-        # Record rate limit hit in metrics
-        try:
-            from orizon.metrics import record_rate_limit_hit
-            endpoint = request.url.path
-            record_rate_limit_hit(endpoint, action)
-        except ImportError:
-            pass  # Metrics module not available
+        # Record rate limit hit in metrics (aggregated, flushed periodically)
+        _record_hit(request.url.path, action)
 
         raise HTTPException(
             status_code=429,
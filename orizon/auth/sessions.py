@@ -16,29 +16,22 @@ from typing import Optional
 import redis.asyncio as redis
 from fastapi import Request, Response
 
-logger = logging.getLogger(__name__)
+from orizon.redis_client import get_redis
 
-# Redis configuration
-# Build URL from individual components for consistency with other modules
-REDIS_HOST = os.getenv("REDIS_HOST", "localhost")
-REDIS_PORT = os.getenv("REDIS_PORT", "6379")
-REDIS_PASSWORD = os.getenv("REDIS_PASSWORD", "")
-REDIS_URL = os.getenv("REDIS_URL", f"redis://{REDIS_HOST}:{REDIS_PORT}")
+logger = logging.getLogger(__name__)
 
 # Session configuration
 SESSION_PREFIX = "orizon:session:"
 SESSION_COOKIE_NAME = "orizon_session"
 SESSION_EXPIRY_HOURS = int(os.getenv("SESSION_EXPIRY_HOURS", "24"))
 SESSION_TOKEN_LENGTH = 32
+# Extend session expiry on each authenticated request (sliding expiration), opt-in
+SESSION_SLIDING_EXPIRY = os.getenv("SESSION_SLIDING_EXPIRY", "false").lower() == "true"
 
 
 async def get_redis_client() -> redis.Redis:
-    """Get Redis client connection."""
-    return redis.from_url(
-        REDIS_URL,
-        password=REDIS_PASSWORD if REDIS_PASSWORD else None,
-        decode_responses=True,
-    )
+    """Get the shared Redis client (do not close it)."""
+    return await get_redis()
 
 
 async def create_session(
@@ -75,12 +68,12 @@ async def create_session(
     try:
         client = await get_redis_client()
 
-        # Store session
+        # Store session and set expiry atomically in one round-trip
         key = f"{SESSION_PREFIX}{session_token}"
-        await client.hset(key, mapping=session_data)
-        await client.expire(key, SESSION_EXPIRY_HOURS * 3600)
-
-        await client.aclose()
+        async with client.pipeline(transaction=True) as pipe:
+            pipe.hset(key, mapping=session_data)
+            pipe.expire(key, SESSION_EXPIRY_HOURS * 3600)
+            await pipe.execute()
 
         logger.info(f"Created session for user: {email}")
         return session_token
@@ -90,11 +83,13 @@ async def create_session(
         raise
 
 
-async def get_session(session_token: str) -> Optional[dict]:
+async def get_session(session_token: str, refresh: bool = False) -> Optional[dict]:
     """Get session data from token.
 
     Args:
         session_token: Session token from cookie
+        refresh: Also extend the session expiry, pipelined with the read so
+            both cost a single Redis round-trip
 
     Returns:
         Session data dict or None if invalid/expired
@@ -103,9 +98,13 @@ async def get_session(session_token: str) -> Optional[dict]:
         client = await get_redis_client()
 
         key = f"{SESSION_PREFIX}{session_token}"
-        session_data = await client.hgetall(key)
-
-        await client.aclose()
+        if refresh:
+            async with client.pipeline(transaction=False) as pipe:
+                pipe.hgetall(key)
+                pipe.expire(key, SESSION_EXPIRY_HOURS * 3600)
+                session_data, _ = await pipe.execute()
+        else:
+            session_data = await client.hgetall(key)
 
         if not session_data:
             return None
@@ -132,8 +131,6 @@ async def delete_session(session_token: str) -> bool:
         key = f"{SESSION_PREFIX}{session_token}"
         result = await client.delete(key)
 
-        await client.aclose()
-
         return result > 0
 
     except Exception as e:
@@ -156,8 +153,6 @@ async def refresh_session(session_token: str) -> bool:
         key = f"{SESSION_PREFIX}{session_token}"
         result = await client.expire(key, SESSION_EXPIRY_HOURS * 3600)
 
-        await client.aclose()
-
         return result
 
     except Exception as e:
@@ -206,7 +201,8 @@ def clear_session_cookie(response: Response) -> None:
 async def get_current_session(request: Request) -> Optional[dict]:
     """Get current user session from request.
 
-    This is a helper for protected routes.
+    This is a helper for protected routes. With SESSION_SLIDING_EXPIRY the
+    session expiry is refreshed in the same Redis round-trip as the read.
 
     Args:
         request: FastAPI request object
@@ -219,4 +215,4 @@ async def get_current_session(request: Request) -> Optional[dict]:
     if not session_token:
         return None
 
-    return await get_session(session_token)
+    return await get_session(session_token, refresh=SESSION_SLIDING_EXPIRY)
@@ -6,21 +6,15 @@ Uses Redis for token storage with expiration.
 """
 
 import logging
-import os
 import secrets
 from datetime import datetime, timedelta, timezone
 from typing import Optional
 
 import redis.asyncio as redis
 
-logger = logging.getLogger(__name__)
+from orizon.redis_client import get_redis
 
-# Redis configuration
-# Build URL from individual components for consistency with other modules
-REDIS_HOST = os.getenv("REDIS_HOST", "localhost")
-REDIS_PORT = os.getenv("REDIS_PORT", "6379")
-REDIS_PASSWORD = os.getenv("REDIS_PASSWORD", "")
-REDIS_URL = os.getenv("REDIS_URL", f"redis://{REDIS_HOST}:{REDIS_PORT}")
+logger = logging.getLogger(__name__)
 
 # Token configuration
 TOKEN_PREFIX = "orizon:magic:"
@@ -29,12 +23,8 @@ TOKEN_LENGTH = 32
 
 
 async def get_redis_client() -> redis.Redis:
-    """Get Redis client connection."""
-    return redis.from_url(
-        REDIS_URL,
-        password=REDIS_PASSWORD if REDIS_PASSWORD else None,
-        decode_responses=True,
-    )
+    """Get the shared Redis client (do not close it)."""
+    return await get_redis()
 
 
 async def create_magic_link_token(
@@ -74,12 +64,12 @@ async def create_magic_link_token(
     try:
         client = await get_redis_client()
 
-        # Store token with expiration
+        # Store token with expiration in one round-trip
         key = f"{TOKEN_PREFIX}{token}"
-        await client.hset(key, mapping=token_data)
-        await client.expire(key, TOKEN_EXPIRY_MINUTES * 60)
-
-        await client.aclose()
+        async with client.pipeline(transaction=True) as pipe:
+            pipe.hset(key, mapping=token_data)
+            pipe.expire(key, TOKEN_EXPIRY_MINUTES * 60)
+            await pipe.execute()
 
         logger.info(f"Created magic link token for {email}")
         return token
@@ -107,18 +97,16 @@ async def verify_magic_link_token(token: str) -> Optional[dict]:
 
         key = f"{TOKEN_PREFIX}{token}"
 
-        # Get token data
-        token_data = await client.hgetall(key)
+        # Get and delete token atomically (single-use, one round-trip)
+        async with client.pipeline(transaction=True) as pipe:
+            pipe.hgetall(key)
+            pipe.delete(key)
+            token_data, _ = await pipe.execute()
 
         if not token_data:
             logger.warning("Token not found or expired")
-            await client.aclose()
             return None
 
-        # Delete token (single-use)
-        await client.delete(key)
-        await client.aclose()
-
         # Convert is_signup back to bool
         token_data["is_signup"] = token_data.get("is_signup") == "1"
 
@@ -145,8 +133,6 @@ async def invalidate_token(token: str) -> bool:
         key = f"{TOKEN_PREFIX}{token}"
         result = await client.delete(key)
 
-        await client.aclose()
-
         return result > 0
 
     except Exception as e:
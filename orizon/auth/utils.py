@@ -21,6 +21,14 @@ logger = logging.getLogger(__name__)
 LITELLM_BASE_URL = os.getenv("LITELLM_BASE_URL", "http://localhost:4000")
 LITELLM_MASTER_KEY = os.getenv("LITELLM_MASTER_KEY", "")
 
+# Admin API client configuration
+ADMIN_API_TIMEOUT = float(os.getenv("ORIZON_ADMIN_API_TIMEOUT", "10"))
+ADMIN_API_MAX_CONNECTIONS = int(os.getenv("ORIZON_ADMIN_API_MAX_CONNECTIONS", "20"))
+ADMIN_API_MAX_KEEPALIVE = int(os.getenv("ORIZON_ADMIN_API_MAX_KEEPALIVE", "10"))
+
+# Shared HTTP client for LiteLLM admin API calls (/user/*, /key/*)
+_admin_client: Optional[httpx.AsyncClient] = None
+
 # Validate required configuration
 if not LITELLM_MASTER_KEY:
     logger.error("LITELLM_MASTER_KEY environment variable is required but not set!")
@@ -29,6 +37,43 @@ if not LITELLM_MASTER_KEY:
     )
 
 
+def get_admin_client() -> httpx.AsyncClient:
+    """Get or create the shared HTTP client for LiteLLM admin API calls.
+
+    Reusing one pooled client avoids a TCP/TLS handshake per provisioning
+    round-trip.
+
+    Returns:
+        Configured httpx.AsyncClient instance
+    """
+    global _admin_client
+
+    if _admin_client is None:
+        _admin_client = httpx.AsyncClient(
+            timeout=ADMIN_API_TIMEOUT,
+            limits=httpx.Limits(
+                max_connections=ADMIN_API_MAX_CONNECTIONS,
+                max_keepalive_connections=ADMIN_API_MAX_KEEPALIVE,
+            ),
+        )
+        logger.info(
+            f"Created admin API client pool: {ADMIN_API_MAX_CONNECTIONS} max, "
+            f"{ADMIN_API_MAX_KEEPALIVE} keepalive"
+        )
+
+    return _admin_client
+
+
+async def close_admin_client():
+    """Close the shared admin API client."""
+    global _admin_client
+
+    if _admin_client is not None:
+        await _admin_client.aclose()
+        _admin_client = None
+        logger.info("Closed admin API client pool")
+
+
 def get_user_email(request: Request) -> Optional[str]:
     """Extract email from oauth2-proxy headers.
 
@@ -120,30 +165,29 @@ async def get_user(user_id: str) -> Optional[dict]:
     Returns:
         User info dict or None if not found
     """
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.get(
-                f"{LITELLM_BASE_URL}/user/info",
-                params={"user_id": user_id},
-                headers={"Authorization": f"Bearer {LITELLM_MASTER_KEY}"},
-                timeout=10.0,
-            )
-
-            if response.status_code == 200:
-                data = response.json()
-                if data.get("user_info"):
-                    return data
-                return None
-            elif response.status_code == 404:
-                return None
-            else:
-                logger.error(f"Error getting user {user_id}: {response.status_code}")
-                return None
-
-        except httpx.RequestError as e:
-            logger.error(f"Request error getting user {user_id}: {e}")
+    client = get_admin_client()
+    try:
+        response = await client.get(
+            f"{LITELLM_BASE_URL}/user/info",
+            params={"user_id": user_id},
+            headers={"Authorization": f"Bearer {LITELLM_MASTER_KEY}"},
+        )
+
+        if response.status_code == 200:
+            data = response.json()
+            if data.get("user_info"):
+                return data
+            return None
+        elif response.status_code == 404:
+            return None
+        else:
+            logger.error(f"Error getting user {user_id}: {response.status_code}")
             return None
 
+    except httpx.RequestError as e:
+        logger.error(f"Request error getting user {user_id}: {e}")
+        return None
+
 
 async def create_user(email: str, user_id: str) -> Optional[dict]:
     """Create new user in LiteLLM.
@@ -155,36 +199,35 @@ async def create_user(email: str, user_id: str) -> Optional[dict]:
     Returns:
         Created user data or None on failure
     """
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.post(
-                f"{LITELLM_BASE_URL}/user/new",
-                json={
-                    "user_id": user_id,
-                    "user_email": email,
-                },
-                headers={
-                    "Authorization": f"Bearer {LITELLM_MASTER_KEY}",
-                    "Content-Type": "application/json",
-                },
-                timeout=10.0,
+    client = get_admin_client()
+    try:
+        response = await client.post(
+            f"{LITELLM_BASE_URL}/user/new",
+            json={
+                "user_id": user_id,
+                "user_email": email,
+            },
+            headers={
+                "Authorization": f"Bearer {LITELLM_MASTER_KEY}",
+                "Content-Type": "application/json",
+            },
+        )
+
+        if response.status_code == 200:
+            data = response.json()
+            logger.info(f"Created user {user_id} for {email}")
+            return data
+        else:
+            logger.error(
+                f"Error creating user {user_id}: "
+                f"{response.status_code} - {response.text}"
             )
-
-            if response.status_code == 200:
-                data = response.json()
-                logger.info(f"Created user {user_id} for {email}")
-                return data
-            else:
-                logger.error(
-                    f"Error creating user {user_id}: "
-                    f"{response.status_code} - {response.text}"
-                )
-                return None
-
-        except httpx.RequestError as e:
-            logger.error(f"Request error creating user {user_id}: {e}")
             return None
 
+    except httpx.RequestError as e:
+        logger.error(f"Request error creating user {user_id}: {e}")
+        return None
+
 
 async def get_or_create_user(email: str) -> Optional[dict]:
     """Get existing user or create new one.
@@ -229,41 +272,40 @@ async def create_key_for_user(user_id: str) -> Optional[str]:
     """
     import uuid
 
-    async with httpx.AsyncClient() as client:
-        try:
-            # Use unique alias for each key (LiteLLM requires unique aliases)
-            unique_suffix = uuid.uuid4().hex[:8]
-            response = await client.post(
-                f"{LITELLM_BASE_URL}/key/generate",
-                json={
-                    "user_id": user_id,
-                    "key_alias": f"orizon-{user_id}-{unique_suffix}",
-                },
-                headers={
-                    "Authorization": f"Bearer {LITELLM_MASTER_KEY}",
-                    "Content-Type": "application/json",
-                },
-                timeout=10.0,
+    client = get_admin_client()
+    try:
+        # Use unique alias for each key (LiteLLM requires unique aliases)
+        unique_suffix = uuid.uuid4().hex[:8]
+        response = await client.post(
+            f"{LITELLM_BASE_URL}/key/generate",
+            json={
+                "user_id": user_id,
+                "key_alias": f"orizon-{user_id}-{unique_suffix}",
+            },
+            headers={
+                "Authorization": f"Bearer {LITELLM_MASTER_KEY}",
+                "Content-Type": "application/json",
+            },
+        )
+
+        if response.status_code == 200:
+            data = response.json()
+            key = data.get("key")
+            if key:
+                logger.info(f"Created new key for user {user_id}")
+                return key
+            return None
+        else:
+            logger.error(
+                f"Error creating key for user {user_id}: "
+                f"{response.status_code} - {response.text}"
             )
-
-            if response.status_code == 200:
-                data = response.json()
-                key = data.get("key")
-                if key:
-                    logger.info(f"Created new key for user {user_id}")
-                    return key
-                return None
-            else:
-                logger.error(
-                    f"Error creating key for user {user_id}: "
-                    f"{response.status_code} - {response.text}"
-                )
-                return None
-
-        except httpx.RequestError as e:
-            logger.error(f"Request error creating key for {user_id}: {e}")
             return None
 
+    except httpx.RequestError as e:
+        logger.error(f"Request error creating key for {user_id}: {e}")
+        return None
+
 
 def get_user_virtual_key(user_data: dict) -> Optional[str]:
     """Extract virtual key from user data.
@@ -140,15 +140,16 @@ def set_active_sessions(count: int):
         _active_sessions.set(count)
 
 
-def record_rate_limit_hit(endpoint: str, action: str):
-    """Record a rate limit violation.
+def record_rate_limit_hit(endpoint: str, action: str, count: int = 1):
+    """Record rate limit violations.
 
     Args:
         endpoint: The endpoint that was rate limited
         action: The rate limit action type (login, signup, etc.)
+        count: Number of violations to record (for batched updates)
     """
     if _init_metrics() and _rate_limit_hits:
-        _rate_limit_hits.labels(endpoint=endpoint, action=action).inc()
+        _rate_limit_hits.labels(endpoint=endpoint, action=action).inc(count)
 
 
 def record_oauth_flow(provider: str, status: str):
@@ -6,11 +6,12 @@ Handles forwarding requests to LiteLLM backend.
 
 import logging
 import os
-from typing import Optional, Dict, Any
+from typing import AsyncIterator, Optional, Dict, Any
 
 import httpx
 from fastapi import Request
 from fastapi.responses import StreamingResponse, JSONResponse
+from starlette.background import BackgroundTask
 
 logger = logging.getLogger(__name__)
 
@@ -22,6 +23,25 @@ PROXY_TIMEOUT = int(os.getenv("PROXY_TIMEOUT", "300"))  # 5 minutes for streamin
 MAX_CONNECTIONS = int(os.getenv("PROXY_MAX_CONNECTIONS", "100"))
 MAX_KEEPALIVE_CONNECTIONS = int(os.getenv("PROXY_MAX_KEEPALIVE", "20"))
 
+# Streaming configuration
+# When enabled, request bodies are streamed upstream and responses are relayed
+# chunk-by-chunk as they arrive instead of being buffered in full first.
+PROXY_STREAM_UPSTREAM = os.getenv("PROXY_STREAM_UPSTREAM", "true").lower() == "true"
+
+# Hop-by-hop headers must not be forwarded by proxies (RFC 7230 section 6.1)
+HOP_BY_HOP_HEADERS = frozenset(
+    {
+        "connection",
+        "keep-alive",
+        "proxy-authenticate",
+        "proxy-authorization",
+        "te",
+        "trailers",
+        "transfer-encoding",
+        "upgrade",
+    }
+)
+
 # Module-level HTTP client with connection pooling
 _http_client: Optional[httpx.AsyncClient] = None
 
@@ -70,13 +90,217 @@ async def close_http_client():
         logger.info("Closed HTTP client pool")
 
 
+def _build_upstream_headers(request: Request, virtual_key: str) -> Dict[str, str]:
+    """Build headers for the upstream LiteLLM request.
+
+    Args:
+        request: Original FastAPI request
+        virtual_key: User's virtual API key
+
+    Returns:
+        Headers dict with host removed and authorization replaced
+    """
+    headers = {
+        k: v for k, v in request.headers.items() if k.lower() not in HOP_BY_HOP_HEADERS
+    }
+    # Remove host header (will be set automatically)
+    headers.pop("host", None)
+    # Set authorization with virtual key
+    headers["authorization"] = f"Bearer {virtual_key}"
+    return headers
+
+
+def _build_downstream_headers(response: httpx.Response) -> Dict[str, str]:
+    """Filter upstream response headers for relaying to the client.
+
+    Drops hop-by-hop headers and content-length, since the relayed body is
+    re-framed by the ASGI server.
+
+    Args:
+        response: Upstream httpx response
+
+    Returns:
+        Headers dict safe to pass to a StreamingResponse
+    """
+    return {
+        k: v
+        for k, v in response.headers.items()
+        if k.lower() not in HOP_BY_HOP_HEADERS and k.lower() != "content-length"
+    }
+
+
+async def _relay_stream(response: httpx.Response) -> AsyncIterator[bytes]:
+    """Relay raw upstream bytes to the client as they arrive.
+
+    Raw (undecoded) bytes are relayed so that any content-encoding set by
+    LiteLLM stays valid for the client. If the client disconnects, Starlette
+    cancels this generator and the finally block closes the upstream
+    response, which aborts the in-flight LiteLLM call.
+
+    Args:
+        response: Upstream httpx response opened with stream=True
+
+    Yields:
+        Response body chunks
+    """
+    try:
+        async for chunk in response.aiter_raw():
+            yield chunk
+    finally:
+        await response.aclose()
+
+
+def _json_response_from_upstream(response: httpx.Response) -> JSONResponse:
+    """Convert a fully-read upstream response to a JSONResponse.
+
+    Args:
+        response: Upstream httpx response whose body has been read
+
+    Returns:
+        JSONResponse mirroring the upstream status and headers, or a 502 if
+        the upstream body is not valid JSON
+    """
+    try:
+        json_content = response.json() if response.content else {}
+    except (ValueError, Exception) as json_error:
+        logger.error(f"Malformed JSON response from LiteLLM: {json_error}")
+        return JSONResponse(
+            status_code=502,
+            content={"error": "Bad gateway - invalid JSON response from LiteLLM"},
+        )
+
+    return JSONResponse(
+        status_code=response.status_code,
+        content=json_content,
+        headers=dict(response.headers),
+    )
+
+
 async def forward_request(
     request: Request,
     path: str,
     virtual_key: str,
+    stream_upstream: Optional[bool] = None,
 ) -> StreamingResponse | JSONResponse:
     """Forward a request to LiteLLM with user's virtual key.
 
+    Args:
+        request: Original FastAPI request
+        path: Path to forward (e.g., "/v1/chat/completions")
+        virtual_key: User's virtual API key
+        stream_upstream: Relay bodies chunk-by-chunk instead of buffering them.
+            Defaults to PROXY_STREAM_UPSTREAM.
+
+    Returns:
+        StreamingResponse or JSONResponse from LiteLLM
+    """
+    if stream_upstream is None:
+        stream_upstream = PROXY_STREAM_UPSTREAM
+
+    if stream_upstream:
+        return await forward_streaming_request(request, path, virtual_key)
+    return await forward_buffered_request(request, path, virtual_key)
+
+
+async def forward_streaming_request(
+    request: Request,
+    path: str,
+    virtual_key: str,
+) -> StreamingResponse | JSONResponse:
+    """Forward a request to LiteLLM, streaming both directions.
+
+    The request body is streamed upstream as the client sends it, and SSE
+    responses are relayed to the client chunk-by-chunk as LiteLLM produces
+    them, so time-to-first-token is not delayed by buffering the whole
+    completion. The upstream response is closed when the relay finishes or
+    the client disconnects.
+
+    Args:
+        request: Original FastAPI request
+        path: Path to forward (e.g., "/v1/chat/completions")
+        virtual_key: User's virtual API key
+
+    Returns:
+        StreamingResponse or JSONResponse from LiteLLM
+    """
+    # Build target URL
+    target_url = f"{LITELLM_BASE_URL}{path}"
+
+    # Stream the request body instead of reading it into memory
+    content = request.stream() if request.method in ("POST", "PUT", "PATCH") else None
+
+    headers = _build_upstream_headers(request, virtual_key)
+
+    # Log request
+    logger.info(f"Proxying {request.method} {path} with key {virtual_key[:10]}...")
+
+    response: Optional[httpx.Response] = None
+    try:
+        # Get pooled HTTP client
+        client = get_http_client()
+
+        upstream_request = client.build_request(
+            method=request.method,
+            url=target_url,
+            params=dict(request.query_params),
+            headers=headers,
+            content=content,
+        )
+        response = await client.send(upstream_request, stream=True)
+
+        # Check if response is streaming (SSE)
+        content_type = response.headers.get("content-type", "")
+        is_streaming = "text/event-stream" in content_type
+
+        if is_streaming:
+            # Hand ownership of the open response to the relay generator
+            streaming_response = StreamingResponse(
+                content=_relay_stream(response),
+                status_code=response.status_code,
+                headers=_build_downstream_headers(response),
+                media_type=content_type,
+                background=BackgroundTask(response.aclose),
+            )
+            response = None
+            return streaming_response
+
+        # Non-streaming responses are small; read them in full
+        await response.aread()
+        return _json_response_from_upstream(response)
+
+    except httpx.TimeoutException as e:
+        logger.error(f"LiteLLM request timeout: {e}")
+        return JSONResponse(
+            status_code=504,
+            content={"error": "Gateway timeout - request to LiteLLM timed out"},
+        )
+    except httpx.RequestError as e:
+        logger.error(f"LiteLLM request error: {e}")
+        return JSONResponse(
+            status_code=502,
+            content={"error": "Bad gateway - failed to connect to LiteLLM"},
+        )
+    except Exception as e:
+        logger.error(f"Proxy error: {e}")
+        return JSONResponse(
+            status_code=500,
+            content={"error": "Internal proxy error"},
+        )
+    finally:
+        if response is not None:
+            await response.aclose()
+
+
+async def forward_buffered_request(
+    request: Request,
+    path: str,
+    virtual_key: str,
+) -> StreamingResponse | JSONResponse:
+    """Forward a request to LiteLLM, buffering request and response bodies.
+
+    This is the legacy forwarding mode, kept for upstreams that do not cope
+    with chunked request bodies and as a baseline for benchmarks.
+
     Args:
         request: Original FastAPI request
         path: Path to forward (e.g., "/v1/chat/completions")
@@ -100,12 +324,7 @@ async def forward_request(
                 content={"error": "Failed to read request body"},
             )
 
-    # Build headers
-    headers = dict(request.headers)
-    # Remove host header (will be set automatically)
-    headers.pop("host", None)
-    # Set authorization with virtual key
-    headers["authorization"] = f"Bearer {virtual_key}"
+    headers = _build_upstream_headers(request, virtual_key)
 
     # Log request
     logger.info(f"Proxying {request.method} {path} with key {virtual_key[:10]}...")
@@ -136,21 +355,7 @@ async def forward_request(
                 media_type=content_type,
             )
         else:
-            # Return JSON response
-            try:
-                json_content = response.json() if response.content else {}
-            except (ValueError, Exception) as json_error:
-                logger.error(f"Malformed JSON response from LiteLLM: {json_error}")
-                return JSONResponse(
-                    status_code=502,
-                    content={"error": "Bad gateway - invalid JSON response from LiteLLM"},
-                )
-
-            return JSONResponse(
-                status_code=response.status_code,
-                content=json_content,
-                headers=dict(response.headers),
-            )
+            return _json_response_from_upstream(response)
 
     except httpx.TimeoutException as e:
         logger.error(f"LiteLLM request timeout: {e}")
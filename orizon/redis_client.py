@@ -0,0 +1,88 @@
+"""
+Orizon Redis Client
+
+Shared, lifecycle-managed async Redis connection pool for all Orizon modules
+(sessions, magic link tokens, OAuth state, rate limiting, key cache).
+
+The pool is opened by setup_orizon() at application startup and closed on
+shutdown. Modules call get_redis() per operation; it returns the shared
+client instead of creating a new connection pool.
+"""
+
+import logging
+import os
+from typing import Optional
+
+import redis.asyncio as redis
+
+logger = logging.getLogger(__name__)
+
+# Redis configuration
+REDIS_HOST = os.getenv("REDIS_HOST", "localhost")
+REDIS_PORT = os.getenv("REDIS_PORT", "6379")
+REDIS_PASSWORD = os.getenv("REDIS_PASSWORD", "")
+REDIS_URL = os.getenv("REDIS_URL", f"redis://{REDIS_HOST}:{REDIS_PORT}")
+
+# Connection pool configuration
+REDIS_MAX_CONNECTIONS = int(os.getenv("ORIZON_REDIS_MAX_CONNECTIONS", "50"))
+REDIS_SOCKET_TIMEOUT = float(os.getenv("ORIZON_REDIS_SOCKET_TIMEOUT", "5"))
+
+# Module-level client backed by a single connection pool
+_redis_client: Optional[redis.Redis] = None
+
+
+def _create_client() -> redis.Redis:
+    """Create a Redis client with its own connection pool."""
+    client = redis.from_url(
+        REDIS_URL,
+        password=REDIS_PASSWORD if REDIS_PASSWORD else None,
+        decode_responses=True,
+        max_connections=REDIS_MAX_CONNECTIONS,
+        socket_connect_timeout=REDIS_SOCKET_TIMEOUT,
+        socket_timeout=REDIS_SOCKET_TIMEOUT,
+    )
+    logger.info(
+        f"Created Redis connection pool: {REDIS_HOST}:{REDIS_PORT} "
+        f"({REDIS_MAX_CONNECTIONS} max connections)"
+    )
+    return client
+
+
+async def init_redis() -> redis.Redis:
+    """Open the shared Redis pool.
+
+    Called at application startup. Safe to call more than once.
+
+    Returns:
+        Shared Redis client
+    """
+    return await get_redis()
+
+
+async def get_redis() -> redis.Redis:
+    """Get the shared Redis client, creating the pool on first use.
+
+    Callers must not close the returned client.
+
+    Returns:
+        Shared Redis client
+    """
+    global _redis_client
+
+    if _redis_client is None:
+        _redis_client = _create_client()
+
+    return _redis_client
+
+
+async def close_redis() -> None:
+    """Close the shared Redis pool.
+
+    Called at application shutdown.
+    """
+    global _redis_client
+
+    if _redis_client is not None:
+        await _redis_client.aclose()
+        _redis_client = None
+        logger.info("Closed Redis connection pool")
@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Benchmark the content filter guardrail keyword matching
+(litellm/proxy/guardrails/guardrail_hooks/litellm_content_filter/).
+
+Loads --keywords synthetic blocked words and category keywords and measures:
+    - per-text checks: the previous per-keyword scan (`keyword in text` /
+      `re.search(r"\\b...\\b")` per keyword) vs the Aho-Corasick automaton
+    - streaming: re-checking the whole accumulated response on every chunk (the
+      previous behaviour) vs the incremental streaming hook
+
+USAGE:
+    python scripts/benchmark_content_filter.py --keywords 10000 --chunks 100
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import re
+import statistics
+import sys
+import tempfile
+import time
+from unittest.mock import MagicMock
+
+import yaml
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from litellm.proxy.guardrails.guardrail_hooks.litellm_content_filter.content_filter import (  # noqa: E402
+    ContentFilterGuardrail,
+)
+from litellm.types.guardrails import ContentFilterAction  # noqa: E402
+from litellm.types.utils import (  # noqa: E402
+    Delta,
+    ModelResponseStream,
+    StreamingChoices,
+)
+
+WORDS = (
+    "the model returned a short answer about the weather and the schedule for "
+    "next week with some notes on travel budget and meeting rooms"
+).split()
+
+
+def make_keyword(rng: random.Random) -> str:
+    return "".join(rng.choice("abcdefghijklmnopqrstuvwxyz") for _ in range(8))
+
+
+def build_guardrail(keywords: int, category_file: str) -> ContentFilterGuardrail:
+    rng = random.Random(0)
+    category = {
+        "category_name": "bench",
+        "default_action": "BLOCK",
+        "keywords": [
+            {"keyword": make_keyword(rng), "severity": "high"} for _ in range(keywords)
+        ],
+        "exceptions": [make_keyword(rng) for _ in range(50)],
+    }
+    with open(category_file, "w") as f:
+        yaml.safe_dump(category, f)
+    return ContentFilterGuardrail(
+        guardrail_name="bench",
+        blocked_words=[
+            {"keyword": make_keyword(rng), "action": "BLOCK"} for _ in range(keywords)
+        ],
+        categories=[
+            {"category": "bench", "category_file": category_file, "action": "BLOCK"}
+        ],
+        patterns=[
+            {"pattern_type": "prebuilt", "pattern_name": "us_ssn", "action": "BLOCK"},
+            {"pattern_type": "prebuilt", "pattern_name": "email", "action": "BLOCK"},
+        ],
+    )
+
+
+def previous_keyword_checks(guardrail: ContentFilterGuardrail, text: str) -> bool:
+    text_lower = text.lower()
+    for keyword in guardrail.blocked_words:
+        if keyword in text_lower:
+            return True
+    for category in guardrail.loaded_categories.values():
+        for exception in category.exceptions:
+            if exception in text_lower:
+                return False
+    for keyword in guardrail.category_keywords:
+        if " " in keyword:
+            if keyword in text_lower:
+                return True
+        elif re.search(r"\b" + re.escape(keyword) + r"\b", text_lower):
+            return True
+    return False
+
+
+def automaton_keyword_checks(guardrail: ContentFilterGuardrail, text: str) -> bool:
+    return bool(
+        guardrail._check_blocked_words(text)
+        or guardrail._check_category_keywords(text)
+    )
+
+
+def time_per_call(fn, iterations: int) -> float:
+    timings = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+async def previous_streaming(guardrail: ContentFilterGuardrail, chunks: list) -> None:
+    accumulated = ""
+    for chunk in chunks:
+        accumulated += chunk
+        for pattern_entry in guardrail.compiled_patterns:
+            if pattern_entry["action"] == ContentFilterAction.BLOCK:
+                guardrail._find_pattern_spans(accumulated, pattern_entry)
+        previous_keyword_checks(guardrail, accumulated)
+
+
+async def incremental_streaming(
+    guardrail: ContentFilterGuardrail, chunks: list
+) -> None:
+    async def stream():
+        for chunk in chunks:
+            yield ModelResponseStream(
+                choices=[StreamingChoices(delta=Delta(content=chunk), index=0)]
+            )
+
+    async for _ in guardrail.async_post_call_streaming_iterator_hook(
+        user_api_key_dict=MagicMock(), response=stream(), request_data={}
+    ):
+        pass
+
+
+def main(keywords: int, chunks: int, iterations: int) -> None:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        start = time.perf_counter()
+        guardrail = build_guardrail(keywords, os.path.join(tmp_dir, "bench.yaml"))
+        print(
+            f"loaded {len(guardrail.blocked_words)} blocked words, "
+            f"{len(guardrail.category_keywords)} category keywords "
+            f"in {time.perf_counter() - start:.2f}s"
+        )
+
+    rng = random.Random(1)
+    text = " ".join(rng.choice(WORDS) for _ in range(300))
+    for name, fn in [
+        ("per-keyword (previous)", previous_keyword_checks),
+        ("automaton", automaton_keyword_checks),
+    ]:
+        median = time_per_call(lambda: fn(guardrail, text), iterations)
+        print(f"{name:<28} {median * 1e3:10.3f} ms / {len(text)} char text")
+
+    stream_chunks = [" " + rng.choice(WORDS) for _ in range(chunks)]
+    for name, fn in [
+        ("streaming rescan (previous)", previous_streaming),
+        ("streaming incremental", incremental_streaming),
+    ]:
+        start = time.perf_counter()
+        asyncio.run(fn(guardrail, stream_chunks))
+        elapsed = time.perf_counter() - start
+        print(f"{name:<28} {elapsed * 1e3:10.1f} ms / {chunks} chunk stream")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="content filter guardrail benchmark")
+    parser.add_argument("--keywords", type=int, default=10000)
+    parser.add_argument("--chunks", type=int, default=100)
+    parser.add_argument("--iterations", type=int, default=5)
+    args = parser.parse_args()
+    main(args.keywords, args.chunks, args.iterations)
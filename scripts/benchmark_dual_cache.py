@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Benchmark the DualCache read path against a simulated Redis.
+
+Simulates proxy auth traffic: bursts of concurrent requests look up a skewed
+set of hot keys (key / team objects) plus keys that are not in Redis at all.
+The in-memory TTL is short, so hot keys keep expiring and falling through to
+Redis. Compares the previous read path (every in-memory miss issues its own
+GET) with request coalescing, and with coalescing + negative caching.
+
+USAGE:
+    python scripts/benchmark_dual_cache.py --requests 20000 --concurrency 200
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from litellm.caching.dual_cache import DualCache  # noqa: E402
+from litellm.caching.in_memory_cache import InMemoryCache  # noqa: E402
+
+
+class SimulatedRedis:
+    def __init__(self, values: dict, round_trip: float):
+        self.values = values
+        self.round_trip = round_trip
+        self.gets = 0
+
+    async def async_get_cache(self, key, parent_otel_span=None, **kwargs):
+        self.gets += 1
+        await asyncio.sleep(self.round_trip)
+        return self.values.get(key)
+
+
+class UncoalescedDualCache(DualCache):
+    """The previous read path: one redis GET per in-memory miss."""
+
+    async def _async_get_from_redis(self, key, parent_otel_span):
+        self.redis_get_calls += 1
+        assert self.redis_cache is not None
+        return (
+            await self.redis_cache.async_get_cache(
+                key, parent_otel_span=parent_otel_span
+            ),
+            True,
+        )
+
+
+async def run(name, cache_cls, args, negative_cache_ttl=None):
+    rng = random.Random(0)
+    values = {f"key:{i}": {"token": f"key:{i}", "team": i % 10} for i in range(100)}
+    redis = SimulatedRedis(values, args.round_trip)
+    cache = cache_cls(
+        in_memory_cache=InMemoryCache(default_ttl=args.in_memory_ttl),
+        redis_cache=redis,  # type: ignore
+        default_in_memory_ttl=args.in_memory_ttl,
+        default_negative_cache_ttl=negative_cache_ttl,
+    )
+    weights = [1 / (rank + 1) for rank in range(100)]
+
+    def next_key() -> str:
+        if rng.random() < args.missing_ratio:
+            return f"missing:{rng.randrange(20)}"
+        return f"key:{rng.choices(range(100), weights=weights)[0]}"
+
+    start = time.perf_counter()
+    for _ in range(args.requests // args.concurrency):
+        await asyncio.gather(
+            *(cache.async_get_cache(next_key()) for _ in range(args.concurrency))
+        )
+    elapsed = time.perf_counter() - start
+
+    metrics = cache.get_cache_metrics()
+    print(
+        f"{name:<30} {elapsed:6.2f}s  redis GETs={redis.gets:<6} "
+        f"redis ops/request={metrics['redis_ops_per_request']:.3f}  "
+        f"in-memory hit ratio={metrics['in_memory_hit_ratio']:.3f}"
+    )
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="DualCache read path benchmark")
+    parser.add_argument("--requests", type=int, default=20_000)
+    parser.add_argument("--concurrency", type=int, default=200)
+    parser.add_argument("--round-trip", type=float, default=0.001)
+    parser.add_argument("--in-memory-ttl", type=float, default=0.05)
+    parser.add_argument("--missing-ratio", type=float, default=0.1)
+    parser.add_argument("--negative-cache-ttl", type=float, default=1.0)
+    args = parser.parse_args()
+
+    await run("previous (no coalescing)", UncoalescedDualCache, args)
+    await run("coalescing", DualCache, args)
+    await run(
+        "coalescing + negative cache",
+        DualCache,
+        args,
+        negative_cache_ttl=args.negative_cache_ttl,
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
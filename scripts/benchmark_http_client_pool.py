@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Benchmark the shared http client pool (litellm/llms/custom_httpx/http_client_pool.py).
+
+Measures, on one event loop:
+    - lookup: get_async_httpx_client for an already pooled client - paid on every
+      LLM call
+    - create: building a new AsyncHTTPHandler - previously paid (plus the TLS
+      handshakes of the dropped connections) every time a client hit its cache TTL
+    - pool utilization reported by get_http_client_pool_metrics()
+
+USAGE:
+    python scripts/benchmark_http_client_pool.py --iterations 20000
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import httpx  # noqa: E402
+
+import litellm  # noqa: E402
+from litellm.llms.custom_httpx.http_client_pool import (  # noqa: E402
+    get_http_client_pool_metrics,
+    http_client_pool_manager,
+)
+from litellm.llms.custom_httpx.http_handler import (  # noqa: E402
+    AsyncHTTPHandler,
+    get_async_httpx_client,
+)
+from litellm.types.utils import LlmProviders  # noqa: E402
+
+
+def report(name: str, timings: list) -> None:
+    print(
+        f"{name:<28} median={statistics.median(timings) * 1e6:8.2f}µs  "
+        f"p99={sorted(timings)[int(len(timings) * 0.99)] * 1e6:8.2f}µs"
+    )
+
+
+async def run(iterations: int) -> None:
+    litellm.http_client_pool_settings = {
+        "default": {"max_connections": 1000, "keepalive_timeout": 120}
+    }
+    params = {"timeout": httpx.Timeout(timeout=600.0, connect=5.0)}
+    providers = [LlmProviders.OPENAI, LlmProviders.ANTHROPIC, LlmProviders.BEDROCK]
+
+    lookup_timings = []
+    for i in range(iterations):
+        start = time.perf_counter()
+        get_async_httpx_client(
+            llm_provider=providers[i % len(providers)], params=params
+        )
+        lookup_timings.append(time.perf_counter() - start)
+
+    create_timings = []
+    for _ in range(max(iterations // 100, 10)):
+        start = time.perf_counter()
+        handler = AsyncHTTPHandler(**params)
+        create_timings.append(time.perf_counter() - start)
+        await handler.close()
+
+    report("pooled lookup", lookup_timings)
+    report("new AsyncHTTPHandler", create_timings)
+    print(f"\npool stats: {http_client_pool_manager.get_stats()}")
+    for metric in get_http_client_pool_metrics():
+        print(f"  {metric}")
+    await http_client_pool_manager.aclose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="http client pool benchmark")
+    parser.add_argument("--iterations", type=int, default=20000)
+    args = parser.parse_args()
+    asyncio.run(run(args.iterations))
+
+
+if __name__ == "__main__":
+    main()
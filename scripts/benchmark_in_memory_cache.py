@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+Benchmark litellm's InMemoryCache against the previous heap-based implementation.
+
+Replays the key patterns the proxy puts through InMemoryCache:
+  - auth:        hashed virtual keys -> key/team objects (read-heavy, hot set)
+  - rate limit:  "{key}::{minute}::request_count" counters (increment-heavy)
+  - router:      "{deployment_id}:tpm:{HH-MM}" usage counters
+  - overwrite:   the same hot keys rewritten with a new TTL each request
+
+USAGE:
+    python scripts/benchmark_in_memory_cache.py --ops 200000 --max-size 1000
+"""
+
+import argparse
+import hashlib
+import heapq
+import json
+import os
+import random
+import sys
+import time
+from typing import Callable, Dict, List, Tuple
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+
+class LegacyInMemoryCache:
+    """The previous implementation: earliest-expiry eviction via a lazily cleaned heap,
+    json.loads on every read."""
+
+    def __init__(self, max_size_in_memory: int = 200, default_ttl: int = 600):
+        self.max_size_in_memory = max_size_in_memory
+        self.default_ttl = default_ttl
+        self.cache_dict: dict = {}
+        self.ttl_dict: dict = {}
+        self.expiration_heap: List[Tuple[float, str]] = []
+
+    def _remove_key(self, key):
+        self.cache_dict.pop(key, None)
+        self.ttl_dict.pop(key, None)
+
+    def evict_cache(self):
+        now = time.time()
+        while self.expiration_heap:
+            expiration_time, key = self.expiration_heap[0]
+            if expiration_time != self.ttl_dict.get(key):
+                heapq.heappop(self.expiration_heap)
+            elif expiration_time <= now:
+                heapq.heappop(self.expiration_heap)
+                self._remove_key(key)
+            else:
+                break
+        while len(self.cache_dict) >= self.max_size_in_memory:
+            expiration_time, key = heapq.heappop(self.expiration_heap)
+            if self.ttl_dict.get(key) == expiration_time:
+                self._remove_key(key)
+
+    def set_cache(self, key, value, **kwargs):
+        if len(self.cache_dict) >= self.max_size_in_memory:
+            self.evict_cache()
+        self.cache_dict[key] = value
+        ttl_time = self.ttl_dict.get(key)
+        if ttl_time is None or ttl_time < time.time():
+            self.ttl_dict[key] = time.time() + float(kwargs.get("ttl") or self.default_ttl)
+            heapq.heappush(self.expiration_heap, (self.ttl_dict[key], key))
+
+    def get_cache(self, key, **kwargs):
+        if key in self.cache_dict:
+            if key in self.ttl_dict and time.time() > self.ttl_dict[key]:
+                self._remove_key(key)
+                return None
+            original = self.cache_dict[key]
+            try:
+                return json.loads(original)
+            except Exception:
+                return original
+        return None
+
+    def increment_cache(self, key, value, **kwargs):
+        new_value = (self.get_cache(key) or 0) + value
+        self.set_cache(key, new_value, **kwargs)
+        return new_value
+
+
+def make_key_object(i: int) -> Dict:
+    return {
+        "token": hashlib.sha256(f"sk-{i}".encode()).hexdigest(),
+        "key_alias": f"key-{i}",
+        "spend": random.random() * 100,
+        "max_budget": 1000.0,
+        "models": [f"gpt-4o-{j}" for j in range(10)],
+        "metadata": {"team": f"team-{i % 50}", "tags": ["prod", "eu"]},
+        "team_id": f"team-{i % 50}",
+        "rpm_limit": 1000,
+        "tpm_limit": 100000,
+    }
+
+
+def build_workload(ops: int, num_keys: int) -> List[Tuple[str, str, object]]:
+    keys = [hashlib.sha256(f"sk-{i}".encode()).hexdigest() for i in range(num_keys)]
+    objects = {k: make_key_object(i) for i, k in enumerate(keys)}
+    deployments = [f"deployment-{i}" for i in range(50)]
+    minute = time.strftime("%H-%M")
+    workload: List[Tuple[str, str, object]] = []
+    for _ in range(ops):
+        # 80/20 hot set for auth lookups
+        key = keys[int(random.paretovariate(1.2)) % num_keys]
+        r = random.random()
+        if r < 0.5:
+            workload.append(("auth", key, objects[key]))
+        elif r < 0.8:
+            workload.append(("rate", f"{key}::{minute}::request_count", 1))
+        elif r < 0.95:
+            workload.append(("router", f"{random.choice(deployments)}:tpm:{minute}", 100))
+        else:
+            workload.append(("overwrite", key, objects[key]))
+    return workload
+
+
+def run(cache, workload) -> Tuple[float, int]:
+    hits = 0
+    start = time.perf_counter()
+    for kind, key, value in workload:
+        if kind == "auth":
+            if cache.get_cache(key) is not None:
+                hits += 1
+            else:
+                cache.set_cache(key, value, ttl=60)
+        elif kind in ("rate", "router"):
+            cache.increment_cache(key, value, ttl=60)
+        else:
+            cache.set_cache(key, value, ttl=60)
+    return time.perf_counter() - start, hits
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="InMemoryCache benchmark")
+    parser.add_argument("--ops", type=int, default=200_000)
+    parser.add_argument("--keys", type=int, default=5_000)
+    parser.add_argument("--max-size", type=int, default=1_000)
+    args = parser.parse_args()
+
+    from litellm.caching.in_memory_cache import InMemoryCache
+
+    random.seed(42)
+    workload = build_workload(args.ops, args.keys)
+    auth_lookups = sum(1 for w in workload if w[0] == "auth")
+
+    candidates: List[Tuple[str, Callable[[], object]]] = [
+        ("legacy (heap)", lambda: LegacyInMemoryCache(max_size_in_memory=args.max_size)),
+        ("lru + wheel", lambda: InMemoryCache(max_size_in_memory=args.max_size)),
+    ]
+    for name, factory in candidates:
+        cache = factory()
+        elapsed, hits = run(cache, workload)
+        extra = ""
+        if hasattr(cache, "expiration_heap"):
+            extra = f"heap entries={len(cache.expiration_heap)}"
+        if hasattr(cache, "get_stats"):
+            stats = cache.get_stats()
+            extra = f"evictions={stats['evictions']} bytes={stats['size_in_bytes']}"
+        print(
+            f"{name:<14} {args.ops / elapsed:>12,.0f} ops/s  "
+            f"auth hit ratio={hits / auth_lookups:6.1%}  {extra}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Benchmark JSONL parsing of batch files.
+
+Compares the previous parsers (character-by-character buffer for batch
+uploads, split-into-a-list for batch output files) with the streaming decoder
+in litellm.litellm_core_utils.jsonl_utils. Reports throughput and the peak
+memory allocated while summing usage over a synthetic batch output file.
+
+USAGE:
+    python scripts/benchmark_jsonl_stream.py --size-mb 64
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, Iterable, List
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from litellm.litellm_core_utils.jsonl_utils import iter_jsonl  # noqa: E402
+
+
+def legacy_parse_with_embedded_newlines(content: str) -> List[dict]:
+    """The previous parse_jsonl_with_embedded_newlines."""
+    json_objects = []
+    buffer = ""
+    for char in content:
+        buffer += char
+        if char == "\n":
+            try:
+                json_objects.append(json.loads(buffer.strip()))
+                buffer = ""
+            except json.JSONDecodeError:
+                continue
+    if buffer.strip():
+        json_objects.append(json.loads(buffer.strip()))
+    return json_objects
+
+
+def legacy_file_content_as_dictionary(file_content: bytes) -> List[dict]:
+    """The previous _get_file_content_as_dictionary, minus the debug dump."""
+    return [
+        json.loads(line)
+        for line in file_content.decode("utf-8").strip().split("\n")
+        if line
+    ]
+
+
+def build_batch_output(size_bytes: int) -> bytes:
+    lines = []
+    total = 0
+    i = 0
+    while total < size_bytes:
+        line = json.dumps(
+            {
+                "id": f"batch_req_{i}",
+                "custom_id": f"request-{i}",
+                "response": {
+                    "status_code": 200,
+                    "body": {
+                        "model": "gpt-4o-mini",
+                        "choices": [
+                            {
+                                "index": 0,
+                                "message": {
+                                    "role": "assistant",
+                                    "content": "Line 1\nLine 2\n" * 20,
+                                },
+                            }
+                        ],
+                        "usage": {
+                            "prompt_tokens": 20,
+                            "completion_tokens": 80,
+                            "total_tokens": 100,
+                        },
+                    },
+                },
+            }
+        )
+        lines.append(line)
+        total += len(line) + 1
+        i += 1
+    return "\n".join(lines).encode("utf-8")
+
+
+def total_tokens(records: Iterable[Any]) -> int:
+    return sum(r["response"]["body"]["usage"]["total_tokens"] for r in records)
+
+
+def run(name: str, fn: Callable[[], int], size_bytes: int) -> None:
+    tracemalloc.start()
+    start = time.perf_counter()
+    tokens = fn()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(
+        f"{name:<34} {size_bytes / elapsed / 2**20:8.1f} MB/s  "
+        f"peak +{peak / 2**20:8.1f} MiB  tokens={tokens}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Batch JSONL parsing benchmark")
+    parser.add_argument("--size-mb", type=int, default=64)
+    parser.add_argument(
+        "--legacy-upload-mb",
+        type=int,
+        default=4,
+        help="size for the character-by-character parser, which is slow",
+    )
+    args = parser.parse_args()
+
+    content = build_batch_output(args.size_mb * 2**20)
+    print(f"-- batch output file: {len(content) / 2**20:.1f} MiB")
+    run(
+        "list of dicts (previous)",
+        lambda: total_tokens(legacy_file_content_as_dictionary(content)),
+        len(content),
+    )
+    run("iter_jsonl", lambda: total_tokens(iter_jsonl(content)), len(content))
+
+    upload = build_batch_output(args.legacy_upload_mb * 2**20).decode("utf-8")
+    print(f"-- batch upload parsing: {len(upload) / 2**20:.1f} MiB")
+    run(
+        "char-by-char buffer (previous)",
+        lambda: total_tokens(legacy_parse_with_embedded_newlines(upload)),
+        len(upload),
+    )
+    run("iter_jsonl", lambda: total_tokens(iter_jsonl(upload)), len(upload))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Benchmark the message snapshot taken when a Logging object is created.
+
+Compares copy.deepcopy (previous behaviour) with snapshot_messages on ~1 MB
+prompts: a long chat history, and a short conversation with a base64 image.
+Reports throughput and the extra memory each snapshot allocates.
+
+USAGE:
+    python scripts/benchmark_logging_snapshot.py --prompt-kb 1024 --iterations 200
+"""
+
+import argparse
+import copy
+import os
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, List
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from litellm.litellm_core_utils.core_helpers import snapshot_messages  # noqa: E402
+
+
+def build_long_history(prompt_bytes: int) -> List[dict]:
+    turn = "Tell me more about the previous answer, with examples. " * 20
+    messages: List[dict] = [{"role": "system", "content": "You are helpful."}]
+    while sum(len(m["content"]) for m in messages) < prompt_bytes:
+        messages.append({"role": "user", "content": turn})
+        messages.append(
+            {
+                "role": "assistant",
+                "content": turn,
+                "tool_calls": [
+                    {
+                        "id": f"call_{len(messages)}",
+                        "type": "function",
+                        "function": {"name": "lookup", "arguments": '{"q": "x"}'},
+                    }
+                ],
+            }
+        )
+    return messages
+
+
+def build_image_prompt(prompt_bytes: int) -> List[dict]:
+    image_data = "iVBORw0KGgo" * (prompt_bytes // 11)
+    return [
+        {
+            "role": "user",
+            "content": [
+                {"type": "text", "text": "What is in this image?"},
+                {
+                    "type": "image_url",
+                    "image_url": {"url": "data:image/png;base64," + image_data},
+                },
+            ],
+        }
+    ]
+
+
+def run(name: str, snapshot: Callable[[Any], Any], messages: Any, iterations: int):
+    start = time.perf_counter()
+    for _ in range(iterations):
+        snapshot(messages)
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    kept = snapshot(messages)
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del kept
+
+    print(
+        f"{name:<30} {iterations / elapsed:>10,.0f} snapshots/s  "
+        f"{elapsed / iterations * 1e6:10.1f}us  +{allocated / 1024:9.1f} KiB"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Logging message snapshot benchmark")
+    parser.add_argument("--prompt-kb", type=int, default=1024)
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+
+    prompt_bytes = args.prompt_kb * 1024
+    for label, messages in [
+        ("long history", build_long_history(prompt_bytes)),
+        ("base64 image", build_image_prompt(prompt_bytes)),
+    ]:
+        print(f"-- {label}: {len(messages)} messages")
+        run("copy.deepcopy", copy.deepcopy, messages, args.iterations)
+        run("snapshot_messages", snapshot_messages, messages, args.iterations)
+
+
+if __name__ == "__main__":
+    main()
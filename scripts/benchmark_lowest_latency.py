@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Benchmark latency-based routing with a large model group.
+
+Compares the previous selection path (shuffle the whole latency map, then for
+each entry scan healthy_deployments for the matching deployment, plus a
+token_counter call per request) with the current one (single pass over
+healthy_deployments, EWMA lookups, no tokenization without tpm limits).
+
+Also times success logging, which updates per-deployment stats in place.
+
+USAGE:
+    python scripts/benchmark_lowest_latency.py --deployments 500 --requests 2000
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from typing import Dict, List, Optional
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from litellm import token_counter  # noqa: E402
+from litellm.caching.caching import DualCache  # noqa: E402
+from litellm.router_strategy.lowest_latency import (  # noqa: E402
+    LowestLatencyLoggingHandler,
+    _get_precise_minute,
+)
+
+MODEL_GROUP = "gpt-4o"
+MESSAGES = [{"role": "user", "content": "What's the weather like in Boston today?"}]
+
+
+def legacy_select(
+    healthy_deployments: List[Dict], request_count_dict: Dict
+) -> Optional[Dict]:
+    """The previous _get_available_deployments, minus the debugging map."""
+    precise_minute = _get_precise_minute()
+    all_deployments = request_count_dict
+    for d in healthy_deployments:
+        if d["model_info"]["id"] not in all_deployments:
+            all_deployments[d["model_info"]["id"]] = {
+                "latency": [0],
+                precise_minute: {"tpm": 0, "rpm": 0},
+            }
+    try:
+        input_tokens = token_counter(messages=MESSAGES)
+    except Exception:
+        input_tokens = 0
+    _items = all_deployments.items()
+    all_deployments = dict(random.sample(list(_items), len(_items)))
+    potential_deployments = []
+    for item, item_map in all_deployments.items():
+        _deployment = None
+        for m in healthy_deployments:
+            if item == m["model_info"]["id"]:
+                _deployment = m
+        if _deployment is None:
+            continue
+        item_latency = item_map.get("latency", [])
+        total = sum(v for v in item_latency if isinstance(v, float))
+        latency = total / len(item_latency)
+        item_tpm = item_map.get(precise_minute, {}).get("tpm", 0)
+        if item_tpm + input_tokens > float("inf"):
+            continue
+        potential_deployments.append((_deployment, latency))
+    if not potential_deployments:
+        return None
+    sorted_deployments = sorted(potential_deployments, key=lambda x: x[1])
+    lowest_latency = sorted_deployments[0][1]
+    return random.choice(
+        [x for x in sorted_deployments if x[1] <= lowest_latency]
+    )[0]
+
+
+def build_deployments(num_deployments: int) -> List[Dict]:
+    return [
+        {
+            "model_name": MODEL_GROUP,
+            "litellm_params": {
+                "model": "openai/gpt-4o",
+                "api_base": f"https://deployment-{i}.example.com",
+            },
+            "model_info": {"id": str(i)},
+        }
+        for i in range(num_deployments)
+    ]
+
+
+def timed(name: str, n: int, fn) -> None:
+    start = time.perf_counter()
+    for _ in range(n):
+        fn()
+    elapsed = time.perf_counter() - start
+    print(f"{name:<24} {n / elapsed:>12,.0f} ops/s  {elapsed / n * 1e6:10.1f}us/op")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Latency-based routing benchmark")
+    parser.add_argument("--deployments", type=int, default=500)
+    parser.add_argument("--requests", type=int, default=2_000)
+    args = parser.parse_args()
+
+    random.seed(42)
+    healthy_deployments = build_deployments(args.deployments)
+    handler = LowestLatencyLoggingHandler(router_cache=DualCache())
+
+    deployment_ids = [d["model_info"]["id"] for d in healthy_deployments]
+
+    def log_success():
+        deployment_id = random.choice(deployment_ids)
+        handler.log_success_event(
+            kwargs={
+                "litellm_params": {
+                    "metadata": {"model_group": MODEL_GROUP},
+                    "model_info": {"id": deployment_id},
+                }
+            },
+            response_obj=None,
+            start_time=0.0,
+            end_time=random.uniform(0.1, 2.0),
+        )
+
+    timed("log_success_event", args.requests * 10, log_success)
+
+    legacy_map: Dict = {
+        k: {"latency": [float(v) for v in stats["latency"]]}
+        for k, stats in handler._get_latency_map(f"{MODEL_GROUP}_map").items()
+    }
+    legacy_requests = max(1, args.requests // 20)  # legacy is slow
+    timed(
+        "legacy selection",
+        legacy_requests,
+        lambda: legacy_select(healthy_deployments, legacy_map),
+    )
+    timed(
+        "selection",
+        args.requests,
+        lambda: handler.get_available_deployments(
+            model_group=MODEL_GROUP,
+            healthy_deployments=healthy_deployments,
+            messages=MESSAGES,  # type: ignore
+        ),
+    )
+
+
+if __name__ == "__main__":
+    main()
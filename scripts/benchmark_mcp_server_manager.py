@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""
+Benchmark MCPServerManager tool listing / calling latency
+(litellm/proxy/_experimental/mcp_server/mcp_server_manager.py).
+
+Starts local stand-in MCP servers (a FastMCP script over stdio, and the same
+script over streamable HTTP) and measures the latency of:
+    - list: `_get_tools_from_server`, with a new session per listing (the previous
+      behaviour), with pooled sessions, and with pooled sessions + the tool catalog
+    - call: `_call_regular_mcp_tool`, with a new session per call and with pooled
+      sessions
+and of resolving a tool name to its server among --servers registered servers,
+scanning the registry (the previous behaviour) vs the lookup indexes.
+
+USAGE:
+    python scripts/benchmark_mcp_server_manager.py --iterations 20
+"""
+
+import argparse
+import asyncio
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import textwrap
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from litellm.proxy._experimental.mcp_server import (  # noqa: E402
+    mcp_server_manager as mcp_server_manager_module,
+)
+from litellm.proxy._experimental.mcp_server.mcp_server_manager import (  # noqa: E402
+    MCPServerManager,
+)
+from litellm.proxy._experimental.mcp_server.utils import (  # noqa: E402
+    normalize_server_name,
+    split_server_prefix_from_name,
+)
+from litellm.types.mcp import MCPTransport  # noqa: E402
+from litellm.types.mcp_server.mcp_server_manager import MCPServer  # noqa: E402
+
+SERVER_SCRIPT = textwrap.dedent("""
+    import sys
+
+    from mcp.server.fastmcp import FastMCP
+
+    mcp = FastMCP(
+        "bench",
+        port=int(sys.argv[2]) if len(sys.argv) > 2 else 8000,
+        log_level="WARNING",
+    )
+
+    for i in range(20):
+        def tool(text: str) -> str:
+            return text
+        mcp.tool(name=f"tool_{i}", description=f"stand-in tool {i}")(tool)
+
+    @mcp.tool()
+    def echo(text: str) -> str:
+        return text
+
+    mcp.run(transport=sys.argv[1])
+    """)
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def wait_for_port(port: int, timeout: float = 30.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=0.5).close()
+            return
+        except OSError:
+            time.sleep(0.1)
+    raise RuntimeError(f"stand-in MCP server did not start on port {port}")
+
+
+async def time_per_call(fn, iterations: int) -> float:
+    timings = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        await fn()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+async def bench_server(server: MCPServer, iterations: int) -> dict:
+    results = {}
+    for pooled in (False, True):
+        manager = MCPServerManager()
+        manager.registry = {server.server_id: server}
+        if not pooled:
+            manager.session_pool = None
+
+        async def list_tools():
+            manager.invalidate_tool_catalog()
+            tools = await manager._get_tools_from_server(server)
+            assert tools, "stand-in server listed no tools"
+
+        async def call_tool():
+            await manager._call_regular_mcp_tool(
+                server, "echo", {"text": "hi"}, [], None, None, None, None, None
+            )
+
+        label = "pooled" if pooled else "new session"
+        results[f"list ({label})"] = await time_per_call(list_tools, iterations)
+        results[f"call ({label})"] = await time_per_call(call_tool, iterations)
+        if pooled:
+            await manager._get_tools_from_server(server)
+            results["list (pooled + catalog)"] = await time_per_call(
+                lambda: manager._get_tools_from_server(server), iterations
+            )
+        await manager.close()
+    return results
+
+
+def scan_for_server(manager: MCPServerManager, tool_name: str):
+    """Tool name -> server resolution by scanning the registry, as before."""
+    _, server_name = split_server_prefix_from_name(tool_name)
+    for server in manager.get_registry().values():
+        if normalize_server_name(server.server_name or server.name) == server_name:
+            return server
+    return None
+
+
+def bench_lookups(num_servers: int, iterations: int) -> dict:
+    manager = MCPServerManager()
+    manager.registry = {
+        f"id-{i}": MCPServer(
+            server_id=f"id-{i}",
+            name=f"server_{i}",
+            server_name=f"server_{i}",
+            transport=MCPTransport.http,
+        )
+        for i in range(num_servers)
+    }
+    manager.tool_name_to_mcp_server_name_mapping["create_issue"] = "unmapped"
+    tool_name = f"server_{num_servers - 1}-create_issue"
+    assert manager._get_mcp_server_from_tool_name(tool_name) is not None
+
+    def per_call(fn) -> float:
+        start = time.perf_counter()
+        for _ in range(iterations * 100):
+            fn()
+        return (time.perf_counter() - start) / (iterations * 100)
+
+    return {
+        "scan": per_call(lambda: scan_for_server(manager, tool_name)),
+        "index": per_call(lambda: manager._get_mcp_server_from_tool_name(tool_name)),
+        "index miss": per_call(lambda: manager.get_mcp_server_by_id("stale-id")),
+    }
+
+
+async def main(iterations: int, num_servers: int) -> None:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        script = os.path.join(tmp_dir, "server.py")
+        with open(script, "w") as f:
+            f.write(SERVER_SCRIPT)
+
+        port = free_port()
+        http_server = subprocess.Popen(
+            [sys.executable, script, "streamable-http", str(port)],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        try:
+            wait_for_port(port)
+            servers = {
+                "stdio": MCPServer(
+                    server_id="bench-stdio",
+                    name="bench_stdio",
+                    server_name="bench_stdio",
+                    transport=MCPTransport.stdio,
+                    command=sys.executable,
+                    args=[script, "stdio"],
+                    env={},
+                ),
+                "http": MCPServer(
+                    server_id="bench-http",
+                    name="bench_http",
+                    server_name="bench_http",
+                    transport=MCPTransport.http,
+                    url=f"http://127.0.0.1:{port}/mcp",
+                ),
+            }
+            for transport, server in servers.items():
+                for name, latency in (await bench_server(server, iterations)).items():
+                    print(f"{transport:>6} {name:<26} {latency * 1e3:>9.2f} ms")
+        finally:
+            http_server.terminate()
+            http_server.wait()
+
+    for name, latency in bench_lookups(num_servers, iterations).items():
+        print(
+            f"lookup {f'{name} ({num_servers} servers)':<26} {latency * 1e6:>9.2f} us"
+        )
+
+
+if __name__ == "__main__":
+    # keep the proxy's MCP debug logs out of the results
+    mcp_server_manager_module.verbose_logger.setLevel("WARNING")
+    parser = argparse.ArgumentParser(description="MCP server manager benchmark")
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument("--servers", type=int, default=1000)
+    args = parser.parse_args()
+    asyncio.run(main(args.iterations, args.servers))
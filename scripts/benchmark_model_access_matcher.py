@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Benchmark key / team model access checks over long allow-lists.
+
+Compares the previous wildcard check (build + compile a regex per wildcard
+entry, plus a get_llm_provider call per entry on a miss) with the compiled
+ModelAccessMatcher used by `_check_model_access_helper`.
+
+Allow-lists are shaped like real keys: a mix of exact model names,
+provider wildcards (`bedrock/*`) and prefix wildcards (`openai/gpt-4*`).
+
+USAGE:
+    python scripts/benchmark_model_access_matcher.py --allow-list-size 200 --checks 20000
+"""
+
+import argparse
+import os
+import random
+import re
+import sys
+import time
+from typing import Callable, List
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from litellm.litellm_core_utils.get_llm_provider_logic import (  # noqa: E402
+    get_llm_provider,
+)
+from litellm.proxy.auth.model_access_matcher import (  # noqa: E402
+    get_model_access_matcher,
+)
+
+PROVIDERS = ["openai", "azure", "bedrock", "vertex_ai", "anthropic", "gemini"]
+
+
+def legacy_is_model_allowed_by_pattern(model: str, allowed_model_pattern: str) -> bool:
+    if "*" in allowed_model_pattern:
+        pattern = f"^{allowed_model_pattern.replace('*', '.*')}$"
+        return bool(re.match(pattern, model))
+    return False
+
+
+def legacy_provider_matches(model: str, allowed_model_pattern: str) -> bool:
+    try:
+        model, custom_llm_provider, _, _ = get_llm_provider(model=model)
+    except Exception:
+        return False
+    return legacy_is_model_allowed_by_pattern(
+        f"{custom_llm_provider}/{model}", allowed_model_pattern
+    )
+
+
+def legacy_check(model: str, allowed_models: List[str]) -> bool:
+    """The previous _model_matches_any_wildcard_pattern_in_list + membership check."""
+    if any(
+        "*" in p and legacy_is_model_allowed_by_pattern(model, p)
+        for p in allowed_models
+    ):
+        return True
+    if any("*" in p and legacy_provider_matches(model, p) for p in allowed_models):
+        return True
+    return model in allowed_models
+
+
+def matcher_check(model: str, allowed_models: List[str]) -> bool:
+    matcher = get_model_access_matcher(allowed_models)
+    return matcher.matches_wildcard(model) or model in matcher.exact_models
+
+
+def build_allow_list(size: int) -> List[str]:
+    allowed = []
+    for i in range(size):
+        r = i % 4
+        if r == 0:
+            allowed.append(f"{PROVIDERS[i % len(PROVIDERS)]}/team-{i}-*")
+        elif r == 1:
+            allowed.append(f"openai/ft:gpt-4o:org-{i}:*")
+        else:
+            allowed.append(f"custom-model-{i}")
+    allowed.append("bedrock/us.anthropic.*")
+    return allowed
+
+
+def build_requests(allowed: List[str], checks: int) -> List[str]:
+    candidates = [
+        "bedrock/us.anthropic.claude-3-5-sonnet-20240620-v1:0",  # late wildcard hit
+        "gpt-4o",  # miss -> provider lookup path
+        random.choice([m for m in allowed if "*" not in m]),  # exact hit
+        "openai/ft:gpt-4o:org-1:abc",  # early wildcard hit
+    ]
+    return [random.choice(candidates) for _ in range(checks)]
+
+
+def run(name: str, check: Callable[[str, List[str]], bool], allowed, requests) -> None:
+    allowed_count = 0
+    start = time.perf_counter()
+    for model in requests:
+        allowed_count += check(model, allowed)
+    elapsed = time.perf_counter() - start
+    print(
+        f"{name:<16} {len(requests) / elapsed:>12,.0f} checks/s  "
+        f"{elapsed / len(requests) * 1e6:8.1f}us/check  allowed={allowed_count}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Model access matcher benchmark")
+    parser.add_argument("--allow-list-size", type=int, default=200)
+    parser.add_argument("--checks", type=int, default=20_000)
+    args = parser.parse_args()
+
+    random.seed(42)
+    allowed = build_allow_list(args.allow_list_size)
+    requests = build_requests(allowed, args.checks)
+
+    run("legacy", legacy_check, allowed, requests[: max(1, args.checks // 10)])
+    run("compiled", matcher_check, allowed, requests)
+
+
+if __name__ == "__main__":
+    main()
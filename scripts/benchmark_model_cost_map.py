@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Benchmark `import litellm` and the model cost map loading steps.
+
+Import time is measured in fresh interpreters for:
+    - blocking fetch: the previous behaviour, import waits on the hosted map
+      (LITELLM_MODEL_COST_MAP_BACKGROUND_REFRESH=False)
+    - background refresh: bundled map from the precompiled index, hosted map
+      fetched in a daemon thread (default)
+    - local only: LITELLM_LOCAL_MODEL_COST_MAP=True
+
+and, in-process, json.loads of the bundled map vs loading the precompiled index.
+
+USAGE:
+    python scripts/benchmark_model_cost_map.py --runs 5
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+IMPORT_SNIPPET = (
+    "import time; start = time.perf_counter(); import litellm; "
+    "print(time.perf_counter() - start)"
+)
+
+
+def time_import(env_overrides: dict, runs: int) -> list:
+    env = {**os.environ, **env_overrides}
+    timings = []
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, "-c", IMPORT_SNIPPET],
+            env=env,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+        timings.append(float(output.strip().splitlines()[-1]))
+    return timings
+
+
+def report(name: str, timings: list) -> None:
+    print(
+        f"{name:<34} median={statistics.median(timings) * 1000:8.1f}ms  "
+        f"min={min(timings) * 1000:8.1f}ms"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="model cost map load benchmark")
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    from litellm.litellm_core_utils.model_cost_index import (
+        build_model_cost_index,
+        get_model_cost_map_path,
+        load_model_cost_index,
+    )
+
+    _, _, index_path = build_model_cost_index()
+    print(f"index: {index_path}\n")
+
+    print("import litellm:")
+    modes = [
+        (
+            "blocking fetch (previous)",
+            {"LITELLM_MODEL_COST_MAP_BACKGROUND_REFRESH": "False"},
+        ),
+        ("background refresh", {}),
+        ("local only", {"LITELLM_LOCAL_MODEL_COST_MAP": "True"}),
+    ]
+    for name, env_overrides in modes:
+        report(name, time_import(env_overrides, args.runs))
+
+    print("\nbundled model cost map:")
+    json_timings, index_timings = [], []
+    for _ in range(args.runs * 4):
+        start = time.perf_counter()
+        with open(get_model_cost_map_path(), encoding="utf-8") as f:
+            json.load(f)
+        json_timings.append(time.perf_counter() - start)
+        start = time.perf_counter()
+        load_model_cost_index()
+        index_timings.append(time.perf_counter() - start)
+    report("json.load", json_timings)
+    report("precompiled index", index_timings)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+Benchmark Orizon gateway forwarding modes: streaming vs buffered.
+
+Starts a local mock LiteLLM upstream that emits an SSE completion one chunk at
+a time, then forwards requests through `orizon.proxy.client.forward_request`
+in both modes and compares time-to-first-token (TTFT), total latency and
+relay throughput.
+
+USAGE:
+    python scripts/benchmark_orizon_proxy_streaming.py
+    python scripts/benchmark_orizon_proxy_streaming.py --chunks 500 --delay-ms 5 --requests 50
+
+OUTPUT:
+    Per mode: mean/p50/p99 TTFT, mean total latency and MB/s relayed.
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+from statistics import mean, quantiles
+from typing import Dict, List
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+
+async def _handle_upstream(
+    reader: asyncio.StreamReader,
+    writer: asyncio.StreamWriter,
+    chunks: int,
+    delay: float,
+    chunk_size: int,
+) -> None:
+    """Minimal HTTP/1.1 server emitting a chunked SSE response."""
+    try:
+        while True:
+            # Read request head
+            head = await reader.readuntil(b"\r\n\r\n")
+            content_length = 0
+            chunked = False
+            for line in head.split(b"\r\n"):
+                lower = line.lower()
+                if lower.startswith(b"content-length:"):
+                    content_length = int(line.split(b":", 1)[1])
+                elif lower.startswith(b"transfer-encoding:") and b"chunked" in lower:
+                    chunked = True
+
+            # Drain request body
+            if chunked:
+                while True:
+                    size_line = await reader.readuntil(b"\r\n")
+                    size = int(size_line.strip(), 16)
+                    await reader.readexactly(size + 2)
+                    if size == 0:
+                        break
+            elif content_length:
+                await reader.readexactly(content_length)
+
+            writer.write(
+                b"HTTP/1.1 200 OK\r\n"
+                b"content-type: text/event-stream\r\n"
+                b"transfer-encoding: chunked\r\n\r\n"
+            )
+            payload = b"data: " + b"x" * chunk_size + b"\n\n"
+            frame = b"%x\r\n%s\r\n" % (len(payload), payload)
+            for _ in range(chunks):
+                writer.write(frame)
+                await writer.drain()
+                if delay:
+                    await asyncio.sleep(delay)
+            done = b"data: [DONE]\n\n"
+            writer.write(b"%x\r\n%s\r\n0\r\n\r\n" % (len(done), done))
+            await writer.drain()
+    except (asyncio.IncompleteReadError, ConnectionResetError):
+        pass
+    finally:
+        writer.close()
+
+
+def _make_request(body: bytes):
+    """Build a Starlette request for forward_request()."""
+    from starlette.requests import Request
+
+    sent = False
+
+    async def receive():
+        nonlocal sent
+        if not sent:
+            sent = True
+            return {"type": "http.request", "body": body, "more_body": False}
+        await asyncio.sleep(3600)
+        return {"type": "http.disconnect"}
+
+    scope = {
+        "type": "http",
+        "method": "POST",
+        "path": "/v1/chat/completions",
+        "query_string": b"",
+        "headers": [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(body)).encode()),
+        ],
+    }
+    return Request(scope, receive)
+
+
+async def _run_one(stream_upstream: bool, body: bytes) -> Dict[str, float]:
+    from fastapi.responses import StreamingResponse
+
+    from orizon.proxy.client import forward_request
+
+    start = time.perf_counter()
+    response = await forward_request(
+        _make_request(body),
+        "/v1/chat/completions",
+        "sk-bench-key",
+        stream_upstream=stream_upstream,
+    )
+    assert isinstance(response, StreamingResponse), response
+
+    ttft = None
+    total_bytes = 0
+    async for chunk in response.body_iterator:
+        if ttft is None:
+            ttft = time.perf_counter() - start
+        total_bytes += len(chunk)
+    if response.background is not None:
+        await response.background()
+
+    total = time.perf_counter() - start
+    return {"ttft": ttft or total, "total": total, "bytes": total_bytes}
+
+
+def _summarize(name: str, results: List[Dict[str, float]]) -> None:
+    ttfts = [r["ttft"] * 1000 for r in results]
+    totals = [r["total"] for r in results]
+    total_bytes = sum(r["bytes"] for r in results)
+    p = quantiles(ttfts, n=100) if len(ttfts) > 1 else ttfts * 99
+    print(
+        f"{name:<10} ttft mean={mean(ttfts):8.2f}ms p50={p[49]:8.2f}ms "
+        f"p99={p[98]:8.2f}ms | total mean={mean(totals) * 1000:8.2f}ms | "
+        f"throughput={total_bytes / sum(totals) / 1e6:8.2f} MB/s"
+    )
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--chunks", type=int, default=200)
+    parser.add_argument("--chunk-size", type=int, default=64)
+    parser.add_argument("--delay-ms", type=float, default=2.0)
+    parser.add_argument("--requests", type=int, default=20)
+    parser.add_argument("--body-kb", type=int, default=64)
+    args = parser.parse_args()
+
+    server = await asyncio.start_server(
+        lambda r, w: _handle_upstream(
+            r, w, args.chunks, args.delay_ms / 1000, args.chunk_size
+        ),
+        "127.0.0.1",
+        0,
+    )
+    port = server.sockets[0].getsockname()[1]
+
+    import orizon.proxy.client as client
+
+    client.LITELLM_BASE_URL = f"http://127.0.0.1:{port}"
+    body = b'{"messages": "' + b"a" * (args.body_kb * 1024) + b'"}'
+
+    async with server:
+        for name, stream_upstream in (("buffered", False), ("streaming", True)):
+            # Warm up the connection pool
+            await _run_one(stream_upstream, body)
+            results = [
+                await _run_one(stream_upstream, body) for _ in range(args.requests)
+            ]
+            _summarize(name, results)
+        await client.close_http_client()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
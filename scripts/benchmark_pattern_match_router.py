@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Benchmark wildcard routing in PatternMatchRouter.
+
+Compares the previous per-request behaviour (re-sort all patterns by
+specificity, then re.match each in turn) with the compiled router (patterns
+kept sorted on add, one combined regex pass, LRU of resolved model names).
+
+Requests are a mix of names matching early, late and no pattern at all, the
+last being the worst case for a sequential scan.
+
+USAGE:
+    python scripts/benchmark_pattern_match_router.py --patterns 1000 --requests 20000
+"""
+
+import argparse
+import os
+import random
+import re
+import sys
+import time
+from typing import Callable, Dict, List, Optional
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from litellm.router_utils.pattern_match_deployments import (  # noqa: E402
+    PatternMatchRouter,
+    PatternUtils,
+)
+
+
+def legacy_route(router: PatternMatchRouter, request: str) -> Optional[List[Dict]]:
+    """The previous route(): sort on every call, then a sequential re.match scan."""
+    for pattern, llm_deployments in PatternUtils.sorted_patterns(router.patterns):
+        pattern_match = re.match(pattern, request)
+        if pattern_match:
+            return router._return_pattern_matched_deployments(
+                matched_pattern=pattern_match, deployments=llm_deployments
+            )
+    return None
+
+
+def build_router(num_patterns: int) -> PatternMatchRouter:
+    router = PatternMatchRouter()
+    for i in range(num_patterns):
+        pattern = f"provider-{i}/*" if i % 2 else f"team-{i}/model-*-v*"
+        router.add_pattern(
+            pattern,
+            {
+                "model_name": pattern,
+                "litellm_params": {"model": f"openai/{pattern}"},
+                "model_info": {"id": str(i)},
+            },
+        )
+    return router
+
+
+def build_requests(num_patterns: int, num_requests: int, distinct: int) -> List[str]:
+    names = []
+    for _ in range(distinct):
+        i = random.randrange(num_patterns)
+        r = random.random()
+        if r < 0.7:
+            names.append(
+                f"provider-{i | 1}/gpt-{i}" if i % 2 else f"team-{i}/model-x-v{i}"
+            )
+        else:
+            names.append(f"unknown-{i}/model")  # no match - full scan
+    return [random.choice(names) for _ in range(num_requests)]
+
+
+def run(name: str, route: Callable[[str], object], requests: List[str]) -> None:
+    matched = 0
+    start = time.perf_counter()
+    for request in requests:
+        if route(request) is not None:
+            matched += 1
+    elapsed = time.perf_counter() - start
+    print(
+        f"{name:<22} {len(requests) / elapsed:>12,.0f} routes/s  "
+        f"{elapsed / len(requests) * 1e6:8.1f}us/route  matched={matched}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="PatternMatchRouter benchmark")
+    parser.add_argument("--patterns", type=int, default=1000)
+    parser.add_argument("--requests", type=int, default=20_000)
+    parser.add_argument("--distinct", type=int, default=500)
+    args = parser.parse_args()
+
+    random.seed(42)
+    router = build_router(args.patterns)
+    requests = build_requests(args.patterns, args.requests, args.distinct)
+    legacy_requests = requests[: max(1, args.requests // 20)]  # legacy is slow
+
+    run("legacy (sort + scan)", lambda r: legacy_route(router, r), legacy_requests)
+
+    def uncached(request: str):
+        router._resolved_cache.clear()
+        return router.route(request)
+
+    run("compiled (no LRU)", uncached, requests)
+    run("compiled + LRU", router.route, requests)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Benchmark the chunk + embed stages of RAG ingestion on a 500-page document.
+
+The embedding provider is simulated: each request costs a fixed round trip
+plus a per-input cost. Compares the previous single aembedding(input=all
+chunks) call with batched, concurrent embedding, and a re-ingestion where
+only a few pages changed (served from the embedding cache).
+
+Pass --trace-memory to also report peak allocations (slows every run down).
+
+USAGE:
+    python scripts/benchmark_rag_ingestion.py --pages 500 --batch-size 100
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+import tracemalloc
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import litellm  # noqa: E402
+from litellm.rag.ingestion.base_ingestion import BaseRAGIngestion  # noqa: E402
+
+PAGE = (
+    "Section {page}. The quarterly report describes revenue, costs and "
+    "forecasts for each region. " * 6
+    + "\n\n"
+) * 5
+
+
+class SimulatedEmbeddingProvider:
+    def __init__(self, round_trip: float, per_input: float):
+        self.round_trip = round_trip
+        self.per_input = per_input
+        self.requests = 0
+        self.inputs = 0
+
+    async def __call__(self, model, input):
+        self.requests += 1
+        self.inputs += len(input)
+        await asyncio.sleep(self.round_trip + self.per_input * len(input))
+        return litellm.EmbeddingResponse(
+            data=[{"embedding": [0.0] * 1536, "index": i} for i in range(len(input))]
+        )
+
+
+class _Ingestion(BaseRAGIngestion):
+    async def store(self, file_content, filename, content_type, chunks, embeddings):
+        return "vs_benchmark", None
+
+
+class _BatchedStoreIngestion(_Ingestion):
+    async def store_embeddings(self, chunks, embeddings):
+        pass
+
+
+async def legacy_embed(chunks):
+    response = await litellm.aembedding(model="text-embedding-3-small", input=chunks)
+    return [item["embedding"] for item in response.data]
+
+
+def build_document(pages: int, changed_pages: int = 0) -> bytes:
+    return "".join(
+        PAGE.format(page=f"{page}-v2" if page < changed_pages else page)
+        for page in range(pages)
+    ).encode("utf-8")
+
+
+async def run(name: str, provider, coro_fn, trace_memory: bool) -> None:
+    with patch.object(litellm, "aembedding", new=provider):
+        if trace_memory:
+            tracemalloc.start()
+        start = time.perf_counter()
+        await coro_fn()
+        elapsed = time.perf_counter() - start
+        memory = ""
+        if trace_memory:
+            memory = f"  peak +{tracemalloc.get_traced_memory()[1] / 2**20:7.1f} MiB"
+            tracemalloc.stop()
+    print(
+        f"{name:<36} {elapsed:7.2f}s  requests={provider.requests:<5} "
+        f"inputs={provider.inputs:<6}{memory}"
+    )
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="RAG ingestion benchmark")
+    parser.add_argument("--pages", type=int, default=500)
+    parser.add_argument("--batch-size", type=int, default=100)
+    parser.add_argument("--max-concurrency", type=int, default=4)
+    parser.add_argument("--round-trip", type=float, default=0.05)
+    parser.add_argument("--per-input", type=float, default=0.0005)
+    parser.add_argument("--trace-memory", action="store_true")
+    args = parser.parse_args()
+
+    options = {
+        "embedding": {
+            "model": "text-embedding-3-small",
+            "batch_size": args.batch_size,
+            "max_concurrency": args.max_concurrency,
+        },
+        "vector_store": {"custom_llm_provider": "benchmark"},
+    }
+    document = build_document(args.pages)
+    chunks = _Ingestion(ingest_options=options).chunk(None, document, False)
+    print(
+        f"-- {args.pages} pages, {len(document) / 2**20:.1f} MiB, "
+        f"{len(chunks)} chunks"
+    )
+
+    def provider():
+        return SimulatedEmbeddingProvider(args.round_trip, args.per_input)
+
+    trace_memory = args.trace_memory
+    await run(
+        "single aembedding call (previous)",
+        provider(),
+        lambda: legacy_embed(chunks),
+        trace_memory,
+    )
+    await run(
+        "batched embed()",
+        provider(),
+        lambda: _Ingestion(ingest_options=options).embed(chunks),
+        trace_memory,
+    )
+    changed_document = build_document(args.pages, changed_pages=10)
+    await run(
+        "re-ingest, 10 pages changed",
+        provider(),
+        lambda: _Ingestion(ingest_options=options).embed(
+            _Ingestion(ingest_options=options).chunk(None, changed_document, False)
+        ),
+        trace_memory,
+    )
+
+    # fresh cache for the streaming run
+    from litellm.rag.ingestion.base_ingestion import _embedding_cache
+
+    _embedding_cache.flush_cache()
+    await run(
+        "ingest() with store_embeddings",
+        provider(),
+        lambda: _BatchedStoreIngestion(ingest_options=options).ingest(
+            file_data=("report.txt", document, "text/plain")
+        ),
+        trace_memory,
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Benchmark RedisCache value codecs on the payloads litellm actually caches.
+
+Payloads:
+    - completion: the dict Cache._add_cache_logic writes for a ModelResponse
+      ({"timestamp": ..., "response": model_dump_json()})
+    - embedding: one cached embedding item ({"timestamp": ..., "response": {...}})
+      as written by Cache.add_embedding_response_to_cache
+
+Compares the previous path (json.dumps on write, decode + json.loads on read)
+with each RedisCacheCodec configuration: encode/decode time and stored size.
+
+USAGE:
+    python scripts/benchmark_redis_codec.py --iterations 2000 --dimensions 1536
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import litellm  # noqa: E402
+from litellm.caching.caching import Cache  # noqa: E402
+from litellm.caching.redis_codec import RedisCacheCodec  # noqa: E402
+
+
+def completion_payload(cache: Cache, words: int) -> dict:
+    rng = random.Random(0)
+    content = " ".join(
+        rng.choice(["cache", "redis", "token", "model", "latency"])
+        for _ in range(words)
+    )
+    response = litellm.ModelResponse(
+        model="gpt-4o",
+        choices=[{"message": {"role": "assistant", "content": content}}],
+        usage={
+            "prompt_tokens": 120,
+            "completion_tokens": words,
+            "total_tokens": 120 + words,
+        },
+    )
+    _, cached_data, _ = cache._add_cache_logic(
+        result=response,
+        model="gpt-4o",
+        messages=[{"role": "user", "content": "hello"}],
+    )
+    return cached_data
+
+
+def embedding_payload(cache: Cache, dimensions: int) -> dict:
+    rng = random.Random(0)
+    response = litellm.EmbeddingResponse(
+        model="text-embedding-3-small",
+        data=[
+            {
+                "object": "embedding",
+                "index": 0,
+                "embedding": [rng.uniform(-1, 1) for _ in range(dimensions)],
+            }
+        ],
+    )
+    _, cached_data, _ = cache.add_embedding_response_to_cache(
+        result=response,
+        input="hello",
+        kwargs={"model": "text-embedding-3-small"},
+    )
+    return cached_data
+
+
+def bench(name: str, encode, decode, value, iterations: int) -> None:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        encoded = encode(value)
+    encode_us = (time.perf_counter() - start) / iterations * 1e6
+    start = time.perf_counter()
+    for _ in range(iterations):
+        decoded = decode(encoded)
+    decode_us = (time.perf_counter() - start) / iterations * 1e6
+    assert decoded == value
+    print(
+        f"  {name:<28} encode={encode_us:8.1f}us  decode={decode_us:8.1f}us  "
+        f"size={len(encoded):>8} bytes"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Redis cache codec benchmark")
+    parser.add_argument("--iterations", type=int, default=2000)
+    parser.add_argument("--dimensions", type=int, default=1536)
+    parser.add_argument("--completion-words", type=int, default=800)
+    parser.add_argument("--compression-min-bytes", type=int, default=4096)
+    args = parser.parse_args()
+
+    codecs = [
+        ("json", None),
+        ("msgpack", None),
+        ("json", "zstd"),
+        ("msgpack", "zstd"),
+    ]
+    cache = Cache(type="local")
+    payloads = {
+        "completion": completion_payload(cache, args.completion_words),
+        "embedding": embedding_payload(cache, args.dimensions),
+    }
+    for payload_name, value in payloads.items():
+        print(f"{payload_name}:")
+        bench(
+            "previous (json.dumps)",
+            lambda v: json.dumps(v).encode("utf-8"),
+            lambda raw: json.loads(raw.decode("utf-8")),
+            value,
+            args.iterations,
+        )
+        for serializer, compression in codecs:
+            try:
+                codec = RedisCacheCodec(
+                    serializer=serializer,
+                    compression=compression,
+                    compression_min_bytes=args.compression_min_bytes,
+                )
+            except ImportError as e:
+                print(f"  {serializer}+{compression}: skipped ({e})")
+                continue
+            bench(
+                f"{serializer}" + (f"+{compression}" if compression else ""),
+                codec.encode,
+                codec.decode,
+                value,
+                args.iterations,
+            )
+
+
+if __name__ == "__main__":
+    main()
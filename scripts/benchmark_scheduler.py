@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Load test for the request prioritization Scheduler.
+
+Queues N requests behind a blocked head of queue (no healthy deployments), then
+releases the head and measures how long the queue takes to drain, plus per-
+priority wait times.
+
+Compares the previous polling loop (every waiter sleeps `polling_interval`,
+then re-reads and re-heapifies the whole queue) with `Scheduler.wait_for_turn`,
+where waiters await a future and are woken in priority order.
+
+USAGE:
+    python scripts/benchmark_scheduler.py --requests 10000 --legacy-requests 1000
+"""
+
+import argparse
+import asyncio
+import heapq
+import os
+import sys
+import time
+from typing import Dict, List
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from litellm.scheduler import FlowItem, Scheduler  # noqa: E402
+
+MODEL = "gpt-4o"
+PRIORITIES = 4
+
+
+class LegacyPollingScheduler:
+    """The previous scheduler: a heapified list per model, polled by every waiter."""
+
+    def __init__(self, polling_interval: float):
+        self.polling_interval = polling_interval
+        self.queues: Dict[str, list] = {}
+
+    async def add_request(self, request: FlowItem) -> None:
+        queue = self.queues.setdefault(request.model_name, [])
+        heapq.heappush(queue, (request.priority, request.request_id))
+
+    async def poll(self, id: str, model_name: str, health_deployments: list) -> bool:
+        queue = list(self.queues[model_name])  # queue was read back from the cache
+        heapq.heapify(queue)
+        if len(health_deployments) == 0:
+            if queue[0][1] == id:
+                heapq.heappop(queue)
+                self.queues[model_name] = queue
+                return True
+            return False
+        return True
+
+    async def wait_for_turn(self, request: FlowItem, timeout: float) -> bool:
+        await self.add_request(request)
+        end_time = time.monotonic() + timeout
+        while time.monotonic() < end_time:
+            if await self.poll(request.request_id, request.model_name, []):
+                return True
+            await asyncio.sleep(self.polling_interval)
+        return False
+
+
+async def _no_healthy_deployments() -> list:
+    return []
+
+
+def _report(name: str, elapsed: float, waits: Dict[int, List[float]]) -> None:
+    total = sum(len(w) for w in waits.values())
+    print(f"{name:<12} drained {total:>6} requests in {elapsed:8.3f}s")
+    for priority, priority_waits in sorted(waits.items()):
+        priority_waits.sort()
+        p50 = priority_waits[len(priority_waits) // 2]
+        p99 = priority_waits[int(len(priority_waits) * 0.99) - 1]
+        print(
+            f"{'':<12} priority={priority} p50={p50 * 1000:8.1f}ms "
+            f"p99={p99 * 1000:8.1f}ms"
+        )
+
+
+async def run_legacy(num_requests: int, polling_interval: float) -> None:
+    scheduler = LegacyPollingScheduler(polling_interval=polling_interval)
+    await scheduler.add_request(
+        FlowItem(priority=0, request_id="head", model_name=MODEL)
+    )
+    waits: Dict[int, List[float]] = {p: [] for p in range(1, PRIORITIES + 1)}
+
+    async def _request(i: int) -> None:
+        item = FlowItem(
+            priority=1 + i % PRIORITIES, request_id=str(i), model_name=MODEL
+        )
+        await scheduler.wait_for_turn(item, timeout=600)
+        waits[item.priority].append(time.perf_counter() - released_at)
+
+    tasks = [asyncio.create_task(_request(i)) for i in range(num_requests)]
+    await asyncio.sleep(polling_interval * 2)
+    released_at = time.perf_counter()
+    await scheduler.poll(id="head", model_name=MODEL, health_deployments=[])
+    await asyncio.gather(*tasks)
+    _report("legacy", time.perf_counter() - released_at, waits)
+
+
+async def run_event_driven(num_requests: int, polling_interval: float) -> None:
+    scheduler = Scheduler(polling_interval=polling_interval)
+    await scheduler.add_request(
+        FlowItem(priority=0, request_id="head", model_name=MODEL)
+    )
+    waits: Dict[int, List[float]] = {p: [] for p in range(1, PRIORITIES + 1)}
+
+    async def _request(i: int) -> None:
+        item = FlowItem(
+            priority=1 + i % PRIORITIES, request_id=str(i), model_name=MODEL
+        )
+        await scheduler.wait_for_turn(
+            request=item,
+            get_healthy_deployments=_no_healthy_deployments,
+            timeout=600,
+        )
+        waits[item.priority].append(time.perf_counter() - released_at)
+
+    tasks = [asyncio.create_task(_request(i)) for i in range(num_requests)]
+    await asyncio.sleep(polling_interval * 2)
+    released_at = time.perf_counter()
+    await scheduler.poll(id="head", model_name=MODEL, health_deployments=[])
+    await asyncio.gather(*tasks)
+    _report("event-driven", time.perf_counter() - released_at, waits)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Scheduler load test")
+    parser.add_argument("--requests", type=int, default=10_000)
+    parser.add_argument("--legacy-requests", type=int, default=1_000)
+    parser.add_argument("--polling-interval", type=float, default=0.03)
+    args = parser.parse_args()
+
+    asyncio.run(run_legacy(args.legacy_requests, args.polling_interval))
+    asyncio.run(run_event_driven(args.legacy_requests, args.polling_interval))
+    asyncio.run(run_event_driven(args.requests, args.polling_interval))
+
+
+if __name__ == "__main__":
+    main()
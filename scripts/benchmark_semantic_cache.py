@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+Benchmark the in-process semantic tier in front of RedisSemanticCache.
+
+The embedding provider and the Redis vector index are simulated, each round
+trip costs a fixed latency. Prompts are paraphrases of a fixed set of topics
+requested with a skewed (zipf-like) distribution; a miss stores the answer for
+its topic. Compares the remote-only lookup path (local tier disabled) with the
+local tier, and reports recall: how often the local tier returns the same
+answer as the remote-only path.
+
+USAGE:
+    python scripts/benchmark_semantic_cache.py --queries 2000 --topics 200
+"""
+
+import argparse
+import asyncio
+import math
+import os
+import random
+import statistics
+import sys
+import time
+from unittest.mock import MagicMock, patch
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import litellm  # noqa: E402
+from litellm.caching.local_semantic_index import LocalSemanticIndex  # noqa: E402
+
+
+def _unit(vector):
+    norm = math.sqrt(sum(x * x for x in vector))
+    return [x / norm for x in vector]
+
+
+class SimulatedRedisVectorIndex:
+    """Stands in for redisvl's SemanticCache: brute-force cosine search."""
+
+    def __init__(self, round_trip: float, distance_threshold: float):
+        self.round_trip = round_trip
+        self.distance_threshold = distance_threshold
+        self.entries = []
+        self.requests = 0
+
+    async def astore(self, prompt, response, vector, ttl=None):
+        self.requests += 1
+        await asyncio.sleep(self.round_trip)
+        self.entries.append((_unit(vector), prompt, response))
+
+    async def acheck(self, prompt, vector):
+        self.requests += 1
+        await asyncio.sleep(self.round_trip)
+        query = _unit(vector)
+        best = None
+        for entry_vector, entry_prompt, response in self.entries:
+            distance = 1 - sum(a * b for a, b in zip(entry_vector, query))
+            if distance <= self.distance_threshold and (
+                best is None or distance < best["vector_distance"]
+            ):
+                best = {
+                    "prompt": entry_prompt,
+                    "response": response,
+                    "vector_distance": distance,
+                }
+        return [best] if best is not None else []
+
+
+class SimulatedEmbeddingProvider:
+    def __init__(self, vectors: dict, round_trip: float):
+        self.vectors = vectors
+        self.round_trip = round_trip
+        self.requests = 0
+
+    async def __call__(self, model, input, **kwargs):
+        self.requests += 1
+        await asyncio.sleep(self.round_trip)
+        return {"data": [{"embedding": self.vectors[input]}]}
+
+
+def build_workload(args):
+    rng = random.Random(0)
+    vectors = {}
+    prompts_by_topic = []
+    for topic in range(args.topics):
+        center = [rng.gauss(0, 1) for _ in range(args.dimensions)]
+        prompts = []
+        for paraphrase in range(args.paraphrases):
+            prompt = f"topic {topic} paraphrase {paraphrase}"
+            vectors[prompt] = _unit(
+                [x + rng.gauss(0, args.noise) for x in _unit(center)]
+            )
+            prompts.append(prompt)
+        prompts_by_topic.append(prompts)
+    weights = [1 / (rank + 1) for rank in range(args.topics)]
+    queries = []
+    for _ in range(args.queries):
+        topic = rng.choices(range(args.topics), weights=weights)[0]
+        queries.append((topic, rng.choice(prompts_by_topic[topic])))
+    return vectors, queries
+
+
+def make_cache(args, local_tier: bool):
+    # redisvl is replaced by SimulatedRedisVectorIndex below
+    sys.modules.setdefault("redisvl.extensions.llmcache", MagicMock())
+    sys.modules.setdefault("redisvl.utils.vectorize", MagicMock())
+    from litellm.caching.redis_semantic_cache import RedisSemanticCache
+
+    cache = RedisSemanticCache(
+        redis_url="redis://localhost:6379",
+        similarity_threshold=args.similarity_threshold,
+        local_index_size=args.local_index_size,
+    )
+    if not local_tier:
+        cache.local_index = LocalSemanticIndex(
+            similarity_threshold=args.similarity_threshold,
+            max_size=0,
+            embedding_memo_size=0,
+        )
+    cache.llmcache = SimulatedRedisVectorIndex(
+        args.round_trip, cache.distance_threshold
+    )
+    return cache
+
+
+async def run(name, args, vectors, queries, local_tier):
+    cache = make_cache(args, local_tier)
+    provider = SimulatedEmbeddingProvider(vectors, args.round_trip)
+    answers = []
+    latencies = []
+    proxy_server = MagicMock(llm_router=None, llm_model_list=None)
+    with patch.object(litellm, "aembedding", new=provider), patch.dict(
+        "sys.modules", {"litellm.proxy.proxy_server": proxy_server}
+    ):
+        start = time.perf_counter()
+        for topic, prompt in queries:
+            messages = [{"role": "user", "content": prompt}]
+            lookup_start = time.perf_counter()
+            answer = await cache.async_get_cache(key="", messages=messages)
+            latencies.append(time.perf_counter() - lookup_start)
+            if answer is None:
+                await cache.async_set_cache(
+                    key="", value=f'"answer {topic}"', messages=messages
+                )
+            answers.append(answer)
+        elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    p50 = statistics.median(latencies) * 1e3
+    p99 = latencies[int(len(latencies) * 0.99)] * 1e3
+    hits = sum(answer is not None for answer in answers)
+    print(
+        f"{name:<24} {elapsed:6.2f}s  lookup p50={p50:6.2f}ms "
+        f"p99={p99:6.2f}ms  hits={hits:<5} "
+        f"embedding calls={provider.requests:<5} redis calls={cache.llmcache.requests}"
+    )
+    return answers
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="Semantic cache local tier benchmark")
+    parser.add_argument("--queries", type=int, default=2000)
+    parser.add_argument("--topics", type=int, default=200)
+    parser.add_argument("--paraphrases", type=int, default=5)
+    parser.add_argument("--dimensions", type=int, default=256)
+    parser.add_argument("--noise", type=float, default=0.015)
+    parser.add_argument("--similarity-threshold", type=float, default=0.9)
+    parser.add_argument("--local-index-size", type=int, default=1024)
+    parser.add_argument("--round-trip", type=float, default=0.002)
+    args = parser.parse_args()
+
+    vectors, queries = build_workload(args)
+    print(
+        f"-- {args.queries} queries over {args.topics} topics x "
+        f"{args.paraphrases} paraphrases, {args.dimensions} dims"
+    )
+    remote = await run("remote only (previous)", args, vectors, queries, False)
+    local = await run("local tier", args, vectors, queries, True)
+    agree = sum(a == b for a, b in zip(remote, local))
+    local_hits = [b for a, b in zip(remote, local) if b is not None]
+    correct = sum(a == b for a, b in zip(remote, local) if b is not None)
+    print(
+        f"recall vs remote only: {agree / len(queries):.3f} of lookups agree, "
+        f"{correct}/{len(local_hits)} local-tier hits return the remote answer"
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
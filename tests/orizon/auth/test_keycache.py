@@ -0,0 +1,205 @@
+"""Tests for orizon.auth.keycache module."""
+
+import asyncio
+import json
+
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from orizon.auth.keycache import UserKeyCache
+from orizon.auth.utils import generate_user_id
+
+
+@pytest.fixture
+def mock_redis():
+    """Patch the shared Redis client with an in-memory fake."""
+    store = {}
+    client = AsyncMock()
+    client.get.side_effect = lambda key: store.get(key)
+    client.set.side_effect = lambda key, value, ex=None: store.__setitem__(key, value)
+    client.delete.side_effect = lambda key: store.pop(key, None)
+
+    with patch(
+        "orizon.auth.keycache.get_redis", new_callable=AsyncMock, return_value=client
+    ):
+        yield store
+
+
+class TestUserKeyCache:
+    """Tests for UserKeyCache."""
+
+    @pytest.mark.asyncio
+    async def test_caches_provisioned_key(self, mock_redis):
+        """Should call LiteLLM only once for repeated lookups."""
+        cache = UserKeyCache()
+        user_data = {"user_id": "orizon-abc123"}
+
+        with patch(
+            "orizon.auth.keycache.get_or_create_user_key",
+            new_callable=AsyncMock,
+            return_value=(user_data, "sk-key-1"),
+        ) as mock_provision:
+            first = await cache.get_or_create("User@Example.com")
+            second = await cache.get_or_create("user@example.com")
+
+        assert first == second == (user_data, "sk-key-1")
+        mock_provision.assert_awaited_once_with("user@example.com")
+
+    @pytest.mark.asyncio
+    async def test_single_flight_for_concurrent_misses(self, mock_redis):
+        """Should share one provisioning call across concurrent misses."""
+        cache = UserKeyCache()
+        release = asyncio.Event()
+
+        async def slow_provision(email):
+            await release.wait()
+            return {"user_id": "u"}, "sk-shared"
+
+        with patch(
+            "orizon.auth.keycache.get_or_create_user_key",
+            side_effect=slow_provision,
+        ) as mock_provision:
+            tasks = [
+                asyncio.create_task(cache.get_or_create("same@example.com"))
+                for _ in range(10)
+            ]
+            await asyncio.sleep(0)
+            release.set()
+            results = await asyncio.gather(*tasks)
+
+        assert all(r[1] == "sk-shared" for r in results)
+        assert mock_provision.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_does_not_cache_failures(self, mock_redis):
+        """Should retry provisioning when no key was returned."""
+        cache = UserKeyCache()
+
+        with patch(
+            "orizon.auth.keycache.get_or_create_user_key",
+            new_callable=AsyncMock,
+            return_value=(None, None),
+        ) as mock_provision:
+            await cache.get_or_create("fail@example.com")
+            await cache.get_or_create("fail@example.com")
+
+        assert mock_provision.await_count == 2
+        assert len(cache) == 0
+
+    @pytest.mark.asyncio
+    async def test_reads_key_shared_by_other_replica(self, mock_redis):
+        """Should use a key another replica stored in Redis."""
+        email = "shared@example.com"
+        mock_redis[f"orizon:userkey:{generate_user_id(email)}"] = json.dumps(
+            {"user_data": {"user_id": "u"}, "virtual_key": "sk-from-redis"}
+        )
+        cache = UserKeyCache()
+
+        with patch(
+            "orizon.auth.keycache.get_or_create_user_key", new_callable=AsyncMock
+        ) as mock_provision:
+            _, key = await cache.get_or_create(email)
+
+        assert key == "sk-from-redis"
+        mock_provision.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_writes_provisioned_key_to_redis(self, mock_redis):
+        """Should share newly provisioned keys through Redis."""
+        email = "new@example.com"
+        cache = UserKeyCache()
+
+        with patch(
+            "orizon.auth.keycache.get_or_create_user_key",
+            new_callable=AsyncMock,
+            return_value=({"user_id": "u"}, "sk-new"),
+        ):
+            await cache.get_or_create(email)
+
+        stored = json.loads(mock_redis[f"orizon:userkey:{generate_user_id(email)}"])
+        assert stored["virtual_key"] == "sk-new"
+
+    @pytest.mark.asyncio
+    async def test_invalidate_forces_reprovisioning(self, mock_redis):
+        """Should drop local and Redis entries on invalidation."""
+        cache = UserKeyCache()
+
+        with patch(
+            "orizon.auth.keycache.get_or_create_user_key",
+            new_callable=AsyncMock,
+            side_effect=[({"user_id": "u"}, "sk-old"), ({"user_id": "u"}, "sk-new")],
+        ):
+            await cache.get_or_create("rotate@example.com")
+            await cache.invalidate("rotate@example.com")
+            _, key = await cache.get_or_create("rotate@example.com")
+
+        assert key == "sk-new"
+
+    @pytest.mark.asyncio
+    async def test_invalidate_user_id_forces_reprovisioning(self, mock_redis):
+        """Should drop local and Redis entries for a LiteLLM user id."""
+        email = "Revoke@example.com"
+        cache = UserKeyCache()
+
+        with patch(
+            "orizon.auth.keycache.get_or_create_user_key",
+            new_callable=AsyncMock,
+            side_effect=[({"user_id": "u"}, "sk-old"), ({"user_id": "u"}, "sk-new")],
+        ):
+            await cache.get_or_create(email)
+            await cache.invalidate_user_id(generate_user_id(email))
+            assert cache.get_local(email) is None
+            assert mock_redis == {}
+            _, key = await cache.get_or_create(email)
+
+        assert key == "sk-new"
+
+    def test_evicts_least_recently_used(self):
+        """Should evict the least recently used entry when full."""
+        cache = UserKeyCache(max_size=2)
+        cache.set_local("a@example.com", (None, "sk-a"))
+        cache.set_local("b@example.com", (None, "sk-b"))
+        cache.get_local("a@example.com")
+        cache.set_local("c@example.com", (None, "sk-c"))
+
+        assert cache.get_local("a@example.com") is not None
+        assert cache.get_local("b@example.com") is None
+        assert cache.get_local("c@example.com") is not None
+
+    def test_expires_entries_after_ttl(self):
+        """Should treat entries past their TTL as misses."""
+        cache = UserKeyCache(ttl=10)
+
+        with patch("orizon.auth.keycache.time.monotonic", return_value=100.0):
+            cache.set_local("ttl@example.com", (None, "sk-ttl"))
+        with patch("orizon.auth.keycache.time.monotonic", return_value=111.0):
+            assert cache.get_local("ttl@example.com") is None
+
+
+class TestKeyManagementInvalidation:
+    """Tests for invalidation from LiteLLM's key management endpoints."""
+
+    @pytest.mark.asyncio
+    async def test_revoked_key_is_not_injected_again(self, mock_redis):
+        """Should stop serving a deleted/blocked key on the next request."""
+        from litellm.proxy.management_endpoints.key_management_endpoints import (
+            _invalidate_orizon_user_key_cache,
+        )
+        from orizon.auth.keycache import get_cached_user_key, user_key_cache
+
+        email = "revoked@example.com"
+        user_key_cache.clear()
+
+        with patch(
+            "orizon.auth.keycache.get_or_create_user_key",
+            new_callable=AsyncMock,
+            side_effect=[
+                ({"user_id": "u"}, "sk-revoked"),
+                ({"user_id": "u"}, "sk-new"),
+            ],
+        ):
+            assert (await get_cached_user_key(email))[1] == "sk-revoked"
+            await _invalidate_orizon_user_key_cache([generate_user_id(email), None])
+            assert (await get_cached_user_key(email))[1] == "sk-new"
+
+        user_key_cache.clear()
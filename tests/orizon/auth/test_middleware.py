@@ -80,7 +80,7 @@ class TestOrizonAuthMiddleware:
             "orizon.auth.middleware.get_user_email"
         ) as mock_email:
             with patch(
-                "orizon.auth.middleware.get_or_create_user_key",
+                "orizon.auth.middleware.get_cached_user_key",
                 new_callable=AsyncMock
             ) as mock_provision:
                 mock_email.return_value = "internal@company.com"
@@ -102,7 +102,7 @@ class TestOrizonAuthMiddleware:
             "orizon.auth.middleware.get_user_email"
         ) as mock_email:
             with patch(
-                "orizon.auth.middleware.get_or_create_user_key",
+                "orizon.auth.middleware.get_cached_user_key",
                 new_callable=AsyncMock
             ) as mock_provision:
                 mock_email.return_value = "failing@company.com"
@@ -124,7 +124,7 @@ class TestOrizonAuthMiddleware:
             "orizon.auth.middleware.get_user_email"
         ) as mock_email:
             with patch(
-                "orizon.auth.middleware.get_or_create_user_key",
+                "orizon.auth.middleware.get_cached_user_key",
                 new_callable=AsyncMock
             ) as mock_provision:
                 mock_email.return_value = "nokey@company.com"
@@ -0,0 +1,172 @@
+"""Tests for orizon.auth.ratelimit module."""
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+from fastapi import HTTPException, Request
+
+from orizon.auth import ratelimit
+from orizon.auth.ratelimit import (
+    SLIDING_WINDOW_SCRIPT,
+    check_rate_limit,
+    clear_local_blocks,
+    flush_rate_limit_metrics,
+    rate_limit,
+    stop_rate_limit_metrics_flush,
+)
+
+
+@pytest.fixture(autouse=True)
+def reset_state():
+    """Clear in-process limiter state between tests."""
+    clear_local_blocks()
+    ratelimit._pending_hits.clear()
+    yield
+    clear_local_blocks()
+    ratelimit._pending_hits.clear()
+    if ratelimit._metrics_flush_task is not None:
+        ratelimit._metrics_flush_task.cancel()
+        ratelimit._metrics_flush_task = None
+
+
+def make_request(ip="10.0.0.1", path="/api/auth/login"):
+    request = MagicMock(spec=Request)
+    request.headers = {"X-Forwarded-For": ip}
+    request.url.path = path
+    request.state = MagicMock()
+    return request
+
+
+def mock_redis_eval(*results):
+    client = AsyncMock()
+    client.eval = AsyncMock(side_effect=list(results))
+    return patch(
+        "orizon.auth.ratelimit.get_redis", new_callable=AsyncMock, return_value=client
+    ), client
+
+
+class TestCheckRateLimit:
+    """Tests for check_rate_limit function."""
+
+    @pytest.mark.asyncio
+    async def test_allows_within_limit(self):
+        """Should allow and report remaining quota in one script call."""
+        redis_patch, client = mock_redis_eval([1, 2, 60000])
+
+        with redis_patch:
+            allowed, remaining, reset = await check_rate_limit(
+                make_request(), "login"
+            )
+
+        assert allowed is True
+        assert remaining == 3
+        assert reset == 60
+        client.eval.assert_awaited_once()
+        args = client.eval.call_args[0]
+        assert args[0] == SLIDING_WINDOW_SCRIPT
+        assert args[2] == "ratelimit:login:10.0.0.1"
+        assert args[4:6] == (60000, 5)
+
+    @pytest.mark.asyncio
+    async def test_rejects_over_limit(self):
+        """Should reject when the window is full."""
+        redis_patch, _ = mock_redis_eval([0, 5, 12500])
+
+        with redis_patch:
+            allowed, remaining, reset = await check_rate_limit(
+                make_request(), "login"
+            )
+
+        assert allowed is False
+        assert remaining == 0
+        assert reset == 13
+
+    @pytest.mark.asyncio
+    async def test_local_precheck_skips_redis(self):
+        """Should reject a blocked client locally without calling Redis."""
+        redis_patch, client = mock_redis_eval([0, 5, 30000])
+
+        with redis_patch:
+            await check_rate_limit(make_request(), "login")
+            allowed, remaining, reset = await check_rate_limit(
+                make_request(), "login"
+            )
+
+        assert allowed is False
+        assert remaining == 0
+        assert 0 < reset <= 30
+        assert client.eval.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_local_block_is_per_client(self):
+        """Should not block other clients locally."""
+        redis_patch, client = mock_redis_eval([0, 5, 30000], [1, 1, 60000])
+
+        with redis_patch:
+            await check_rate_limit(make_request("10.0.0.1"), "login")
+            allowed, _, _ = await check_rate_limit(make_request("10.0.0.2"), "login")
+
+        assert allowed is True
+        assert client.eval.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_fails_open_on_redis_error(self):
+        """Should allow the request if Redis is unavailable."""
+        import redis.asyncio as redis
+
+        client = AsyncMock()
+        client.eval = AsyncMock(side_effect=redis.RedisError("down"))
+
+        with patch(
+            "orizon.auth.ratelimit.get_redis",
+            new_callable=AsyncMock,
+            return_value=client,
+        ):
+            allowed, remaining, reset = await check_rate_limit(
+                make_request(), "login"
+            )
+
+        assert allowed is True
+        assert remaining == 5
+        assert reset == 0
+
+
+class TestRateLimit:
+    """Tests for rate_limit function."""
+
+    @pytest.mark.asyncio
+    async def test_raises_429_and_batches_metrics(self):
+        """Should raise 429 and aggregate hits until flushed."""
+        redis_patch, _ = mock_redis_eval([0, 5, 10000])
+
+        with redis_patch, patch(
+            "orizon.metrics.record_rate_limit_hit"
+        ) as mock_record, patch.object(ratelimit, "METRICS_FLUSH_INTERVAL", 3600):
+            for _ in range(3):
+                with pytest.raises(HTTPException) as exc_info:
+                    await rate_limit(make_request(), "login")
+                assert exc_info.value.status_code == 429
+
+            mock_record.assert_not_called()
+            flush_rate_limit_metrics()
+
+        mock_record.assert_called_once_with("/api/auth/login", "login", 3)
+
+    @pytest.mark.asyncio
+    async def test_buffered_metrics_are_flushed_without_further_hits(self):
+        """An idle key's hits are flushed by the background task."""
+        import asyncio
+
+        redis_patch, _ = mock_redis_eval([0, 5, 10000])
+
+        with redis_patch, patch(
+            "orizon.metrics.record_rate_limit_hit"
+        ) as mock_record, patch.object(ratelimit, "METRICS_FLUSH_INTERVAL", 0.01):
+            with pytest.raises(HTTPException):
+                await rate_limit(make_request(), "login")
+            mock_record.assert_not_called()
+
+            await asyncio.sleep(0.05)
+            mock_record.assert_called_once_with("/api/auth/login", "login", 1)
+
+            await stop_rate_limit_metrics_flush()
+            assert ratelimit._metrics_flush_task is None
@@ -17,6 +17,16 @@ from orizon.auth.sessions import (
 )
 
 
+def make_pipeline(mock_redis, results):
+    """Attach a fake pipeline to a mocked Redis client."""
+    pipe = MagicMock()
+    pipe.__aenter__ = AsyncMock(return_value=pipe)
+    pipe.__aexit__ = AsyncMock(return_value=None)
+    pipe.execute = AsyncMock(return_value=results)
+    mock_redis.pipeline = MagicMock(return_value=pipe)
+    return pipe
+
+
 class TestCreateSession:
     """Tests for create_session function."""
 
@@ -24,9 +34,7 @@ class TestCreateSession:
     async def test_creates_session(self):
         """Should create session and return token."""
         mock_redis = AsyncMock()
-        mock_redis.hset = AsyncMock()
-        mock_redis.expire = AsyncMock()
-        mock_redis.aclose = AsyncMock()
+        pipe = make_pipeline(mock_redis, [1, True])
 
         with patch(
             "orizon.auth.sessions.get_redis_client",
@@ -42,21 +50,22 @@ class TestCreateSession:
 
             assert token is not None
             assert len(token) > 20
-            mock_redis.hset.assert_called_once()
-            mock_redis.expire.assert_called_once()
+            mock_redis.pipeline.assert_called_once_with(transaction=True)
+            pipe.hset.assert_called_once()
+            pipe.expire.assert_called_once()
+            pipe.execute.assert_awaited_once()
 
     @pytest.mark.asyncio
     async def test_stores_session_data(self):
         """Should store correct session data."""
         mock_redis = AsyncMock()
+        pipe = make_pipeline(mock_redis, [1, True])
         stored_data = {}
 
-        async def capture_hset(key, mapping):
+        def capture_hset(key, mapping):
             stored_data.update(mapping)
 
-        mock_redis.hset = capture_hset
-        mock_redis.expire = AsyncMock()
-        mock_redis.aclose = AsyncMock()
+        pipe.hset = capture_hset
 
         with patch(
             "orizon.auth.sessions.get_redis_client",
@@ -90,7 +99,6 @@ class TestGetSession:
                 "virtual_key": "sk-test-key",
             }
         )
-        mock_redis.aclose = AsyncMock()
 
         with patch(
             "orizon.auth.sessions.get_redis_client",
@@ -107,7 +115,6 @@ class TestGetSession:
         """Should return None for invalid token."""
         mock_redis = AsyncMock()
         mock_redis.hgetall = AsyncMock(return_value={})
-        mock_redis.aclose = AsyncMock()
 
         with patch(
             "orizon.auth.sessions.get_redis_client",
@@ -127,7 +134,6 @@ class TestDeleteSession:
         """Should delete session from Redis."""
         mock_redis = AsyncMock()
         mock_redis.delete = AsyncMock(return_value=1)
-        mock_redis.aclose = AsyncMock()
 
         with patch(
             "orizon.auth.sessions.get_redis_client",
@@ -144,7 +150,6 @@ class TestDeleteSession:
         """Should return False for non-existent session."""
         mock_redis = AsyncMock()
         mock_redis.delete = AsyncMock(return_value=0)
-        mock_redis.aclose = AsyncMock()
 
         with patch(
             "orizon.auth.sessions.get_redis_client",
@@ -164,7 +169,6 @@ class TestRefreshSession:
         """Should refresh session expiry."""
         mock_redis = AsyncMock()
         mock_redis.expire = AsyncMock(return_value=True)
-        mock_redis.aclose = AsyncMock()
 
         with patch(
             "orizon.auth.sessions.get_redis_client",
@@ -224,15 +228,12 @@ class TestGetCurrentSession:
 
     @pytest.mark.asyncio
     async def test_returns_session_for_valid_cookie(self):
-        """Should return session data for valid cookie."""
+        """Should return session data without extending it by default."""
         request = MagicMock(spec=Request)
         request.cookies = {SESSION_COOKIE_NAME: "valid-token"}
 
         mock_redis = AsyncMock()
-        mock_redis.hgetall = AsyncMock(
-            return_value={"email": "user@example.com"}
-        )
-        mock_redis.aclose = AsyncMock()
+        mock_redis.hgetall.return_value = {"email": "user@example.com"}
 
         with patch(
             "orizon.auth.sessions.get_redis_client",
@@ -243,6 +244,49 @@ class TestGetCurrentSession:
 
             assert result is not None
             assert result["email"] == "user@example.com"
+            mock_redis.hgetall.assert_called_once_with("orizon:session:valid-token")
+            mock_redis.expire.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_sliding_expiry_refreshes_session(self):
+        """With SESSION_SLIDING_EXPIRY, reading the session extends it."""
+        request = MagicMock(spec=Request)
+        request.cookies = {SESSION_COOKIE_NAME: "valid-token"}
+
+        mock_redis = AsyncMock()
+        pipe = make_pipeline(mock_redis, [{"email": "user@example.com"}, True])
+
+        with patch(
+            "orizon.auth.sessions.get_redis_client",
+            new_callable=AsyncMock,
+            return_value=mock_redis,
+        ), patch("orizon.auth.sessions.SESSION_SLIDING_EXPIRY", True):
+            result = await get_current_session(request)
+
+            assert result is not None
+            assert result["email"] == "user@example.com"
+            # Read and expiry refresh share one pipelined round-trip
+            pipe.hgetall.assert_called_once()
+            pipe.expire.assert_called_once()
+            mock_redis.hgetall.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_returns_none_for_expired_session(self):
+        """Should return None when the session no longer exists."""
+        request = MagicMock(spec=Request)
+        request.cookies = {SESSION_COOKIE_NAME: "expired-token"}
+
+        mock_redis = AsyncMock()
+        mock_redis.hgetall.return_value = {}
+
+        with patch(
+            "orizon.auth.sessions.get_redis_client",
+            new_callable=AsyncMock,
+            return_value=mock_redis,
+        ):
+            result = await get_current_session(request)
+
+            assert result is None
 
     @pytest.mark.asyncio
     async def test_returns_none_for_no_cookie(self):
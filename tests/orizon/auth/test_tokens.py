@@ -11,6 +11,16 @@ from orizon.auth.tokens import (
 )
 
 
+def make_pipeline(mock_redis, results):
+    """Attach a fake pipeline to a mocked Redis client."""
+    pipe = MagicMock()
+    pipe.__aenter__ = AsyncMock(return_value=pipe)
+    pipe.__aexit__ = AsyncMock(return_value=None)
+    pipe.execute = AsyncMock(return_value=results)
+    mock_redis.pipeline = MagicMock(return_value=pipe)
+    return pipe
+
+
 class TestCreateMagicLinkToken:
     """Tests for create_magic_link_token function."""
 
@@ -18,9 +28,7 @@ class TestCreateMagicLinkToken:
     async def test_creates_token(self):
         """Should create a token string."""
         mock_redis = AsyncMock()
-        mock_redis.hset = AsyncMock()
-        mock_redis.expire = AsyncMock()
-        mock_redis.aclose = AsyncMock()
+        pipe = make_pipeline(mock_redis, [1, True])
 
         with patch(
             "orizon.auth.tokens.get_redis_client",
@@ -34,21 +42,22 @@ class TestCreateMagicLinkToken:
 
             assert token is not None
             assert len(token) > 20  # Token should be reasonably long
-            mock_redis.hset.assert_called_once()
-            mock_redis.expire.assert_called_once()
+            mock_redis.pipeline.assert_called_once_with(transaction=True)
+            pipe.hset.assert_called_once()
+            pipe.expire.assert_called_once()
+            pipe.execute.assert_awaited_once()
 
     @pytest.mark.asyncio
     async def test_stores_signup_data(self):
         """Should store signup data in token."""
         mock_redis = AsyncMock()
+        pipe = make_pipeline(mock_redis, [1, True])
         stored_data = {}
 
-        async def capture_hset(key, mapping):
+        def capture_hset(key, mapping):
             stored_data.update(mapping)
 
-        mock_redis.hset = capture_hset
-        mock_redis.expire = AsyncMock()
-        mock_redis.aclose = AsyncMock()
+        pipe.hset = capture_hset
 
         with patch(
             "orizon.auth.tokens.get_redis_client",
@@ -89,15 +98,12 @@ class TestVerifyMagicLinkToken:
     async def test_verifies_valid_token(self):
         """Should verify and return token data."""
         mock_redis = AsyncMock()
-        mock_redis.hgetall = AsyncMock(
-            return_value={
-                "email": "user@example.com",
-                "is_signup": "0",
-                "created_at": "2025-01-01T00:00:00",
-            }
-        )
-        mock_redis.delete = AsyncMock()
-        mock_redis.aclose = AsyncMock()
+        token_data = {
+            "email": "user@example.com",
+            "is_signup": "0",
+            "created_at": "2025-01-01T00:00:00",
+        }
+        pipe = make_pipeline(mock_redis, [token_data, 1])
 
         with patch(
             "orizon.auth.tokens.get_redis_client",
@@ -109,14 +115,16 @@ class TestVerifyMagicLinkToken:
             assert result is not None
             assert result["email"] == "user@example.com"
             assert result["is_signup"] is False
-            mock_redis.delete.assert_called_once()  # Token should be deleted
+            # Token should be read and deleted in one atomic round-trip
+            mock_redis.pipeline.assert_called_once_with(transaction=True)
+            pipe.hgetall.assert_called_once()
+            pipe.delete.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_returns_none_for_invalid_token(self):
         """Should return None for invalid token."""
         mock_redis = AsyncMock()
-        mock_redis.hgetall = AsyncMock(return_value={})  # Empty = not found
-        mock_redis.aclose = AsyncMock()
+        make_pipeline(mock_redis, [{}, 0])  # Empty = not found
 
         with patch(
             "orizon.auth.tokens.get_redis_client",
@@ -148,7 +156,6 @@ class TestInvalidateToken:
         """Should delete token from Redis."""
         mock_redis = AsyncMock()
         mock_redis.delete = AsyncMock(return_value=1)  # 1 key deleted
-        mock_redis.aclose = AsyncMock()
 
         with patch(
             "orizon.auth.tokens.get_redis_client",
@@ -165,7 +172,6 @@ class TestInvalidateToken:
         """Should return False for non-existent token."""
         mock_redis = AsyncMock()
         mock_redis.delete = AsyncMock(return_value=0)  # 0 keys deleted
-        mock_redis.aclose = AsyncMock()
 
         with patch(
             "orizon.auth.tokens.get_redis_client",
@@ -169,11 +169,9 @@ class TestGetUser:
             "keys": [],
         }
 
-        with patch("orizon.auth.utils.httpx.AsyncClient") as mock_client:
+        with patch("orizon.auth.utils.get_admin_client") as mock_client:
             mock_instance = AsyncMock()
             mock_instance.get.return_value = mock_response
-            mock_instance.__aenter__.return_value = mock_instance
-            mock_instance.__aexit__.return_value = None
             mock_client.return_value = mock_instance
 
             result = await get_user("orizon-abc123")
@@ -187,11 +185,9 @@ class TestGetUser:
         mock_response = MagicMock()
         mock_response.status_code = 404
 
-        with patch("orizon.auth.utils.httpx.AsyncClient") as mock_client:
+        with patch("orizon.auth.utils.get_admin_client") as mock_client:
             mock_instance = AsyncMock()
             mock_instance.get.return_value = mock_response
-            mock_instance.__aenter__.return_value = mock_instance
-            mock_instance.__aexit__.return_value = None
             mock_client.return_value = mock_instance
 
             result = await get_user("nonexistent")
@@ -213,11 +209,9 @@ class TestCreateUser:
             "key": "sk-test-key",
         }
 
-        with patch("orizon.auth.utils.httpx.AsyncClient") as mock_client:
+        with patch("orizon.auth.utils.get_admin_client") as mock_client:
             mock_instance = AsyncMock()
             mock_instance.post.return_value = mock_response
-            mock_instance.__aenter__.return_value = mock_instance
-            mock_instance.__aexit__.return_value = None
             mock_client.return_value = mock_instance
 
             result = await create_user("user@example.com", "orizon-abc123")
@@ -232,11 +226,9 @@ class TestCreateUser:
         mock_response.status_code = 500
         mock_response.text = "Internal Server Error"
 
-        with patch("orizon.auth.utils.httpx.AsyncClient") as mock_client:
+        with patch("orizon.auth.utils.get_admin_client") as mock_client:
             mock_instance = AsyncMock()
             mock_instance.post.return_value = mock_response
-            mock_instance.__aenter__.return_value = mock_instance
-            mock_instance.__aexit__.return_value = None
             mock_client.return_value = mock_instance
 
             result = await create_user("user@example.com", "orizon-abc123")
@@ -300,11 +292,9 @@ class TestCreateKeyForUser:
             "user_id": "orizon-abc123",
         }
 
-        with patch("orizon.auth.utils.httpx.AsyncClient") as mock_client:
+        with patch("orizon.auth.utils.get_admin_client") as mock_client:
             mock_instance = AsyncMock()
             mock_instance.post.return_value = mock_response
-            mock_instance.__aenter__.return_value = mock_instance
-            mock_instance.__aexit__.return_value = None
             mock_client.return_value = mock_instance
 
             result = await create_key_for_user("orizon-abc123")
@@ -318,11 +308,9 @@ class TestCreateKeyForUser:
         mock_response.status_code = 500
         mock_response.text = "Server Error"
 
-        with patch("orizon.auth.utils.httpx.AsyncClient") as mock_client:
+        with patch("orizon.auth.utils.get_admin_client") as mock_client:
             mock_instance = AsyncMock()
             mock_instance.post.return_value = mock_response
-            mock_instance.__aenter__.return_value = mock_instance
-            mock_instance.__aexit__.return_value = None
             mock_client.return_value = mock_instance
 
             result = await create_key_for_user("orizon-abc123")
@@ -36,7 +36,10 @@ class TestForwardRequest:
             mock_client.return_value = mock_instance
 
             response = await forward_request(
-                mock_request, "/v1/chat/completions", "sk-test-key"
+                mock_request,
+                "/v1/chat/completions",
+                "sk-test-key",
+                stream_upstream=False,
             )
 
             # Verify request was made with correct parameters
@@ -68,7 +71,10 @@ class TestForwardRequest:
             mock_client.return_value = mock_instance
 
             response = await forward_request(
-                mock_request, "/v1/chat/completions", "sk-test-key"
+                mock_request,
+                "/v1/chat/completions",
+                "sk-test-key",
+                stream_upstream=False,
             )
 
             # Verify it's a streaming response
@@ -94,7 +100,9 @@ class TestForwardRequest:
             mock_instance.__aexit__.return_value = None
             mock_client.return_value = mock_instance
 
-            response = await forward_request(mock_request, "/v1/test", "sk-test-key")
+            response = await forward_request(
+                mock_request, "/v1/test", "sk-test-key", stream_upstream=False
+            )
 
             # Should return 504 Gateway Timeout
             from fastapi.responses import JSONResponse
@@ -119,7 +127,9 @@ class TestForwardRequest:
             mock_instance.__aexit__.return_value = None
             mock_client.return_value = mock_instance
 
-            response = await forward_request(mock_request, "/v1/test", "sk-test-key")
+            response = await forward_request(
+                mock_request, "/v1/test", "sk-test-key", stream_upstream=False
+            )
 
             # Should return 502 Bad Gateway
             from fastapi.responses import JSONResponse
@@ -128,6 +138,170 @@ class TestForwardRequest:
             assert response.status_code == 502
 
 
+class TestForwardStreamingRequest:
+    """Tests for the streaming forwarding mode."""
+
+    @staticmethod
+    def _make_request(method="POST", body_chunks=(b'{"stream": true}',)):
+        async def body_stream():
+            for chunk in body_chunks:
+                yield chunk
+
+        mock_request = MagicMock(spec=Request)
+        mock_request.method = method
+        mock_request.headers = {
+            "content-type": "application/json",
+            "host": "gateway",
+            "connection": "keep-alive",
+        }
+        mock_request.query_params = {}
+        mock_request.stream = MagicMock(side_effect=lambda: body_stream())
+        mock_request.body = AsyncMock(
+            side_effect=AssertionError("body must not be buffered")
+        )
+        return mock_request
+
+    @staticmethod
+    def _make_client(response):
+        mock_client = MagicMock()
+        mock_client.build_request = MagicMock(return_value=MagicMock())
+        mock_client.send = AsyncMock(return_value=response)
+        return mock_client
+
+    @pytest.mark.asyncio
+    async def test_streams_request_body_upstream(self):
+        """Should pass the request body stream upstream without buffering it."""
+        mock_request = self._make_request()
+
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.headers = {"content-type": "application/json"}
+        mock_response.content = b'{"response": "ok"}'
+        mock_response.json.return_value = {"response": "ok"}
+        mock_response.aread = AsyncMock()
+        mock_response.aclose = AsyncMock()
+        mock_client = self._make_client(mock_response)
+
+        with patch("orizon.proxy.client.get_http_client", return_value=mock_client):
+            response = await forward_request(
+                mock_request, "/v1/chat/completions", "sk-test-key"
+            )
+
+        build_kwargs = mock_client.build_request.call_args[1]
+        assert build_kwargs["method"] == "POST"
+        assert build_kwargs["headers"]["authorization"] == "Bearer sk-test-key"
+        assert "host" not in build_kwargs["headers"]
+        assert "connection" not in build_kwargs["headers"]
+        assert [c async for c in build_kwargs["content"]] == [b'{"stream": true}']
+        assert mock_client.send.call_args[1]["stream"] is True
+        mock_request.body.assert_not_called()
+
+        # Non-streaming responses are read in full and closed
+        assert response.status_code == 200
+        mock_response.aread.assert_awaited_once()
+        mock_response.aclose.assert_awaited()
+
+    @pytest.mark.asyncio
+    async def test_relays_sse_chunks_as_they_arrive(self):
+        """Should relay each upstream chunk without waiting for the full body."""
+        mock_request = self._make_request()
+        chunks = [b"data: one\n\n", b"data: two\n\n", b"data: [DONE]\n\n"]
+
+        async def aiter_raw():
+            for chunk in chunks:
+                yield chunk
+
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.headers = {
+            "content-type": "text/event-stream",
+            "content-length": "42",
+            "transfer-encoding": "chunked",
+        }
+        mock_response.aiter_raw = aiter_raw
+        mock_response.aread = AsyncMock()
+        mock_response.aclose = AsyncMock()
+        mock_client = self._make_client(mock_response)
+
+        with patch("orizon.proxy.client.get_http_client", return_value=mock_client):
+            response = await forward_request(
+                mock_request, "/v1/chat/completions", "sk-test-key"
+            )
+
+        from fastapi.responses import StreamingResponse
+
+        assert isinstance(response, StreamingResponse)
+        assert "transfer-encoding" not in response.headers
+        mock_response.aread.assert_not_called()
+        mock_response.aclose.assert_not_called()
+
+        received = [chunk async for chunk in response.body_iterator]
+        assert received == chunks
+        mock_response.aclose.assert_awaited()
+
+    @pytest.mark.asyncio
+    async def test_closes_upstream_when_client_disconnects(self):
+        """Should close the upstream response if the relay is abandoned."""
+        mock_request = self._make_request()
+
+        async def aiter_raw():
+            yield b"data: one\n\n"
+            yield b"data: two\n\n"
+
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.headers = {"content-type": "text/event-stream"}
+        mock_response.aiter_raw = aiter_raw
+        mock_response.aclose = AsyncMock()
+        mock_client = self._make_client(mock_response)
+
+        with patch("orizon.proxy.client.get_http_client", return_value=mock_client):
+            response = await forward_request(
+                mock_request, "/v1/chat/completions", "sk-test-key"
+            )
+
+        # Simulate Starlette cancelling the body iterator on disconnect
+        first = await response.body_iterator.__anext__()
+        assert first == b"data: one\n\n"
+        await response.body_iterator.aclose()
+
+        mock_response.aclose.assert_awaited()
+
+    @pytest.mark.asyncio
+    async def test_handles_timeout(self):
+        """Should map upstream timeouts to 504."""
+        import httpx
+
+        mock_request = self._make_request()
+        mock_client = self._make_client(None)
+        mock_client.send.side_effect = httpx.TimeoutException("Timeout")
+
+        with patch("orizon.proxy.client.get_http_client", return_value=mock_client):
+            response = await forward_request(mock_request, "/v1/test", "sk-test-key")
+
+        assert response.status_code == 504
+
+    @pytest.mark.asyncio
+    async def test_get_request_has_no_body(self):
+        """Should not stream a body for GET requests."""
+        mock_request = self._make_request(method="GET")
+
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.headers = {"content-type": "application/json"}
+        mock_response.content = b"{}"
+        mock_response.json.return_value = {}
+        mock_response.aread = AsyncMock()
+        mock_response.aclose = AsyncMock()
+        mock_client = self._make_client(mock_response)
+
+        with patch("orizon.proxy.client.get_http_client", return_value=mock_client):
+            await forward_request(mock_request, "/v1/models", "sk-test-key")
+
+        assert mock_client.build_request.call_args[1]["content"] is None
+        mock_request.stream.assert_not_called()
+
+
 class TestGetUserVirtualKeyFromRequest:
     """Tests for get_user_virtual_key_from_request function."""
 
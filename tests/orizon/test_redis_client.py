@@ -0,0 +1,65 @@
+"""Tests for orizon.redis_client module."""
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from orizon import redis_client
+
+
+@pytest.fixture(autouse=True)
+def reset_client():
+    """Ensure each test starts without a shared client."""
+    redis_client._redis_client = None
+    yield
+    redis_client._redis_client = None
+
+
+class TestSharedRedisClient:
+    """Tests for the shared Redis pool lifecycle."""
+
+    @pytest.mark.asyncio
+    async def test_reuses_single_client(self):
+        """Should create one pool and return it on every call."""
+        with patch("orizon.redis_client.redis.from_url") as mock_from_url:
+            mock_from_url.return_value = MagicMock()
+
+            first = await redis_client.get_redis()
+            second = await redis_client.get_redis()
+
+            assert first is second
+            mock_from_url.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_init_opens_pool(self):
+        """Should open the pool eagerly on startup."""
+        with patch("orizon.redis_client.redis.from_url") as mock_from_url:
+            mock_from_url.return_value = MagicMock()
+
+            client = await redis_client.init_redis()
+
+            assert redis_client._redis_client is client
+
+    @pytest.mark.asyncio
+    async def test_close_releases_pool(self):
+        """Should close the pool and allow it to be recreated."""
+        mock_client = MagicMock()
+        mock_client.aclose = AsyncMock()
+
+        with patch(
+            "orizon.redis_client.redis.from_url", return_value=mock_client
+        ) as mock_from_url:
+            await redis_client.get_redis()
+            await redis_client.close_redis()
+
+            mock_client.aclose.assert_awaited_once()
+            assert redis_client._redis_client is None
+
+            await redis_client.get_redis()
+            assert mock_from_url.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_close_without_pool_is_noop(self):
+        """Should do nothing when no pool was opened."""
+        await redis_client.close_redis()
+
+        assert redis_client._redis_client is None
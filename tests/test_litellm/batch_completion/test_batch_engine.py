@@ -0,0 +1,183 @@
+import asyncio
+import json
+import os
+import sys
+from unittest.mock import patch
+
+import pytest
+
+sys.path.insert(
+    0, os.path.abspath("../../..")
+)  # Adds the parent directory to the system path
+
+import litellm
+from litellm.batch_completion.batch_engine import (
+    BatchDeploymentLimiter,
+    run_batch_completion,
+)
+
+
+def _requests(n: int):
+    return ([{"role": "user", "content": f"request {i}"}] for i in range(n))
+
+
+def _rate_limit_error() -> Exception:
+    return litellm.RateLimitError(
+        message="rate limited", llm_provider="openai", model="gpt-4o"
+    )
+
+
+async def _collect(**kwargs) -> list:
+    return [result async for result in run_batch_completion(**kwargs)]
+
+
+@pytest.mark.asyncio
+async def test_concurrency_bounded_per_deployment():
+    in_flight = {"a": 0, "b": 0}
+    max_in_flight = {"a": 0, "b": 0}
+
+    async def completion_fn(deployment, messages):
+        in_flight[deployment] += 1
+        max_in_flight[deployment] = max(
+            max_in_flight[deployment], in_flight[deployment]
+        )
+        await asyncio.sleep(0.001)
+        in_flight[deployment] -= 1
+        return messages[0]["content"]
+
+    results = await _collect(
+        messages=_requests(50),
+        limiters=[
+            BatchDeploymentLimiter("a", max_concurrency=3),
+            BatchDeploymentLimiter("b", max_concurrency=2),
+        ],
+        completion_fn=completion_fn,
+    )
+
+    assert sorted(idx for _, idx in results) == list(range(50))
+    assert all(response == f"request {idx}" for response, idx in results)
+    assert max_in_flight == {"a": 3, "b": 2}
+
+
+@pytest.mark.asyncio
+async def test_rate_limited_requests_are_retried_with_lower_concurrency():
+    limiter = BatchDeploymentLimiter("a", max_concurrency=8)
+    attempts = {"count": 0}
+
+    async def completion_fn(deployment, messages):
+        attempts["count"] += 1
+        if attempts["count"] <= 2:
+            raise _rate_limit_error()
+        return "ok"
+
+    with patch(
+        "litellm.batch_completion.batch_engine._get_rate_limit_retry_after",
+        return_value=0.01,
+    ):
+        results = await _collect(
+            messages=_requests(1), limiters=[limiter], completion_fn=completion_fn
+        )
+
+    assert results == [("ok", 0)]
+    assert attempts["count"] == 3
+    assert limiter.concurrency_limit < 8
+
+
+@pytest.mark.asyncio
+async def test_errors_returned_after_rate_limit_retries_exhausted():
+    async def completion_fn(deployment, messages):
+        raise _rate_limit_error()
+
+    with patch(
+        "litellm.batch_completion.batch_engine._get_rate_limit_retry_after",
+        return_value=0.0,
+    ):
+        results = await _collect(
+            messages=_requests(1),
+            limiters=[BatchDeploymentLimiter("a")],
+            completion_fn=completion_fn,
+            max_rate_limit_retries=2,
+        )
+
+    assert isinstance(results[0][0], litellm.RateLimitError)
+
+
+def test_start_interval_from_rpm_and_tpm():
+    limiter = BatchDeploymentLimiter("a", rpm=120, tpm=6000)
+    assert limiter._min_start_interval() == 0.5
+
+    limiter.on_start(now=0.0)
+    limiter.on_success(total_tokens=1000)  # tpm allows 6 requests per minute
+    assert limiter._min_start_interval() == 10.0
+
+
+@pytest.mark.asyncio
+async def test_checkpoint_resume(tmp_path):
+    checkpoint_file = tmp_path / "results.jsonl"
+    calls = []
+
+    async def completion_fn(deployment, messages):
+        calls.append(messages[0]["content"])
+        if messages[0]["content"] == "request 3":
+            raise ValueError("bad request")
+        return {"content": messages[0]["content"]}
+
+    kwargs = dict(
+        limiters=[BatchDeploymentLimiter("a", max_concurrency=1)],
+        completion_fn=completion_fn,
+        checkpoint_file=checkpoint_file,
+    )
+    async for _, idx in run_batch_completion(messages=_requests(10), **kwargs):
+        if idx == 4:
+            break  # crash after 5 results
+    with open(checkpoint_file, "a") as f:
+        f.write('{"index": 5, "respo')  # partially written record
+
+    calls.clear()
+    results = await _collect(messages=_requests(10), **kwargs)
+
+    assert calls == [f"request {i}" for i in [3, 5, 6, 7, 8, 9]]
+    assert sorted(idx for _, idx in results) == [3, 5, 6, 7, 8, 9]
+    with open(checkpoint_file) as f:
+        records = [json.loads(line) for line in f]
+    completed = sorted(r["index"] for r in records if "response" in r)
+    assert completed == [0, 1, 2, 4, 5, 6, 7, 8, 9]
+
+
+@pytest.mark.asyncio
+async def test_router_abatch_completion_iter_spreads_over_deployments():
+    router = litellm.Router(
+        model_list=[
+            {
+                "model_name": "gpt-4o",
+                "litellm_params": {"model": "openai/gpt-4o", "mock_response": "hi"},
+                "model_info": {"id": "deployment-1"},
+            },
+            {
+                "model_name": "gpt-4o",
+                "litellm_params": {"model": "openai/gpt-4o", "mock_response": "hi"},
+                "model_info": {"id": "deployment-2"},
+                "rpm": 6000,
+            },
+        ]
+    )
+    called_models = []
+    original_acompletion = router.acompletion
+
+    async def _acompletion(model, messages, **kwargs):
+        called_models.append(model)
+        return await original_acompletion(model=model, messages=messages, **kwargs)
+
+    with patch.object(router, "acompletion", side_effect=_acompletion):
+        results = [
+            result
+            async for result in router.abatch_completion_iter(
+                model="gpt-4o", messages=_requests(20), max_concurrency=2
+            )
+        ]
+
+    assert len(results) == 20
+    assert all(
+        response.choices[0].message.content == "hi" for response, _ in results
+    )
+    assert set(called_models) == {"deployment-1", "deployment-2"}
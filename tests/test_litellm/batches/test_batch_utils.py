@@ -0,0 +1,121 @@
+import json
+import os
+import sys
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+sys.path.insert(
+    0, os.path.abspath("../../..")
+)  # Adds the parent directory to the system path
+
+import openai
+
+from litellm.batches.batch_utils import _handle_completed_batch
+from litellm.files.main import openai_files_instance
+from litellm.types.llms.openai import Batch, FileContentRequest
+
+
+def _batch_output_line(custom_id: str, status_code: int = 200) -> bytes:
+    record = {
+        "id": f"batch_req_{custom_id}",
+        "custom_id": custom_id,
+        "response": {
+            "status_code": status_code,
+            "body": {
+                "id": f"chatcmpl-{custom_id}",
+                "object": "chat.completion",
+                "created": 1711475054,
+                "model": "gpt-4o-mini-2024-07-18",
+                "choices": [
+                    {
+                        "index": 0,
+                        "message": {"role": "assistant", "content": "Hello!"},
+                        "finish_reason": "stop",
+                    }
+                ],
+                "usage": {
+                    "prompt_tokens": 10,
+                    "completion_tokens": 5,
+                    "total_tokens": 15,
+                },
+            },
+        },
+        "error": None,
+    }
+    return json.dumps(record).encode() + b"\n"
+
+
+def _openai_client(*chunks: bytes, requests: list) -> openai.AsyncOpenAI:
+    async def _file_content():
+        for chunk in chunks:
+            yield chunk
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, content=_file_content())
+
+    return openai.AsyncOpenAI(
+        api_key="sk-test",
+        http_client=httpx.AsyncClient(transport=httpx.MockTransport(_handler)),
+    )
+
+
+@pytest.mark.asyncio
+async def test_completed_batch_output_file_is_streamed():
+    requests: list = []
+    client = _openai_client(
+        _batch_output_line("request-1"),
+        _batch_output_line("request-2"),
+        _batch_output_line("request-3", status_code=500),
+        requests=requests,
+    )
+    batch = Batch(
+        id="batch_abc123",
+        completion_window="24h",
+        created_at=1711471533,
+        endpoint="/v1/chat/completions",
+        input_file_id="file-input",
+        object="batch",
+        status="completed",
+        output_file_id="file-output",
+    )
+
+    file_contents = []
+
+    async def _afile_content(file_id, custom_llm_provider, extra_headers, **kwargs):
+        file_content = await openai_files_instance.afile_content(
+            FileContentRequest(file_id=file_id, extra_headers=extra_headers),
+            openai_client=client,
+        )
+        file_contents.append(file_content)
+        return file_content
+
+    with patch("litellm.files.main.afile_content", new=_afile_content):
+        cost, usage, models = await _handle_completed_batch(
+            batch=batch, custom_llm_provider="openai"
+        )
+
+    assert requests[0].headers["X-Stainless-Raw-Response"] == "stream"
+    assert file_contents[0].response.is_closed
+    assert cost > 0
+    assert (usage.prompt_tokens, usage.completion_tokens) == (20, 10)
+    assert models == ["gpt-4o-mini-2024-07-18"] * 2
+
+
+@pytest.mark.asyncio
+async def test_openai_file_content_is_not_read_when_streamed():
+    client = _openai_client(b'{"id": 1}\n', requests=[])
+    content = await openai_files_instance.afile_content(
+        FileContentRequest(
+            file_id="file-output",
+            extra_headers={"X-Stainless-Raw-Response": "stream"},
+        ),
+        openai_client=client,
+    )
+    with pytest.raises(httpx.ResponseNotRead):
+        content.content
+    assert b"".join([chunk async for chunk in await content.aiter_bytes()]) == (
+        b'{"id": 1}\n'
+    )
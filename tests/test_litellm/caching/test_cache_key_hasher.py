@@ -0,0 +1,74 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(
+    0, os.path.abspath("../../..")
+)  # Adds the parent directory to the system path
+
+from litellm.caching.cache_key_hasher import CacheKeyHasher
+from litellm.caching.caching import Cache
+
+
+def _hash(**params) -> str:
+    hasher = CacheKeyHasher()
+    for param, value in params.items():
+        hasher.update_param(param, value)
+    return hasher.hexdigest()
+
+
+def test_dict_key_order_does_not_change_hash():
+    message_a = {"role": "user", "content": "hello"}
+    message_b = {"content": "hello", "role": "user"}
+    assert _hash(messages=[message_a]) == _hash(messages=[message_b])
+
+
+def test_values_are_type_tagged():
+    assert _hash(temperature=1) != _hash(temperature="1")
+    assert _hash(temperature=1) != _hash(temperature=1.0)
+    assert _hash(stop=["ab"]) != _hash(stop=["a", "b"])
+    assert _hash(stream=True) != _hash(stream=1)
+    assert _hash(user=None) != _hash(user="None")
+
+
+def test_large_values_are_hashed_by_content():
+    image = "data:image/png;base64," + "A" * 100_000
+    messages = [{"role": "user", "content": [{"type": "image_url", "image_url": image}]}]
+    first = _hash(messages=messages)
+
+    messages.append({"role": "user", "content": "describe it"})
+    second = _hash(messages=messages)
+    assert first != second
+
+    # an equal but distinct string produces the same hash
+    copied_image = "".join([image[:10], image[10:]])
+    assert copied_image is not image
+    copied_messages = [
+        {"role": "user", "content": [{"type": "image_url", "image_url": copied_image}]},
+        {"role": "user", "content": "describe it"},
+    ]
+    assert _hash(messages=copied_messages) == second
+    assert _hash(messages=[{"content": image[:-1] + "B"}]) != _hash(
+        messages=[{"content": image}]
+    )
+
+
+def test_get_cache_key_is_independent_of_kwarg_order():
+    cache = Cache()
+    messages = [{"role": "user", "content": "hi"}]
+    key_1 = cache.get_cache_key(model="gpt-4o", messages=messages, temperature=0.2)
+    key_2 = cache.get_cache_key(temperature=0.2, messages=messages, model="gpt-4o")
+    assert key_1 == key_2
+    assert len(key_1) == 64
+
+
+def test_get_cache_key_changes_with_messages():
+    cache = Cache()
+    key_1 = cache.get_cache_key(
+        model="gpt-4o", messages=[{"role": "user", "content": "hi"}]
+    )
+    key_2 = cache.get_cache_key(
+        model="gpt-4o", messages=[{"role": "user", "content": "hi!"}]
+    )
+    assert key_1 != key_2
@@ -0,0 +1,132 @@
+import asyncio
+import os
+import sys
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+sys.path.insert(
+    0, os.path.abspath("../../..")
+)  # Adds the parent directory to the system path
+
+from litellm.caching.dual_cache import DualCache
+from litellm.caching.in_memory_cache import InMemoryCache
+
+
+def _redis_cache(get_result=None, delay: float = 0.01) -> MagicMock:
+    async def _async_get_cache(key, **kwargs):
+        await asyncio.sleep(delay)
+        return get_result
+
+    redis_cache = MagicMock()
+    redis_cache.async_get_cache = AsyncMock(side_effect=_async_get_cache)
+    redis_cache.async_set_cache = AsyncMock()
+    redis_cache.async_delete_cache = AsyncMock()
+    return redis_cache
+
+
+class _FakePubSubBroker:
+    def __init__(self):
+        self.subscribers = []
+
+    async def publish(self, channel, message):
+        for queue in self.subscribers:
+            queue.put_nowait({"type": "message", "data": message.encode()})
+        return len(self.subscribers)
+
+    def pubsub(self):
+        broker = self
+
+        class _PubSub:
+            async def subscribe(self, channel):
+                self.queue = asyncio.Queue()
+                broker.subscribers.append(self.queue)
+
+            async def listen(self):
+                while True:
+                    yield await self.queue.get()
+
+            async def reset(self):
+                broker.subscribers.remove(self.queue)
+
+        return _PubSub()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_share_one_redis_get():
+    redis_cache = _redis_cache(get_result={"team_id": "t1"})
+    cache = DualCache(in_memory_cache=InMemoryCache(), redis_cache=redis_cache)
+
+    results = await asyncio.gather(
+        *(cache.async_get_cache("team:t1") for _ in range(20))
+    )
+
+    assert results == [{"team_id": "t1"}] * 20
+    assert redis_cache.async_get_cache.await_count == 1
+    assert await cache.async_get_cache("team:t1") == {"team_id": "t1"}
+    metrics = cache.get_cache_metrics()
+    assert metrics["get_requests"] == 21
+    assert metrics["coalesced_redis_gets"] == 19
+    assert metrics["redis_ops_per_request"] == pytest.approx(1 / 21)
+
+
+@pytest.mark.asyncio
+async def test_negative_cache_skips_redis_until_key_is_written():
+    redis_cache = _redis_cache(get_result=None, delay=0)
+    cache = DualCache(
+        in_memory_cache=InMemoryCache(),
+        redis_cache=redis_cache,
+        default_negative_cache_ttl=60,
+    )
+
+    assert await cache.async_get_cache("key") is None
+    assert await cache.async_get_cache("key") is None
+    assert redis_cache.async_get_cache.await_count == 1
+    assert cache.get_cache_metrics()["negative_cache_hits"] == 1
+
+    await cache.async_set_cache("key", "value")
+    assert await cache.async_get_cache("key") == "value"
+
+
+@pytest.mark.asyncio
+async def test_write_during_redis_get_is_not_overwritten():
+    redis_cache = _redis_cache(get_result="stale", delay=0.05)
+    cache = DualCache(in_memory_cache=InMemoryCache(), redis_cache=redis_cache)
+
+    pending = asyncio.create_task(cache.async_get_cache("key"))
+    await asyncio.sleep(0.01)
+    await cache.async_set_cache("key", "fresh")
+
+    assert await pending == "stale"
+    assert await cache.async_get_cache("key") == "fresh"
+
+
+@pytest.mark.asyncio
+async def test_writes_invalidate_other_instances():
+    broker = _FakePubSubBroker()
+
+    def _shared_redis_cache():
+        redis_cache = _redis_cache(get_result=None, delay=0)
+        redis_cache.async_publish = AsyncMock(side_effect=broker.publish)
+        redis_cache.init_async_client.return_value.pubsub = broker.pubsub
+        return redis_cache
+
+    pod_a = DualCache(redis_cache=_shared_redis_cache(), invalidation_channel="l1")
+    pod_b = DualCache(redis_cache=_shared_redis_cache(), invalidation_channel="l1")
+    try:
+        await pod_a.async_get_cache("unused")  # starts pod_a's listener
+        await pod_b.async_get_cache("unused")
+        await asyncio.sleep(0)
+        await pod_a.async_set_cache("key", "v1")
+        await pod_b.async_set_cache("key", "v1", local_only=True)
+
+        await pod_a.async_set_cache("key", "v2")
+        await asyncio.sleep(0.01)
+
+        assert pod_b.in_memory_cache.get_cache("key") is None
+        assert pod_a.in_memory_cache.get_cache("key") == "v2"
+        assert pod_b.get_cache_metrics()["invalidations_received"] == 2
+        assert pod_a.get_cache_metrics()["invalidations_received"] == 0
+    finally:
+        for pod in (pod_a, pod_b):
+            pod._invalidation_listener.cancel()
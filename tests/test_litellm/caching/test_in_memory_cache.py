@@ -188,14 +188,106 @@ def test_in_memory_cache_eviction_order():
     assert "new_item" in in_memory_cache.cache_dict
 
 
-def test_in_memory_cache_heap_size_staus_bounded():
+def test_in_memory_cache_expiry_wheel_stays_bounded():
     """
-    Test that the expiration_heap does not grow unbounded when the same key is updated repeaatedly.
+    Test that the expiry timer wheel does not grow unbounded when the same key is updated repeatedly.
     """
     in_memory_cache = InMemoryCache(max_size_in_memory=10)
 
     for i in range(1_000):
         in_memory_cache.set_cache(key="hot_key", value=f"value_{i}", ttl=60)
 
-    # Expiration heap should only have 1 entry
-    assert len(in_memory_cache.expiration_heap) == 1
+    # Expiry wheel should only track the key once
+    assert sum(len(b) for b in in_memory_cache._expiry_buckets.values()) == 1
+    assert len(in_memory_cache._expiry_bucket_heap) == 1
+
+
+def test_in_memory_cache_lru_eviction():
+    """
+    Test that reading a key protects it from eviction (true LRU).
+    """
+    in_memory_cache = InMemoryCache(max_size_in_memory=2)
+
+    in_memory_cache.set_cache(key="a", value="1", ttl=300)
+    in_memory_cache.set_cache(key="b", value="2", ttl=300)
+    in_memory_cache.get_cache(key="a")  # "b" is now least recently used
+    in_memory_cache.set_cache(key="c", value="3", ttl=300)
+
+    assert "a" in in_memory_cache.cache_dict
+    assert "b" not in in_memory_cache.cache_dict
+    assert "c" in in_memory_cache.cache_dict
+    assert in_memory_cache.evictions == 1
+
+
+def test_in_memory_cache_byte_budget():
+    """
+    Test that total estimated size stays within max_size_in_bytes.
+    """
+    in_memory_cache = InMemoryCache(max_size_in_memory=1000, max_size_in_bytes=10_000)
+
+    for i in range(100):
+        in_memory_cache.set_cache(key=f"key_{i}", value="x" * 1000)
+
+    assert in_memory_cache.total_size_in_bytes <= 10_000
+    assert len(in_memory_cache.cache_dict) < 100
+    # most recent keys are kept
+    assert "key_99" in in_memory_cache.cache_dict
+    assert "key_0" not in in_memory_cache.cache_dict
+
+
+def test_in_memory_cache_size_accounting_on_overwrite_and_delete():
+    in_memory_cache = InMemoryCache()
+
+    in_memory_cache.set_cache(key="k", value="x" * 100)
+    in_memory_cache.set_cache(key="k", value="x" * 1000)
+    assert in_memory_cache.total_size_in_bytes == in_memory_cache.size_dict["k"]
+
+    in_memory_cache.delete_cache(key="k")
+    assert in_memory_cache.total_size_in_bytes == 0
+
+
+def test_in_memory_cache_native_objects_returned_without_decode():
+    """
+    Native objects are returned as stored; JSON strings are decoded once on write.
+    """
+    in_memory_cache = InMemoryCache()
+    value = {"user_id": "u1", "spend": 1.5}
+
+    in_memory_cache.set_cache(key="native", value=value)
+    assert in_memory_cache.get_cache(key="native") is value
+
+    in_memory_cache.set_cache(key="json", value=json.dumps(value))
+    assert in_memory_cache.cache_dict["json"] == value
+    assert in_memory_cache.get_cache(key="json") == value
+
+    in_memory_cache.set_cache(key="plain", value="hello world")
+    assert in_memory_cache.get_cache(key="plain") == "hello world"
+
+
+def test_in_memory_cache_stats():
+    in_memory_cache = InMemoryCache()
+
+    in_memory_cache.set_cache(key="k", value=1)
+    in_memory_cache.get_cache(key="k")
+    in_memory_cache.get_cache(key="missing")
+
+    stats = in_memory_cache.get_stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["hit_ratio"] == 0.5
+    assert stats["num_items"] == 1
+
+
+def test_in_memory_cache_expired_keys_swept_on_write():
+    """
+    Expired keys are released by the timer wheel even when the cache is not full.
+    """
+    in_memory_cache = InMemoryCache(max_size_in_memory=100)
+
+    in_memory_cache.set_cache(key="short", value="v", ttl=1)
+    time.sleep(2.1)
+    in_memory_cache.set_cache(key="other", value="v", ttl=60)
+
+    assert "short" not in in_memory_cache.cache_dict
+    assert "short" not in in_memory_cache.ttl_dict
+    assert in_memory_cache.expirations == 1
@@ -0,0 +1,236 @@
+import gc
+import os
+import sys
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+sys.path.insert(
+    0, os.path.abspath("../../..")
+)  # Adds the parent directory to the system path
+
+from litellm.caching import local_semantic_index
+from litellm.caching.local_semantic_index import LocalSemanticIndex
+
+requires_numpy = pytest.mark.skipif(
+    local_semantic_index._get_numpy() is None, reason="numpy is not installed"
+)
+
+
+@pytest.fixture
+def make_index():
+    if local_semantic_index._get_numpy() is None:
+        pytest.skip("numpy is not installed")
+    return LocalSemanticIndex
+
+
+def test_search_returns_best_match_above_threshold(make_index):
+    index = make_index(similarity_threshold=0.9)
+    index.add([1.0, 0.0, 0.0], "paris", "r1")
+    index.add([0.0, 1.0, 0.0], "madrid", "r2")
+
+    match = index.search([0.1, 1.0, 0.0])
+    assert match is not None
+    assert (match.prompt, match.response) == ("madrid", "r2")
+    assert match.similarity == pytest.approx(0.995, abs=1e-3)
+
+    assert index.search([1.0, 1.0, 0.0]) is None  # similarity 0.707
+
+
+def test_ring_buffer_evicts_oldest(make_index):
+    index = make_index(similarity_threshold=0.99, max_size=2)
+    index.add([1.0, 0.0, 0.0], "a", "ra")
+    index.add([0.0, 1.0, 0.0], "b", "rb")
+    index.add([0.0, 0.0, 1.0], "c", "rc")
+
+    assert index.search([1.0, 0.0, 0.0]) is None
+    assert index.search([0.0, 1.0, 0.0]).response == "rb"
+    assert index.search([0.0, 0.0, 1.0]).response == "rc"
+
+
+def test_expired_entries_are_not_served(make_index):
+    index = make_index(similarity_threshold=0.9)
+    index.add([1.0, 0.0], "old", "stale", ttl=-1)
+    index.add([0.9, 0.1], "new", "fresh")
+
+    assert index.search([1.0, 0.0]).response == "fresh"
+
+
+def test_disabled_index_only_memoizes_embeddings(make_index):
+    index = make_index(similarity_threshold=0.5, max_size=0)
+    index.add([1.0, 0.0], "a", "ra")
+    index.set_embedding("text-embedding-3-small", "a", [0.5, 0.25])
+
+    assert index.search([1.0, 0.0]) is None
+    assert index.get_embedding("text-embedding-3-small", "a") == [0.5, 0.25]
+    assert index.get_embedding("other-model", "a") is None
+
+
+def test_index_is_disabled_without_numpy():
+    with patch.object(local_semantic_index, "_get_numpy", return_value=None):
+        index = LocalSemanticIndex(similarity_threshold=0.5, max_size=16)
+    index.add([1.0, 0.0], "a", "ra")
+    index.set_embedding("text-embedding-3-small", "a", [0.5, 0.25])
+
+    assert index.max_size == 0
+    assert index.search([1.0, 0.0]) is None
+    assert index.get_embedding("text-embedding-3-small", "a") == [0.5, 0.25]
+
+
+@requires_numpy
+def test_memory_mapped_vectors(tmp_path):
+    mmap_path = str(tmp_path / "index.npy")
+    index = LocalSemanticIndex(similarity_threshold=0.9, mmap_path=mmap_path)
+    other_index = LocalSemanticIndex(similarity_threshold=0.9, mmap_path=mmap_path)
+    index.add([0.0, 2.0], "a", "ra")
+    other_index.add([2.0, 0.0], "b", "rb")
+
+    # indexes sharing a path each get their own file
+    assert index.search([0.0, 1.0]).response == "ra"
+    assert other_index.search([0.0, 1.0]) is None
+    assert index.mmap_path != other_index.mmap_path
+    assert sorted(os.listdir(tmp_path)) == sorted(
+        os.path.basename(i.mmap_path) for i in (index, other_index)
+    )
+
+    del index, other_index
+    gc.collect()
+    assert os.listdir(tmp_path) == []
+
+
+@requires_numpy
+@pytest.mark.asyncio
+async def test_redis_semantic_cache_answers_locally_after_set(monkeypatch):
+    with patch.dict(
+        "sys.modules",
+        {
+            "redisvl.extensions.llmcache": MagicMock(SemanticCache=MagicMock()),
+            "redisvl.utils.vectorize": MagicMock(CustomTextVectorizer=MagicMock()),
+        },
+    ):
+        from litellm.caching.redis_semantic_cache import RedisSemanticCache
+
+        monkeypatch.setenv("REDIS_HOST", "localhost")
+        monkeypatch.setenv("REDIS_PORT", "6379")
+        monkeypatch.setenv("REDIS_PASSWORD", "test_password")
+        cache = RedisSemanticCache(similarity_threshold=0.8)
+
+    cache.llmcache.astore = AsyncMock()
+    cache.llmcache.acheck = AsyncMock(return_value=[])
+    embeddings = {
+        "What is the capital of France?": [0.1, 0.2, 0.3],
+        "What's the capital of France?": [0.1, 0.21, 0.3],
+    }
+    embedding_calls = []
+
+    async def _aembedding(model, input, **kwargs):
+        embedding_calls.append(input)
+        return {"data": [{"embedding": embeddings[input]}]}
+
+    proxy_server = MagicMock(llm_router=None, llm_model_list=None)
+    with patch("litellm.aembedding", new=_aembedding), patch.dict(
+        "sys.modules", {"litellm.proxy.proxy_server": proxy_server}
+    ):
+        await cache.async_set_cache(
+            key="test_key",
+            value='{"content": "Paris"}',
+            messages=[{"content": "What is the capital of France?"}],
+        )
+        metadata: dict = {}
+        for prompt in embeddings:
+            result = await cache.async_get_cache(
+                key="test_key", messages=[{"content": prompt}], metadata=metadata
+            )
+            assert result == {"content": "Paris"}
+
+    cache.llmcache.astore.assert_awaited_once()
+    cache.llmcache.acheck.assert_not_called()
+    assert embedding_calls == list(embeddings)  # set + get reuse the memo
+    assert metadata["semantic-similarity"] > 0.99
+
+
+# A~B and B~C pass a 0.8 threshold (cosine 0.866), A~C doesn't (cosine 0.5)
+_CHAINED_EMBEDDINGS = {
+    "a": [1.0, 0.0],
+    "b": [0.866, 0.5],
+    "c": [0.5, 0.866],
+}
+
+
+async def _chained_aembedding(model, input, **kwargs):
+    return {"data": [{"embedding": _CHAINED_EMBEDDINGS[input]}]}
+
+
+@requires_numpy
+@pytest.mark.asyncio
+async def test_redis_remote_hit_is_indexed_under_stored_prompt(monkeypatch):
+    with patch.dict(
+        "sys.modules",
+        {
+            "redisvl.extensions.llmcache": MagicMock(SemanticCache=MagicMock()),
+            "redisvl.utils.vectorize": MagicMock(CustomTextVectorizer=MagicMock()),
+        },
+    ):
+        from litellm.caching.redis_semantic_cache import RedisSemanticCache
+
+        monkeypatch.setenv("REDIS_HOST", "localhost")
+        monkeypatch.setenv("REDIS_PORT", "6379")
+        monkeypatch.setenv("REDIS_PASSWORD", "test_password")
+        cache = RedisSemanticCache(similarity_threshold=0.8)
+
+    hit_a = {"prompt": "a", "response": '{"content": "A"}', "vector_distance": 0.134}
+    # "a" misses, "b" matches the stored "a", "c" is too far from "a"
+    cache.llmcache.acheck = AsyncMock(side_effect=[[], [hit_a], []])
+
+    proxy_server = MagicMock(llm_router=None, llm_model_list=None)
+    with patch("litellm.aembedding", new=_chained_aembedding), patch.dict(
+        "sys.modules", {"litellm.proxy.proxy_server": proxy_server}
+    ):
+        results = [
+            await cache.async_get_cache(
+                key="test_key", messages=[{"content": prompt}], metadata={}
+            )
+            for prompt in ("a", "b", "c", "b")
+        ]
+
+    assert results == [None, {"content": "A"}, None, {"content": "A"}]
+    # the last "b" is answered locally
+    assert cache.llmcache.acheck.await_count == 3
+
+
+@requires_numpy
+def test_qdrant_remote_hit_is_indexed_under_stored_vector():
+    with patch("litellm.llms.custom_httpx.http_handler._get_httpx_client") as client:
+        client.return_value.get.return_value = MagicMock(
+            status_code=200, json=MagicMock(return_value={"result": {"exists": True}})
+        )
+        from litellm.caching.qdrant_semantic_cache import QdrantSemanticCache
+
+        cache = QdrantSemanticCache(
+            collection_name="test_collection",
+            qdrant_api_base="http://test.qdrant.local",
+            qdrant_api_key="test_key",
+            similarity_threshold=0.8,
+        )
+
+    def _search(url, headers, json):
+        query = json["vector"]
+        score = sum(x * y for x, y in zip(query, _CHAINED_EMBEDDINGS["a"]))
+        point = {
+            "payload": {"text": "a", "response": '{"content": "A"}'},
+            "score": score,
+            "vector": _CHAINED_EMBEDDINGS["a"] if json.get("with_vector") else None,
+        }
+        return MagicMock(json=MagicMock(return_value={"result": [point]}))
+
+    cache.sync_client.post = MagicMock(side_effect=_search)
+    embeddings = [{"data": [{"embedding": _CHAINED_EMBEDDINGS[p]}]} for p in "bcb"]
+    with patch("litellm.embedding", side_effect=embeddings):
+        results = [
+            cache.get_cache(key="test_key", messages=[{"content": prompt}])
+            for prompt in "bcb"
+        ]
+
+    assert results == [{"content": "A"}, None, {"content": "A"}]
+    # "c" goes to qdrant and is rejected there, the last "b" is answered locally
+    assert cache.sync_client.post.call_count == 2
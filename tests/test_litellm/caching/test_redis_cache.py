@@ -96,6 +96,42 @@ async def test_redis_cache_async_batch_get_cache(monkeypatch, redis_no_ping):
         assert result["key3"] == {"key3": "value3"}
 
 
+@pytest.mark.asyncio
+async def test_redis_cache_codec_roundtrip(monkeypatch, redis_no_ping):
+    pytest.importorskip("msgpack")
+    pytest.importorskip("zstandard")
+    monkeypatch.setenv("REDIS_HOST", "https://my-test-host")
+    redis_cache = RedisCache(
+        serializer="msgpack", compression="zstd", compression_min_bytes=1024
+    )
+    assert "serializer" not in redis_cache.redis_kwargs
+
+    store = {}
+
+    async def _set(name, value, **kwargs):
+        store[name] = value
+        return True
+
+    async def _get(name):
+        return store.get(name)
+
+    mock_redis_instance = AsyncMock()
+    mock_redis_instance.set.side_effect = _set
+    mock_redis_instance.get.side_effect = _get
+    value = {"timestamp": 1.0, "response": '{"id": "chatcmpl-1"}' * 200}
+
+    with patch.object(
+        redis_cache, "init_async_client", return_value=mock_redis_instance
+    ):
+        await redis_cache.async_set_cache("key", value)
+        assert len(store["key"]) < 1024
+        assert await redis_cache.async_get_cache("key") == value
+
+        # entries written before the codec existed still decode
+        store["legacy"] = b'{"key": "value"}'
+        assert await redis_cache.async_get_cache("legacy") == {"key": "value"}
+
+
 @pytest.mark.asyncio
 async def test_handle_lpop_count_for_older_redis_versions(monkeypatch):
     """Test the helper method that handles LPOP with count for Redis versions < 7.0"""
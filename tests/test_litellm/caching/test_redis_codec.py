@@ -0,0 +1,92 @@
+import json
+import os
+import sys
+
+import pytest
+
+sys.path.insert(
+    0, os.path.abspath("../../..")
+)  # Adds the parent directory to the system path
+
+from litellm.caching.redis_codec import CODEC_HEADER_MAGIC, RedisCacheCodec
+
+CACHED_RESPONSE = {
+    "timestamp": 1718000000.5,
+    "response": json.dumps(
+        {"id": "chatcmpl-1", "choices": [{"message": {"content": "hi " * 2000}}]}
+    ),
+}
+EMBEDDING = {"embedding": [0.001 * i for i in range(1536)], "index": 0}
+
+
+@pytest.mark.parametrize(
+    "serializer, compression",
+    [("json", None), ("json", "zstd"), ("msgpack", None), ("msgpack", "zstd")],
+)
+@pytest.mark.parametrize("value", [CACHED_RESPONSE, EMBEDDING, "text", ["a", 1]])
+def test_codec_roundtrip(serializer, compression, value):
+    pytest.importorskip("msgpack")
+    pytest.importorskip("zstandard")
+    codec = RedisCacheCodec(
+        serializer=serializer, compression=compression, compression_min_bytes=1024
+    )
+    assert codec.decode(codec.encode(value)) == value
+
+
+def test_default_codec_writes_plain_json():
+    codec = RedisCacheCodec()
+    encoded = codec.encode({"user_id": "u1", "spend": 1.5})
+    assert json.loads(encoded) == {"user_id": "u1", "spend": 1.5}
+
+
+def test_numbers_are_never_prefixed():
+    pytest.importorskip("msgpack")
+    codec = RedisCacheCodec(serializer="msgpack")
+    assert codec.encode(10) == b"10"
+    assert codec.encode(1.5) == b"1.5"
+    assert codec.encode(None) == b"null"
+    assert codec.encode({"a": 1}).startswith(CODEC_HEADER_MAGIC)
+
+
+def test_compression_threshold():
+    pytest.importorskip("zstandard")
+    codec = RedisCacheCodec(compression="zstd", compression_min_bytes=1024)
+    assert not codec.encode({"small": "value"}).startswith(CODEC_HEADER_MAGIC)
+    compressed = codec.encode(CACHED_RESPONSE)
+    assert compressed.startswith(CODEC_HEADER_MAGIC)
+    assert len(compressed) < len(json.dumps(CACHED_RESPONSE)) / 10
+
+
+@pytest.mark.parametrize(
+    "raw, expected",
+    [
+        (json.dumps({"key": "value"}).encode("utf-8"), {"key": "value"}),
+        (
+            str({"key": "value", "flag": True}).encode("utf-8"),
+            {"key": "value", "flag": True},
+        ),
+        ('{"key": "value"}', {"key": "value"}),
+        (None, None),
+    ],
+)
+def test_decodes_entries_written_by_older_versions(raw, expected):
+    """json.dumps() (async writes) and str(value) (sync writes) entries still decode"""
+    assert RedisCacheCodec(serializer="json").decode(raw) == expected
+
+
+def test_decode_does_not_depend_on_configured_serializer():
+    pytest.importorskip("msgpack")
+    pytest.importorskip("zstandard")
+    writer = RedisCacheCodec(serializer="msgpack", compression="zstd")
+    reader = RedisCacheCodec(serializer="json")
+    assert reader.decode(writer.encode(CACHED_RESPONSE)) == CACHED_RESPONSE
+
+
+def test_unknown_header_version_raises():
+    with pytest.raises(ValueError, match="version"):
+        RedisCacheCodec().decode(CODEC_HEADER_MAGIC + bytes((9, 1, 0)) + b"{}")
+
+
+def test_invalid_serializer_raises():
+    with pytest.raises(ValueError, match="serializer"):
+        RedisCacheCodec(serializer="pickle")
@@ -0,0 +1,131 @@
+"""
+Tests for the MCP session pool, against a local stdio MCP server
+"""
+
+import os
+import signal
+import sys
+import textwrap
+
+import pytest
+
+sys.path.insert(0, "../../../")
+
+from litellm.experimental_mcp_client.client import MCPClient
+from litellm.experimental_mcp_client.session_pool import MCPSessionPool
+from litellm.types.mcp import MCPStdioConfig, MCPTransport
+
+SERVER_SCRIPT = textwrap.dedent("""
+    import os
+
+    from mcp.server.fastmcp import Context, FastMCP
+
+    mcp = FastMCP("pool-test")
+
+    @mcp.tool()
+    def pid() -> str:
+        return str(os.getpid())
+
+    @mcp.tool()
+    async def change_tools(ctx: Context) -> str:
+        await ctx.session.send_tool_list_changed()
+        return "ok"
+
+    mcp.run()
+    """)
+
+
+@pytest.fixture
+def stdio_config(tmp_path) -> MCPStdioConfig:
+    script = tmp_path / "server.py"
+    script.write_text(SERVER_SCRIPT)
+    return MCPStdioConfig(command=sys.executable, args=[str(script)], env={})
+
+
+def _client(pool: MCPSessionPool, stdio_config, server_id="server-1") -> MCPClient:
+    return MCPClient(
+        transport_type=MCPTransport.stdio,
+        stdio_config=stdio_config,
+        session_pool=pool,
+        session_pool_server_id=server_id,
+    )
+
+
+async def _call(client: MCPClient, name: str) -> str:
+    async def _operation(session):
+        result = await session.call_tool(name, {})
+        return result.content[0].text
+
+    return await client.run_with_session(_operation)
+
+
+@pytest.mark.asyncio
+async def test_session_is_reused_across_clients(stdio_config):
+    pool = MCPSessionPool()
+    try:
+        first = await _call(_client(pool, stdio_config), "pid")
+        second = await _call(_client(pool, stdio_config), "pid")
+        assert first == second
+        assert len(pool) == 1
+
+        # a different server id gets its own session
+        other = await _call(_client(pool, stdio_config, "server-2"), "pid")
+        assert other != first
+        assert len(pool) == 2
+    finally:
+        await pool.close_all()
+    assert len(pool) == 0
+
+
+@pytest.mark.asyncio
+async def test_lost_session_is_replaced_and_call_retried(stdio_config):
+    pool = MCPSessionPool(health_check_interval=3600)
+    try:
+        client = _client(pool, stdio_config)
+        first = await _call(client, "pid")
+        os.kill(int(first), signal.SIGKILL)
+
+        second = await _call(client, "pid")
+        assert second != first
+        assert len(pool) == 1
+    finally:
+        await pool.close_all()
+
+
+@pytest.mark.asyncio
+async def test_unhealthy_session_is_replaced_before_use(stdio_config):
+    pool = MCPSessionPool(health_check_interval=0)
+    try:
+        client = _client(pool, stdio_config)
+        first = await _call(client, "pid")
+        assert await _call(client, "pid") == first
+
+        os.kill(int(first), signal.SIGKILL)
+        assert await _call(client, "pid") != first
+    finally:
+        await pool.close_all()
+
+
+@pytest.mark.asyncio
+async def test_close_server_closes_its_sessions(stdio_config):
+    pool = MCPSessionPool()
+    try:
+        first = await _call(_client(pool, stdio_config), "pid")
+        await _call(_client(pool, stdio_config, "server-2"), "pid")
+
+        pool.close_server("server-1")
+        assert len(pool) == 1
+        assert await _call(_client(pool, stdio_config), "pid") != first
+    finally:
+        await pool.close_all()
+
+
+@pytest.mark.asyncio
+async def test_tools_list_changed_is_reported(stdio_config):
+    changed = []
+    pool = MCPSessionPool(on_tools_list_changed=changed.append)
+    try:
+        assert await _call(_client(pool, stdio_config), "change_tools") == "ok"
+        assert changed == ["server-1"]
+    finally:
+        await pool.close_all()
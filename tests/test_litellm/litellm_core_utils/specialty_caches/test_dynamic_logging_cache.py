@@ -44,7 +44,7 @@ class TestLangfuseInMemoryCache:
             expired_time = time.time() - 1  # Already expired
             self.cache.cache_dict["test_key"] = mock_logger
             self.cache.ttl_dict["test_key"] = expired_time
-            self.cache.expiration_heap = [(expired_time, "test_key")]
+            self.cache._schedule_expiry("test_key", expired_time)
 
             initial_count = litellm.initialized_langfuse_clients
 
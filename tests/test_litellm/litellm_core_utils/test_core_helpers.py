@@ -43,3 +43,46 @@ def test_reconstruct_model_name_returns_original_for_other_providers():
     )
 
     assert result == "claude-3-sonnet"
+
+
+def test_snapshot_messages_isolated_from_original():
+    """Mutating the original messages after the snapshot must not change it."""
+    from litellm.litellm_core_utils.core_helpers import snapshot_messages
+
+    image_url = "data:image/png;base64," + "A" * 1024
+    messages = [
+        {"role": "system", "content": "be brief"},
+        {
+            "role": "user",
+            "content": [
+                {"type": "text", "text": "what is this?"},
+                {"type": "image_url", "image_url": {"url": image_url}},
+            ],
+        },
+    ]
+
+    snapshot = snapshot_messages(messages)
+    messages[0]["content"] = "changed"
+    messages[1]["content"][1]["image_url"]["url"] = "redacted"
+    messages.append({"role": "assistant", "content": "hi"})
+
+    assert snapshot[0]["content"] == "be brief"
+    assert snapshot[1]["content"][1]["image_url"]["url"] == image_url
+    assert len(snapshot) == 2
+    # immutable leaves are shared, not copied
+    assert snapshot[1]["content"][1]["image_url"]["url"] is image_url
+
+
+def test_snapshot_messages_deep_copies_other_objects():
+    from litellm.litellm_core_utils.core_helpers import snapshot_messages
+
+    class ToolCall:
+        def __init__(self, name):
+            self.name = name
+
+    tool_call = ToolCall("get_weather")
+    snapshot = snapshot_messages([{"role": "assistant", "tool_calls": (tool_call,)}])
+    tool_call.name = "changed"
+
+    assert snapshot[0]["tool_calls"][0].name == "get_weather"
+    assert snapshot_messages(None) is None
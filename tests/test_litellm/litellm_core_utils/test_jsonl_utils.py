@@ -0,0 +1,96 @@
+import io
+import json
+
+import pytest
+
+from litellm.litellm_core_utils.jsonl_utils import (
+    JSONLDecoder,
+    aiter_jsonl,
+    iter_jsonl,
+    write_jsonl,
+)
+
+RECORDS = [
+    {"id": 1, "text": "héllo wörld"},
+    {"id": 2, "nested": {"field": "Value\nWith\nNewlines"}},
+    {"id": 3, "emoji": "🚀"},
+]
+
+
+def _jsonl_bytes() -> bytes:
+    return "\n".join(json.dumps(r, ensure_ascii=False) for r in RECORDS).encode()
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 7, 1024])
+def test_iter_jsonl_bytes_split_at_any_position(chunk_size):
+    # small chunk sizes split multi-byte utf-8 characters across chunks
+    assert list(iter_jsonl(_jsonl_bytes(), chunk_size=chunk_size)) == RECORDS
+
+
+def test_iter_jsonl_sources():
+    content = _jsonl_bytes()
+    assert list(iter_jsonl(content.decode())) == RECORDS
+    assert list(iter_jsonl(io.BytesIO(content), chunk_size=5)) == RECORDS
+    assert list(iter_jsonl(io.StringIO(content.decode()), chunk_size=5)) == RECORDS
+    assert list(iter_jsonl([content[:10], content[10:]])) == RECORDS
+
+
+def test_iter_jsonl_multiline_records():
+    content = (
+        '{\n  "id": 1,\n  "msg": "raw\nnewline"\n}\n\n'
+        '{"id": 2}\r\n'
+        "   \n"
+        '{"id": 3}'
+    )
+    assert list(iter_jsonl(content)) == [
+        {"id": 1, "msg": "raw\nnewline"},
+        {"id": 2},
+        {"id": 3},
+    ]
+
+
+def test_iter_jsonl_is_lazy():
+    records = iter_jsonl(b'{"id": 1}\n{"id": 2}\nnot json', chunk_size=4)
+    assert next(records) == {"id": 1}
+    assert next(records) == {"id": 2}
+    with pytest.raises(json.JSONDecodeError):
+        next(records)
+
+
+def test_corrupt_line_raises_without_joining_following_lines():
+    decoder = JSONLDecoder()
+    assert decoder.feed('{"id": 1}\n') == [{"id": 1}]
+    with pytest.raises(json.JSONDecodeError):
+        decoder.feed('{"id": 2,, "x": 1}\n{"id": 3}\n')
+
+    # an unterminated string swallows at most the line that closes it
+    records = iter_jsonl('{"id": "abc\n{"id": 3}\n' + '{"id": 4}\n' * 1000)
+    with pytest.raises(json.JSONDecodeError):
+        next(records)
+
+
+def test_decoder_feed_and_close():
+    decoder = JSONLDecoder()
+    assert decoder.feed('{"a": ') == []
+    assert decoder.feed('1}\n{"b"') == [{"a": 1}]
+    assert decoder.feed(": 2}") == []
+    assert decoder.close() == [{"b": 2}]
+    assert decoder.close() == []
+
+
+@pytest.mark.asyncio
+async def test_aiter_jsonl():
+    content = _jsonl_bytes()
+
+    async def chunks():
+        for i in range(0, len(content), 4):
+            yield content[i : i + 4]
+
+    assert [r async for r in aiter_jsonl(chunks())] == RECORDS
+
+
+def test_write_jsonl_round_trip():
+    file = io.BytesIO()
+    assert write_jsonl(iter(RECORDS), file) == 3
+    assert list(iter_jsonl(file.getvalue())) == RECORDS
+    assert not file.getvalue().endswith(b"\n")
@@ -0,0 +1,112 @@
+import json
+import os
+import sys
+from unittest.mock import patch
+
+sys.path.insert(
+    0, os.path.abspath("../../..")
+)  # Adds the parent directory to the system path
+
+import litellm
+from litellm.litellm_core_utils import model_cost_index
+from litellm.litellm_core_utils.get_model_cost_map import apply_remote_model_cost_map
+
+
+def _write_model_cost_map(tmp_path, model_cost: dict) -> str:
+    source_path = tmp_path / "model_prices_and_context_window_backup.json"
+    source_path.write_text(json.dumps(model_cost))
+    return str(source_path)
+
+
+def test_index_matches_bundled_json_and_is_reused(tmp_path):
+    source_path = _write_model_cost_map(
+        tmp_path,
+        {
+            "gpt-4o": {"litellm_provider": "openai", "mode": "chat"},
+            "claude-3": {"litellm_provider": "anthropic", "mode": "chat"},
+            "sample_spec": {"mode": "chat"},
+        },
+    )
+    index_dir = str(tmp_path / "idx")
+    with patch.object(
+        model_cost_index, "get_model_cost_map_path", return_value=source_path
+    ), patch.object(model_cost_index, "MODEL_COST_INDEX_DIR", index_dir):
+        model_cost, provider_models = model_cost_index.load_model_cost_index()
+        assert model_cost == json.loads(open(source_path).read())
+        assert provider_models == {"openai": ["gpt-4o"], "anthropic": ["claude-3"]}
+        assert len(os.listdir(tmp_path / "idx")) == 1
+
+        with patch("json.load") as json_load:
+            cached_model_cost, _ = model_cost_index.load_model_cost_index()
+        json_load.assert_not_called()
+        assert cached_model_cost == model_cost
+        assert cached_model_cost is not model_cost
+
+
+def test_index_is_rebuilt_when_json_changes(tmp_path):
+    source_path = _write_model_cost_map(
+        tmp_path, {"gpt-4o": {"litellm_provider": "openai"}}
+    )
+    index_dir = str(tmp_path / "idx")
+    with patch.object(
+        model_cost_index, "get_model_cost_map_path", return_value=source_path
+    ), patch.object(model_cost_index, "MODEL_COST_INDEX_DIR", index_dir):
+        model_cost_index.load_model_cost_index()
+        _write_model_cost_map(
+            tmp_path,
+            {
+                "gpt-4o": {"litellm_provider": "openai"},
+                "gpt-5": {"litellm_provider": "openai"},
+            },
+        )
+        model_cost, provider_models = model_cost_index.load_model_cost_index()
+    assert set(model_cost) == {"gpt-4o", "gpt-5"}
+    assert provider_models == {"openai": ["gpt-4o", "gpt-5"]}
+
+
+def test_add_known_models_uses_provider_grouping():
+    litellm.add_known_models(
+        model_cost_map={
+            "new-anthropic-model": {"litellm_provider": "anthropic"},
+            "vertex_ai/new-claude": {
+                "litellm_provider": "vertex_ai-anthropic_models"
+            },
+            "ft:gpt-4o": {"litellm_provider": "openai"},
+            "bedrock/us-east-1/new-model": {"litellm_provider": "bedrock"},
+            "j3-chat": {"litellm_provider": "ai21", "mode": "chat"},
+        }
+    )
+    assert "new-anthropic-model" in litellm.anthropic_models
+    assert "new-claude" in litellm.vertex_anthropic_models
+    # pricing-only 'ft:<model>' keys are skipped
+    assert "ft:gpt-4o" not in litellm.open_ai_chat_completion_models
+    assert "bedrock/us-east-1/new-model" not in litellm.bedrock_models
+    assert "j3-chat" in litellm.ai21_chat_models
+
+
+def test_remote_map_is_applied_without_dropping_registered_models():
+    original_model_cost = litellm.model_cost
+    bundled = {"gpt-4o": {"litellm_provider": "openai", "input_cost_per_token": 1}}
+    loaded = {
+        **bundled,
+        "my-model": {"litellm_provider": "openai", "input_cost_per_token": 3},
+    }
+    remote = {
+        "gpt-4o": {"litellm_provider": "openai", "input_cost_per_token": 2},
+        "remote-only-model": {"litellm_provider": "anthropic"},
+    }
+    try:
+        litellm.model_cost = loaded
+        with patch(
+            "litellm.litellm_core_utils.get_model_cost_map.get_local_model_cost_map",
+            return_value=json.loads(json.dumps(bundled)),
+        ):
+            assert apply_remote_model_cost_map(remote, loaded_model_cost=loaded)
+        assert litellm.model_cost["gpt-4o"]["input_cost_per_token"] == 2
+        assert litellm.model_cost["my-model"]["input_cost_per_token"] == 3
+        assert "remote-only-model" in litellm.anthropic_models
+
+        # model_cost replaced since import (e.g. /reload/model_cost_map) -> skipped
+        assert not apply_remote_model_cost_map(remote, loaded_model_cost=loaded)
+    finally:
+        litellm.model_cost = original_model_cost
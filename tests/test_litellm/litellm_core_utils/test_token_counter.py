@@ -972,3 +972,92 @@ def test_token_counter_with_thinking_content():
     # Should only count "Response" and message overhead
     assert tokens_no_thinking < 15, f"Expected minimal token count for empty thinking block, got {tokens_no_thinking}"
 
+
+
+def test_token_counter_memoizes_text_messages():
+    """
+    Repeated text-only messages are only encoded once per tokenizer
+    """
+    from litellm.litellm_core_utils import token_counter as token_counter_module
+
+    token_counter_module._message_token_count_cache.clear()
+    messages = [
+        {"role": "system", "content": "You are a helpful assistant."},
+        {"role": "user", "content": "Hey, how's it going?"},
+    ]
+    first = token_counter_new(model="gpt-4o", messages=messages)
+
+    with patch.object(
+        token_counter_module, "_count_message", wraps=token_counter_module._count_message
+    ) as mock_count_message:
+        messages.append({"role": "user", "content": "What's the weather?"})
+        second = token_counter_new(model="gpt-4o", messages=messages)
+
+    # only the new message was counted
+    assert mock_count_message.call_count == 1
+    assert second > first
+    token_counter_module._message_token_count_cache.clear()
+    assert token_counter_new(model="gpt-4o", messages=messages) == second
+
+
+def test_token_counter_memo_keys_by_tokenizer_and_content():
+    from litellm.litellm_core_utils.token_counter import (
+        _get_message_token_count_cache_key,
+    )
+
+    message = {"role": "user", "content": "hello world"}
+    assert _get_message_token_count_cache_key(
+        "gpt-4o", message
+    ) != _get_message_token_count_cache_key("claude-2", message)
+    assert _get_message_token_count_cache_key(
+        "gpt-4o", message
+    ) == _get_message_token_count_cache_key(
+        "gpt-4o", {"role": "user", "content": "hello world"}
+    )
+    assert _get_message_token_count_cache_key(
+        "gpt-4o", message
+    ) != _get_message_token_count_cache_key(
+        "gpt-4o", {"role": "user", "content": "hello world!"}
+    )
+    # images / tool calls are never memoized
+    assert (
+        _get_message_token_count_cache_key(
+            "gpt-4o",
+            {
+                "role": "user",
+                "content": [
+                    {"type": "image_url", "image_url": {"url": "https://x.png"}}
+                ],
+            },
+        )
+        is None
+    )
+
+
+@pytest.mark.parametrize(
+    "messages",
+    [
+        [{"role": "user", "content": "Hello, world!"}],
+        [{"role": "user", "content": text}],
+        [{"role": "user", "content": "日本語のテキスト 🚀" * 50, "name": "tester"}],
+        [{"role": "user", "content": [{"type": "text", "text": "hi " * 100}]}],
+        [{"role": "tool", "content": "72F", "tool_call_id": "call_abc123"}],
+    ],
+)
+@pytest.mark.parametrize("model", ["", "gpt-4o", "gpt-3.5-turbo"])
+def test_get_token_count_upper_bound(messages, model):
+    from litellm.litellm_core_utils.token_counter import get_token_count_upper_bound
+
+    upper_bound = get_token_count_upper_bound(messages)
+    assert upper_bound is not None
+    assert upper_bound >= token_counter_new(model=model, messages=messages)
+
+
+def test_get_token_count_upper_bound_requires_text_only():
+    from litellm.litellm_core_utils.token_counter import get_token_count_upper_bound
+
+    assert get_token_count_upper_bound([MESSAGES_WITH_IMAGES[0]["message"]]) is None
+    assert (
+        get_token_count_upper_bound([{"role": "custom role", "content": "hi"}])
+        is None
+    )
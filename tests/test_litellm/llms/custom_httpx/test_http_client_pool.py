@@ -0,0 +1,150 @@
+import asyncio
+import os
+import sys
+
+import httpx
+import pytest
+
+sys.path.insert(
+    0, os.path.abspath("../../../..")
+)  # Adds the parent directory to the system path
+import litellm
+from litellm.llms.custom_httpx.http_client_pool import (
+    HTTPClientPoolManager,
+    get_http_client_pool_metrics,
+)
+from litellm.llms.custom_httpx.http_handler import (
+    AsyncHTTPHandler,
+    _get_httpx_client,
+    get_async_httpx_client,
+)
+from litellm.types.utils import LlmProviders
+
+
+class _FakeClient:
+    is_closed = False
+
+
+class _FakeHandler:
+    def __init__(self, pool_settings=None):
+        self.pool_settings = pool_settings
+        self.client = _FakeClient()
+        self.close_calls = 0
+
+    async def close(self):
+        self.close_calls += 1
+        self.client.is_closed = True
+
+
+@pytest.fixture
+def pool_settings():
+    original = litellm.http_client_pool_settings
+    yield
+    litellm.http_client_pool_settings = original
+
+
+@pytest.mark.asyncio
+async def test_pool_key_is_stable_and_closed_clients_are_replaced():
+    pool = HTTPClientPoolManager()
+    client = pool.get_client(
+        "async", "openai", {"timeout": 5, "headers": {"a": "1", "b": "2"}}, _FakeHandler
+    )
+    same_client = pool.get_client(
+        "async", "openai", {"headers": {"b": "2", "a": "1"}, "timeout": 5}, _FakeHandler
+    )
+    assert client is same_client
+    assert pool.get_client("async", "anthropic", None, _FakeHandler) is not client
+
+    client.client.is_closed = True
+    new_client = pool.get_client(
+        "async", "openai", {"timeout": 5, "headers": {"a": "1", "b": "2"}}, _FakeHandler
+    )
+    assert new_client is not client
+    assert pool.get_stats()["clients_replaced"] == 1
+
+
+@pytest.mark.asyncio
+async def test_pool_settings_per_provider_and_drain_on_change(pool_settings):
+    pool = HTTPClientPoolManager(drain_timeout=0.01)
+    litellm.http_client_pool_settings = {
+        "default": {"max_connections": 100},
+        "openai": {"max_connections_per_host": 10, "http2": True},
+    }
+    openai_client = pool.get_client("async", LlmProviders.OPENAI, None, _FakeHandler)
+    anthropic_client = pool.get_client("async", "anthropic", None, _FakeHandler)
+    assert openai_client.pool_settings == {
+        "max_connections": 100,
+        "max_connections_per_host": 10,
+        "http2": True,
+    }
+    assert anthropic_client.pool_settings == {"max_connections": 100}
+
+    # equal settings (e.g. config reloaded without changes) keep the clients
+    litellm.http_client_pool_settings = {
+        "default": {"max_connections": 100},
+        "openai": {"max_connections_per_host": 10, "http2": True},
+    }
+    assert pool.get_client("async", "openai", None, _FakeHandler) is openai_client
+
+    litellm.http_client_pool_settings = {"default": {"max_connections": 200}}
+    new_openai_client = pool.get_client("async", "openai", None, _FakeHandler)
+    assert new_openai_client is not openai_client
+    assert new_openai_client.pool_settings == {"max_connections": 200}
+
+    # drained clients stay open for in-flight requests until the drain timeout
+    assert openai_client.close_calls == 0
+    await asyncio.sleep(0.05)
+    assert openai_client.close_calls == 1
+    assert anthropic_client.close_calls == 1
+    assert new_openai_client.close_calls == 0
+
+
+@pytest.mark.asyncio
+async def test_pool_drains_least_recently_used_client_when_full():
+    pool = HTTPClientPoolManager(max_clients=2, drain_timeout=0)
+    first = pool.get_client("async", "a", None, _FakeHandler)
+    second = pool.get_client("async", "b", None, _FakeHandler)
+    pool.get_client("async", "a", None, _FakeHandler)
+    pool.get_client("async", "c", None, _FakeHandler)
+    await asyncio.sleep(0.01)
+    assert first.close_calls == 0
+    assert second.close_calls == 1
+
+
+@pytest.mark.asyncio
+async def test_pool_does_not_close_clients_on_shared_sessions():
+    pool = HTTPClientPoolManager(drain_timeout=0)
+    client = pool.get_client(
+        "async", "openai", None, _FakeHandler, owns_transport=False
+    )
+    pool.drain()
+    await pool.aclose()
+    await asyncio.sleep(0.01)
+    assert client.close_calls == 0
+
+
+@pytest.mark.asyncio
+async def test_get_async_httpx_client_uses_pool_settings(pool_settings):
+    litellm.http_client_pool_settings = {"anthropic": {"max_connections": 7}}
+    params = {"timeout": httpx.Timeout(timeout=30.0, connect=5.0)}
+    client = get_async_httpx_client(llm_provider=LlmProviders.ANTHROPIC, params=params)
+    assert isinstance(client, AsyncHTTPHandler)
+    assert client.pool_settings == {"max_connections": 7}
+    assert "shared_session" not in params
+    assert (
+        get_async_httpx_client(
+            llm_provider=LlmProviders.ANTHROPIC,
+            params={"timeout": httpx.Timeout(timeout=30.0, connect=5.0)},
+        )
+        is client
+    )
+
+    metrics = get_http_client_pool_metrics()
+    assert any(metric["provider"] == "anthropic" for metric in metrics)
+
+
+def test_get_httpx_client_is_pooled():
+    client = _get_httpx_client({"timeout": 30})
+    assert _get_httpx_client({"timeout": 30}) is client
+    client.close()
+    assert _get_httpx_client({"timeout": 30}) is not client
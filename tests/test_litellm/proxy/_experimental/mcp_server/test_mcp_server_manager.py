@@ -1867,6 +1867,107 @@ class TestMCPServerManager:
         assert resolved_server.name == "Test Server Name"  # name is different
         assert resolved_server.server_name == "test_server"  # server_name matches
 
+    @pytest.mark.asyncio
+    async def test_get_tools_from_server_caches_tool_catalog(self):
+        """Tool listings are cached per server and auth context until invalidated."""
+        manager = MCPServerManager()
+        server = MCPServer(
+            server_id="zapier",
+            name="zapier",
+            transport=MCPTransport.http,
+        )
+        manager.registry = {server.server_id: server}
+        manager._create_mcp_client = MagicMock(return_value=MagicMock())
+        upstream_tool = MCPTool(name="send_email", description="", inputSchema={})
+        manager._fetch_tools_with_timeout = AsyncMock(return_value=[upstream_tool])
+
+        await manager._get_tools_from_server(server)
+        await manager._get_tools_from_server(server)
+        assert manager._fetch_tools_with_timeout.await_count == 1
+
+        # another auth context is listed separately
+        await manager._get_tools_from_server(server, mcp_auth_header="token-2")
+        assert manager._fetch_tools_with_timeout.await_count == 2
+
+        # e.g. on notifications/tools/list_changed from the server
+        manager.invalidate_tool_catalog(server.server_id)
+        await manager._get_tools_from_server(server)
+        assert manager._fetch_tools_with_timeout.await_count == 3
+
+        # an updated server object isn't served the old server's tools
+        updated_server = server.model_copy(update={"url": "https://example.com"})
+        manager.registry[server.server_id] = updated_server
+        await manager._get_tools_from_server(updated_server)
+        assert manager._fetch_tools_with_timeout.await_count == 4
+
+    @pytest.mark.asyncio
+    async def test_get_tools_from_server_does_not_cache_empty_listing(self):
+        manager = MCPServerManager()
+        server = MCPServer(server_id="zapier", name="zapier", transport=MCPTransport.http)
+        manager._create_mcp_client = MagicMock(return_value=MagicMock())
+        manager._fetch_tools_with_timeout = AsyncMock(return_value=[])
+
+        await manager._get_tools_from_server(server)
+        await manager._get_tools_from_server(server)
+        assert manager._fetch_tools_with_timeout.await_count == 2
+
+    def test_server_lookups_follow_registry_changes(self):
+        """The server lookup indexes are rebuilt when the registry changes."""
+        manager = MCPServerManager()
+        github = MCPServer(
+            server_id="github-id",
+            name="GitHub",
+            server_name="github",
+            transport=MCPTransport.http,
+        )
+        manager.registry = {github.server_id: github}
+        manager.tool_name_to_mcp_server_name_mapping["create_issue"] = "github"
+        assert manager.get_mcp_server_by_id("github-id") is github
+        assert manager.get_mcp_server_by_name("github") is github
+        assert manager._get_mcp_server_from_tool_name("github-create_issue") is github
+
+        jira = MCPServer(
+            server_id="jira-id",
+            name="jira",
+            server_name="jira",
+            transport=MCPTransport.http,
+        )
+        manager.config_mcp_servers[jira.server_id] = jira
+        assert manager.get_mcp_server_by_id("jira-id") is jira
+        assert manager.get_mcp_server_by_name("jira") is jira
+
+        manager.registry.pop(github.server_id)
+        assert manager.get_mcp_server_by_id("github-id") is None
+        assert manager._get_mcp_server_from_tool_name("github-create_issue") is None
+
+        # updated servers are found by their new name only
+        jira_cloud = jira.model_copy(update={"server_name": "jira_cloud"})
+        manager.config_mcp_servers[jira.server_id] = jira_cloud
+        assert manager.get_mcp_server_by_name("jira_cloud") is jira_cloud
+        assert manager.get_mcp_server_by_name("jira") is None
+
+        # a server changed in place is not served under its old name
+        jira_cloud.server_name = "jira_server"
+        assert manager.get_mcp_server_by_name("jira_cloud") is None
+
+    def test_server_lookup_miss_does_not_rebuild_indexes(self):
+        manager = MCPServerManager()
+        manager.registry = {
+            f"server-{i}": MCPServer(
+                server_id=f"server-{i}", name=f"server-{i}", transport=MCPTransport.http
+            )
+            for i in range(3)
+        }
+        assert manager.get_mcp_server_by_id("server-1") is not None
+
+        with patch.object(
+            manager, "_build_server_indexes", wraps=manager._build_server_indexes
+        ) as build_server_indexes:
+            for _ in range(10):
+                assert manager.get_mcp_server_by_id("stale-id") is None
+            assert manager.get_mcp_server_by_id("server-2") is not None
+        build_server_indexes.assert_not_called()
+
 
 if __name__ == "__main__":
     pytest.main([__file__])
@@ -0,0 +1,66 @@
+from unittest.mock import patch
+
+import pytest
+
+from litellm.proxy.auth.model_access_matcher import (
+    ModelAccessMatcher,
+    get_model_access_matcher,
+)
+
+
+@pytest.mark.parametrize(
+    "model,allowed_models,expected",
+    [
+        ("bedrock/us.amazon.nova-micro-v1:0", ["bedrock/*"], True),
+        ("bedrock/us.amazon.nova-micro-v1:0", ["bedrock/us.*"], True),
+        ("bedrockzzzz/us.amazon.nova-micro-v1:0", ["bedrock/*"], False),
+        ("gpt-4o", ["gpt-4o"], False),  # exact entries are not wildcards
+        ("openai/gpt-4o", ["azure/*", "openai/gpt-4*"], True),
+        ("openai/gpt-3.5-turbo", ["azure/*", "openai/gpt-4*"], False),
+        ("anything", ["*"], True),
+    ],
+)
+def test_matches_wildcard(model, allowed_models, expected):
+    matcher = ModelAccessMatcher(allowed_models=tuple(allowed_models))
+    assert matcher.matches_wildcard(model) is expected
+
+
+def test_matches_wildcard_with_custom_llm_provider():
+    """
+    `gpt-4o` is allowed by `openai/*`, via get_llm_provider
+    """
+    matcher = ModelAccessMatcher(allowed_models=("openai/*",))
+    assert matcher.matches_wildcard("gpt-4o") is True
+    assert matcher.matches_wildcard("my-unknown-model") is False
+
+
+def test_matches_wildcard_is_memoized():
+    matcher = ModelAccessMatcher(allowed_models=("openai/*",))
+    with patch(
+        "litellm.proxy.auth.model_access_matcher.get_llm_provider",
+        return_value=("gpt-4o", "openai", None, None),
+    ) as mock_get_llm_provider:
+        assert matcher.matches_wildcard("gpt-4o") is True
+        assert matcher.matches_wildcard("gpt-4o") is True
+
+    mock_get_llm_provider.assert_called_once()
+
+
+def test_exact_models():
+    matcher = ModelAccessMatcher(allowed_models=("gpt-4o", "claude-3", "openai/*"))
+    assert matcher.exact_models == frozenset({"gpt-4o", "claude-3", "openai/*"})
+    assert matcher.wildcard_patterns == ("openai/*",)
+
+
+def test_invalid_regex_falls_back_to_per_pattern_check():
+    matcher = ModelAccessMatcher(allowed_models=("openai/*", "bad(*"))
+    assert matcher._use_combined_regex is False
+    assert matcher.matches_wildcard("openai/gpt-4o") is True
+
+
+def test_get_model_access_matcher_reuses_compiled_allow_list():
+    allowed_models = [f"provider-{i}/*" for i in range(200)]
+    matcher = get_model_access_matcher(allowed_models)
+    assert get_model_access_matcher(list(allowed_models)) is matcher
+    assert matcher.matches_wildcard("provider-150/model") is True
+    assert matcher.matches_wildcard("provider-200/model") is False
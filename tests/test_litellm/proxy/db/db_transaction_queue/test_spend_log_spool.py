@@ -0,0 +1,305 @@
+import asyncio
+import json
+import os
+import re
+import sys
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import pytest
+
+from litellm.proxy.db.db_transaction_queue import spend_log_spool
+from litellm.proxy.db.db_transaction_queue.spend_log_spool import (
+    SPEND_LOGS_BULK_INSERT_QUERY,
+    SpendLogSpool,
+)
+
+sys.path.insert(
+    0, os.path.abspath("../../..")
+)  # Adds the parent directory to the system path
+
+
+def _spend_log(request_id: str, **kwargs) -> dict:
+    return {
+        "request_id": request_id,
+        "call_type": "acompletion",
+        "spend": 0.1,
+        "startTime": datetime(2025, 1, 1, 12, 0, 0),
+        "endTime": datetime(2025, 1, 1, 12, 0, 1, tzinfo=timezone.utc),
+        "metadata": json.dumps({"status": "success"}),
+        "request_tags": "[]",
+        "messages": "not json",
+        **kwargs,
+    }
+
+
+class _FakeDB:
+    """Collects the spend logs inserted by the spool, by request_id"""
+
+    def __init__(self, failing_calls=(), error: Exception = None):
+        self.rows: dict = {}
+        self.calls = 0
+        self.failing_calls = failing_calls
+        self.error = error or httpx.ConnectError("Failed to connect")
+
+    async def insert_rows(self, rows_json: str):
+        self.calls += 1
+        if self.calls in self.failing_calls:
+            raise self.error
+        for row in json.loads(rows_json):
+            self.rows.setdefault(row["request_id"], row)
+
+
+@pytest.fixture
+def spool_dir(tmp_path):
+    return str(tmp_path / "spool")
+
+
+@pytest.mark.asyncio
+async def test_spooled_spend_logs_are_loaded_and_segments_deleted(spool_dir):
+    spool = SpendLogSpool(spool_dir, segment_max_bytes=1024, load_batch_size=3)
+    for i in range(20):
+        assert await spool.append(_spend_log(f"req-{i}")) is True
+    assert spool.pending_records == 20
+    assert len(os.listdir(spool_dir)) > 1
+
+    db = _FakeDB()
+    assert await spool.load(db.insert_rows) == 20
+    assert sorted(db.rows) == sorted(f"req-{i}" for i in range(20))
+    assert os.listdir(spool_dir) == []
+    assert spool.get_stats()["pending_records"] == 0
+    assert spool.get_stats()["loaded_records"] == 20
+
+    row = db.rows["req-0"]
+    # naive datetimes are UTC, JSON columns are loaded as JSON
+    assert row["startTime"] == "2025-01-01T12:00:00+00:00"
+    assert row["metadata"] == {"status": "success"}
+    assert row["request_tags"] == []
+    assert row["messages"] == "not json"
+
+
+@pytest.mark.asyncio
+async def test_failed_load_keeps_spend_logs_for_next_load(spool_dir):
+    spool = SpendLogSpool(spool_dir, load_batch_size=2)
+    for i in range(5):
+        await spool.append(_spend_log(f"req-{i}"))
+
+    # the second batch of the segment fails - the segment is kept
+    db = _FakeDB(failing_calls=(2,))
+    with pytest.raises(httpx.ConnectError):
+        await spool.load(db.insert_rows, retryable_errors=(httpx.ConnectError,))
+    assert sorted(db.rows) == ["req-0", "req-1"]
+    assert len(os.listdir(spool_dir)) == 1
+    assert spool.pending_records == 5
+
+    # loading again inserts the rest, without duplicating the first batch
+    assert await spool.load(db.insert_rows) == 5
+    assert sorted(db.rows) == [f"req-{i}" for i in range(5)]
+    assert os.listdir(spool_dir) == []
+
+
+@pytest.mark.asyncio
+async def test_spend_logs_survive_restart(spool_dir):
+    spool = SpendLogSpool(spool_dir)
+    for i in range(3):
+        await spool.append(_spend_log(f"req-{i}"))
+    spool.close()
+
+    # e.g. the proxy crashed while writing a spend log
+    segment = os.path.join(spool_dir, os.listdir(spool_dir)[0])
+    with open(segment, "ab") as f:
+        f.write(b'{"request_id": "req-partial"')
+
+    restarted_spool = SpendLogSpool(spool_dir)
+    assert restarted_spool.pending_records == 3
+    db = _FakeDB()
+    assert await restarted_spool.load(db.insert_rows) == 3
+    assert sorted(db.rows) == ["req-0", "req-1", "req-2"]
+
+
+@pytest.mark.asyncio
+async def test_segment_locked_by_another_spool_is_not_loaded(spool_dir):
+    pytest.importorskip("fcntl")
+    writer = SpendLogSpool(spool_dir)
+    await writer.append(_spend_log("req-active"))
+
+    # the writer's active segment is locked until it's sealed
+    loader = SpendLogSpool(spool_dir)
+    db = _FakeDB()
+    assert await loader.load(db.insert_rows) == 0
+    assert db.rows == {}
+
+    writer.close()
+    assert await loader.load(db.insert_rows) == 1
+    assert list(db.rows) == ["req-active"]
+
+
+@pytest.mark.asyncio
+async def test_new_segment_is_not_loaded_before_it_is_locked(spool_dir):
+    pytest.importorskip("fcntl")
+    writer = SpendLogSpool(spool_dir)
+    loader = SpendLogSpool(spool_dir)
+    flock = spend_log_spool.fcntl.flock
+    claimed = []
+
+    def load_then_flock(fd, operation):
+        # another worker loading the spool right before the new segment is locked
+        claimed.extend(
+            path for path in loader._segment_paths() if loader._claim_segment(path)
+        )
+        return flock(fd, operation)
+
+    with patch.object(spend_log_spool.fcntl, "flock", side_effect=load_then_flock):
+        await writer.append(_spend_log("req-0"))
+    assert claimed == []
+
+    writer.close()
+    db = _FakeDB()
+    assert await loader.load(db.insert_rows) == 1
+    assert list(db.rows) == ["req-0"]
+
+
+class _RejectingDB(_FakeDB):
+    """Rejects every batch containing one of `rejected` request_ids, like Postgres"""
+
+    def __init__(self, rejected=(), **kwargs):
+        super().__init__(**kwargs)
+        self.rejected = set(rejected)
+
+    async def insert_rows(self, rows_json: str):
+        request_ids = {row["request_id"] for row in json.loads(rows_json)}
+        if request_ids & self.rejected:
+            self.calls += 1
+            raise ValueError("invalid byte sequence for encoding UTF8: 0x00")
+        await super().insert_rows(rows_json)
+
+
+@pytest.mark.asyncio
+async def test_rejected_spend_logs_are_moved_to_failed_file(spool_dir):
+    spool = SpendLogSpool(spool_dir, load_batch_size=3)
+    for i in range(5):
+        await spool.append(_spend_log(f"req-{i}"))
+    spool.close()
+
+    db = _RejectingDB(rejected={"req-1"})
+    assert await spool.load(db.insert_rows) == 5
+    assert sorted(db.rows) == ["req-0", "req-2", "req-3", "req-4"]
+    assert spool.pending_records == 0
+    assert spool.get_stats()["failed_records"] == 1
+
+    # the segment is gone, the rejected spend log is kept in a .failed file
+    (failed_file,) = os.listdir(spool_dir)
+    assert failed_file.endswith(".failed")
+    with open(os.path.join(spool_dir, failed_file)) as f:
+        assert [json.loads(line)["request_id"] for line in f] == ["req-1"]
+
+    # the next load doesn't retry it
+    calls = db.calls
+    assert await spool.load(db.insert_rows) == 0
+    assert db.calls == calls
+
+
+@pytest.mark.asyncio
+async def test_retryable_error_keeps_segment_of_rejected_batch(spool_dir):
+    spool = SpendLogSpool(spool_dir)
+    await spool.append(_spend_log("req-0"))
+    await spool.append(_spend_log("req-1"))
+
+    # the batch is rejected, then the DB goes away while loading one at a time
+    db = _RejectingDB(rejected={"req-1"}, failing_calls=(2,))
+    with pytest.raises(httpx.ConnectError):
+        await spool.load(db.insert_rows, retryable_errors=(httpx.ConnectError,))
+    assert len(os.listdir(spool_dir)) == 1
+    assert spool.pending_records == 2
+
+
+@pytest.mark.asyncio
+async def test_non_retryable_error_continues_with_next_segment(spool_dir):
+    spool = SpendLogSpool(spool_dir, segment_max_bytes=1)
+    await spool.append(_spend_log("req-bad"))
+    await spool.append(_spend_log("req-good"))
+
+    # e.g. the .failed file can't be written
+    db = _RejectingDB(rejected={"req-bad"})
+    with patch.object(spool, "_move_to_failed", side_effect=OSError("disk full")):
+        with pytest.raises(OSError):
+            await spool.load(db.insert_rows, retryable_errors=(httpx.ConnectError,))
+    assert list(db.rows) == ["req-good"]
+    # the failed segment is kept
+    assert len(os.listdir(spool_dir)) == 1
+
+
+@pytest.mark.asyncio
+async def test_full_spool_drops_spend_logs(spool_dir):
+    spool = SpendLogSpool(spool_dir, max_bytes=600)
+    results = [await spool.append(_spend_log(f"req-{i}")) for i in range(5)]
+    assert results[0] is True
+    assert results[-1] is False
+    assert spool.dropped_records == results.count(False)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("fsync", ["always", "interval", "never"])
+async def test_fsync_policies(spool_dir, fsync):
+    spool = SpendLogSpool(spool_dir, fsync=fsync, fsync_interval=3600)
+    with patch.object(spend_log_spool.os, "fsync") as mock_fsync:
+        await spool.append(_spend_log("req-0"))
+        await spool.append(_spend_log("req-1"))
+        spool.close()
+    # "interval" only syncs on sealing the segment, within the first interval
+    expected = {"always": 3, "interval": 1, "never": 0}[fsync]
+    assert mock_fsync.call_count == expected
+
+
+def test_invalid_fsync_policy(spool_dir):
+    with pytest.raises(ValueError):
+        SpendLogSpool(spool_dir, fsync="sometimes")
+
+
+def test_bulk_insert_query_covers_spend_logs_table():
+    """The bulk insert must write every column of LiteLLM_SpendLogs in schema.prisma"""
+    schema_path = os.path.join(
+        os.path.dirname(spend_log_spool.__file__), "..", "..", "schema.prisma"
+    )
+    with open(schema_path) as f:
+        schema = f.read()
+    model = re.search(r"model LiteLLM_SpendLogs \{(.*?)\n\}", schema, re.S).group(1)
+    columns = {
+        line.split()[0]
+        for line in model.strip().splitlines()
+        if line.strip() and not line.strip().startswith(("@@", "//"))
+    }
+    assert columns == set(spend_log_spool._SPEND_LOGS_COLUMNS)
+    assert 'ON CONFLICT ("request_id") DO NOTHING' in SPEND_LOGS_BULK_INSERT_QUERY
+
+
+@pytest.mark.asyncio
+async def test_update_spend_logs_job_loads_spool(spool_dir):
+    from litellm.proxy.utils import update_spend_logs_job
+
+    spool = SpendLogSpool(spool_dir)
+    await spool.append(_spend_log("req-0"))
+
+    prisma_client = MagicMock()
+    prisma_client.spend_log_transactions = []
+    prisma_client._spend_log_transactions_lock = asyncio.Lock()
+    prisma_client.db.execute_raw = AsyncMock(
+        side_effect=[httpx.ConnectError("Failed to connect"), 1]
+    )
+
+    with patch.object(spend_log_spool, "_spend_log_spool", spool), patch(
+        "litellm.proxy.utils.asyncio.sleep", new=AsyncMock()
+    ):
+        await update_spend_logs_job(
+            prisma_client=prisma_client,
+            db_writer_client=None,
+            proxy_logging_obj=MagicMock(),
+        )
+
+    assert prisma_client.db.execute_raw.call_count == 2
+    query, rows_json = prisma_client.db.execute_raw.call_args.args
+    assert query == SPEND_LOGS_BULK_INSERT_QUERY
+    assert [row["request_id"] for row in json.loads(rows_json)] == ["req-0"]
+    assert spool.pending_records == 0
+    assert os.listdir(spool_dir) == []
@@ -503,6 +503,104 @@ class TestContentFilterGuardrail:
         assert exc_info.value.status_code == 403
         assert "us_ssn" in str(exc_info.value.detail)
 
+    @pytest.mark.asyncio
+    async def test_streaming_hook_block_split_across_chunks(self):
+        """
+        Test streaming hook blocks content split across chunks, even after an
+        earlier MASK match
+        """
+        from litellm.types.utils import Delta, ModelResponseStream, StreamingChoices
+
+        guardrail = ContentFilterGuardrail(
+            guardrail_name="test-streaming-split",
+            patterns=[
+                ContentFilterPattern(
+                    pattern_type="prebuilt",
+                    pattern_name="email",
+                    action=ContentFilterAction.MASK,
+                ),
+                ContentFilterPattern(
+                    pattern_type="prebuilt",
+                    pattern_name="us_ssn",
+                    action=ContentFilterAction.BLOCK,
+                ),
+            ],
+            blocked_words=[
+                BlockedWord(keyword="openai", action=ContentFilterAction.MASK),
+                BlockedWord(keyword="project x", action=ContentFilterAction.BLOCK),
+            ],
+            event_hook=GuardrailEventHooks.during_call,
+        )
+
+        def mock_stream(parts):
+            async def _stream():
+                for i, part in enumerate(parts):
+                    yield ModelResponseStream(
+                        id=f"chunk{i}",
+                        choices=[StreamingChoices(delta=Delta(content=part), index=0)],
+                        model="gpt-4",
+                    )
+
+            return _stream()
+
+        async def consume(parts):
+            chunks = []
+            async for chunk in guardrail.async_post_call_streaming_iterator_hook(
+                user_api_key_dict=MagicMock(),
+                response=mock_stream(parts),
+                request_data={},
+            ):
+                chunks.append(chunk)
+            return chunks
+
+        with pytest.raises(HTTPException) as exc_info:
+            await consume(["Mail test@example.com, SSN 123-4", "5-6789"])
+        assert "us_ssn" in str(exc_info.value.detail)
+
+        with pytest.raises(HTTPException) as exc_info:
+            await consume(["OpenAI works on Proj", "ect X"])
+        assert exc_info.value.detail["keyword"] == "project x"
+
+        assert len(await consume(["OpenAI works ", "on a project"])) == 2
+
+    @pytest.mark.asyncio
+    async def test_streaming_hook_category_keywords_and_exceptions(self):
+        """
+        Test streaming hook blocks category keywords split across chunks and skips
+        them once an exception phrase was streamed
+        """
+        from litellm.types.utils import Delta, ModelResponseStream, StreamingChoices
+
+        guardrail = ContentFilterGuardrail(
+            guardrail_name="test-streaming-categories",
+            categories=[
+                {"category": "harmful_violence", "enabled": True, "action": "BLOCK"}
+            ],
+            event_hook=GuardrailEventHooks.during_call,
+        )
+        keyword = next(iter(guardrail.category_keywords))
+        exception = guardrail.loaded_categories["harmful_violence"].exceptions[0]
+
+        async def consume(parts):
+            async def _stream():
+                for part in parts:
+                    yield ModelResponseStream(
+                        choices=[StreamingChoices(delta=Delta(content=part), index=0)]
+                    )
+
+            async for _ in guardrail.async_post_call_streaming_iterator_hook(
+                user_api_key_dict=MagicMock(),
+                response=_stream(),
+                request_data={},
+            ):
+                pass
+
+        with pytest.raises(HTTPException) as exc_info:
+            await consume(["it says ", keyword[:2], keyword[2:] + " here"])
+        assert exc_info.value.detail["keyword"] == keyword
+
+        await consume([f"about {exception}. ", f"it says {keyword} here"])
+
     def test_init_with_plain_dicts(self):
         """
         Test initialization with plain dicts (DB format).
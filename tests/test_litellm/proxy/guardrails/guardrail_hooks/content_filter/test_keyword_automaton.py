@@ -0,0 +1,82 @@
+"""
+Tests for the content filter keyword automaton
+"""
+
+import os
+import random
+import re
+import sys
+
+sys.path.insert(
+    0, os.path.abspath("../../")
+)  # Adds the parent directory to the system path
+
+from litellm.proxy.guardrails.guardrail_hooks.litellm_content_filter.keyword_automaton import (
+    KeywordAutomaton,
+)
+
+
+def _regex_matches(keywords, text):
+    """Keyword indexes the per-keyword checks the automaton replaced would find."""
+    found = set()
+    for index, keyword in enumerate(keywords):
+        if " " in keyword:
+            if keyword in text:
+                found.add(index)
+        elif re.search(r"\b" + re.escape(keyword) + r"\b", text):
+            found.add(index)
+    return found
+
+
+def test_scan_finds_overlapping_keywords():
+    automaton = KeywordAutomaton(["he", "she", "his", "hers"])
+    matches, _ = automaton.scan("ushers")
+    assert sorted(matches) == [(1, 4, 1), (2, 4, 0), (2, 6, 3)]
+
+
+def test_whole_word_keywords_match_like_word_boundary_regex():
+    automaton = KeywordAutomaton(
+        ["men", "kill", "gun control"], whole_word=lambda keyword: " " not in keyword
+    )
+    assert automaton.first_match("i recommend skills") is None
+    assert automaton.first_match("men and women") == 0
+    assert automaton.first_match("they kill_ things") is None
+    assert automaton.first_match("(kill)") == 1
+    assert automaton.first_match("the gun controller") == 2
+
+
+def test_first_match_returns_first_keyword_in_insertion_order():
+    automaton = KeywordAutomaton(["zeta", "alpha"])
+    assert automaton.first_match("alpha zeta") == 0
+    assert automaton.first_match("alpha") == 1
+    assert automaton.first_match("") is None
+
+
+def test_resumed_scan_matches_rescanning_the_growing_text():
+    """Scanning only the new text of a stream finds what re-checking all of it did."""
+    rng = random.Random(42)
+    alphabet = "ab c-+_"
+    for _ in range(500):
+        keywords = list(
+            dict.fromkeys(
+                "".join(rng.choice(alphabet) for _ in range(rng.randint(1, 4)))
+                for _ in range(rng.randint(1, 6))
+            )
+        )
+        automaton = KeywordAutomaton(
+            keywords, whole_word=lambda keyword: " " not in keyword
+        )
+        text = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 30)))
+
+        matches, _ = automaton.scan(text)
+        assert {index for _, _, index in matches} == _regex_matches(keywords, text)
+
+        found, expected = set(), set()
+        scanned, state = 0, 0
+        while scanned < len(text):
+            end = min(len(text), scanned + rng.randint(1, 5))
+            matches, state = automaton.scan(text[:end], scanned, state)
+            found.update(index for _, _, index in matches)
+            expected.update(_regex_matches(keywords, text[:end]))
+            scanned = end
+            assert found == expected
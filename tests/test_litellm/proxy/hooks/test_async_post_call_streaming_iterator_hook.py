@@ -192,3 +192,81 @@ async def test_streaming_hook_propagates_callback_errors():
         with pytest.raises(RuntimeError, match="Callback failed!"):
             async for _ in result:
                 pass
+
+
+def test_has_async_post_call_streaming_hook():
+    """Verify only callbacks overriding the per-chunk hook disable the fast path."""
+    proxy_logging = ProxyLogging(user_api_key_cache=MagicMock())
+
+    class ChunkHookCallback(CustomLogger):
+        async def async_post_call_streaming_hook(self, user_api_key_dict, response):
+            return None
+
+    with patch.object(
+        litellm, "callbacks", [CustomLogger(), MockStreamingCallback(), print]
+    ):
+        assert proxy_logging.has_async_post_call_streaming_hook() is False
+
+    with patch.object(litellm, "callbacks", [CustomLogger(), ChunkHookCallback()]):
+        assert proxy_logging.has_async_post_call_streaming_hook() is True
+
+
+@pytest.mark.asyncio
+async def test_streaming_hook_skips_default_iterator_hooks():
+    """Callbacks without their own iterator hook don't wrap the stream."""
+    proxy_logging = ProxyLogging(user_api_key_cache=MagicMock())
+    response = mock_streaming_response()
+
+    with patch.object(
+        CustomLogger, "async_post_call_streaming_iterator_hook"
+    ) as default_hook, patch.object(litellm, "callbacks", [CustomLogger()]):
+        collected_chunks = [
+            chunk
+            async for chunk in proxy_logging.async_post_call_streaming_iterator_hook(
+                response=response,
+                user_api_key_dict=UserAPIKeyAuth(api_key="test_key"),
+                request_data={"model": "gpt-4", "messages": []},
+            )
+        ]
+
+    assert len(collected_chunks) == 4
+    default_hook.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_streaming_hook_joins_str_so_far_parts_only_for_callbacks():
+    """Streamed text parts are only joined when a callback receives them."""
+    import litellm.proxy.proxy_server  # registers its callbacks on import
+
+    proxy_logging = ProxyLogging(user_api_key_cache=MagicMock())
+    chunk = litellm.ModelResponseStream(
+        choices=[{"index": 0, "delta": {"content": "World"}}]
+    )
+    str_so_far_parts = MagicMock(wraps=["Hello", " "])
+
+    class ChunkHookCallback(CustomLogger):
+        def __init__(self):
+            super().__init__()
+            self.responses = []
+
+        async def async_post_call_streaming_hook(self, user_api_key_dict, response):
+            self.responses.append(response)
+
+    with patch.object(litellm, "callbacks", []):
+        await proxy_logging.async_post_call_streaming_hook(
+            data={},
+            response=chunk,
+            user_api_key_dict=UserAPIKeyAuth(api_key="test_key"),
+            str_so_far_parts=str_so_far_parts,
+        )
+    str_so_far_parts.__iter__.assert_not_called()
+
+    callbacks = [ChunkHookCallback(), ChunkHookCallback()]
+    with patch.object(litellm, "callbacks", callbacks):
+        await proxy_logging.async_post_call_streaming_hook(
+            data={},
+            response=chunk,
+            user_api_key_dict=UserAPIKeyAuth(api_key="test_key"),
+            str_so_far_parts=["Hello", " "],
+        )
+    assert [callback.responses for callback in callbacks] == [["Hello World"]] * 2
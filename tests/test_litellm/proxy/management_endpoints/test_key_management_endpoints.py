@@ -3080,6 +3080,12 @@ async def test_delete_key_fn_persists_deleted_keys(monkeypatch):
 
     data = KeyRequest(keys=["sk-token-1"])
 
+    mock_invalidate = AsyncMock()
+    monkeypatch.setattr(
+        "litellm.proxy.management_endpoints.key_management_endpoints._invalidate_orizon_user_key_cache",
+        mock_invalidate,
+    )
+
     result = await delete_key_fn(
         data=data,
         user_api_key_dict=user_api_key_dict,
@@ -3087,6 +3093,8 @@ async def test_delete_key_fn_persists_deleted_keys(monkeypatch):
     )
 
     assert result["deleted_keys"] == ["sk-token-1"]
+    # the deleted key's owner must not keep getting it injected by Orizon
+    mock_invalidate.assert_awaited_once_with(["user-123"])
 
 
 @pytest.mark.asyncio
@@ -1,4 +1,6 @@
+import asyncio
 import copy
+import json
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
@@ -1024,3 +1026,120 @@ class TestExtractErrorFromSSEChunk:
         # Other fields should be obtained from the original error object (if exists)
 
 
+
+
+class TestAsyncSSEDataGenerator:
+    @staticmethod
+    def _get_proxy_logging_obj(has_streaming_hook: bool) -> MagicMock:
+        mock_proxy_logging_obj = MagicMock(spec=ProxyLogging)
+        mock_proxy_logging_obj.has_async_post_call_streaming_hook.return_value = (
+            has_streaming_hook
+        )
+
+        async def mock_streaming_iterator(response, **kwargs):
+            async for chunk in response:
+                yield chunk
+
+        mock_proxy_logging_obj.async_post_call_streaming_iterator_hook = (
+            mock_streaming_iterator
+        )
+        mock_proxy_logging_obj.async_post_call_streaming_hook = AsyncMock(
+            side_effect=lambda **kwargs: kwargs["response"]
+        )
+        return mock_proxy_logging_obj
+
+    @staticmethod
+    async def _stream(chunks, delay: float = 0):
+        for chunk in chunks:
+            if delay:
+                await asyncio.sleep(delay)
+            yield chunk
+
+    @pytest.mark.asyncio
+    async def test_fast_path_skips_streaming_hook(self):
+        mock_proxy_logging_obj = self._get_proxy_logging_obj(has_streaming_hook=False)
+        chunks = [
+            {"type": "message_start", "message": {"id": "msg_123"}},
+            "event: ping\ndata: {}\n\n",
+            {"type": "content_block_delta", "delta": {"text": "hi"}, "tags": {"a"}},
+        ]
+
+        result = [
+            chunk
+            async for chunk in ProxyBaseLLMRequestProcessing.async_sse_data_generator(
+                response=self._stream(chunks),
+                user_api_key_dict=MagicMock(),
+                request_data={"model": "claude-sonnet-4"},
+                proxy_logging_obj=mock_proxy_logging_obj,
+            )
+        ]
+
+        mock_proxy_logging_obj.async_post_call_streaming_hook.assert_not_called()
+        assert result[1] == chunks[1]
+        assert json.loads(result[0][len("data: ") :]) == chunks[0]
+        assert json.loads(result[2][len("data: ") :]) == {
+            "type": "content_block_delta",
+            "delta": {"text": "hi"},
+            "tags": ["a"],
+        }
+        assert all(chunk.endswith("\n\n") for chunk in result)
+
+    @pytest.mark.asyncio
+    async def test_streaming_hook_can_replace_chunks(self):
+        mock_proxy_logging_obj = self._get_proxy_logging_obj(has_streaming_hook=True)
+        mock_proxy_logging_obj.async_post_call_streaming_hook = AsyncMock(
+            return_value='data: {"error": "blocked"}\n\n'
+        )
+
+        result = [
+            chunk
+            async for chunk in ProxyBaseLLMRequestProcessing.async_sse_data_generator(
+                response=self._stream([{"type": "message_start"}]),
+                user_api_key_dict=MagicMock(),
+                request_data={},
+                proxy_logging_obj=mock_proxy_logging_obj,
+            )
+        ]
+
+        assert result == ['data: {"error": "blocked"}\n\n']
+
+    @pytest.mark.asyncio
+    async def test_coalesces_frames_within_window(self, monkeypatch):
+        monkeypatch.setattr(
+            "litellm.proxy.common_request_processing.PROXY_SSE_COALESCE_WINDOW_MS", 50
+        )
+        mock_proxy_logging_obj = self._get_proxy_logging_obj(has_streaming_hook=False)
+        chunks = [f"data: {i}\n\n" for i in range(5)]
+
+        result = [
+            chunk
+            async for chunk in ProxyBaseLLMRequestProcessing.async_sse_data_generator(
+                response=self._stream(chunks),
+                user_api_key_dict=MagicMock(),
+                request_data={},
+                proxy_logging_obj=mock_proxy_logging_obj,
+            )
+        ]
+
+        # first frame is never held back - create_response inspects it
+        assert result == [chunks[0], "".join(chunks[1:])]
+
+    @pytest.mark.asyncio
+    async def test_coalescing_does_not_hold_frames_past_window(self, monkeypatch):
+        monkeypatch.setattr(
+            "litellm.proxy.common_request_processing.PROXY_SSE_COALESCE_WINDOW_MS", 1
+        )
+        mock_proxy_logging_obj = self._get_proxy_logging_obj(has_streaming_hook=False)
+        chunks = [f"data: {i}\n\n" for i in range(3)]
+
+        result = [
+            chunk
+            async for chunk in ProxyBaseLLMRequestProcessing.async_sse_data_generator(
+                response=self._stream(chunks, delay=0.02),
+                user_api_key_dict=MagicMock(),
+                request_data={},
+                proxy_logging_obj=mock_proxy_logging_obj,
+            )
+        ]
+
+        assert result == chunks
@@ -0,0 +1,137 @@
+import asyncio
+import os
+import sys
+from typing import List, Optional, Tuple
+from unittest.mock import patch
+
+import pytest
+
+sys.path.insert(
+    0, os.path.abspath("../../..")
+)  # Adds the parent directory to the system path
+
+import litellm
+from litellm.rag.ingestion import base_ingestion
+from litellm.rag.ingestion.base_ingestion import BaseRAGIngestion
+from litellm.rag.text_splitters import RecursiveCharacterTextSplitter
+
+
+class _Ingestion(BaseRAGIngestion):
+    async def store(self, file_content, filename, content_type, chunks, embeddings):
+        self.stored = (chunks, embeddings)
+        return "vs_123", None
+
+
+class _BatchedStoreIngestion(_Ingestion):
+    async def store_embeddings(self, chunks, embeddings):
+        self.batches = getattr(self, "batches", []) + [(chunks, embeddings)]
+
+
+class _FakeEmbeddings:
+    def __init__(self, fail_first: int = 0):
+        self.calls: List[List[str]] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.fail_first = fail_first
+
+    async def __call__(self, model, input):
+        self.calls.append(list(input))
+        if len(self.calls) <= self.fail_first:
+            raise litellm.RateLimitError(
+                message="rate limited", llm_provider="openai", model=model
+            )
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.001)
+        self.in_flight -= 1
+        return litellm.EmbeddingResponse(
+            data=[
+                {"embedding": [float(len(text))], "index": idx}
+                for idx, text in enumerate(input)
+            ]
+        )
+
+
+@pytest.fixture(autouse=True)
+def clear_embedding_cache():
+    base_ingestion._embedding_cache.flush_cache()
+
+
+def _options(**embedding) -> dict:
+    return {
+        "embedding": {"model": "text-embedding-3-small", **embedding},
+        "chunking_strategy": {"chunk_size": 20, "chunk_overlap": 0},
+        "vector_store": {"custom_llm_provider": "test"},
+    }
+
+
+def test_split_text_matches_iter_split_text():
+    text = "\n\n".join(f"paragraph {i} " + "word " * (i % 30) for i in range(200))
+    splitter = RecursiveCharacterTextSplitter(chunk_size=100, chunk_overlap=30)
+    chunks = splitter.split_text(text)
+    assert len(chunks) > 1
+    assert chunks == list(splitter.iter_split_text(text))
+
+
+@pytest.mark.asyncio
+async def test_embed_batches_with_bounded_concurrency():
+    fake = _FakeEmbeddings()
+    ingestion = _Ingestion(ingest_options=_options(batch_size=3, max_concurrency=2))
+    chunks = [f"chunk {i}" * (i + 1) for i in range(10)]
+
+    with patch.object(litellm, "aembedding", new=fake):
+        embeddings = await ingestion.embed(chunks)
+
+    assert embeddings == [[float(len(chunk))] for chunk in chunks]
+    assert [len(call) for call in fake.calls] == [3, 3, 3, 1]
+    assert fake.max_in_flight == 2
+
+
+@pytest.mark.asyncio
+async def test_embed_retries_and_caches_unchanged_chunks():
+    fake = _FakeEmbeddings(fail_first=1)
+    ingestion = _Ingestion(ingest_options=_options(num_retries=1))
+
+    with patch.object(litellm, "aembedding", new=fake), patch(
+        "litellm.utils._calculate_retry_after", return_value=0
+    ):
+        await ingestion.embed(["a", "b"])
+        embeddings = await ingestion.embed(["a", "b", "changed"])
+
+    assert fake.calls == [["a", "b"], ["a", "b"], ["changed"]]
+    assert embeddings == [[1.0], [1.0], [7.0]]
+
+
+@pytest.mark.asyncio
+async def test_ingest_writes_embedded_batches_as_they_arrive():
+    fake = _FakeEmbeddings()
+    ingestion = _BatchedStoreIngestion(ingest_options=_options(batch_size=2))
+    text = b"one two three four five six seven eight nine ten eleven twelve"
+
+    with patch.object(litellm, "aembedding", new=fake):
+        response = await ingestion.ingest(file_data=("doc.txt", text, "text/plain"))
+
+    assert response["status"] == "completed"
+    assert ingestion.stored == ([], None)
+    batches: List[Tuple[List[str], Optional[List[List[float]]]]] = ingestion.batches
+    assert all(len(chunks) <= 2 for chunks, _ in batches)
+    all_chunks = [chunk for chunks, _ in batches for chunk in chunks]
+    assert all_chunks == ingestion.chunk(None, text, ocr_was_used=False)
+
+
+@pytest.mark.asyncio
+async def test_ingest_passes_all_embeddings_to_store_by_default():
+    fake = _FakeEmbeddings()
+    ingestion = _Ingestion(ingest_options=_options(batch_size=2))
+    text = b"one two three four five six seven eight nine ten eleven twelve"
+
+    # the default store_embeddings is a no-op
+    assert await ingestion.store_embeddings(chunks=["one"], embeddings=[[3.0]]) is None
+    with patch.object(litellm, "aembedding", new=fake):
+        response = await ingestion.ingest(file_data=("doc.txt", text, "text/plain"))
+
+    assert response["status"] == "completed"
+    chunks, embeddings = ingestion.stored
+    assert chunks == ingestion.chunk(None, text, ocr_was_used=False)
+    assert embeddings == [[float(len(chunk))] for chunk in chunks]
+    assert all(len(batch) <= 2 for batch in fake.calls)
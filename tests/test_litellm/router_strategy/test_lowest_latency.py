@@ -0,0 +1,147 @@
+import os
+import sys
+from unittest.mock import patch
+
+import pytest
+
+sys.path.insert(
+    0, os.path.abspath("../../..")
+)  # Adds the parent directory to the system path
+
+from litellm.caching.caching import DualCache
+from litellm.router_strategy.lowest_latency import LowestLatencyLoggingHandler
+
+
+def _log_kwargs(deployment_id: str, model_group: str = "gpt-4o", **kwargs) -> dict:
+    return {
+        "litellm_params": {
+            "metadata": {"model_group": model_group},
+            "model_info": {"id": deployment_id},
+        },
+        **kwargs,
+    }
+
+
+def _deployment(deployment_id: str, **model_info) -> dict:
+    return {
+        "model_name": "gpt-4o",
+        "litellm_params": {
+            "model": "openai/gpt-4o",
+            "api_base": f"https://{deployment_id}.example.com",
+        },
+        "model_info": {"id": deployment_id, **model_info},
+    }
+
+
+def test_latency_stats_updated_incrementally():
+    handler = LowestLatencyLoggingHandler(
+        router_cache=DualCache(), routing_args={"max_latency_list_size": 3}
+    )
+    for latency in [1.0, 2.0, 3.0, 4.0]:
+        handler.log_success_event(
+            kwargs=_log_kwargs("1"),
+            response_obj=None,
+            start_time=0.0,
+            end_time=latency,
+        )
+
+    deployment_stats = handler._get_latency_map("gpt-4o_map")["1"]
+    assert deployment_stats["latency"] == [2.0, 3.0, 4.0]  # most recent values
+    assert 2.0 < deployment_stats["latency_ewma"] < 4.0
+    assert sum(deployment_stats["latency_sketch"].values()) == 4
+
+    stats = handler.get_latency_stats(model_group="gpt-4o")["1"]
+    assert stats["latency_p50"] == pytest.approx(2.0, rel=0.05)
+    assert stats["time_to_first_token_ewma"] is None
+
+
+def test_only_current_minute_usage_kept():
+    handler = LowestLatencyLoggingHandler(router_cache=DualCache())
+    with patch(
+        "litellm.router_strategy.lowest_latency._get_precise_minute",
+        side_effect=["2025-01-01-10-00", "2025-01-01-10-01"],
+    ):
+        for _ in range(2):
+            handler.log_success_event(
+                kwargs=_log_kwargs("1"), response_obj=None, start_time=0.0, end_time=1.0
+            )
+
+    deployment_stats = handler._get_latency_map("gpt-4o_map")["1"]
+    assert "2025-01-01-10-00" not in deployment_stats
+    assert deployment_stats["2025-01-01-10-01"] == {"tpm": 0, "rpm": 1}
+
+
+@pytest.mark.asyncio
+async def test_timeout_penalty_not_added_to_sketch():
+    import litellm
+
+    handler = LowestLatencyLoggingHandler(router_cache=DualCache())
+    kwargs = _log_kwargs("1")
+    kwargs["exception"] = litellm.Timeout(
+        message="timeout", model="gpt-4o", llm_provider="openai"
+    )
+    await handler.async_log_failure_event(
+        kwargs=kwargs, response_obj=None, start_time=0.0, end_time=1.0
+    )
+
+    deployment_stats = handler._get_latency_map("gpt-4o_map")["1"]
+    assert deployment_stats["latency_ewma"] == 1000.0
+    assert "latency_sketch" not in deployment_stats
+
+
+def test_picks_lowest_latency_deployment():
+    handler = LowestLatencyLoggingHandler(router_cache=DualCache())
+    for deployment_id, latency in [("1", 2.0), ("2", 0.5), ("3", 1.0)]:
+        handler.log_success_event(
+            kwargs=_log_kwargs(deployment_id),
+            response_obj=None,
+            start_time=0.0,
+            end_time=latency,
+        )
+
+    deployment = handler.get_available_deployments(
+        model_group="gpt-4o",
+        healthy_deployments=[_deployment("1"), _deployment("2"), _deployment("3")],
+        messages=[{"role": "user", "content": "hi"}],
+    )
+    assert deployment["model_info"]["id"] == "2"
+
+
+def test_no_token_counting_without_tpm_limits():
+    handler = LowestLatencyLoggingHandler(router_cache=DualCache())
+    healthy_deployments = [_deployment(str(i)) for i in range(500)]
+    with patch(
+        "litellm.router_strategy.lowest_latency.token_counter"
+    ) as mock_token_counter:
+        handler.get_available_deployments(
+            model_group="gpt-4o",
+            healthy_deployments=healthy_deployments,
+            messages=[{"role": "user", "content": "hi"}],
+        )
+    mock_token_counter.assert_not_called()
+
+    healthy_deployments.append(_deployment("limited", tpm=1))
+    with patch(
+        "litellm.router_strategy.lowest_latency.token_counter", return_value=10
+    ) as mock_token_counter:
+        handler.get_available_deployments(
+            model_group="gpt-4o",
+            healthy_deployments=healthy_deployments,
+            messages=[{"role": "user", "content": "hi"}],
+        )
+    mock_token_counter.assert_called_once()
+
+
+def test_shared_latency_used_for_deployments_without_local_samples():
+    handler = LowestLatencyLoggingHandler(router_cache=DualCache())
+    handler.log_success_event(
+        kwargs=_log_kwargs("1"), response_obj=None, start_time=0.0, end_time=1.0
+    )
+
+    deployment = handler._get_available_deployments(
+        model_group="gpt-4o",
+        healthy_deployments=[_deployment("1"), _deployment("2")],
+        request_count_dict=handler._get_latency_map("gpt-4o_map"),
+        shared_latencies={"2": 5.0},  # seen by other instances
+    )
+    assert deployment["model_info"]["id"] == "1"
@@ -0,0 +1,41 @@
+import pytest
+
+from litellm.router_utils.latency_stats import (
+    add_to_sketch,
+    get_ewma_alpha,
+    get_sketch_quantile,
+    merge_sketches,
+    update_ewma,
+)
+
+
+def test_update_ewma():
+    assert update_ewma(None, 2.0, alpha=0.5) == 2.0
+    assert update_ewma(2.0, 4.0, alpha=0.5) == 3.0
+    assert get_ewma_alpha(1) == 1.0
+
+
+def test_sketch_quantiles_within_relative_accuracy():
+    sketch: dict = {}
+    for i in range(1, 1001):
+        add_to_sketch(sketch, i / 1000)
+
+    assert get_sketch_quantile(sketch, 0.5) == pytest.approx(0.5, rel=0.03)
+    assert get_sketch_quantile(sketch, 0.99) == pytest.approx(0.99, rel=0.03)
+    assert get_sketch_quantile({}, 0.5) is None
+
+
+def test_merge_sketches():
+    fast: dict = {}
+    slow: dict = {}
+    for _ in range(90):
+        add_to_sketch(fast, 0.1)
+    for _ in range(10):
+        add_to_sketch(slow, 10.0)
+    add_to_sketch(slow, 0.0)  # zero latency is kept in the lowest bucket
+
+    # keys come back as strings after a json round trip
+    merged = merge_sketches(fast, {str(k): v for k, v in slow.items()})
+    assert sum(merged.values()) == 101
+    assert get_sketch_quantile(merged, 0.5) == pytest.approx(0.1, rel=0.03)
+    assert get_sketch_quantile(merged, 0.95) == pytest.approx(10.0, rel=0.03)
@@ -0,0 +1,177 @@
+from typing import Dict
+
+from litellm.router_utils.pattern_match_deployments import (
+    PatternMatchRouter,
+    PatternUtils,
+)
+
+
+def _deployment(model: str, model_id: str) -> Dict:
+    return {
+        "model_name": model,
+        "litellm_params": {"model": model},
+        "model_info": {"id": model_id},
+    }
+
+
+class TestPatternMatchRouter:
+    """Test cases for the compiled, pre-sorted PatternMatchRouter"""
+
+    def test_patterns_kept_sorted_on_add(self):
+        router = PatternMatchRouter()
+        router.add_pattern("*", _deployment("openai/*", "1"))
+        router.add_pattern("openai/*", _deployment("openai/*", "2"))
+        router.add_pattern("openai/gpt-*", _deployment("openai/gpt-*", "3"))
+
+        expected = [
+            regex for regex, _ in PatternUtils.sorted_patterns(router.patterns)
+        ]
+        assert router._sorted_regexes == expected
+
+    def test_equal_specificity_keeps_insertion_order(self):
+        router = PatternMatchRouter()
+        router.add_pattern("aaa/*", _deployment("aaa/*", "1"))
+        router.add_pattern("bbb/*", _deployment("bbb/*", "2"))
+        router.add_pattern("*/x", _deployment("*/x", "3"))
+
+        expected = [
+            regex for regex, _ in PatternUtils.sorted_patterns(router.patterns)
+        ]
+        assert router._sorted_regexes == expected
+
+    def test_prefix_index_returns_most_specific_match(self):
+        router = PatternMatchRouter()
+        router.add_pattern("openai/*", _deployment("openai/*", "1"))
+        router.add_pattern("openai/gpt-*", _deployment("openai/gpt-*", "2"))
+        router.add_pattern("anthropic/*", _deployment("anthropic/*", "3"))
+
+        result = router.route("openai/gpt-4o")
+        assert result is not None
+        assert result[0]["model_info"]["id"] == "2"
+        assert result[0]["litellm_params"]["model"] == "openai/gpt-4o"
+
+        result = router.route("anthropic/claude-3")
+        assert result is not None
+        assert result[0]["model_info"]["id"] == "3"
+        assert result[0]["litellm_params"]["model"] == "anthropic/claude-3"
+
+        assert router.route("bedrock/titan") is None
+
+    def test_get_literal_prefix(self):
+        router = PatternMatchRouter()
+        assert (
+            router._get_literal_prefix(router._pattern_to_regex("openai/*"))
+            == "openai/"
+        )
+        assert (
+            router._get_literal_prefix(router._pattern_to_regex("openai/gpt-*"))
+            == "openai/gpt-"
+        )
+        assert (
+            router._get_literal_prefix(router._pattern_to_regex("*meta.llama3*"))
+            == ""
+        )
+        assert router._get_literal_prefix("ab?c") == "a"
+        assert router._get_literal_prefix(r"ab\d(.*)") == "ab"
+        assert router._get_literal_prefix("a/(.*)|b/(.*)") == ""
+
+    def test_matches_agree_with_sequential_scan(self):
+        router = PatternMatchRouter()
+        patterns = [f"provider-{i}/*" for i in range(50)] + [
+            "provider-1*/special-*",
+            "*meta.llama3*",
+            "*",
+        ]
+        for i, pattern in enumerate(patterns):
+            router.add_pattern(pattern, _deployment(pattern, str(i)))
+
+        requests = [
+            "provider-7/gpt",
+            "provider-12/special-model",
+            "provider-1/special-model",
+            "hello-meta.llama3-70b",
+            "no-provider",
+        ]
+        for request in requests:
+            expected = None
+            for regex, deployments in PatternUtils.sorted_patterns(router.patterns):
+                if router._compiled[regex].match(request):
+                    expected = deployments[0]["model_info"]["id"]
+                    break
+            result = router.route(request)
+            assert result is not None
+            assert result[0]["model_info"]["id"] == expected
+
+    def test_resolved_routes_are_cached_and_invalidated_on_change(self):
+        router = PatternMatchRouter()
+        router.add_pattern("openai/*", _deployment("openai/*", "1"))
+
+        assert router.route("openai/gpt-4o") is not None
+        assert router.route("anthropic/claude") is None
+        assert "openai/gpt-4o" in router._resolved_cache
+        assert "anthropic/claude" in router._resolved_cache
+
+        router.add_pattern("anthropic/*", _deployment("anthropic/*", "2"))
+        assert router._resolved_cache == {}
+        result = router.route("anthropic/claude")
+        assert result is not None
+        assert result[0]["model_info"]["id"] == "2"
+
+    def test_route_returns_copies(self):
+        router = PatternMatchRouter()
+        router.add_pattern("openai/*", _deployment("openai/*", "1"))
+
+        first = router.route("openai/gpt-4o")
+        assert first is not None
+        first[0]["litellm_params"]["api_key"] = "mutated"
+
+        second = router.route("openai/gpt-4o")
+        assert second is not None
+        assert "api_key" not in second[0]["litellm_params"]
+
+    def test_remove_deployment(self):
+        router = PatternMatchRouter()
+        router.add_pattern("openai/*", _deployment("openai/*", "1"))
+        router.add_pattern("openai/gpt-*", _deployment("openai/gpt-*", "2"))
+        assert router.route("openai/gpt-4o")[0]["model_info"]["id"] == "2"
+
+        router.remove_deployment("2")
+        assert list(router.patterns.keys()) == ["openai/(.*)"]
+        assert router.route("openai/gpt-4o")[0]["model_info"]["id"] == "1"
+
+    def test_filtered_model_names(self):
+        router = PatternMatchRouter()
+        router.add_pattern("openai/*", _deployment("openai/*", "1"))
+        router.add_pattern("openai/gpt-*", _deployment("openai/gpt-*", "2"))
+
+        result = router.route("openai/gpt-4o", filtered_model_names=["openai/*"])
+        assert result is not None
+        assert result[0]["model_info"]["id"] == "1"
+        assert router.route("openai/gpt-4o", filtered_model_names=["azure/*"]) is None
+
+    def test_clear(self):
+        router = PatternMatchRouter()
+        router.add_pattern("openai/*", _deployment("openai/*", "1"))
+        router.route("openai/gpt-4o")
+
+        router.clear()
+        assert router.patterns == {}
+        assert router.route("openai/gpt-4o") is None
+
+
+def test_router_delete_deployment_removes_wildcard_route():
+    from litellm import Router
+
+    router = Router(
+        model_list=[
+            {
+                "model_name": "openai/*",
+                "litellm_params": {"model": "openai/*"},
+                "model_info": {"id": "wildcard-1"},
+            }
+        ]
+    )
+    assert router.pattern_router.route("openai/gpt-4o") is not None
+
+    router.delete_deployment(id="wildcard-1")
+    assert router.pattern_router.route("openai/gpt-4o") is None
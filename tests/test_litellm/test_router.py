@@ -1869,3 +1869,46 @@ async def test_aguardrail():
 
     assert result["result"] == "success"
     assert result["selected_guardrail"]["id"] == "guardrail-1"
+
+
+def test_pre_call_checks_skips_token_counting_for_large_context_windows():
+    """
+    If every deployment's context window is clearly large enough, _pre_call_checks
+    should not tokenize the messages. Exact counting still filters small windows.
+    """
+    router = litellm.Router(
+        model_list=[
+            {
+                "model_name": "gpt-4o",
+                "litellm_params": {"model": "gpt-4o", "api_key": "fake-key"},
+                "model_info": {"id": "large", "max_input_tokens": 100000},
+            },
+            {
+                "model_name": "gpt-4o",
+                "litellm_params": {"model": "gpt-4o", "api_key": "fake-key"},
+                "model_info": {"id": "small", "max_input_tokens": 10},
+            },
+        ],
+        enable_pre_call_checks=True,
+    )
+    deployments = router.get_model_list(model_name="gpt-4o")
+
+    short_messages = [{"role": "user", "content": "hi"}]
+    with patch.object(
+        litellm, "token_counter", wraps=litellm.token_counter
+    ) as mock_token_counter:
+        result = router._pre_call_checks(
+            model="gpt-4o", healthy_deployments=deployments, messages=short_messages
+        )
+    mock_token_counter.assert_not_called()
+    assert len(result) == 2
+
+    long_messages = [{"role": "user", "content": "hello world " * 100}]
+    with patch.object(
+        litellm, "token_counter", wraps=litellm.token_counter
+    ) as mock_token_counter:
+        result = router._pre_call_checks(
+            model="gpt-4o", healthy_deployments=deployments, messages=long_messages
+        )
+    mock_token_counter.assert_called_once()
+    assert [d["model_info"]["id"] for d in result] == ["large"]
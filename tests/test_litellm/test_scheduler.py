@@ -0,0 +1,209 @@
+import asyncio
+import time
+from typing import Dict, List, Optional
+
+import pytest
+
+from litellm.scheduler import FlowItem, Scheduler
+
+
+async def _no_healthy_deployments() -> list:
+    return []
+
+
+class FakeSortedSetRedisCache:
+    """Minimal stand-in for the RedisCache sorted-set helpers used by the Scheduler"""
+
+    def __init__(self):
+        self.sorted_sets: Dict[str, Dict[str, float]] = {}
+
+    async def async_zadd(self, key: str, mapping: dict, ttl: Optional[int] = None):
+        self.sorted_sets.setdefault(key, {}).update(mapping)
+        return len(mapping)
+
+    async def async_zrem(self, key: str, *members: str):
+        removed = 0
+        for member in members:
+            if self.sorted_sets.get(key, {}).pop(member, None) is not None:
+                removed += 1
+        return removed
+
+    async def async_zrange(
+        self, key: str, start: int, end: int, withscores: bool = False
+    ) -> List:
+        members = sorted(
+            self.sorted_sets.get(key, {}).items(), key=lambda kv: (kv[1], kv[0])
+        )
+        members = members[start:] if end == -1 else members[start : end + 1]
+        if withscores:
+            return members
+        return [member for member, _ in members]
+
+
+@pytest.mark.asyncio
+async def test_poll_removes_request_when_healthy_deployments_available():
+    scheduler = Scheduler()
+    await scheduler.add_request(FlowItem(priority=0, request_id="1", model_name="m"))
+    await scheduler.add_request(FlowItem(priority=0, request_id="2", model_name="m"))
+
+    assert await scheduler.poll(id="2", model_name="m", health_deployments=[{}])
+    assert await scheduler.get_queue(model_name="m") == [(0, "1")]
+
+
+@pytest.mark.asyncio
+async def test_wait_for_turn_goes_in_priority_order():
+    scheduler = Scheduler()
+    await scheduler.add_request(
+        FlowItem(priority=0, request_id="blocker", model_name="m")
+    )
+    order = []
+
+    async def _request(request_id: str, priority: int):
+        assert await scheduler.wait_for_turn(
+            request=FlowItem(priority=priority, request_id=request_id, model_name="m"),
+            get_healthy_deployments=_no_healthy_deployments,
+            timeout=5,
+        )
+        order.append(request_id)
+
+    tasks = [
+        asyncio.create_task(_request("low", 5)),
+        asyncio.create_task(_request("high", 1)),
+        asyncio.create_task(_request("mid", 3)),
+    ]
+    await asyncio.sleep(0.01)
+    assert order == []
+
+    start_time = time.monotonic()
+    await scheduler.poll(id="blocker", model_name="m", health_deployments=[])
+    await asyncio.gather(*tasks)
+
+    assert order == ["high", "mid", "low"]
+    # waiters are woken, not left waiting for the next poll
+    assert time.monotonic() - start_time < scheduler.polling_interval
+    assert scheduler.get_queue_status() == {}
+
+
+@pytest.mark.asyncio
+async def test_wait_for_turn_timeout_leaves_queue():
+    scheduler = Scheduler()
+    await scheduler.add_request(
+        FlowItem(priority=0, request_id="blocker", model_name="m")
+    )
+
+    made_request = await scheduler.wait_for_turn(
+        request=FlowItem(priority=1, request_id="1", model_name="m"),
+        get_healthy_deployments=_no_healthy_deployments,
+        timeout=0.05,
+    )
+
+    assert made_request is False
+    assert await scheduler.get_queue(model_name="m") == [(0, "blocker")]
+    assert scheduler.get_wait_time_metrics()[1]["timeouts"] == 1
+
+
+@pytest.mark.asyncio
+async def test_notify_capacity_wakes_top_of_queue():
+    scheduler = Scheduler()
+    healthy_deployments: list = []
+
+    async def _get_healthy_deployments() -> list:
+        return healthy_deployments
+
+    await scheduler.add_request(
+        FlowItem(priority=0, request_id="blocker", model_name="m")
+    )
+    task = asyncio.create_task(
+        scheduler.wait_for_turn(
+            request=FlowItem(priority=1, request_id="1", model_name="m"),
+            get_healthy_deployments=_get_healthy_deployments,
+            timeout=5,
+        )
+    )
+    await asyncio.sleep(0.01)
+    assert not task.done()
+
+    # request "1" is now at the top of the queue - it rechecks on notify
+    healthy_deployments.append({"model_name": "m"})
+    scheduler.notify_capacity(model_name="m")
+    assert await asyncio.wait_for(task, timeout=1) is True
+    assert await scheduler.get_queue(model_name="m") == [(0, "blocker")]
+
+
+@pytest.mark.asyncio
+async def test_wait_time_metrics_per_priority():
+    scheduler = Scheduler()
+    for priority in [0, 0, 2]:
+        await scheduler.wait_for_turn(
+            request=FlowItem(
+                priority=priority, request_id=str(priority), model_name="m"
+            ),
+            get_healthy_deployments=_no_healthy_deployments,
+            timeout=1,
+        )
+
+    metrics = scheduler.get_wait_time_metrics()
+    assert list(metrics.keys()) == [0, 2]
+    assert metrics[0]["count"] == 2
+    assert metrics[0]["timeouts"] == 0
+    assert metrics[0]["max_wait_seconds"] >= metrics[0]["avg_wait_seconds"]
+
+
+@pytest.mark.asyncio
+async def test_redis_queue_shared_across_schedulers():
+    redis_cache = FakeSortedSetRedisCache()
+    scheduler_1 = Scheduler(polling_interval=0.01, redis_cache=redis_cache)  # type: ignore
+    scheduler_2 = Scheduler(polling_interval=0.01, redis_cache=redis_cache)  # type: ignore
+
+    await scheduler_1.add_request(
+        FlowItem(priority=0, request_id="pod-1", model_name="m")
+    )
+    task = asyncio.create_task(
+        scheduler_2.wait_for_turn(
+            request=FlowItem(priority=1, request_id="pod-2", model_name="m"),
+            get_healthy_deployments=_no_healthy_deployments,
+            timeout=5,
+        )
+    )
+    await asyncio.sleep(0.05)
+    assert not task.done()
+    assert await scheduler_2.get_queue(model_name="m") == [
+        (0, "pod-1"),
+        (1, "pod-2"),
+    ]
+
+    assert await scheduler_1.poll(id="pod-1", model_name="m", health_deployments=[])
+    assert await asyncio.wait_for(task, timeout=1) is True
+    assert await scheduler_1.get_queue(model_name="m") == []
+
+
+class UnavailableRedisCache:
+    async def async_zadd(self, *args, **kwargs):
+        raise ConnectionError("Connection refused")
+
+    async_zrem = async_zadd
+    async_zrange = async_zadd
+
+
+@pytest.mark.asyncio
+async def test_redis_outage_falls_back_to_in_process_queue():
+    scheduler = Scheduler(polling_interval=0.01, redis_cache=UnavailableRedisCache())  # type: ignore
+
+    low = asyncio.create_task(
+        scheduler.wait_for_turn(
+            request=FlowItem(priority=1, request_id="low", model_name="m"),
+            get_healthy_deployments=_no_healthy_deployments,
+            timeout=5,
+        )
+    )
+    await asyncio.sleep(0)
+    high = asyncio.create_task(
+        scheduler.wait_for_turn(
+            request=FlowItem(priority=0, request_id="high", model_name="m"),
+            get_healthy_deployments=_no_healthy_deployments,
+            timeout=5,
+        )
+    )
+    assert await asyncio.wait_for(low, timeout=1) is True
+    assert await asyncio.wait_for(high, timeout=1) is True
+    assert await scheduler.get_queue(model_name="m") == []